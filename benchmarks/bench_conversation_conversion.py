@@ -0,0 +1,96 @@
+"""Benchmark request conversion over a growing agent conversation
+
+Simulates an agent loop that resends its whole history every turn, each turn
+appending a tool call and its result, and times ``RequestConverter.convert``
+per turn with and without a ``ConversionCache``. Without the cache a turn's
+cost grows with the history; with it, the cost stays close to that of the two
+new messages. Runs offline:
+
+    python benchmarks/bench_conversation_conversion.py --turns 400
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Optional
+
+from anthropic_openai_bridge.converters.conversion_cache import ConversionCache
+from anthropic_openai_bridge.converters.request_converter import RequestConverter
+
+
+def build_turn(index: int, result_lines: int) -> List[Dict[str, Any]]:
+    """Build one turn: an assistant tool call and the user's tool result"""
+    tool_id = f"toolu_{index:06d}"
+    return [
+        {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": f"Reading file {index} to continue."},
+                {
+                    "type": "tool_use",
+                    "id": tool_id,
+                    "name": "read_file",
+                    "input": {"path": f"/src/module_{index}.py", "limit": 200},
+                },
+            ],
+        },
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": f"def function_{index}():\n    pass\n" * result_lines,
+                }
+            ],
+        },
+    ]
+
+
+def run_session(
+    turns: int, result_lines: int, cache: Optional[ConversionCache]
+) -> List[float]:
+    """Run one conversation and return the conversion time of each turn in us"""
+    converter = RequestConverter(conversion_cache=cache)
+    history: List[Dict[str, Any]] = [
+        {"role": "user", "content": "Fix the failing test"}
+    ]
+    timings = []
+    for index in range(turns):
+        history += build_turn(index, result_lines)
+        request = {
+            "model": "gpt-4o",
+            "max_tokens": 1024,
+            "system": "You are a coding agent.",
+            "messages": list(history),
+        }
+        started = time.perf_counter()
+        converter.convert(request)
+        timings.append((time.perf_counter() - started) * 1e6)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=400)
+    parser.add_argument("--result-lines", type=int, default=20)
+    args = parser.parse_args()
+
+    uncached = run_session(args.turns, args.result_lines, None)
+    cache = ConversionCache()
+    cached = run_session(args.turns, args.result_lines, cache)
+
+    checkpoints = sorted({1, 10, 100, args.turns} & set(range(1, args.turns + 1)))
+    print(f"{'turn':>6} {'messages':>9} {'uncached us':>12} {'cached us':>10}")
+    for turn in checkpoints:
+        print(
+            f"{turn:>6} {2 * turn + 1:>9} {uncached[turn - 1]:12.1f} "
+            f"{cached[turn - 1]:10.1f}"
+        )
+    print(
+        f"session total: {sum(uncached) / 1000:.1f} ms uncached, "
+        f"{sum(cached) / 1000:.1f} ms cached; cache {cache.snapshot()}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark cold import time of the package's entry points
+
+Imports each entry point in a fresh interpreter, takes the median of several
+runs, and lists which heavy dependencies were loaded along the way:
+
+    python benchmarks/bench_import_time.py --runs 7
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+HEAVY_MODULES = ("anthropic", "openai", "httpx", "dotenv", "pydantic")
+
+ENTRY_POINTS = {
+    "package": "import anthropic_openai_bridge",
+    "config": "from anthropic_openai_bridge.config.config_manager import ConfigManager",
+    "request converter": (
+        "from anthropic_openai_bridge.converters.request_converter import "
+        "RequestConverter"
+    ),
+    "bridge": "from anthropic_openai_bridge import AnthropicOpenAIBridge",
+}
+
+
+def time_import(statement: str) -> Dict[str, Any]:
+    """Run ``statement`` in a new interpreter and return its cost"""
+    script = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = (time.perf_counter() - started) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'heavy': heavy, 'ms': elapsed}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    result: Dict[str, Any] = json.loads(output)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, statement in ENTRY_POINTS.items():
+        timings: List[float] = []
+        heavy: List[str] = []
+        for _ in range(args.runs):
+            result = time_import(statement)
+            timings.append(result["ms"])
+            heavy = result["heavy"]
+        print(
+            f"{name:>17}: {statistics.median(timings):8.1f} ms  "
+            f"loads {', '.join(heavy) or 'no heavy dependencies'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
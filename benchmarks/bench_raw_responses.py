@@ -0,0 +1,122 @@
+"""Benchmark the raw-response fast path against the SDK's response models
+
+Serves a large tool-call completion from an in-process httpx transport and
+times the full non-streaming path, upstream call through
+``ResponseConverter``, with and without ``raw_responses``. Runs offline:
+
+    python benchmarks/bench_raw_responses.py --tool-calls 32 --iterations 500
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+import httpx
+
+from anthropic_openai_bridge import json_codec
+from anthropic_openai_bridge.client.openai_client import OpenAIClientWrapper
+from anthropic_openai_bridge.config.config_manager import ConfigManager
+from anthropic_openai_bridge.converters.response_converter import ResponseConverter
+
+
+def build_completion(tool_calls: int, argument_fields: int) -> Dict[str, Any]:
+    """Build a chat completion whose message makes many large tool calls"""
+    return {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": "Looking that up.",
+                    "tool_calls": [
+                        {
+                            "id": f"call_{i}",
+                            "type": "function",
+                            "function": {
+                                "name": f"tool_{i % 8}",
+                                "arguments": json.dumps(
+                                    {
+                                        f"field_{j}": f"value {i} {j} " * 4
+                                        for j in range(argument_fields)
+                                    }
+                                ),
+                            },
+                        }
+                        for i in range(tool_calls)
+                    ],
+                },
+                "finish_reason": "tool_calls",
+            }
+        ],
+        "usage": {"prompt_tokens": 900, "completion_tokens": 700, "total_tokens": 1600},
+    }
+
+
+def measure(func: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    """Run ``func`` repeatedly and return wall and CPU microseconds per call"""
+    for _ in range(min(iterations, 20)):
+        func()
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    for _ in range(iterations):
+        func()
+    return {
+        "wall_us": (time.perf_counter() - wall_started) / iterations * 1e6,
+        "cpu_us": (time.process_time() - cpu_started) / iterations * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tool-calls", type=int, default=32)
+    parser.add_argument("--argument-fields", type=int, default=16)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    body = json.dumps(build_completion(args.tool_calls, args.argument_fields))
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, content=body, headers={"content-type": "application/json"}
+        )
+    )
+    converter = ResponseConverter()
+    request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hi"}]}
+
+    print(
+        f"response body {len(body) / 1024:.1f} KiB, {args.tool_calls} tool calls, "
+        f"JSON decoder {json_codec.BACKEND}"
+    )
+    results = {}
+    for raw_responses in (False, True):
+        wrapper = OpenAIClientWrapper(
+            ConfigManager(
+                openai_api_key="bench",
+                httpx_client=httpx.Client(transport=transport),
+                raw_responses=raw_responses,
+            )
+        )
+
+        def send() -> Any:
+            return converter.convert(wrapper.create_chat_completion(request))
+
+        label = "raw" if raw_responses else "sdk"
+        results[label] = measure(send, args.iterations)
+        print(
+            f"{label:>4}: {results[label]['wall_us']:9.1f} us/op wall, "
+            f"{results[label]['cpu_us']:9.1f} us/op CPU"
+        )
+
+    saved = results["sdk"]["cpu_us"] - results["raw"]["cpu_us"]
+    print(
+        f"saved {saved:.1f} us CPU per response "
+        f"({saved / results['sdk']['cpu_us']:.0%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark sending requests with many tool definitions, with and without caching
+
+Sends the same request carrying a large tool set through the bridge to an
+in-process httpx transport, and times the full path from conversion and
+request serialization to the converted response, with and without a
+``ToolDefinitionCache``. Runs offline:
+
+    python benchmarks/bench_tool_cache.py --tools 150 --iterations 200
+"""
+
+import argparse
+import json
+from typing import Any, Dict, List
+
+import httpx
+from bench_raw_responses import measure
+
+from anthropic_openai_bridge.bridge import AnthropicOpenAIBridge
+from anthropic_openai_bridge.converters.tool_cache import ToolDefinitionCache
+
+COMPLETION = {
+    "id": "chatcmpl-bench",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Done."},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 9000, "completion_tokens": 2, "total_tokens": 9002},
+}
+
+
+def build_tools(count: int, properties: int) -> List[Dict[str, Any]]:
+    """Build tool definitions with JSON Schemas of realistic size"""
+    return [
+        {
+            "name": f"tool_{index}",
+            "description": f"Performs operation {index} on the workspace. " * 3,
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    f"param_{field}": {
+                        "type": "string",
+                        "description": f"Parameter {field} of tool {index}",
+                        "enum": [f"option_{value}" for value in range(4)],
+                    }
+                    for field in range(properties)
+                },
+                "required": [f"param_{field}" for field in range(properties // 2)],
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, default=150)
+    parser.add_argument("--properties", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    body = json.dumps(COMPLETION)
+    sent: List[int] = []
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        sent.append(len(request.content))
+        return httpx.Response(
+            200, content=body, headers={"content-type": "application/json"}
+        )
+
+    request = {
+        "model": "gpt-4o",
+        "max_tokens": 1024,
+        "tools": build_tools(args.tools, args.properties),
+        "messages": [{"role": "user", "content": "Tidy up the workspace"}],
+    }
+
+    results = {}
+    for label, cache in (("uncached", None), ("cached", ToolDefinitionCache())):
+        bridge = AnthropicOpenAIBridge(
+            openai_api_key="bench",
+            httpx_client=httpx.Client(transport=httpx.MockTransport(upstream)),
+            tool_cache=cache,
+        )
+        results[label] = measure(lambda: bridge.send_message(request), args.iterations)
+        print(
+            f"{label:>9}: {results[label]['wall_us']:9.1f} us/op wall, "
+            f"{results[label]['cpu_us']:9.1f} us/op CPU"
+        )
+
+    print(f"request body {sent[-1] / 1024:.1f} KiB with {args.tools} tools")
+    saved = results["uncached"]["cpu_us"] - results["cached"]["cpu_us"]
+    print(
+        f"saved {saved:.1f} us CPU per request "
+        f"({saved / results['uncached']['cpu_us']:.0%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
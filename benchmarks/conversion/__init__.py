@@ -0,0 +1,15 @@
+"""Micro-benchmarks for the request, response, tool and stream converters
+
+Generates synthetic workloads from ``tests/fixtures`` and reports ops/sec,
+per-op latency and memory for each converter. Runs offline from the
+repository root:
+
+    python -m benchmarks.conversion
+    python -m benchmarks.conversion --scenario agent --converter request
+    python -m benchmarks.conversion --messages 500 --tools 100 --json out.json
+"""
+
+from .runner import measure
+from .workload import SCENARIOS, WorkloadGenerator, WorkloadSpec
+
+__all__ = ["SCENARIOS", "WorkloadGenerator", "WorkloadSpec", "measure"]
@@ -0,0 +1,126 @@
+"""Run the conversion micro-benchmarks: python -m benchmarks.conversion"""
+
+import argparse
+import json
+from typing import Any, Callable, Dict, List, Tuple
+
+from anthropic_openai_bridge.converters.request_converter import RequestConverter
+from anthropic_openai_bridge.converters.response_converter import ResponseConverter
+from anthropic_openai_bridge.converters.stream_converter import StreamConverter
+from anthropic_openai_bridge.converters.tool_converter import ToolConverter
+
+from . import __doc__ as package_doc
+from .runner import measure
+from .workload import SCENARIOS, WorkloadGenerator, WorkloadSpec
+
+Case = Tuple[str, Callable[[], Any]]
+
+
+def build_cases(generator: WorkloadGenerator, spec: WorkloadSpec) -> List[Case]:
+    """Build the benchmark of each converter for one workload"""
+    request = generator.request(spec)
+    response = generator.response(spec)
+    chunks = generator.chunks(spec)
+    tools = generator.tool_definitions(spec)
+    tool_calls = generator.tool_calls(spec)
+    request_converter = RequestConverter()
+    response_converter = ResponseConverter()
+    tool_converter = ToolConverter()
+
+    def stream() -> List[Any]:
+        converter = StreamConverter()
+        events = []
+        for chunk in chunks:
+            events.extend(converter.convert_chunk(chunk))
+        events.extend(converter.finish())
+        return events
+
+    return [
+        ("request", lambda: request_converter.convert(request)),
+        ("response", lambda: response_converter.convert(response)),
+        (
+            "tool_definitions",
+            lambda: tool_converter.convert_anthropic_tools_to_openai(tools),
+        ),
+        (
+            "tool_calls",
+            lambda: tool_converter.convert_openai_tool_calls_to_anthropic(tool_calls),
+        ),
+        ("stream", stream),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=package_doc.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="scenarios: "
+        + "; ".join(f"{name} ({spec.describe()})" for name, spec in SCENARIOS.items()),
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="workload to run, repeatable (default: all)",
+    )
+    parser.add_argument(
+        "--converter",
+        action="append",
+        choices=["request", "response", "tool_definitions", "tool_calls", "stream"],
+        help="converter to run, repeatable (default: all)",
+    )
+    parser.add_argument("--messages", type=int, help="run a custom workload")
+    parser.add_argument("--text-size", type=int, default=1000)
+    parser.add_argument("--tools", type=int, default=16)
+    parser.add_argument("--tool-call-density", type=float, default=0.5)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="also write results as JSON")
+    args = parser.parse_args()
+
+    if args.messages is not None:
+        specs = [
+            WorkloadSpec(
+                "custom",
+                messages=args.messages,
+                text_size=args.text_size,
+                tools=args.tools,
+                tool_call_density=args.tool_call_density,
+            )
+        ]
+    else:
+        specs = [SCENARIOS[name] for name in args.scenario or SCENARIOS]
+
+    generator = WorkloadGenerator(seed=args.seed)
+    results: List[Dict[str, Any]] = []
+    print(
+        f"{'scenario':<8} {'converter':<16} {'ops/sec':>10} {'mean us':>9} "
+        f"{'p50 us':>9} {'p99 us':>9} {'peak KiB':>9} {'kept blocks':>11}"
+    )
+    for spec in specs:
+        for name, func in build_cases(generator, spec):
+            if args.converter and name not in args.converter:
+                continue
+            result = measure(func, args.iterations)
+            results.append(
+                {
+                    "scenario": spec.name,
+                    "workload": spec.describe(),
+                    "converter": name,
+                    **result,
+                }
+            )
+            print(
+                f"{spec.name:<8} {name:<16} {result['ops_per_sec']:>10.0f} "
+                f"{result['mean_us']:>9.1f} {result['p50_us']:>9.1f} "
+                f"{result['p99_us']:>9.1f} {result['peak_kib']:>9.1f} "
+                f"{result['retained_blocks']:>11}"
+            )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"seed": args.seed, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Timing and allocation measurement for the conversion benchmarks"""
+
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+
+def measure(func: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    """Time ``func`` per call, then trace the memory of one more call
+
+    Timing runs with tracemalloc off, since tracing slows every allocation,
+    and with the garbage collector paused so its pauses do not land on
+    arbitrary calls. The traced call reports the peak memory allocated while
+    it ran and the blocks and bytes still held by its result.
+
+    Returns:
+        ops/sec, mean, median and p99 latency in microseconds, peak KiB
+        allocated per call, and blocks and KiB retained by the result
+    """
+    if iterations < 1:
+        raise ValueError("iterations must be at least 1")
+    for _ in range(min(iterations, 20)):
+        func()
+
+    latencies = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            started = time.perf_counter_ns()
+            func()
+            latencies.append((time.perf_counter_ns() - started) / 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        retained = tracemalloc.take_snapshot().compare_to(before, "filename")
+    finally:
+        tracemalloc.stop()
+    del result
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "ops_per_sec": iterations / total * 1e6 if total else float("inf"),
+        "mean_us": total / iterations,
+        "p50_us": statistics.median(latencies),
+        "p99_us": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "peak_kib": peak / 1024,
+        "retained_blocks": sum(max(stat.count_diff, 0) for stat in retained),
+        "retained_kib": sum(max(stat.size_diff, 0) for stat in retained) / 1024,
+    }
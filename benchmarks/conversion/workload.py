@@ -0,0 +1,287 @@
+"""Synthetic conversion workloads seeded from the test fixtures
+
+Texts, tool definitions and tool arguments are sampled from
+``tests/fixtures`` and scaled to the requested sizes, so every workload uses
+the same shapes the converters are tested against. Generation is
+deterministic for a given seed.
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+FIXTURES = Path(__file__).resolve().parents[2] / "tests" / "fixtures"
+
+# Size of the text and argument fragments in generated stream chunks
+CHUNK_CHARS = 16
+
+
+class WorkloadSpec:
+    """Dimensions of one synthetic workload
+
+    ``tool_call_density`` is the fraction of assistant turns in the request
+    history that call a tool, and the fraction of the offered tools the
+    response calls.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        messages: int,
+        text_size: int,
+        tools: int,
+        tool_call_density: float,
+    ):
+        if messages < 1:
+            raise ValueError("messages must be at least 1")
+        if not 0.0 <= tool_call_density <= 1.0:
+            raise ValueError("tool_call_density must be between 0 and 1")
+        self.name = name
+        self.messages = messages
+        self.text_size = text_size
+        self.tools = tools
+        self.tool_call_density = tool_call_density
+
+    def describe(self) -> str:
+        return (
+            f"{self.messages} messages, {self.text_size} chars, "
+            f"{self.tools} tools, {self.tool_call_density:.0%} tool calls"
+        )
+
+
+# Default workloads, from a short chat to a long agent session
+SCENARIOS = {
+    "chat": WorkloadSpec(
+        "chat", messages=4, text_size=200, tools=0, tool_call_density=0.0
+    ),
+    "tools": WorkloadSpec(
+        "tools", messages=8, text_size=400, tools=8, tool_call_density=0.25
+    ),
+    "agent": WorkloadSpec(
+        "agent", messages=60, text_size=1000, tools=24, tool_call_density=0.5
+    ),
+    "large": WorkloadSpec(
+        "large", messages=200, text_size=4000, tools=64, tool_call_density=0.75
+    ),
+}
+
+
+class _FixtureCorpus:
+    """Texts, tools and tool inputs collected from the fixture files"""
+
+    def __init__(self) -> None:
+        self.texts: List[str] = []
+        self.tools: List[Dict[str, Any]] = []
+        self.inputs: List[Dict[str, Any]] = []
+        for path in sorted(FIXTURES.glob("*anthropic_samples.json")):
+            with open(path) as f:
+                self._collect(json.load(f))
+
+    def _collect(self, value: Any) -> None:
+        if isinstance(value, list):
+            for item in value:
+                self._collect(item)
+        elif isinstance(value, dict):
+            if "input_schema" in value:
+                self.tools.append(value)
+            elif value.get("type") == "tool_use":
+                self.inputs.append(value["input"])
+            elif value.get("type") == "text" or isinstance(value.get("content"), str):
+                self.texts.append(value.get("text") or value["content"])
+            for item in value.values():
+                if isinstance(item, (list, dict)):
+                    self._collect(item)
+
+
+class WorkloadGenerator:
+    """Builds requests, responses and stream chunks for a ``WorkloadSpec``"""
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+        self.corpus = _FixtureCorpus()
+
+    def _random(self, spec: WorkloadSpec, kind: str) -> random.Random:
+        # Each artifact gets its own stream so they do not shift each other
+        return random.Random(f"{self.seed}:{spec.name}:{kind}")
+
+    def _text(self, rng: random.Random, size: int) -> str:
+        parts: List[str] = []
+        length = 0
+        while length < size:
+            text = rng.choice(self.corpus.texts)
+            parts.append(text)
+            length += len(text) + 1
+        return " ".join(parts)[:size] or "Hi"
+
+    def _arguments(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        arguments = dict(rng.choice(self.corpus.inputs))
+        arguments["request"] = index
+        return arguments
+
+    def tool_definitions(self, spec: WorkloadSpec) -> List[Dict[str, Any]]:
+        """Anthropic tool definitions, fixture tools renamed to be distinct"""
+        tools = self.corpus.tools
+        definitions = []
+        for index in range(spec.tools):
+            tool = tools[index % len(tools)]
+            definitions.append({**tool, "name": f"{tool['name']}_{index}"})
+        return definitions
+
+    def request(self, spec: WorkloadSpec) -> Dict[str, Any]:
+        """An Anthropic request whose history alternates user and assistant"""
+        rng = self._random(spec, "request")
+        tools = self.tool_definitions(spec)
+        messages: List[Dict[str, Any]] = [
+            {"role": "user", "content": self._text(rng, spec.text_size)}
+        ]
+        while len(messages) < spec.messages:
+            index = len(messages)
+            if tools and rng.random() < spec.tool_call_density:
+                tool_id = f"toolu_{index:08d}"
+                messages.append(
+                    {
+                        "role": "assistant",
+                        "content": [
+                            {"type": "text", "text": self._text(rng, 40)},
+                            {
+                                "type": "tool_use",
+                                "id": tool_id,
+                                "name": rng.choice(tools)["name"],
+                                "input": self._arguments(rng, index),
+                            },
+                        ],
+                    }
+                )
+                messages.append(
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "tool_result",
+                                "tool_use_id": tool_id,
+                                "content": self._text(rng, spec.text_size),
+                            }
+                        ],
+                    }
+                )
+            else:
+                messages.append(
+                    {
+                        "role": "assistant",
+                        "content": [
+                            {"type": "text", "text": self._text(rng, spec.text_size)}
+                        ],
+                    }
+                )
+                messages.append(
+                    {"role": "user", "content": self._text(rng, spec.text_size)}
+                )
+        request: Dict[str, Any] = {
+            "model": "gpt-4o",
+            "max_tokens": 1024,
+            "system": "You are a helpful assistant.",
+            "messages": messages[: spec.messages],
+        }
+        if tools:
+            request["tools"] = tools
+        return request
+
+    def tool_calls(self, spec: WorkloadSpec) -> List[Dict[str, Any]]:
+        """OpenAI tool calls made by the response"""
+        rng = self._random(spec, "tool_calls")
+        names = [tool["name"] for tool in self.tool_definitions(spec)]
+        return [
+            {
+                "id": f"call_{index:08d}",
+                "type": "function",
+                "function": {
+                    "name": rng.choice(names),
+                    "arguments": json.dumps(self._arguments(rng, index)),
+                },
+            }
+            for index in range(round(spec.tools * spec.tool_call_density))
+        ]
+
+    def response(self, spec: WorkloadSpec) -> Dict[str, Any]:
+        """An OpenAI chat completion with text and the spec's tool calls"""
+        rng = self._random(spec, "response")
+        message: Dict[str, Any] = {
+            "role": "assistant",
+            "content": self._text(rng, spec.text_size),
+        }
+        tool_calls = self.tool_calls(spec)
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        return {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": message,
+                    "finish_reason": "tool_calls" if tool_calls else "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 100 * spec.messages,
+                "completion_tokens": spec.text_size // 4,
+                "total_tokens": 100 * spec.messages + spec.text_size // 4,
+            },
+        }
+
+    def chunks(self, spec: WorkloadSpec) -> List[Dict[str, Any]]:
+        """The response as OpenAI stream chunks of ``CHUNK_CHARS`` fragments"""
+        response = self.response(spec)
+        choice = response["choices"][0]
+
+        def chunk(delta: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+            return {
+                "id": response["id"],
+                "object": "chat.completion.chunk",
+                "created": response["created"],
+                "model": response["model"],
+                "choices": [{"index": 0, "delta": delta, **extra}],
+            }
+
+        chunks = [chunk({"role": "assistant", "content": ""})]
+        for text in _fragments(choice["message"]["content"]):
+            chunks.append(chunk({"content": text}))
+        for index, call in enumerate(choice["message"].get("tool_calls", [])):
+            chunks.append(
+                chunk(
+                    {
+                        "tool_calls": [
+                            {
+                                "index": index,
+                                "id": call["id"],
+                                "type": "function",
+                                "function": {
+                                    "name": call["function"]["name"],
+                                    "arguments": "",
+                                },
+                            }
+                        ]
+                    }
+                )
+            )
+            for text in _fragments(call["function"]["arguments"]):
+                chunks.append(
+                    chunk(
+                        {
+                            "tool_calls": [
+                                {"index": index, "function": {"arguments": text}}
+                            ]
+                        }
+                    )
+                )
+        chunks.append(chunk({}, finish_reason=choice["finish_reason"]))
+        chunks.append({**chunk({}), "choices": [], "usage": response["usage"]})
+        return chunks
+
+
+def _fragments(text: str) -> Iterator[str]:
+    for start in range(0, len(text), CHUNK_CHARS):
+        yield text[start : start + CHUNK_CHARS]
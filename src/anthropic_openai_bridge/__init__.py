@@ -1,6 +1,19 @@
 """Anthropic-OpenAI Bridge Library"""
 
-from .bridge import AnthropicOpenAIBridge
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .bridge import AnthropicOpenAIBridge, AsyncAnthropicOpenAIBridge
 
 __version__ = "0.1.0"
-__all__ = ["AnthropicOpenAIBridge"]
+__all__ = ["AnthropicOpenAIBridge", "AsyncAnthropicOpenAIBridge"]
+
+
+def __getattr__(name: str) -> Any:
+    # The bridge classes pull in both SDKs, so they are imported on first
+    # access rather than with the package
+    if name in __all__:
+        from . import bridge
+
+        return getattr(bridge, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,54 @@
+"""Command line entry point: ``python -m anthropic_openai_bridge serve``"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m anthropic_openai_bridge",
+        description="Anthropic-to-OpenAI API bridge",
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    serve = subcommands.add_parser(
+        "serve", help="Run an Anthropic-compatible HTTP proxy (/v1/messages)"
+    )
+    serve.add_argument(
+        "--host", default=os.getenv("BRIDGE_HOST", "127.0.0.1"), help="Bind address"
+    )
+    serve.add_argument(
+        "--port",
+        type=int,
+        default=int(os.getenv("BRIDGE_PORT", "8080")),
+        help="Bind port",
+    )
+    serve.add_argument("--env-file", default=None, help="Path to a .env file")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line interface"""
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "serve":
+        from .bridge import AsyncAnthropicOpenAIBridge
+        from .config.config_manager import ConfigManager
+        from .server.app import create_app
+        from .server.http_server import run
+
+        bridge = AsyncAnthropicOpenAIBridge(
+            config_manager=ConfigManager(env_file=args.env_file)
+        )
+        print(
+            f"Serving Anthropic Messages API on http://{args.host}:{args.port}",
+            file=sys.stderr,
+        )
+        run(create_app(bridge), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Local emulation of the Anthropic Message Batches API"""
@@ -0,0 +1,246 @@
+"""SQLite-backed persistent store for message batch jobs"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional
+
+PENDING = "pending"
+PROCESSING = "processing"
+SUCCEEDED = "succeeded"
+ERRORED = "errored"
+CANCELED = "canceled"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    cancel_initiated_at REAL,
+    ended_at REAL
+);
+CREATE TABLE IF NOT EXISTS batch_items (
+    batch_id TEXT NOT NULL REFERENCES batches(id),
+    position INTEGER NOT NULL,
+    custom_id TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (batch_id, position),
+    UNIQUE (batch_id, custom_id)
+);
+CREATE INDEX IF NOT EXISTS batch_items_status ON batch_items (status, batch_id);
+"""
+
+
+class BatchJobStore:
+    """Persists batches and their items so work survives process restarts
+
+    All access goes through one connection guarded by a lock, which makes the
+    store safe to share between the worker threads of a single process. The
+    database runs in WAL mode so readers never block the workers. Only one
+    process should drain a given store at a time.
+    """
+
+    def __init__(self, path: str):
+        """Open (and create if needed) the job store
+
+        Args:
+            path: Filesystem path of the SQLite database
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._closed = False
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def create_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """Persist a new batch of ``{"custom_id", "params"}`` requests
+
+        Returns:
+            The new batch ID
+        """
+        if not requests:
+            raise ValueError("A batch must contain at least one request")
+        custom_ids = [request["custom_id"] for request in requests]
+        if len(set(custom_ids)) != len(custom_ids):
+            raise ValueError("custom_id values must be unique within a batch")
+
+        batch_id = f"msgbatch_{uuid.uuid4().hex}"
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO batches (id, created_at) VALUES (?, ?)", (batch_id, now)
+            )
+            self._conn.executemany(
+                "INSERT INTO batch_items"
+                " (batch_id, position, custom_id, params, status, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        batch_id,
+                        position,
+                        request["custom_id"],
+                        json.dumps(request["params"]),
+                        PENDING,
+                        now,
+                    )
+                    for position, request in enumerate(requests)
+                ),
+            )
+        return batch_id
+
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Return the batch row with per-status item counts, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM batches WHERE id = ?", (batch_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            counts = dict(
+                self._conn.execute(
+                    "SELECT status, COUNT(*) FROM batch_items"
+                    " WHERE batch_id = ? GROUP BY status",
+                    (batch_id,),
+                ).fetchall()
+            )
+        batch = dict(row)
+        batch["counts"] = counts
+        return batch
+
+    def list_batch_ids(self) -> List[str]:
+        """Return all batch IDs, newest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM batches ORDER BY created_at DESC"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """Atomically mark the oldest pending item as processing and return it
+
+        Returns ``None`` when nothing is pending or the store is closed.
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            with self._conn:
+                row = self._conn.execute(
+                    "SELECT i.batch_id, i.position, i.custom_id, i.params"
+                    " FROM batch_items i JOIN batches b ON b.id = i.batch_id"
+                    " WHERE i.status = ? ORDER BY b.created_at, i.position LIMIT 1",
+                    (PENDING,),
+                ).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute(
+                    "UPDATE batch_items SET status = ?, updated_at = ?"
+                    " WHERE batch_id = ? AND position = ?",
+                    (PROCESSING, time.time(), row["batch_id"], row["position"]),
+                )
+        item = dict(row)
+        item["params"] = json.loads(item["params"])
+        return item
+
+    def complete_item(
+        self, batch_id: str, position: int, status: str, result: Dict[str, Any]
+    ) -> None:
+        """Record the outcome of an item and end its batch if nothing is left
+
+        Outcomes arriving after ``close`` are dropped. The item stays in
+        processing and is requeued when the store is next drained.
+        """
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                return
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE batch_items SET status = ?, result = ?, updated_at = ?"
+                    " WHERE batch_id = ? AND position = ? AND status = ?",
+                    (status, json.dumps(result), now, batch_id, position, PROCESSING),
+                )
+                self._end_if_done(batch_id, now)
+
+    def cancel_batch(self, batch_id: str) -> None:
+        """Cancel all items of a batch that have not started yet"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE batches SET cancel_initiated_at = ?"
+                " WHERE id = ? AND cancel_initiated_at IS NULL",
+                (now, batch_id),
+            )
+            self._conn.execute(
+                "UPDATE batch_items SET status = ?, updated_at = ?"
+                " WHERE batch_id = ? AND status = ?",
+                (CANCELED, now, batch_id, PENDING),
+            )
+            self._end_if_done(batch_id, now)
+
+    def requeue_interrupted(self) -> int:
+        """Return items left processing by a dead process to the pending queue
+
+        Returns:
+            Number of items requeued
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE batch_items SET status = ?, updated_at = ? WHERE status = ?",
+                (PENDING, time.time(), PROCESSING),
+            )
+        return cursor.rowcount
+
+    def has_unfinished(self) -> bool:
+        """Whether any item is waiting for or undergoing processing"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM batch_items WHERE status IN (?, ?) LIMIT 1",
+                (PENDING, PROCESSING),
+            ).fetchone()
+        return row is not None
+
+    def iter_results(self, batch_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield finished items of a batch in submission order"""
+        position = -1
+        while True:
+            # Page through the table so huge batches are never held in memory
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT position, custom_id, status, result FROM batch_items"
+                    " WHERE batch_id = ? AND position > ?"
+                    " AND status IN (?, ?, ?) ORDER BY position LIMIT 500",
+                    (batch_id, position, SUCCEEDED, ERRORED, CANCELED),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                position = row["position"]
+                yield {
+                    "custom_id": row["custom_id"],
+                    "status": row["status"],
+                    "result": json.loads(row["result"]) if row["result"] else None,
+                }
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._closed = True
+            self._conn.close()
+
+    def _end_if_done(self, batch_id: str, now: float) -> None:
+        remaining = self._conn.execute(
+            "SELECT 1 FROM batch_items WHERE batch_id = ? AND status IN (?, ?) LIMIT 1",
+            (batch_id, PENDING, PROCESSING),
+        ).fetchone()
+        if remaining is None:
+            self._conn.execute(
+                "UPDATE batches SET ended_at = ? WHERE id = ? AND ended_at IS NULL",
+                (now, batch_id),
+            )
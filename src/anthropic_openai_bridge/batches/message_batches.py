@@ -0,0 +1,166 @@
+"""Message Batches API emulation on top of the bridge"""
+
+import datetime
+import json
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import anthropic.types.messages
+
+from .job_store import (
+    CANCELED,
+    ERRORED,
+    PENDING,
+    PROCESSING,
+    SUCCEEDED,
+    BatchJobStore,
+)
+from .worker_pool import BatchWorkerPool
+
+# Anthropic batches expire if not finished within 24 hours
+_EXPIRY_SECONDS = 24 * 60 * 60
+
+
+def _timestamp(value: Optional[float]) -> Optional[datetime.datetime]:
+    if value is None:
+        return None
+    return datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+
+
+class MessageBatches:
+    """Local stand-in for ``client.messages.batches``
+
+    Batches are persisted in a SQLite job store and drained by a worker pool
+    that calls ``send`` (normally ``AnthropicOpenAIBridge.send_message``) for
+    each item. Unfinished items are resumed when a new instance opens the same
+    store, so long-running workloads survive restarts.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Dict[str, Any]], Any],
+        store_path: str,
+        concurrency: int = 4,
+        autostart: bool = True,
+    ):
+        """Initialize the batch API
+
+        Args:
+            send: Callable sending a single Anthropic request
+            store_path: Path of the SQLite job store
+            concurrency: Number of requests processed in parallel
+            autostart: Start workers now if the store holds unfinished work
+        """
+        self.store = BatchJobStore(store_path)
+        self.workers = BatchWorkerPool(
+            self.store, lambda params: send({**params, "stream": False}), concurrency
+        )
+        if autostart and self.store.has_unfinished():
+            self.workers.start()
+
+    def create(self, requests: Iterable[Dict[str, Any]]) -> Any:
+        """Create a batch of ``{"custom_id": ..., "params": {...}}`` requests
+
+        Returns:
+            anthropic.types.messages.MessageBatch describing the new batch
+        """
+        batch_id = self.store.create_batch(list(requests))
+        self.workers.start()
+        self.workers.notify()
+        return self.retrieve(batch_id)
+
+    def retrieve(self, batch_id: str) -> Any:
+        """Return the current state of a batch as a MessageBatch"""
+        batch = self.store.get_batch(batch_id)
+        if batch is None:
+            raise KeyError(f"Unknown message batch: {batch_id}")
+
+        counts = batch["counts"]
+        if batch["ended_at"] is not None:
+            processing_status = "ended"
+        elif batch["cancel_initiated_at"] is not None:
+            processing_status = "canceling"
+        else:
+            processing_status = "in_progress"
+
+        return anthropic.types.messages.MessageBatch(
+            id=batch_id,
+            type="message_batch",
+            processing_status=processing_status,  # type: ignore[arg-type]
+            request_counts=anthropic.types.messages.MessageBatchRequestCounts(
+                processing=counts.get(PENDING, 0) + counts.get(PROCESSING, 0),
+                succeeded=counts.get(SUCCEEDED, 0),
+                errored=counts.get(ERRORED, 0),
+                canceled=counts.get(CANCELED, 0),
+                expired=0,
+            ),
+            created_at=_timestamp(batch["created_at"]),  # type: ignore[arg-type]
+            expires_at=_timestamp(  # type: ignore[arg-type]
+                batch["created_at"] + _EXPIRY_SECONDS
+            ),
+            cancel_initiated_at=_timestamp(batch["cancel_initiated_at"]),
+            ended_at=_timestamp(batch["ended_at"]),
+            results_url=None,
+        )
+
+    def list(self) -> List[Any]:
+        """Return all batches in the store, newest first"""
+        return [self.retrieve(batch_id) for batch_id in self.store.list_batch_ids()]
+
+    def cancel(self, batch_id: str) -> Any:
+        """Cancel the items of a batch that have not started processing"""
+        self.retrieve(batch_id)
+        self.store.cancel_batch(batch_id)
+        return self.retrieve(batch_id)
+
+    def results(self, batch_id: str) -> Iterator[Any]:
+        """Yield MessageBatchIndividualResponse objects in submission order
+
+        Only finished items are yielded, so calling this before the batch has
+        ended streams back whatever is complete so far.
+        """
+        for raw in self._iter_raw_results(batch_id):
+            yield anthropic.types.messages.MessageBatchIndividualResponse.model_validate(
+                raw
+            )
+
+    def results_jsonl(self, batch_id: str) -> Iterator[str]:
+        """Yield results as JSON Lines, matching the Anthropic results file"""
+        for raw in self._iter_raw_results(batch_id):
+            yield json.dumps(raw) + "\n"
+
+    def wait(
+        self,
+        batch_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+    ) -> Any:
+        """Block until the batch has ended
+
+        Raises:
+            TimeoutError: If the batch is still running after ``timeout`` seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            batch = self.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return batch
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Message batch {batch_id} did not finish in time")
+            time.sleep(poll_interval)
+
+    def close(self) -> None:
+        """Stop the workers and close the job store
+
+        A worker still waiting on the upstream when ``stop`` gives up cannot
+        write to the closed store. Its item is resumed by the next instance
+        that opens the store.
+        """
+        self.workers.stop()
+        self.store.close()
+
+    def _iter_raw_results(self, batch_id: str) -> Iterator[Dict[str, Any]]:
+        self.retrieve(batch_id)
+        for item in self.store.iter_results(batch_id):
+            result = item["result"] or {"type": "canceled"}
+            yield {"custom_id": item["custom_id"], "result": result}
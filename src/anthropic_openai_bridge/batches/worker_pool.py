@@ -0,0 +1,110 @@
+"""Worker threads that drain the batch job store through the bridge"""
+
+import threading
+from typing import Any, Callable, Dict, List
+
+import anthropic.types
+
+from .job_store import ERRORED, SUCCEEDED, BatchJobStore
+
+
+class BatchWorkerPool:
+    """Processes pending batch items at a fixed concurrency
+
+    Each worker claims one item at a time from the store, sends it and records
+    the outcome, so the store always reflects exactly which items are done.
+    Items a previous process was working on when it died are requeued the
+    first time the pool starts.
+    """
+
+    def __init__(
+        self,
+        store: BatchJobStore,
+        send: Callable[[Dict[str, Any]], anthropic.types.Message],
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+    ):
+        """Initialize the worker pool
+
+        Args:
+            store: Job store to drain
+            send: Callable sending a single Anthropic request
+            concurrency: Number of worker threads
+            poll_interval: Seconds an idle worker sleeps before checking for work
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.store = store
+        self.send = send
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._threads: List[threading.Thread] = []
+        self._resumed = False
+
+    @property
+    def running(self) -> bool:
+        """Whether worker threads are active"""
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        """Start the workers, resuming work interrupted by a previous process"""
+        if self.running:
+            return
+        if not self._resumed:
+            self.store.requeue_interrupted()
+            self._resumed = True
+
+        self._stopping = False
+        self._threads = [
+            threading.Thread(target=self._run, name=f"batch-worker-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def notify(self) -> None:
+        """Wake idle workers because new work was queued"""
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Stop the workers after their current item completes"""
+        self._stopping = True
+        self.notify()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _run(self) -> None:
+        while not self._stopping:
+            item = self.store.claim_next()
+            if item is None:
+                with self._wakeup:
+                    if not self._stopping:
+                        self._wakeup.wait(self.poll_interval)
+                continue
+            self._process(item)
+
+    def _process(self, item: Dict[str, Any]) -> None:
+        try:
+            message = self.send(item["params"])
+            status = SUCCEEDED
+            result: Dict[str, Any] = {
+                "type": "succeeded",
+                "message": message.model_dump(mode="json"),
+            }
+        except Exception as e:
+            status = ERRORED
+            result = {
+                "type": "errored",
+                "error": {
+                    "type": "error",
+                    "error": {
+                        "type": getattr(e, "error_type", "api_error"),
+                        "message": str(e),
+                    },
+                },
+            }
+        self.store.complete_item(item["batch_id"], item["position"], status, result)
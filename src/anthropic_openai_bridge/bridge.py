@@ -1,17 +1,55 @@
 """Main bridge class for Anthropic-OpenAI API conversion"""
 
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 
 import anthropic.types
 
-from .client.openai_client import OpenAIClientWrapper
+from .batches.message_batches import MessageBatches
+from .bulk import BulkResult, aiter_bulk_results, iter_bulk_results
+from .cache.response_cache import ResponseCache
+from .cache.single_flight import AsyncSingleFlight, SingleFlight
+from .client.hedging import HedgingPolicy
+from .client.openai_client import (
+    AsyncOpenAIClientWrapper,
+    OpenAIClientWrapper,
+    _BaseClientWrapper,
+)
+from .client.retry import RetryPolicy
+from .client.scheduler import RequestScheduler, request_class
+from .config.breaker_config import CircuitBreakerConfig
 from .config.config_manager import ConfigManager
+from .config.endpoint_config import EndpointConfig
+from .config.pool_config import ConnectionPoolConfig
+from .config.rate_limit_config import RateLimitConfig
+from .converters.conversion_cache import ConversionCache
 from .converters.request_converter import RequestConverter
 from .converters.response_converter import ResponseConverter
+from .converters.tool_cache import ToolDefinitionCache
+from .streaming import AsyncMessageStream, MessageStream
+from .tokens.counter import TokenCounter
+from .tokens.tokenizers import Tokenizer, load_tokenizer
 
 
-class AnthropicOpenAIBridge:
-    """Main bridge class that converts Anthropic requests to OpenAI and back"""
+def _without_stream(anthropic_request: Dict[str, Any]) -> Dict[str, Any]:
+    # Bulk results hold complete messages, an unread stream would keep its
+    # upstream connection open
+    if not anthropic_request.get("stream"):
+        return anthropic_request
+    return {key: value for key, value in anthropic_request.items() if key != "stream"}
+
+
+class _BaseBridge:
+    """Shared configuration and converter setup for the sync and async bridges"""
 
     def __init__(
         self,
@@ -19,6 +57,21 @@ class AnthropicOpenAIBridge:
         openai_api_key: Optional[str] = None,
         openai_base_url: Optional[str] = None,
         httpx_client: Optional[Any] = None,
+        connection_pool: Optional[ConnectionPoolConfig] = None,
+        openai_endpoints: Optional[List[EndpointConfig]] = None,
+        load_balancing: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        rate_limit: Optional[RateLimitConfig] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        raw_responses: Optional[bool] = None,
+        single_flight: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        tokenizer: Optional[Tokenizer] = None,
+        trusted_responses: bool = False,
+        conversion_cache: Optional[ConversionCache] = None,
+        tool_cache: Optional[ToolDefinitionCache] = None,
     ):
         """Initialize the bridge with configuration and converters
 
@@ -27,41 +80,388 @@ class AnthropicOpenAIBridge:
             openai_api_key: Custom OpenAI API key (overrides environment variable)
             openai_base_url: Custom OpenAI base URL (overrides environment variable)
             httpx_client: Custom httpx client for OpenAI requests
+            connection_pool: Upstream connection pool limits and timeouts
+            openai_endpoints: Upstream endpoints to balance requests across
+            load_balancing: ``least_outstanding``, ``power_of_two`` or
+                ``prefix_affinity``
+            retry_policy: Backoff, Retry-After and retry budget settings
+            circuit_breaker: Per-endpoint circuit breaker settings
+            hedging: Hedged request policy for non-streaming messages
+            rate_limit: Client-side requests/min and tokens/min limits
+            scheduler: Upstream concurrency limit and queue policy
+            raw_responses: Parse upstream JSON bodies directly into the
+                response converter, skipping the SDK's pydantic models
+            single_flight: Let concurrent identical ``temperature == 0``
+                requests share one upstream call
+            response_cache: Cache reusing upstream responses to repeated
+                deterministic requests
+            tokenizer: Tokenizer for ``count_tokens``. If None, one is loaded
+                from ``config.tokenizer_path`` on first use.
+            trusted_responses: Build response Messages with ``model_construct``
+                instead of pydantic validation
+            conversion_cache: Cache of converted messages, so each turn of a
+                conversation only converts the messages appended since the
+                last one
+            tool_cache: Cache converting each distinct tool set once and
+                sending its pre-encoded JSON with every request that uses it
         """
         # If custom parameters are provided but no config_manager, create one with the custom params
         if (
-            openai_api_key or openai_base_url or httpx_client
+            openai_api_key
+            or openai_base_url
+            or httpx_client
+            or connection_pool
+            or openai_endpoints
+            or load_balancing
+            or retry_policy
+            or circuit_breaker
+            or hedging
+            or rate_limit
+            or scheduler
+            or raw_responses is not None
         ) and config_manager is None:
             self.config = ConfigManager(
                 openai_api_key=openai_api_key,
                 openai_base_url=openai_base_url,
                 httpx_client=httpx_client,
+                connection_pool=connection_pool,
+                openai_endpoints=openai_endpoints,
+                load_balancing=load_balancing,
+                retry_policy=retry_policy,
+                circuit_breaker=circuit_breaker,
+                hedging=hedging,
+                rate_limit=rate_limit,
+                scheduler=scheduler,
+                raw_responses=raw_responses,
             )
         else:
             self.config = config_manager or ConfigManager()
 
-        self.openai_client = OpenAIClientWrapper(self.config)
-        self.request_converter = RequestConverter()
-        self.response_converter = ResponseConverter()
+        self.openai_client = self._create_openai_client()
+        self.request_converter = RequestConverter(
+            conversion_cache=conversion_cache, tool_cache=tool_cache
+        )
+        self.response_converter = ResponseConverter(trusted=trusted_responses)
+        self.single_flight = self._create_single_flight() if single_flight else None
+        self.response_cache = response_cache
+        self._tokenizer = tokenizer
+        self._token_counter: Optional[TokenCounter] = None
 
-    def send_message(
+    def _create_openai_client(self) -> _BaseClientWrapper:
+        """Create the upstream client wrapper for this bridge"""
+        raise NotImplementedError
+
+    def _create_single_flight(self) -> Any:
+        """Create the request coalescer for this bridge"""
+        raise NotImplementedError
+
+    def single_flight_stats(self) -> Optional[Dict[str, Any]]:
+        """Get upstream calls made and requests coalesced, or None if disabled"""
+        return self.single_flight.snapshot() if self.single_flight else None
+
+    @property
+    def token_counter(self) -> TokenCounter:
+        """Memoizing token counter, created on first use"""
+        if self._token_counter is None:
+            tokenizer = self._tokenizer or load_tokenizer(self.config.tokenizer_path)
+            self._token_counter = TokenCounter(tokenizer)
+        return self._token_counter
+
+    def count_tokens(
+        self, anthropic_request: Dict[str, Any]
+    ) -> anthropic.types.MessageTokensCount:
+        """Count a request's input tokens locally, without calling the upstream
+
+        The request is converted as it would be for ``send_message`` and its
+        messages and tools are counted with the offline tokenizer.
+
+        Args:
+            anthropic_request: Anthropic ``messages.count_tokens`` request
+
+        Returns:
+            Token count in Anthropic format
+        """
+        openai_request = self.request_converter.convert(anthropic_request)
+        return anthropic.types.MessageTokensCount(
+            input_tokens=self.token_counter.count_request(openai_request)
+        )
+
+    def response_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get response cache hit, miss and eviction counters, or None if disabled"""
+        return self.response_cache.snapshot() if self.response_cache else None
+
+    def conversion_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get converted-message cache hit and eviction counters, or None if disabled"""
+        cache = self.request_converter.conversion_cache
+        return cache.snapshot() if cache else None
+
+    def tool_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get tool definition cache hit and eviction counters, or None if disabled"""
+        cache = self.request_converter.tool_converter.tool_cache
+        return cache.snapshot() if cache else None
+
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Get upstream connection pool utilization and wait-time counters
+
+        Returns:
+            Counter snapshot, or None when the pool is caller-managed or the
+            SDK default (no ``connection_pool`` settings)
+        """
+        return self.openai_client.pool_stats()
+
+    def endpoint_stats(self) -> List[Dict[str, Any]]:
+        """Get per-endpoint in-flight, request and error counters
+
+        Each entry's ``circuit`` holds the breaker state and the reason for
+        its last transition, or None when circuit breaking is disabled.
+        """
+        return self.openai_client.endpoint_stats()
+
+    def hedging_stats(self) -> Optional[Dict[str, Any]]:
+        """Get how often hedged requests fired and won, or None if disabled"""
+        return self.openai_client.hedging_stats()
+
+    def rate_limit_stats(self) -> Optional[Dict[str, Any]]:
+        """Get how often requests were delayed or rejected, or None if disabled"""
+        return self.openai_client.rate_limit_stats()
+
+    def scheduler_stats(self) -> Optional[Dict[str, Any]]:
+        """Get queue wait times per request class, or None without a scheduler"""
+        return self.openai_client.scheduler_stats()
+
+
+class AnthropicOpenAIBridge(_BaseBridge):
+    """Main bridge class that converts Anthropic requests to OpenAI and back"""
+
+    openai_client: OpenAIClientWrapper
+    single_flight: Optional[SingleFlight]
+    _batches: Optional[MessageBatches] = None
+
+    def _create_openai_client(self) -> OpenAIClientWrapper:
+        return OpenAIClientWrapper(self.config)
+
+    def _create_single_flight(self) -> SingleFlight:
+        return SingleFlight()
+
+    @property
+    def batches(self) -> MessageBatches:
+        """Message Batches API emulation backed by a persistent local job store
+
+        Created on first access from ``config.batch_store_path`` and
+        ``config.batch_concurrency``; unfinished work in the store resumes then.
+        """
+        if self._batches is None:
+            self._batches = MessageBatches(
+                self._send_batch_message,
+                self.config.batch_store_path,
+                concurrency=self.config.batch_concurrency,
+            )
+        return self._batches
+
+    def _send_batch_message(
         self, anthropic_request: Dict[str, Any]
     ) -> anthropic.types.Message:
+        """Send a batch item, scheduled below interactive requests"""
+        with request_class("batch"):
+            return self._send_complete(anthropic_request)
+
+    def send_message(
+        self, anthropic_request: Dict[str, Any], stream: bool = False
+    ) -> Union[anthropic.types.Message, MessageStream]:
         """Send a message through the bridge
 
         Args:
             anthropic_request: Anthropic Messages API request format
+            stream: Stream the response as Anthropic events. Also enabled by
+                ``"stream": True`` in the request.
 
         Returns:
-            Anthropic Messages API response as Message object
+            Anthropic Messages API response as Message object, or a
+            MessageStream of Anthropic events when streaming
         """
         # Convert Anthropic request to OpenAI format
         openai_request = self.request_converter.convert(anthropic_request)
 
+        if stream or anthropic_request.get("stream"):
+            return MessageStream(
+                self.openai_client.create_chat_completion_stream(openai_request),
+                model=openai_request.get("model"),
+            )
+
         # Send request to OpenAI API
-        openai_response = self.openai_client.create_chat_completion(openai_request)
+        openai_response = self._create_chat_completion(openai_request)
 
         # Convert OpenAI response back to Anthropic format
         anthropic_response = self.response_converter.convert(openai_response)
 
         return anthropic_response
+
+    def send_messages(
+        self,
+        anthropic_requests: Iterable[Dict[str, Any]],
+        max_concurrency: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[BulkResult]:
+        """Send many messages concurrently through the bridge
+
+        ``"stream": True`` in a request is ignored, every result carries a
+        complete message.
+
+        Args:
+            anthropic_requests: Anthropic Messages API requests
+            max_concurrency: Maximum number of upstream requests in flight
+            ordered: Yield results in input order. When False, results are
+                yielded as they complete.
+
+        Returns:
+            Iterator of BulkResult objects, one per request. Failed requests
+            carry their exception in ``error`` instead of aborting the batch.
+        """
+        return iter_bulk_results(
+            self._send_complete, anthropic_requests, max_concurrency, ordered
+        )
+
+    def _send_complete(
+        self, anthropic_request: Dict[str, Any]
+    ) -> anthropic.types.Message:
+        """Send one request of a bulk batch, never streaming the response"""
+        request = _without_stream(anthropic_request)
+        return cast(anthropic.types.Message, self.send_message(request))
+
+    def _create_chat_completion(self, openai_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the upstream response, from the cache or an identical call in flight"""
+        if self.response_cache is not None:
+            cached = self.response_cache.get(openai_request)
+            if cached is not None:
+                return cached
+        if self.single_flight is not None:
+            return self.single_flight.do(openai_request, self._fetch_chat_completion)
+        return self._fetch_chat_completion(openai_request)
+
+    def _fetch_chat_completion(self, openai_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the upstream and cache the response"""
+        openai_response = self.openai_client.create_chat_completion(openai_request)
+        if self.response_cache is not None:
+            self.response_cache.put(openai_request, openai_response)
+        return openai_response
+
+    def close(self) -> None:
+        """Stop the batch workers and hedging threads and close the upstream pool"""
+        if self._batches is not None:
+            self._batches.close()
+        self.openai_client.close()
+
+    def __enter__(self) -> "AnthropicOpenAIBridge":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncAnthropicOpenAIBridge(_BaseBridge):
+    """Asyncio bridge that awaits the upstream call instead of blocking a thread
+
+    Request and response conversion is shared with ``AnthropicOpenAIBridge``;
+    only the upstream call is awaited, so a single event loop can drive many
+    concurrent conversations.
+    """
+
+    openai_client: AsyncOpenAIClientWrapper
+    single_flight: Optional[AsyncSingleFlight]
+
+    def _create_openai_client(self) -> AsyncOpenAIClientWrapper:
+        return AsyncOpenAIClientWrapper(self.config)
+
+    def _create_single_flight(self) -> AsyncSingleFlight:
+        return AsyncSingleFlight()
+
+    async def send_message(
+        self, anthropic_request: Dict[str, Any], stream: bool = False
+    ) -> Union[anthropic.types.Message, AsyncMessageStream]:
+        """Send a message through the bridge
+
+        Args:
+            anthropic_request: Anthropic Messages API request format
+            stream: Stream the response as Anthropic events. Also enabled by
+                ``"stream": True`` in the request.
+
+        Returns:
+            Anthropic Messages API response as Message object, or an
+            AsyncMessageStream of Anthropic events when streaming
+        """
+        openai_request = self.request_converter.convert(anthropic_request)
+
+        if stream or anthropic_request.get("stream"):
+            return AsyncMessageStream(
+                self.openai_client.create_chat_completion_stream(openai_request),
+                model=openai_request.get("model"),
+            )
+
+        openai_response = await self._create_chat_completion(openai_request)
+        return self.response_converter.convert(openai_response)
+
+    async def _create_chat_completion(
+        self, openai_request: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Get the upstream response, from the cache or an identical call in flight"""
+        if self.response_cache is not None:
+            cached = self.response_cache.get(openai_request)
+            if cached is not None:
+                return cached
+        if self.single_flight is not None:
+            return await self.single_flight.do(
+                openai_request, self._fetch_chat_completion
+            )
+        return await self._fetch_chat_completion(openai_request)
+
+    async def _fetch_chat_completion(
+        self, openai_request: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Call the upstream and cache the response"""
+        openai_response = await self.openai_client.create_chat_completion(
+            openai_request
+        )
+        if self.response_cache is not None:
+            self.response_cache.put(openai_request, openai_response)
+        return openai_response
+
+    def send_messages(
+        self,
+        anthropic_requests: Iterable[Dict[str, Any]],
+        max_concurrency: int = 8,
+        ordered: bool = True,
+    ) -> AsyncIterator[BulkResult]:
+        """Send many messages concurrently through the bridge
+
+        ``"stream": True`` in a request is ignored, every result carries a
+        complete message.
+
+        Args:
+            anthropic_requests: Anthropic Messages API requests
+            max_concurrency: Maximum number of upstream requests in flight
+            ordered: Yield results in input order. When False, results are
+                yielded as they complete.
+
+        Returns:
+            Async iterator of BulkResult objects, one per request
+        """
+        return aiter_bulk_results(
+            self._send_complete, anthropic_requests, max_concurrency, ordered
+        )
+
+    async def _send_complete(
+        self, anthropic_request: Dict[str, Any]
+    ) -> anthropic.types.Message:
+        """Send one request of a bulk batch, never streaming the response"""
+        request = _without_stream(anthropic_request)
+        return cast(anthropic.types.Message, await self.send_message(request))
+
+    async def close(self) -> None:
+        """Close the upstream connection pool"""
+        await self.openai_client.close()
+
+    async def __aenter__(self) -> "AsyncAnthropicOpenAIBridge":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
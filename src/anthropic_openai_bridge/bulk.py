@@ -0,0 +1,182 @@
+"""Concurrent fan-out of many Anthropic requests with per-item results"""
+
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+)
+
+import anthropic.types
+
+
+class BulkResult:
+    """Outcome of one request sent through ``send_messages``
+
+    Exactly one of ``message`` and ``error`` is set. A failed request never
+    aborts the rest of the batch; its exception is captured here instead.
+    """
+
+    __slots__ = ("index", "request", "message", "error")
+
+    def __init__(
+        self,
+        index: int,
+        request: Dict[str, Any],
+        message: Optional[anthropic.types.Message] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        self.index = index
+        self.request = request
+        self.message = message
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request produced a message"""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error else f"message={self.message!r}"
+        return f"BulkResult(index={self.index}, {outcome})"
+
+
+def _validate_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+
+def _run_one(
+    send: Callable[[Dict[str, Any]], anthropic.types.Message],
+    index: int,
+    request: Dict[str, Any],
+) -> BulkResult:
+    try:
+        return BulkResult(index, request, message=send(request))
+    except Exception as e:
+        return BulkResult(index, request, error=e)
+
+
+def iter_bulk_results(
+    send: Callable[[Dict[str, Any]], anthropic.types.Message],
+    requests: Iterable[Dict[str, Any]],
+    max_concurrency: int = 8,
+    ordered: bool = True,
+) -> Iterator[BulkResult]:
+    """Send requests on a thread pool, keeping at most max_concurrency in flight
+
+    Args:
+        send: Callable sending a single Anthropic request
+        requests: Anthropic requests; consumed lazily, so generators work
+        max_concurrency: Maximum number of requests in flight at once
+        ordered: Yield results in input order. When False, results are
+            yielded as soon as they complete.
+
+    Yields:
+        One BulkResult per request
+    """
+    _validate_concurrency(max_concurrency)
+    request_iter = enumerate(requests)
+    pending: Dict["Future[BulkResult]", int] = {}
+    completed: Dict[int, BulkResult] = {}
+    next_index = 0
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def submit_next() -> None:
+        for index, request in request_iter:
+            # Worker threads run in a copy of the caller's context, so
+            # request_class() and other context variables carry over
+            run = contextvars.copy_context().run
+            pending[executor.submit(run, _run_one, send, index, request)] = index
+            return
+
+    try:
+        for _ in range(max_concurrency):
+            submit_next()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                submit_next()
+                result = future.result()
+                if ordered:
+                    completed[result.index] = result
+                else:
+                    yield result
+
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+    finally:
+        # Stop queued work if the caller abandons the iterator early
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_bulk_results(
+    send: Callable[[Dict[str, Any]], Awaitable[anthropic.types.Message]],
+    requests: Iterable[Dict[str, Any]],
+    max_concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncIterator[BulkResult]:
+    """Send requests as asyncio tasks, keeping at most max_concurrency in flight
+
+    Args:
+        send: Coroutine function sending a single Anthropic request
+        requests: Anthropic requests; consumed lazily, so generators work
+        max_concurrency: Maximum number of requests in flight at once
+        ordered: Yield results in input order. When False, results are
+            yielded as soon as they complete.
+
+    Yields:
+        One BulkResult per request
+    """
+    _validate_concurrency(max_concurrency)
+    request_iter = enumerate(requests)
+    pending: Set["asyncio.Task[BulkResult]"] = set()
+    completed: Dict[int, BulkResult] = {}
+    next_index = 0
+
+    async def run_one(index: int, request: Dict[str, Any]) -> BulkResult:
+        try:
+            return BulkResult(index, request, message=await send(request))
+        except Exception as e:
+            return BulkResult(index, request, error=e)
+
+    def submit_next() -> None:
+        for index, request in request_iter:
+            pending.add(asyncio.ensure_future(run_one(index, request)))
+            return
+
+    try:
+        for _ in range(max_concurrency):
+            submit_next()
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                submit_next()
+                result = task.result()
+                if ordered:
+                    completed[result.index] = result
+                else:
+                    yield result
+
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+    finally:
+        for task in pending:
+            task.cancel()
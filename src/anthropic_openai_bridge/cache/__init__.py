@@ -0,0 +1 @@
+"""Reuse of upstream responses across identical requests"""
@@ -0,0 +1,312 @@
+"""Storage backends for the response cache"""
+
+import collections
+import sqlite3
+import threading
+import zlib
+from typing import Any, Dict, Optional, OrderedDict, Tuple
+
+
+class CacheBackend:
+    """Byte store behind ``ResponseCache``
+
+    Backends hold opaque encoded responses under request keys, drop entries
+    past their expiry time and evict entries to stay within their size
+    budget. Subclasses must be safe to call from several threads.
+    """
+
+    def get(self, key: str, now: float) -> Optional[bytes]:
+        """Get the value stored under ``key``
+
+        Args:
+            key: Request key
+            now: Current wall-clock time, compared with entry expiry times
+
+        Returns:
+            The stored bytes, or None if missing or expired
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, expires_at: Optional[float]) -> bool:
+        """Store ``value`` under ``key``, evicting other entries if needed
+
+        Args:
+            key: Request key
+            value: Encoded response
+            expires_at: Wall-clock time the entry expires at, or None
+
+        Returns:
+            False if the value alone exceeds the size budget and was not stored
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        raise NotImplementedError
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return entry count, stored bytes and eviction counters"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the backend"""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Process-local LRU store bounded by the total size of its values"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """Initialize the store
+
+        Args:
+            max_bytes: Largest total size of the stored values
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Key -> (expiry time or None, value), least recently used first
+        self._entries: OrderedDict[str, Tuple[Optional[float], bytes]] = (
+            collections.OrderedDict()
+        )
+        self._bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str, now: float) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= now:
+                self._remove(key)
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, expires_at: Optional[float]) -> bool:
+        if len(value) > self.max_bytes:
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._bytes + len(value) > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            self._entries[key] = (expires_at, value)
+            self._bytes += len(value)
+        return True
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at)
+    WHERE expires_at IS NOT NULL;
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL,
+    clock INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, bytes, clock) VALUES (0, 0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET bytes = bytes - OLD.size WHERE id = 0;
+END;
+"""
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Disk store shared by every process on a host that opens the same file
+
+    Values are zlib-compressed, and the size budget counts compressed
+    bytes. The database runs in WAL mode so readers in one process do not
+    block writers in another, and each write runs in an immediate
+    transaction so concurrent processes evict consistently. Recency is an
+    access counter kept in the database rather than a timestamp, so LRU
+    order does not depend on the processes' clocks agreeing. Hits only read
+    the database: the keys read are buffered and their recency is written
+    with the next write, or once ``touch_batch`` hits have accumulated, so
+    concurrent readers do not queue on the write lock. Entries survive
+    restarts, so a redeployed bridge starts with a warm cache.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        compression_level: int = 6,
+        timeout: float = 30.0,
+        touch_batch: int = 64,
+    ):
+        """Open (and create if needed) the cache database
+
+        Args:
+            path: Filesystem path of the SQLite database
+            max_bytes: Largest total size of the compressed values
+            compression_level: zlib level from 0 (none) to 9 (smallest)
+            timeout: Seconds to wait for another process's write lock
+            touch_batch: Hits buffered before their recency is written
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.touch_batch = touch_batch
+        self._lock = threading.Lock()
+        # Keys read since recency was last written, least recent first
+        self._touched: OrderedDict[str, None] = collections.OrderedDict()
+        self._unwritten_hits = 0
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        self.evictions = 0
+        self.expirations = 0
+
+    def _tick(self) -> int:
+        """Advance and return the shared access counter (inside a write)"""
+        self._conn.execute("UPDATE totals SET clock = clock + 1 WHERE id = 0")
+        row = self._conn.execute("SELECT clock FROM totals WHERE id = 0").fetchone()
+        return int(row[0])
+
+    def _write_touched(self) -> None:
+        """Write the recency of the buffered hits (inside a write)"""
+        if not self._touched:
+            return
+        self._conn.execute(
+            "UPDATE totals SET clock = clock + ? WHERE id = 0", (len(self._touched),)
+        )
+        clock = self._conn.execute("SELECT clock FROM totals WHERE id = 0").fetchone()
+        first = int(clock[0]) - len(self._touched) + 1
+        self._conn.executemany(
+            "UPDATE entries SET accessed_at = ? WHERE key = ?",
+            enumerate(self._touched, first),
+        )
+        self._touched.clear()
+        self._unwritten_hits = 0
+
+    def get(self, key: str, now: float) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                with self._conn:
+                    self._conn.execute("BEGIN IMMEDIATE")
+                    deleted = self._conn.execute(
+                        "DELETE FROM entries WHERE key = ? AND expires_at <= ?",
+                        (key, now),
+                    ).rowcount
+                    self.expirations += deleted
+                    self._touched.pop(key, None)
+                return None
+            self._touched[key] = None
+            self._touched.move_to_end(key)
+            self._unwritten_hits += 1
+            if self._unwritten_hits >= self.touch_batch:
+                with self._conn:
+                    self._conn.execute("BEGIN IMMEDIATE")
+                    self._write_touched()
+        return zlib.decompress(value)
+
+    def set(self, key: str, value: bytes, expires_at: Optional[float]) -> bool:
+        blob = zlib.compress(value, self.compression_level)
+        if len(blob) > self.max_bytes:
+            return False
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            # Recent hits must count before choosing what to evict
+            self._write_touched()
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total = self._conn.execute(
+                "SELECT bytes FROM totals WHERE id = 0"
+            ).fetchone()[0]
+            while total + len(blob) > self.max_bytes:
+                oldest = self._conn.execute(
+                    "SELECT key, size FROM entries ORDER BY accessed_at LIMIT 1"
+                ).fetchone()
+                if oldest is None:
+                    break
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (oldest[0],))
+                total -= oldest[1]
+                self.evictions += 1
+            self._conn.execute(
+                "INSERT INTO entries (key, value, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), expires_at, self._tick()),
+            )
+        return True
+
+    def purge_expired(self, now: float) -> int:
+        """Delete every entry expired at ``now``
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock, self._conn:
+            deleted = self._conn.execute(
+                "DELETE FROM entries WHERE expires_at <= ?", (now,)
+            ).rowcount
+            self.expirations += deleted
+        return int(deleted)
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+            self._touched.clear()
+            self._unwritten_hits = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            total = self._conn.execute(
+                "SELECT bytes FROM totals WHERE id = 0"
+            ).fetchone()[0]
+            return {
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            with self._conn:
+                self._write_touched()
+            self._conn.close()
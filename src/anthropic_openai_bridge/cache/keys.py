@@ -0,0 +1,62 @@
+"""Canonical keys for converted OpenAI requests"""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+from ..json_codec import EncodedList, dumps
+
+
+def canonical_request_bytes(request: Dict[str, Any]) -> bytes:
+    """Serialize a request so that equal requests give identical bytes
+
+    Keys are sorted and whitespace is dropped, so dict ordering and
+    formatting differences between callers do not matter.
+    """
+    return json.dumps(
+        request,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    ).encode("utf-8")
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Get the SHA-256 hex digest identifying a converted OpenAI request"""
+    return hashlib.sha256(canonical_request_bytes(request)).hexdigest()
+
+
+def is_deterministic(request: Dict[str, Any]) -> bool:
+    """Whether a request asks for a single greedy (``temperature == 0``) completion
+
+    Only such requests are expected to produce the same output every time.
+    """
+    return request.get("temperature") == 0 and request.get("n", 1) == 1
+
+
+def prefix_key(request: Dict[str, Any], leading_messages: int = 1) -> str:
+    """Get a digest of the part of a request that stays fixed across turns
+
+    The prefix is the model, the tool definitions, the leading system
+    messages and the first ``leading_messages`` messages after them. Later
+    turns of a conversation append messages but keep this prefix, so they
+    get the same key. It is computed on every routed request, so the parts
+    are hashed in their compact encoding rather than canonicalized, and a
+    tool list from the tool definition cache reuses its stored encoding.
+    """
+    messages = request.get("messages") or []
+    system_count = 0
+    while system_count < len(messages) and messages[system_count].get("role") in (
+        "system",
+        "developer",
+    ):
+        system_count += 1
+    tools = request.get("tools")
+    digest = hashlib.sha256(dumps(request.get("model")))
+    # Compact JSON has no raw newlines, so they separate the parts
+    digest.update(b"\n")
+    digest.update(tools.encoded if isinstance(tools, EncodedList) else dumps(tools))
+    digest.update(b"\n")
+    digest.update(dumps(messages[: system_count + leading_messages]))
+    return digest.hexdigest()
@@ -0,0 +1,107 @@
+"""Cache of upstream responses for repeated deterministic requests"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .backends import CacheBackend, MemoryCacheBackend
+from .keys import is_deterministic, request_key
+
+
+class ResponseCache:
+    """Cache of upstream chat completion responses with a byte budget
+
+    Responses are stored as their JSON encoding, so the budget counts real
+    bytes and every hit decodes a fresh dict that callers may modify freely.
+    Entries expire ``ttl`` seconds after they are stored, and the backend
+    evicts the least recently used entries once its size budget would be
+    exceeded.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        deterministic_only: bool = True,
+        clock: Callable[[], float] = time.time,
+        backend: Optional[CacheBackend] = None,
+    ):
+        """Initialize the cache
+
+        Args:
+            max_bytes: Size budget of the default in-memory backend (ignored
+                when ``backend`` is given)
+            ttl: Seconds an entry stays valid (None keeps it until evicted)
+            deterministic_only: Only cache ``temperature == 0`` requests.
+                Sampled requests are expected to differ between calls.
+            clock: Wall-clock time source in seconds. Expiry times are
+                absolute so they stay valid in a backend shared between
+                processes or kept across restarts.
+            backend: Where entries are stored (in memory if None)
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.backend = backend if backend is not None else MemoryCacheBackend(max_bytes)
+        self.ttl = ttl
+        self.deterministic_only = deterministic_only
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def should_cache(self, request: Dict[str, Any]) -> bool:
+        """Whether responses to a request may be cached"""
+        return not self.deterministic_only or is_deterministic(request)
+
+    def get(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Look up the cached response for a converted OpenAI request
+
+        Returns:
+            A copy of the cached response, or None on a miss
+        """
+        if not self.should_cache(request):
+            return None
+        payload = self.backend.get(request_key(request), self._clock())
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        response: Dict[str, Any] = json.loads(payload)
+        return response
+
+    def put(self, request: Dict[str, Any], response: Dict[str, Any]) -> bool:
+        """Store the upstream response for a converted OpenAI request
+
+        Error responses, responses to ineligible requests and responses
+        larger than the whole budget are not stored.
+
+        Returns:
+            True if the response was stored
+        """
+        if "error" in response or not self.should_cache(request):
+            return False
+        payload = json.dumps(response, separators=(",", ":")).encode("utf-8")
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        return self.backend.set(request_key(request), payload, expires_at)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)"""
+        self.backend.clear()
+
+    def __len__(self) -> int:
+        entries: int = self.backend.snapshot()["entries"]
+        return entries
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return hit, miss and eviction counters and current size"""
+        stats = self.backend.snapshot()
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats.update(
+                hits=self.hits,
+                misses=self.misses,
+                hit_rate=self.hits / lookups if lookups else 0.0,
+            )
+        return stats
@@ -0,0 +1,140 @@
+"""Coalescing of identical in-flight upstream requests"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar, cast
+
+from .keys import is_deterministic, request_key
+
+T = TypeVar("T")
+
+
+class _Call:
+    """One in-flight upstream call and the callers waiting on it"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _SingleFlightBase:
+    def __init__(self, deterministic_only: bool = True):
+        """Initialize the coalescer
+
+        Args:
+            deterministic_only: Only coalesce ``temperature == 0`` requests.
+                Sampled requests are expected to differ, so sharing one
+                generation between callers would change their behavior.
+        """
+        self.deterministic_only = deterministic_only
+        self._lock = threading.Lock()
+        # Request key -> in-flight call
+        self._calls: Dict[str, Any] = {}
+        self.leaders_total = 0
+        self.coalesced_total = 0
+
+    def should_coalesce(self, request: Dict[str, Any]) -> bool:
+        """Whether a request is eligible for coalescing"""
+        return not self.deterministic_only or is_deterministic(request)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return upstream calls made and callers served by another's call"""
+        with self._lock:
+            return {
+                "leaders_total": self.leaders_total,
+                "coalesced_total": self.coalesced_total,
+                "in_flight": len(self._calls),
+            }
+
+
+class SingleFlight(_SingleFlightBase):
+    """Lets concurrent identical requests share one upstream call
+
+    The first caller for a key (the leader) makes the call; callers that
+    arrive while it is in flight wait and receive the same upstream result.
+    Each caller then converts the result itself, so no response object is
+    shared between callers.
+    """
+
+    def do(self, request: Dict[str, Any], func: Callable[[Dict[str, Any]], T]) -> T:
+        """Call ``func(request)``, or wait for an identical call in flight
+
+        Args:
+            request: Converted OpenAI request
+            func: Upstream call returning the response for ``request``
+
+        Returns:
+            The upstream result, shared with any coalesced callers
+        """
+        if not self.should_coalesce(request):
+            return func(request)
+
+        key = request_key(request)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.leaders_total += 1
+            else:
+                self.coalesced_total += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast(T, call.result)
+
+        try:
+            call.result = func(request)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return cast(T, call.result)
+
+
+class AsyncSingleFlight(_SingleFlightBase):
+    """asyncio counterpart of SingleFlight
+
+    The upstream call runs as its own task, so a leader being cancelled does
+    not cancel the call for the callers still waiting on it.
+    """
+
+    async def do(
+        self,
+        request: Dict[str, Any],
+        func: Callable[[Dict[str, Any]], Awaitable[T]],
+    ) -> T:
+        """Await ``func(request)``, or join an identical call in flight
+
+        Args:
+            request: Converted OpenAI request
+            func: Upstream coroutine function returning the response
+
+        Returns:
+            The upstream result, shared with any coalesced callers
+        """
+        if not self.should_coalesce(request):
+            return await func(request)
+
+        key = request_key(request)
+        with self._lock:
+            task = self._calls.get(key)
+            if task is None:
+                task = self._calls[key] = asyncio.ensure_future(func(request))
+                task.add_done_callback(lambda _: self._forget(key))
+                self.leaders_total += 1
+            else:
+                self.coalesced_total += 1
+        return cast(T, await asyncio.shield(task))
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
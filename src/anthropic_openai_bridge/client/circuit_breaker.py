@@ -0,0 +1,183 @@
+"""Circuit breaker that stops sending traffic to a failing endpoint"""
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from ..config.breaker_config import CircuitBreakerConfig
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed / open / half-open state machine for one upstream endpoint
+
+    While closed, outcomes are kept in a rolling time window; once the window
+    holds ``minimum_calls`` and the failure or slow-call rate crosses its
+    threshold the circuit opens and rejects calls. After ``open_seconds`` it
+    turns half-open and admits up to ``half_open_probes`` calls: if they all
+    succeed the circuit closes, and any failure opens it again.
+    """
+
+    def __init__(
+        self,
+        config: CircuitBreakerConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker
+
+        Args:
+            config: Breaker thresholds and timings
+            clock: Monotonic time source in seconds
+        """
+        self.config = config
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        # (timestamp, failed, slow) for each call in the rolling window
+        self._calls: Deque[Tuple[float, bool, bool]] = collections.deque()
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.opened_total = 0
+        self.rejected_total = 0
+        self.last_transition: Optional[Dict[str, Any]] = None
+
+    def _transition(self, state: str, reason: str, now: float) -> None:
+        self.last_transition = {
+            "from": self.state,
+            "to": state,
+            "reason": reason,
+            "at": now,
+        }
+        self.state = state
+        if state == OPEN:
+            self._opened_at = now
+            self.opened_total += 1
+        if state != CLOSED:
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+        if state == CLOSED:
+            self._calls.clear()
+
+    def _expire_open(self, now: float) -> None:
+        if self.state == OPEN and now - self._opened_at >= self.config.open_seconds:
+            self._transition(HALF_OPEN, "open timeout elapsed", now)
+
+    def _evict(self, now: float) -> None:
+        horizon = now - self.config.window_seconds
+        while self._calls and self._calls[0][0] < horizon:
+            self._calls.popleft()
+
+    def available(self) -> bool:
+        """Whether a call would currently be admitted (does not reserve a probe)"""
+        with self._lock:
+            self._expire_open(self._clock())
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN:
+                return self._probes_in_flight < self.config.half_open_probes
+            return False
+
+    def try_acquire(self) -> bool:
+        """Admit a call, reserving a probe slot when half-open
+
+        Returns:
+            True if the call may proceed
+        """
+        with self._lock:
+            self._expire_open(self._clock())
+            if self.state == CLOSED:
+                return True
+            if (
+                self.state == HALF_OPEN
+                and self._probes_in_flight < self.config.half_open_probes
+            ):
+                self._probes_in_flight += 1
+                return True
+            self.rejected_total += 1
+            return False
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit starts admitting probes"""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            elapsed = self._clock() - self._opened_at
+            return max(0.0, self.config.open_seconds - elapsed)
+
+    def record(self, failed: bool, latency: Optional[float] = None) -> None:
+        """Record the outcome of an admitted call
+
+        Args:
+            failed: Whether the call failed because of the endpoint
+            latency: Call duration in seconds, used for slow-call detection
+        """
+        slow = (
+            self.config.slow_call_seconds is not None
+            and latency is not None
+            and latency >= self.config.slow_call_seconds
+        )
+        with self._lock:
+            now = self._clock()
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if failed or slow:
+                    reason = "probe failed" if failed else "probe was slow"
+                    self._transition(OPEN, reason, now)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.config.half_open_probes:
+                    self._transition(CLOSED, "probes succeeded", now)
+                return
+            if self.state == OPEN:
+                # A call admitted before the circuit opened; nothing to decide
+                return
+
+            self._calls.append((now, failed, slow))
+            self._evict(now)
+            calls = len(self._calls)
+            if calls < self.config.minimum_calls:
+                return
+            failures = sum(1 for _, call_failed, _ in self._calls if call_failed)
+            if failures / calls >= self.config.failure_rate_threshold:
+                self._transition(
+                    OPEN, f"failure rate {failures}/{calls} in window", now
+                )
+                return
+            if self.config.slow_call_seconds is not None:
+                slow_calls = sum(1 for _, _, call_slow in self._calls if call_slow)
+                if slow_calls / calls >= self.config.slow_call_rate_threshold:
+                    self._transition(
+                        OPEN, f"slow call rate {slow_calls}/{calls} in window", now
+                    )
+
+    def cancel(self) -> None:
+        """Give back the probe slot of an admitted call that was abandoned"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the breaker's state and window statistics"""
+        with self._lock:
+            now = self._clock()
+            self._expire_open(now)
+            self._evict(now)
+            calls = len(self._calls)
+            failures = sum(1 for _, failed, _ in self._calls if failed)
+            slow_calls = sum(1 for _, _, slow in self._calls if slow)
+            return {
+                "state": self.state,
+                "window_calls": calls,
+                "failure_rate": failures / calls if calls else 0.0,
+                "slow_call_rate": slow_calls / calls if calls else 0.0,
+                "opened_total": self.opened_total,
+                "rejected_total": self.rejected_total,
+                "last_transition": (
+                    dict(self.last_transition) if self.last_transition else None
+                ),
+            }
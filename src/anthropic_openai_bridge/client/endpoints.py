@@ -0,0 +1,104 @@
+"""Runtime state for upstream endpoints"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from ..config.endpoint_config import EndpointConfig
+from .circuit_breaker import CircuitBreaker
+
+
+class Endpoint:
+    """An upstream endpoint, its SDK client and its in-flight request count
+
+    Counters are guarded by a lock so the same endpoint can be shared by
+    worker threads and by coroutines on an event loop.
+    """
+
+    def __init__(
+        self,
+        config: EndpointConfig,
+        client: Any,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        """Initialize the endpoint
+
+        Args:
+            config: Endpoint settings
+            client: OpenAI SDK client bound to the endpoint's base URL and key
+            breaker: Circuit breaker guarding the endpoint, if enabled
+        """
+        self.config = config
+        self.client = client
+        self.breaker = breaker
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.requests_total = 0
+        self.errors_total = 0
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    @property
+    def weight(self) -> float:
+        return self.config.weight
+
+    @property
+    def load(self) -> float:
+        """Outstanding requests, including one more, relative to the weight"""
+        return (self.in_flight + 1) / self.config.weight
+
+    @property
+    def available(self) -> bool:
+        """Whether the circuit breaker (if any) would admit a request"""
+        return self.breaker is None or self.breaker.available()
+
+    def acquire(self) -> bool:
+        """Record that a request is being sent to this endpoint
+
+        Returns:
+            False if the circuit breaker rejected the request
+        """
+        if self.breaker is not None and not self.breaker.try_acquire():
+            return False
+        with self._lock:
+            self.in_flight += 1
+            self.requests_total += 1
+        return True
+
+    def release(self, failed: bool = False, latency: Optional[float] = None) -> None:
+        """Record that a request to this endpoint finished
+
+        Args:
+            failed: Whether the request failed because of the endpoint
+            latency: Seconds until the endpoint responded
+        """
+        with self._lock:
+            self.in_flight -= 1
+            if failed:
+                self.errors_total += 1
+        if self.breaker is not None:
+            self.breaker.record(failed, latency)
+
+    def cancel(self) -> None:
+        """Release a request that was abandoned before it completed"""
+        with self._lock:
+            self.in_flight -= 1
+        if self.breaker is not None:
+            self.breaker.cancel()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a consistent copy of the endpoint's counters"""
+        with self._lock:
+            return {
+                "name": self.config.name,
+                "base_url": self.config.base_url,
+                "weight": self.config.weight,
+                "in_flight": self.in_flight,
+                "requests_total": self.requests_total,
+                "errors_total": self.errors_total,
+                "circuit": self.breaker.snapshot() if self.breaker else None,
+            }
+
+    def __repr__(self) -> str:
+        return f"Endpoint(name={self.name!r}, in_flight={self.in_flight})"
@@ -0,0 +1,156 @@
+"""Hedged requests: race a duplicate against a slow upstream call"""
+
+import collections
+import math
+import os
+import threading
+from typing import Any, Deque, Dict, Optional
+
+
+class LatencyTracker:
+    """Recent request latencies per model, for percentile-based hedge delays"""
+
+    def __init__(self, window: int = 500):
+        """Initialize the tracker
+
+        Args:
+            window: Number of most recent latencies kept per model
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, model: str, seconds: float) -> None:
+        """Add one observed latency"""
+        with self._lock:
+            samples = self._samples.get(model)
+            if samples is None:
+                samples = self._samples[model] = collections.deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def count(self, model: str) -> int:
+        """Number of latencies currently held for a model"""
+        with self._lock:
+            return len(self._samples.get(model, ()))
+
+    def percentile(self, model: str, q: float) -> Optional[float]:
+        """Get the ``q`` quantile (0-1) of a model's recent latencies
+
+        Returns:
+            Latency in seconds, or None if no latencies were recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(model, ()))
+        if not samples:
+            return None
+        rank = max(0, math.ceil(q * len(samples)) - 1)
+        return samples[rank]
+
+
+class HedgingPolicy:
+    """Decides when a duplicate request is sent and tracks how hedges fare
+
+    A hedge is sent once the primary request has been outstanding for
+    ``delay`` seconds, or, without a fixed delay, for the model's observed
+    ``percentile`` latency. ``max_hedge_rate`` caps hedges as a fraction of
+    requests so a slow upstream cannot double its own load.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        max_hedge_rate: float = 0.1,
+        tracker: Optional[LatencyTracker] = None,
+    ):
+        """Initialize the policy
+
+        Args:
+            delay: Fixed hedge delay in seconds. If None, the per-model
+                ``percentile`` latency is used once ``min_samples`` are known.
+            percentile: Latency quantile used as the adaptive hedge delay
+            min_samples: Latencies needed before the adaptive delay applies
+            max_hedge_rate: Largest fraction of requests that may be hedged
+            tracker: Latency tracker (a new one is created if None)
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 <= max_hedge_rate <= 1:
+            raise ValueError("max_hedge_rate must be between 0 and 1")
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_rate = max_hedge_rate
+        self.tracker = tracker or LatencyTracker()
+        self._lock = threading.Lock()
+        self.requests_total = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self.hedges_denied = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["HedgingPolicy"]:
+        """Build a policy from ``OPENAI_HEDGE_*`` environment variables
+
+        Returns:
+            Policy if ``OPENAI_HEDGE_DELAY`` or ``OPENAI_HEDGE_PERCENTILE`` is
+            set, otherwise None
+        """
+        delay = os.getenv("OPENAI_HEDGE_DELAY")
+        percentile = os.getenv("OPENAI_HEDGE_PERCENTILE")
+        if not delay and not percentile:
+            return None
+        values: Dict[str, Any] = {}
+        if delay:
+            values["delay"] = float(delay)
+        if percentile:
+            values["percentile"] = float(percentile)
+        if os.getenv("OPENAI_HEDGE_MAX_RATE"):
+            values["max_hedge_rate"] = float(os.environ["OPENAI_HEDGE_MAX_RATE"])
+        return cls(**values)
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """Count a request and get how long to wait before hedging it
+
+        Returns:
+            Delay in seconds, or None if the request should not be hedged
+        """
+        with self._lock:
+            self.requests_total += 1
+        if self.delay is not None:
+            return self.delay
+        if self.tracker.count(model) < self.min_samples:
+            return None
+        return self.tracker.percentile(model, self.percentile)
+
+    def try_fire(self) -> bool:
+        """Reserve a hedge if the hedge rate cap allows it"""
+        with self._lock:
+            if self.hedges_fired + 1 <= self.max_hedge_rate * self.requests_total:
+                self.hedges_fired += 1
+                return True
+            self.hedges_denied += 1
+            return False
+
+    def record(self, model: str, seconds: float, hedge_won: bool = False) -> None:
+        """Record a completed request's latency and whether the hedge won"""
+        self.tracker.record(model, seconds)
+        if hedge_won:
+            with self._lock:
+                self.hedges_won += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return hedge counters"""
+        with self._lock:
+            requests = self.requests_total
+            return {
+                "requests_total": requests,
+                "hedges_fired": self.hedges_fired,
+                "hedges_won": self.hedges_won,
+                "hedges_denied": self.hedges_denied,
+                "hedge_rate": self.hedges_fired / requests if requests else 0.0,
+                "win_rate": (
+                    self.hedges_won / self.hedges_fired if self.hedges_fired else 0.0
+                ),
+            }
@@ -0,0 +1,218 @@
+"""Load balancing strategies for spreading requests over upstream endpoints"""
+
+import bisect
+import hashlib
+import math
+import random
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+from ..cache.keys import prefix_key
+from .endpoints import Endpoint
+
+
+class LoadBalancer:
+    """Chooses the endpoint that serves the next request"""
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        """Initialize the balancer
+
+        Args:
+            rng: Random source used for tie-breaking and sampling
+        """
+        self._random = rng or random.Random()
+
+    def select(
+        self,
+        endpoints: Sequence[Endpoint],
+        request: Optional[Dict[str, Any]] = None,
+    ) -> Endpoint:
+        """Pick an endpoint
+
+        Args:
+            endpoints: Candidate endpoints (at least one)
+            request: The converted OpenAI request being routed, if known
+
+        Returns:
+            The endpoint to send the request to
+        """
+        raise NotImplementedError
+
+
+class LeastOutstandingBalancer(LoadBalancer):
+    """Send each request to the endpoint with the fewest weighted in-flight requests
+
+    Scans every endpoint, so it reacts immediately to a slow node. Ties are
+    broken at random so idle endpoints share the load evenly.
+    """
+
+    def select(
+        self,
+        endpoints: Sequence[Endpoint],
+        request: Optional[Dict[str, Any]] = None,
+    ) -> Endpoint:
+        best = min(endpoint.load for endpoint in endpoints)
+        candidates = [endpoint for endpoint in endpoints if endpoint.load == best]
+        if len(candidates) == 1:
+            return candidates[0]
+        return self._random.choice(candidates)
+
+
+class PowerOfTwoChoicesBalancer(LoadBalancer):
+    """Sample two endpoints by weight and keep the less loaded one
+
+    Costs O(1) per request regardless of the number of endpoints and avoids
+    the herding that a global least-loaded choice can cause when in-flight
+    counts are briefly stale.
+    """
+
+    def select(
+        self,
+        endpoints: Sequence[Endpoint],
+        request: Optional[Dict[str, Any]] = None,
+    ) -> Endpoint:
+        if len(endpoints) == 1:
+            return endpoints[0]
+        weights = [endpoint.weight for endpoint in endpoints]
+        first, second = self._random.choices(endpoints, weights=weights, k=2)
+        if first is second:
+            second = self._random.choice(
+                [endpoint for endpoint in endpoints if endpoint is not first]
+            )
+        return first if first.load <= second.load else second
+
+
+def _ring_hash(value: str) -> int:
+    """Stable 64-bit position on the hash ring (same in every process)"""
+    return int.from_bytes(
+        hashlib.blake2b(value.encode(), digest_size=8).digest(), "big"
+    )
+
+
+class PrefixAffinityBalancer(LoadBalancer):
+    """Route requests sharing a prompt prefix to the same endpoint
+
+    Requests are placed on a consistent-hash ring by a digest of their
+    model, tools, system prompt and first message, so every turn of a
+    conversation reaches the replica that already holds its prefix in the
+    KV cache. Each endpoint gets ring points in proportion to its weight,
+    and adding or losing an endpoint only moves the conversations that
+    hashed to it.
+
+    Load is bounded: an endpoint may hold at most ``load_factor`` times its
+    weighted share of the in-flight requests. A request whose preferred
+    endpoint is full walks on around the ring to the next one with room,
+    so a hot conversation spills over instead of queueing.
+    """
+
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        load_factor: float = 1.25,
+        points_per_weight: int = 100,
+        leading_messages: int = 1,
+    ):
+        """Initialize the balancer
+
+        Args:
+            rng: Random source used when a request has no prefix to route by
+            load_factor: Largest multiple of its fair share of in-flight
+                requests an endpoint may hold (above 1)
+            points_per_weight: Ring points per unit of endpoint weight
+            leading_messages: Non-system messages included in the prefix
+        """
+        if load_factor <= 1:
+            raise ValueError("load_factor must be greater than 1")
+        super().__init__(rng)
+        self.load_factor = load_factor
+        self.points_per_weight = points_per_weight
+        self.leading_messages = leading_messages
+        self._fallback = LeastOutstandingBalancer(rng)
+        self._lock = threading.Lock()
+        # Candidate set -> sorted (position, endpoint index) ring points
+        self._rings: Dict[Tuple[Tuple[str, float], ...], List[Tuple[int, int]]] = {}
+
+    def _ring(self, endpoints: Sequence[Endpoint]) -> List[Tuple[int, int]]:
+        """Get the ring for a candidate set, building it on first use
+
+        Points depend only on endpoint names, so a subset's ring is the full
+        ring minus the missing endpoints' points.
+        """
+        signature = tuple((endpoint.name, endpoint.weight) for endpoint in endpoints)
+        with self._lock:
+            ring = self._rings.get(signature)
+        if ring is not None:
+            return ring
+        ring = sorted(
+            (_ring_hash(f"{endpoint.name}#{point}"), index)
+            for index, endpoint in enumerate(endpoints)
+            for point in range(max(1, round(self.points_per_weight * endpoint.weight)))
+        )
+        with self._lock:
+            # Candidate sets change only when circuits open or retries fail
+            # over, so a handful of rings covers steady state
+            if len(self._rings) >= 64:
+                self._rings.clear()
+            self._rings[signature] = ring
+        return ring
+
+    def select(
+        self,
+        endpoints: Sequence[Endpoint],
+        request: Optional[Dict[str, Any]] = None,
+    ) -> Endpoint:
+        if request is None or not request.get("messages"):
+            return self._fallback.select(endpoints)
+        if len(endpoints) == 1:
+            return endpoints[0]
+
+        total_in_flight = sum(endpoint.in_flight for endpoint in endpoints) + 1
+        total_weight = sum(endpoint.weight for endpoint in endpoints)
+        ring = self._ring(endpoints)
+        start = bisect.bisect(
+            ring, (_ring_hash(prefix_key(request, self.leading_messages)),)
+        )
+        checked: Set[int] = set()
+        for offset in range(len(ring)):
+            index = ring[(start + offset) % len(ring)][1]
+            if index in checked:
+                continue
+            endpoint = endpoints[index]
+            capacity = math.ceil(
+                self.load_factor * total_in_flight * endpoint.weight / total_weight
+            )
+            if endpoint.in_flight < capacity:
+                return endpoint
+            checked.add(index)
+            if len(checked) == len(endpoints):
+                break
+        return self._fallback.select(endpoints)
+
+
+LOAD_BALANCERS: Dict[str, Type[LoadBalancer]] = {
+    "least_outstanding": LeastOutstandingBalancer,
+    "power_of_two": PowerOfTwoChoicesBalancer,
+    "prefix_affinity": PrefixAffinityBalancer,
+}
+
+
+def create_load_balancer(
+    strategy: str, rng: Optional[random.Random] = None
+) -> LoadBalancer:
+    """Create a load balancer by strategy name
+
+    Args:
+        strategy: One of ``LOAD_BALANCERS``
+        rng: Random source passed to the balancer
+
+    Raises:
+        ValueError: If the strategy is unknown
+    """
+    try:
+        balancer_class = LOAD_BALANCERS[strategy]
+    except KeyError:
+        raise ValueError(
+            f"Unknown load balancing strategy {strategy!r}; "
+            f"expected one of {sorted(LOAD_BALANCERS)}"
+        ) from None
+    return balancer_class(rng)
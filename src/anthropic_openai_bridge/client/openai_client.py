@@ -1,11 +1,292 @@
-from typing import Any, Dict, Union
+"""OpenAI client wrapper"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
 
 import openai
+from openai.types.chat import ChatCompletionChunk
 
 from ..config.config_manager import ConfigManager
+from ..config.endpoint_config import EndpointConfig
+from ..errors import CircuitOpenError, error_from_exception
+from ..httpx_compat import httpx
+from ..json_codec import EncodedList, dumps_request
+from ..json_codec import loads as json_loads
+from ..tokens.counter import TokenCounter
+from ..tokens.tokenizers import load_tokenizer
+from .circuit_breaker import CircuitBreaker
+from .endpoints import Endpoint
+from .hedging import HedgingPolicy
+from .load_balancer import create_load_balancer
+from .pool_metrics import AsyncInstrumentedTransport, InstrumentedTransport, PoolMetrics
+from .rate_limiter import RateLimiter, Reservation
+from .scheduler import RequestScheduler, ScheduledRequest
+
+
+class _HedgeLost(Exception):
+    """Raised in a losing hedged attempt to stop its retries"""
+
+
+def _build_client_kwargs(
+    config: ConfigManager, endpoint: EndpointConfig, http_client: Optional[Any]
+) -> Dict[str, Any]:
+    """Build keyword arguments shared by the sync and async OpenAI clients"""
+    client_kwargs: Dict[str, Any] = {
+        "api_key": endpoint.api_key or config.openai_api_key,
+        # Retries are handled by the bridge's RetryPolicy
+        "max_retries": 0,
+    }
+
+    # Add custom base URL if specified
+    if endpoint.base_url:
+        client_kwargs["base_url"] = endpoint.base_url
+
+    # Add custom httpx client if specified
+    if http_client:
+        client_kwargs["http_client"] = http_client
+
+    return client_kwargs
+
+
+# Chat completions path, for requests sent with a body encoded by the bridge
+CHAT_COMPLETIONS_PATH = "/chat/completions"
+
+# Older OpenAI SDK releases cannot post a pre-encoded body; they are sent the
+# request dict, which encodes the pre-encoded parts again
+_POST_ACCEPTS_CONTENT = "content" in inspect.signature(openai.OpenAI.post).parameters
+
+
+def _encoded_body(request: Dict[str, Any]) -> Optional[bytes]:
+    """Encode a request that carries pre-encoded parts, else leave it to the SDK"""
+    if not _POST_ACCEPTS_CONTENT:
+        return None
+    if any(isinstance(value, EncodedList) for value in request.values()):
+        return dumps_request(request)
+    return None
+
+
+def _build_stream_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a streaming request that reports usage in the final chunk"""
+    return {**request, "stream": True, "stream_options": {"include_usage": True}}
+
+
+def _used_tokens(response: Any) -> Optional[int]:
+    """Get ``usage.total_tokens`` from a response or chunk, if reported"""
+    if isinstance(response, dict):
+        total = (response.get("usage") or {}).get("total_tokens")
+    else:
+        total = getattr(getattr(response, "usage", None), "total_tokens", None)
+    return total if isinstance(total, int) else None
+
+
+def _response_to_dict(response: Any) -> Dict[str, Any]:
+    """Get a response as a dict; raw responses are parsed to one already"""
+    if isinstance(response, dict):
+        return response
+    return response.model_dump()  # type: ignore[no-any-return]
+
+
+def _error_to_dict(error: Exception) -> Dict[str, Any]:
+    """Convert OpenAI exceptions to consistent format"""
+    return error_from_exception(error).to_dict()
+
+
+class _BaseClientWrapper:
+    """Endpoint routing shared by the sync and async client wrappers"""
+
+    config: ConfigManager
+    pool_metrics: Optional[PoolMetrics]
+
+    def _init_endpoints(
+        self, client_class: Callable[..., Any], http_client: Optional[Any]
+    ) -> None:
+        """Create one SDK client per endpoint; they share the HTTP pool"""
+        breaker_config = self.config.circuit_breaker
+        self.endpoints = [
+            Endpoint(
+                endpoint,
+                client_class(
+                    **_build_client_kwargs(self.config, endpoint, http_client)
+                ),
+                CircuitBreaker(breaker_config) if breaker_config else None,
+            )
+            for endpoint in self.config.openai_endpoints
+        ]
+        self.client = self.endpoints[0].client
+        self.load_balancer = create_load_balancer(self.config.load_balancing)
+        self.retry_policy = self.config.retry_policy
+        self.hedging: Optional[HedgingPolicy] = self.config.hedging
+        self.raw_responses = self.config.raw_responses
+        self.scheduler: Optional[RequestScheduler] = self.config.scheduler
+        rate_limit = self.config.rate_limit
+        self.rate_limiter: Optional[RateLimiter] = None
+        # Rate limits and cost-based scheduling share one token estimate memo
+        scheduler_needs_counter = (
+            self.scheduler is not None
+            and self.scheduler.policy.uses_cost
+            and self.scheduler.counter is None
+        )
+        if rate_limit is not None or scheduler_needs_counter:
+            counter = TokenCounter(load_tokenizer(self.config.tokenizer_path))
+            if rate_limit is not None:
+                self.rate_limiter = RateLimiter(rate_limit, counter)
+            if self.scheduler is not None and scheduler_needs_counter:
+                self.scheduler.counter = counter
+
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Get connection pool counters, or None if the pool is not managed here"""
+        return self.pool_metrics.snapshot() if self.pool_metrics else None
+
+    def endpoint_stats(self) -> List[Dict[str, Any]]:
+        """Get per-endpoint in-flight, request, error and circuit breaker state"""
+        return [endpoint.snapshot() for endpoint in self.endpoints]
+
+    def hedging_stats(self) -> Optional[Dict[str, Any]]:
+        """Get hedge counters, or None when hedging is disabled"""
+        return self.hedging.snapshot() if self.hedging else None
+
+    def rate_limit_stats(self) -> Optional[Dict[str, Any]]:
+        """Get rate limiter counters, or None when rate limiting is disabled"""
+        return self.rate_limiter.snapshot() if self.rate_limiter else None
+
+    def scheduler_stats(self) -> Optional[Dict[str, Any]]:
+        """Get queue wait times per request class, or None without a scheduler"""
+        return self.scheduler.snapshot() if self.scheduler else None
+
+    def release_slot(self, job: Optional[ScheduledRequest]) -> None:
+        """Give an admitted request's slot back to the scheduler"""
+        if job is not None and self.scheduler is not None:
+            self.scheduler.release(job)
+
+    def reserve_rate_limit(
+        self, endpoint: Endpoint, request: Dict[str, Any]
+    ) -> Optional[Reservation]:
+        """Take rate limit budget for a request to a selected endpoint
 
+        Wait out the reservation before ``claim_endpoint``, so the wait holds
+        neither the endpoint's in-flight slot nor a half-open circuit's probe.
 
-class OpenAIClientWrapper:
+        Returns:
+            Reservation to sleep on and settle, or None without rate limiting
+        """
+        if self.rate_limiter is None:
+            return None
+        return self.rate_limiter.reserve(endpoint.name, request)
+
+    def settle_rate_limit(
+        self, reservation: Optional[Reservation], used_tokens: Optional[int]
+    ) -> None:
+        """Correct a reservation's token estimate with the reported usage"""
+        if reservation is not None and self.rate_limiter is not None:
+            self.rate_limiter.settle(reservation, used_tokens)
+
+    def select_endpoint(
+        self,
+        exclude: Optional[List[Endpoint]] = None,
+        request: Optional[Dict[str, Any]] = None,
+    ) -> Endpoint:
+        """Choose the endpoint for the next request
+
+        Endpoints whose circuit is open are skipped. Endpoints in ``exclude``
+        (for example ones that already failed this request) are only chosen
+        when nothing else is available. ``request`` is passed to the load
+        balancer for strategies that route by content.
+
+        Raises:
+            CircuitOpenError: If every endpoint's circuit is open
+        """
+        if len(self.endpoints) == 1 and self.endpoints[0].breaker is None:
+            return self.endpoints[0]
+        available = [endpoint for endpoint in self.endpoints if endpoint.available]
+        if exclude:
+            preferred = [endpoint for endpoint in available if endpoint not in exclude]
+            available = preferred or available
+        if not available:
+            retry_after = min(
+                endpoint.breaker.retry_after()
+                for endpoint in self.endpoints
+                if endpoint.breaker is not None
+            )
+            raise CircuitOpenError(
+                "All upstream endpoints are unavailable (circuit open)", retry_after
+            )
+        if len(available) == 1:
+            return available[0]
+        return self.load_balancer.select(available, request)
+
+    def acquire_endpoint(
+        self,
+        tried: Optional[List[Endpoint]] = None,
+        request: Optional[Dict[str, Any]] = None,
+    ) -> Endpoint:
+        """Select an endpoint and reserve an in-flight slot on it
+
+        Args:
+            tried: Endpoints already used for this request. The chosen
+                endpoint is appended so retries fail over elsewhere.
+            request: The OpenAI request being sent
+        """
+        while True:
+            endpoint = self.select_endpoint(tried, request)
+            # A half-open circuit can run out of probe slots between the two calls
+            if endpoint.acquire():
+                if tried is not None:
+                    tried.append(endpoint)
+                return endpoint
+
+    def claim_endpoint(
+        self,
+        endpoint: Endpoint,
+        reservation: Optional[Reservation],
+        tried: List[Endpoint],
+        request: Dict[str, Any],
+    ) -> Endpoint:
+        """Reserve an in-flight slot on an endpoint picked by ``select_endpoint``
+
+        Without rate limiting this falls back to another endpoint like
+        ``acquire_endpoint`` when the circuit rejects the request.
+
+        Raises:
+            CircuitOpenError: If the circuit stopped admitting requests while
+                the caller waited on its rate limit reservation
+        """
+        if reservation is None:
+            if endpoint.acquire():
+                tried.append(endpoint)
+                return endpoint
+            return self.acquire_endpoint(tried, request)
+
+        tried.append(endpoint)
+        if not endpoint.acquire():
+            self.settle_rate_limit(reservation, 0)
+            retry_after = endpoint.breaker.retry_after() if endpoint.breaker else 0.0
+            raise CircuitOpenError(
+                f"Endpoint {endpoint.name} is unavailable (circuit open)",
+                retry_after,
+            )
+        return endpoint
+
+    @staticmethod
+    def release_endpoint(
+        endpoint: Endpoint, latency: float, error: Optional[Exception] = None
+    ) -> None:
+        """Release an endpoint, reporting the outcome to its circuit breaker
+
+        Args:
+            endpoint: Endpoint reserved with ``acquire_endpoint``
+            latency: Seconds until the upstream responded (or failed)
+            error: Exception raised by the call, if any. Client errors such as
+                a 400 do not count against the endpoint.
+        """
+        failed = error is not None and error_from_exception(error).endpoint_fault
+        endpoint.release(failed, latency)
+
+
+class OpenAIClientWrapper(_BaseClientWrapper):
     """Wrapper for OpenAI client with configuration management"""
 
     def __init__(self, config_manager: ConfigManager):
@@ -15,19 +296,23 @@ class OpenAIClientWrapper:
             config_manager: Configuration manager instance
         """
         self.config = config_manager
+        self.pool_metrics: Optional[PoolMetrics] = None
 
-        # Initialize OpenAI client
-        client_kwargs: Dict[str, Any] = {"api_key": self.config.openai_api_key}
-
-        # Add custom base URL if specified
-        if self.config.openai_base_url:
-            client_kwargs["base_url"] = self.config.openai_base_url
-
-        # Add custom httpx client if specified
-        if self.config.httpx_client:
-            client_kwargs["http_client"] = self.config.httpx_client
+        # Build a pooled, instrumented httpx client when pool settings are given
+        http_client = self.config.httpx_client
+        pool_config = self.config.connection_pool
+        if pool_config is not None and not http_client:
+            transport = InstrumentedTransport(pool_config)
+            self.pool_metrics = transport.metrics
+            http_client = httpx.Client(
+                transport=transport, timeout=pool_config.httpx_timeout()
+            )
 
-        self.client = openai.OpenAI(**client_kwargs)
+        # Initialize one OpenAI client per endpoint
+        self._init_endpoints(openai.OpenAI, http_client)
+        self._hedge_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+        self._closed = False
 
     def create_chat_completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Create a chat completion using OpenAI API
@@ -38,15 +323,455 @@ class OpenAIClientWrapper:
         Returns:
             OpenAI response dictionary
         """
+        tried: List[Endpoint] = []
+        job: Optional[ScheduledRequest] = None
+        try:
+            if self.scheduler is not None:
+                job = self.scheduler.acquire(request)
+            if self.hedging is not None:
+                response = self._create_hedged(request, tried, self.hedging)
+            else:
+                response = self.retry_policy.call(lambda: self._create(request, tried))
+        except Exception as e:
+            return _error_to_dict(e)
+        finally:
+            self.release_slot(job)
+        return _response_to_dict(response)
+
+    def _create_hedged(
+        self, request: Dict[str, Any], tried: List[Endpoint], hedging: HedgingPolicy
+    ) -> Any:
+        """Send the request, racing a duplicate against it if it is slow
+
+        Both attempts share ``tried``, so the hedge goes to a different
+        endpoint. The primary attempt runs on the calling thread and only the
+        hedge takes a pool thread, fired once the delay has passed since the
+        primary started. A thread cannot be interrupted, so the caller returns
+        when its own upstream call does, using the hedge's response if that
+        arrived first. A losing attempt makes no further retries.
+        """
+        model = request.get("model", "")
+        delay = hedging.hedge_delay(model)
+        started = time.perf_counter()
+
+        if delay is None:
+            response = self.retry_policy.call(lambda: self._create(request, tried))
+            hedging.record(model, time.perf_counter() - started)
+            return response
+
+        hedge_at = started + delay
+        decided = threading.Event()
+        lock = threading.Lock()
+        hedge_fired = False
+
+        def stop_when_decided(seconds: float) -> None:
+            # Losers stop between retries instead of calling the upstream again
+            if decided.wait(seconds):
+                raise _HedgeLost()
+
+        def attempt() -> Any:
+            return self.retry_policy.call(
+                lambda: self._create(request, tried), sleep=stop_when_decided
+            )
+
+        def delayed_hedge() -> Any:
+            nonlocal hedge_fired
+            if decided.wait(max(0.0, hedge_at - time.perf_counter())):
+                raise _HedgeLost()
+            with lock:
+                if decided.is_set() or not hedging.try_fire():
+                    raise _HedgeLost()
+                hedge_fired = True
+            response = attempt()
+            decided.set()
+            return response
+
+        # Only the hedge needs a thread; the primary runs on the caller's
+        hedge = self._get_hedge_executor().submit(delayed_hedge)
+        try:
+            try:
+                response = attempt()
+            except Exception as e:
+                with lock:
+                    fired = hedge_fired
+                    decided.set()
+                if not fired:
+                    raise
+                try:
+                    response = hedge.result()
+                except Exception:
+                    raise e
+                hedging.record(model, time.perf_counter() - started, True)
+                return response
+
+            decided.set()
+            won = hedge.done() and not hedge.cancelled() and hedge.exception() is None
+            if won:
+                response = hedge.result()
+            hedging.record(model, time.perf_counter() - started, won)
+            return response
+        finally:
+            decided.set()
+            hedge.cancel()
+
+    def _get_hedge_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._hedge_lock:
+            if self._closed:
+                raise RuntimeError("The client wrapper is closed")
+            if self._hedge_executor is None:
+                # At most one hedge per connection can make progress
+                pool_config = self.config.connection_pool
+                max_workers = (
+                    pool_config.max_connections
+                    if pool_config is not None
+                    else openai.DEFAULT_CONNECTION_LIMITS.max_connections
+                )
+                self._hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="bridge-hedge"
+                )
+            return self._hedge_executor
+
+    def close(self) -> None:
+        """Stop the hedging threads and close the underlying HTTP connection pool"""
+        with self._hedge_lock:
+            self._closed = True
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        for endpoint in self.endpoints:
+            endpoint.client.close()
+
+    def _create(self, request: Dict[str, Any], tried: List[Endpoint]) -> Any:
+        """Make one upstream attempt on the endpoint chosen by the load balancer"""
+        endpoint = self.select_endpoint(tried, request)
+        reservation = self.reserve_rate_limit(endpoint, request)
+        if reservation is not None and reservation.wait > 0:
+            time.sleep(reservation.wait)
+        endpoint = self.claim_endpoint(endpoint, reservation, tried, request)
+        body = _encoded_body(request)
+        started = time.perf_counter()
+        try:
+            if body is not None:
+                # Send the spliced body as-is and decode the reply directly
+                raw_body = endpoint.client.post(
+                    CHAT_COMPLETIONS_PATH, cast_to=bytes, content=body
+                )
+                response = json_loads(raw_body)
+            elif self.raw_responses:
+                # Decode the body once instead of building a pydantic model
+                completions = endpoint.client.chat.completions
+                raw = completions.with_raw_response.create(**request)
+                response = json_loads(raw.content)
+            else:
+                response = endpoint.client.chat.completions.create(**request)
+        except Exception as e:
+            self.release_endpoint(endpoint, time.perf_counter() - started, e)
+            self.settle_rate_limit(reservation, 0)
+            raise
+        self.release_endpoint(endpoint, time.perf_counter() - started)
+        self.settle_rate_limit(reservation, _used_tokens(response))
+        return response
+
+    def create_chat_completion_stream(
+        self, request: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream a chat completion using OpenAI API
+
+        Args:
+            request: OpenAI-formatted request dictionary
+
+        Yields:
+            OpenAI chunk dictionaries, or a single error dictionary on failure
+        """
+        stream_request = _build_stream_request(request)
+        stream_body = _encoded_body(stream_request)
+        tried: List[Endpoint] = []
+        endpoint: Optional[Endpoint] = None
+        # Time to open the stream; generation time is not held against the endpoint
+        latency = 0.0
+        error: Optional[Exception] = None
+        stream = None
+
+        reservation: Optional[Reservation] = None
+        used_tokens: Optional[int] = None
+
+        def open_stream() -> Any:
+            nonlocal endpoint, latency, reservation
+            selected = self.select_endpoint(tried, request)
+            reservation = self.reserve_rate_limit(selected, request)
+            if reservation is not None and reservation.wait > 0:
+                time.sleep(reservation.wait)
+            try:
+                endpoint = self.claim_endpoint(selected, reservation, tried, request)
+            except Exception:
+                reservation = None
+                raise
+            started = time.perf_counter()
+            try:
+                if stream_body is not None:
+                    opened = endpoint.client.post(
+                        CHAT_COMPLETIONS_PATH,
+                        cast_to=ChatCompletionChunk,
+                        content=stream_body,
+                        stream=True,
+                        stream_cls=openai.Stream[ChatCompletionChunk],
+                    )
+                else:
+                    completions = endpoint.client.chat.completions
+                    opened = completions.create(**stream_request)
+            except Exception as e:
+                self.release_endpoint(endpoint, time.perf_counter() - started, e)
+                self.settle_rate_limit(reservation, 0)
+                endpoint = reservation = None
+                raise
+            latency = time.perf_counter() - started
+            return opened
+
+        job: Optional[ScheduledRequest] = None
+        try:
+            if self.scheduler is not None:
+                job = self.scheduler.acquire(request)
+            # Only opening the stream is retried; once chunks flow, errors end it
+            stream = self.retry_policy.call(open_stream)
+            for chunk in stream:
+                used_tokens = _used_tokens(chunk) or used_tokens
+                yield chunk.model_dump()
+        except Exception as e:
+            error = e
+            yield _error_to_dict(e)
+        finally:
+            if endpoint is not None:
+                self.release_endpoint(endpoint, latency, error)
+            self.settle_rate_limit(reservation, used_tokens)
+            self.release_slot(job)
+            if stream is not None and hasattr(stream, "close"):
+                stream.close()
+
+
+class AsyncOpenAIClientWrapper(_BaseClientWrapper):
+    """Wrapper for the asyncio OpenAI client with configuration management"""
+
+    def __init__(self, config_manager: ConfigManager):
+        """Initialize async OpenAI client wrapper
+
+        Args:
+            config_manager: Configuration manager instance. A custom httpx client,
+                if provided, must be an ``httpx.AsyncClient``.
+        """
+        self.config = config_manager
+        self.pool_metrics: Optional[PoolMetrics] = None
+
+        # Build a pooled, instrumented httpx client when pool settings are given
+        http_client = self.config.httpx_client
+        pool_config = self.config.connection_pool
+        if pool_config is not None and not http_client:
+            transport = AsyncInstrumentedTransport(pool_config)
+            self.pool_metrics = transport.metrics
+            http_client = httpx.AsyncClient(
+                transport=transport, timeout=pool_config.httpx_timeout()
+            )
+
+        # Initialize one AsyncOpenAI client per endpoint
+        self._init_endpoints(openai.AsyncOpenAI, http_client)
+
+    async def create_chat_completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a chat completion using the OpenAI API without blocking
+
+        Args:
+            request: OpenAI-formatted request dictionary
+
+        Returns:
+            OpenAI response dictionary
+        """
+        tried: List[Endpoint] = []
+        job: Optional[ScheduledRequest] = None
         try:
-            response = self.client.chat.completions.create(**request)
-            return response.model_dump()  # type: ignore
+            if self.scheduler is not None:
+                job = await self.scheduler.aacquire(request)
+            if self.hedging is not None:
+                response = await self._create_hedged(request, tried, self.hedging)
+            else:
+                response = await self.retry_policy.acall(
+                    lambda: self._create(request, tried)
+                )
         except Exception as e:
-            # Convert OpenAI exceptions to consistent format
-            return {
-                "error": {
-                    "message": str(e),
-                    "type": "api_error",
-                    "code": getattr(e, "code", "unknown"),
-                }
-            }
+            return _error_to_dict(e)
+        finally:
+            self.release_slot(job)
+        return _response_to_dict(response)
+
+    async def _create_hedged(
+        self, request: Dict[str, Any], tried: List[Endpoint], hedging: HedgingPolicy
+    ) -> Any:
+        """Send the request, racing a duplicate against it if it is slow
+
+        Both attempts share ``tried``, so the hedge goes to a different
+        endpoint. The losing attempt is cancelled.
+        """
+        model = request.get("model", "")
+        delay = hedging.hedge_delay(model)
+        started = time.perf_counter()
+
+        def attempt() -> Any:
+            return self.retry_policy.acall(lambda: self._create(request, tried))
+
+        if delay is None:
+            response = await attempt()
+            hedging.record(model, time.perf_counter() - started)
+            return response
+
+        primary = asyncio.ensure_future(attempt())
+        hedge: Optional["asyncio.Future[Any]"] = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not hedging.try_fire():
+                response = await primary
+                hedging.record(model, time.perf_counter() - started)
+                return response
+
+            hedge = asyncio.ensure_future(attempt())
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        hedging.record(
+                            model, time.perf_counter() - started, task is hedge
+                        )
+                        return task.result()
+            return primary.result()
+        finally:
+            # Also reached when the caller is cancelled mid-wait
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _create(self, request: Dict[str, Any], tried: List[Endpoint]) -> Any:
+        """Make one upstream attempt on the endpoint chosen by the load balancer"""
+        endpoint = self.select_endpoint(tried, request)
+        reservation = self.reserve_rate_limit(endpoint, request)
+        if reservation is not None and reservation.wait > 0:
+            try:
+                await asyncio.sleep(reservation.wait)
+            except asyncio.CancelledError:
+                self.settle_rate_limit(reservation, 0)
+                raise
+        endpoint = self.claim_endpoint(endpoint, reservation, tried, request)
+        body = _encoded_body(request)
+        started = time.perf_counter()
+        try:
+            if body is not None:
+                # Send the spliced body as-is and decode the reply directly
+                raw_body = await endpoint.client.post(
+                    CHAT_COMPLETIONS_PATH, cast_to=bytes, content=body
+                )
+                response = json_loads(raw_body)
+            elif self.raw_responses:
+                # Decode the body once instead of building a pydantic model
+                completions = endpoint.client.chat.completions
+                raw = await completions.with_raw_response.create(**request)
+                response = json_loads(raw.content)
+            else:
+                response = await endpoint.client.chat.completions.create(**request)
+        except asyncio.CancelledError:
+            endpoint.cancel()
+            self.settle_rate_limit(reservation, 0)
+            raise
+        except Exception as e:
+            self.release_endpoint(endpoint, time.perf_counter() - started, e)
+            self.settle_rate_limit(reservation, 0)
+            raise
+        self.release_endpoint(endpoint, time.perf_counter() - started)
+        self.settle_rate_limit(reservation, _used_tokens(response))
+        return response
+
+    async def create_chat_completion_stream(
+        self, request: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a chat completion using the OpenAI API without blocking
+
+        Args:
+            request: OpenAI-formatted request dictionary
+
+        Yields:
+            OpenAI chunk dictionaries, or a single error dictionary on failure
+        """
+        stream_request = _build_stream_request(request)
+        stream_body = _encoded_body(stream_request)
+        tried: List[Endpoint] = []
+        endpoint: Optional[Endpoint] = None
+        # Time to open the stream; generation time is not held against the endpoint
+        latency = 0.0
+        error: Optional[Exception] = None
+        stream = None
+
+        reservation: Optional[Reservation] = None
+        used_tokens: Optional[int] = None
+
+        async def open_stream() -> Any:
+            nonlocal endpoint, latency, reservation
+            selected = self.select_endpoint(tried, request)
+            reservation = self.reserve_rate_limit(selected, request)
+            try:
+                if reservation is not None and reservation.wait > 0:
+                    await asyncio.sleep(reservation.wait)
+                endpoint = self.claim_endpoint(selected, reservation, tried, request)
+            except asyncio.CancelledError:
+                self.settle_rate_limit(reservation, 0)
+                reservation = None
+                raise
+            except Exception:
+                reservation = None
+                raise
+            started = time.perf_counter()
+            try:
+                if stream_body is not None:
+                    opened = await endpoint.client.post(
+                        CHAT_COMPLETIONS_PATH,
+                        cast_to=ChatCompletionChunk,
+                        content=stream_body,
+                        stream=True,
+                        stream_cls=openai.AsyncStream[ChatCompletionChunk],
+                    )
+                else:
+                    completions = endpoint.client.chat.completions
+                    opened = await completions.create(**stream_request)
+            except asyncio.CancelledError:
+                endpoint.cancel()
+                self.settle_rate_limit(reservation, 0)
+                endpoint = reservation = None
+                raise
+            except Exception as e:
+                self.release_endpoint(endpoint, time.perf_counter() - started, e)
+                self.settle_rate_limit(reservation, 0)
+                endpoint = reservation = None
+                raise
+            latency = time.perf_counter() - started
+            return opened
+
+        job: Optional[ScheduledRequest] = None
+        try:
+            if self.scheduler is not None:
+                job = await self.scheduler.aacquire(request)
+            # Only opening the stream is retried; once chunks flow, errors end it
+            stream = await self.retry_policy.acall(open_stream)
+            async for chunk in stream:
+                used_tokens = _used_tokens(chunk) or used_tokens
+                yield chunk.model_dump()
+        except Exception as e:
+            error = e
+            yield _error_to_dict(e)
+        finally:
+            if endpoint is not None:
+                self.release_endpoint(endpoint, latency, error)
+            self.settle_rate_limit(reservation, used_tokens)
+            self.release_slot(job)
+            if stream is not None and hasattr(stream, "close"):
+                await stream.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        for endpoint in self.endpoints:
+            await endpoint.client.close()
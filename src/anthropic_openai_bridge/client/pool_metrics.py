@@ -0,0 +1,238 @@
+"""Connection pool instrumentation for the upstream httpx transport"""
+
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+from ..config.pool_config import ConnectionPoolConfig
+from ..httpx_compat import httpx
+
+_HEADERS_SENT_EVENTS = (
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+)
+_CONNECT_STARTED = "connection.connect_tcp.started"
+
+
+class PoolMetrics:
+    """Thread-safe counters describing upstream connection pool usage
+
+    ``wait`` is the time a request spent waiting for a pooled connection
+    before a new connection was opened or its headers were sent on an
+    existing one. TCP/TLS setup time is tracked separately as ``connect``.
+    """
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests_total = 0
+        self.connections_opened = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.connect_seconds_total = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the pool's connection budget currently in use"""
+        return self.in_flight / self.max_connections
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.requests_total += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def request_finished(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def record_connect(self, seconds: float) -> None:
+        with self._lock:
+            self.connections_opened += 1
+            self.connect_seconds_total += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a consistent copy of all counters"""
+        with self._lock:
+            requests = self.requests_total
+            return {
+                "max_connections": self.max_connections,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "utilization": self.in_flight / self.max_connections,
+                "requests_total": requests,
+                "connections_opened": self.connections_opened,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "wait_seconds_avg": (
+                    self.wait_seconds_total / requests if requests else 0.0
+                ),
+                "connect_seconds_total": self.connect_seconds_total,
+            }
+
+
+class _RequestTimer:
+    """Turns httpcore trace events for one request into pool metrics"""
+
+    __slots__ = ("metrics", "started", "acquired", "connect_started", "parent")
+
+    def __init__(self, metrics: PoolMetrics, parent: Optional[Callable[..., Any]]):
+        self.metrics = metrics
+        self.parent = parent
+        self.started = time.perf_counter()
+        self.acquired: Optional[float] = None
+        self.connect_started: Optional[float] = None
+
+    def on_event(self, name: str) -> None:
+        now = time.perf_counter()
+        if name == _CONNECT_STARTED:
+            self.connect_started = now
+            self._acquire(now)
+        elif name in _HEADERS_SENT_EVENTS:
+            if self.connect_started is not None:
+                self.metrics.record_connect(now - self.connect_started)
+                self.connect_started = None
+            self._acquire(now)
+
+    def _acquire(self, now: float) -> None:
+        if self.acquired is None:
+            self.acquired = now
+            self.metrics.record_wait(now - self.started)
+
+
+class _ClosingStream(httpx.SyncByteStream):
+    def __init__(self, stream: Any, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class _AsyncClosingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: Any, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """httpx transport that records pool utilization and wait time"""
+
+    def __init__(
+        self,
+        pool_config: ConnectionPoolConfig,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        """Initialize the transport
+
+        Args:
+            pool_config: Pool limits applied to the underlying transport
+            transport: Transport to wrap instead of a new ``httpx.HTTPTransport``
+        """
+        self.metrics = PoolMetrics(pool_config.max_connections)
+        self._transport = transport or httpx.HTTPTransport(
+            limits=pool_config.httpx_limits(), http2=pool_config.http2
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        timer = _RequestTimer(self.metrics, request.extensions.get("trace"))
+
+        def trace(name: str, info: Dict[str, Any]) -> None:
+            timer.on_event(name)
+            if timer.parent is not None:
+                timer.parent(name, info)
+
+        request.extensions["trace"] = trace
+        self.metrics.request_started()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            self.metrics.request_finished()
+            raise
+        if response.is_closed:
+            # Pre-read responses never close their stream again
+            self.metrics.request_finished()
+        else:
+            response.stream = _ClosingStream(
+                response.stream, self.metrics.request_finished
+            )
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport that records pool utilization and wait time"""
+
+    def __init__(
+        self,
+        pool_config: ConnectionPoolConfig,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the transport
+
+        Args:
+            pool_config: Pool limits applied to the underlying transport
+            transport: Transport to wrap instead of a new ``httpx.AsyncHTTPTransport``
+        """
+        self.metrics = PoolMetrics(pool_config.max_connections)
+        self._transport = transport or httpx.AsyncHTTPTransport(
+            limits=pool_config.httpx_limits(), http2=pool_config.http2
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timer = _RequestTimer(self.metrics, request.extensions.get("trace"))
+
+        async def trace(name: str, info: Dict[str, Any]) -> None:
+            timer.on_event(name)
+            if timer.parent is not None:
+                await timer.parent(name, info)
+
+        request.extensions["trace"] = trace
+        self.metrics.request_started()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self.metrics.request_finished()
+            raise
+        if response.is_closed:
+            # Pre-read responses never close their stream again
+            self.metrics.request_finished()
+        else:
+            response.stream = _AsyncClosingStream(
+                response.stream, self.metrics.request_finished
+            )
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,312 @@
+"""Client-side token-bucket rate limiting of upstream requests"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..config.rate_limit_config import RateLimitConfig
+from ..errors import RateLimitExceededError
+from ..tokens.counter import TokenCounter
+from ..tokens.tokenizers import ApproximateTokenizer
+
+# (bucket key, limit per minute, amount to withdraw)
+Withdrawal = Tuple[str, float, float]
+
+
+def _refill(balance: float, updated: float, limit: float, now: float) -> float:
+    """Bucket balance after refilling at ``limit`` per minute, up to ``limit``"""
+    return min(limit, balance + max(0.0, now - updated) * limit / 60.0)
+
+
+class BucketStore:
+    """Holds token bucket balances
+
+    Every bucket holds at most one minute of its limit and refills
+    continuously. Balances may go negative: a withdrawal always succeeds
+    (unless it would wait too long) and the caller waits until the bucket
+    would have refilled to cover it, which paces callers in arrival order.
+    """
+
+    def withdraw(
+        self, withdrawals: Sequence[Withdrawal], max_wait: float, now: float
+    ) -> float:
+        """Withdraw from several buckets at once
+
+        Args:
+            withdrawals: Buckets and amounts
+            max_wait: Withdraw nothing if the wait would exceed this
+            now: Current wall-clock time
+
+        Returns:
+            Seconds the caller must wait before sending (if above
+            ``max_wait``, nothing was withdrawn)
+        """
+        raise NotImplementedError
+
+    def deposit(self, key: str, limit: float, amount: float, now: float) -> None:
+        """Give back (or, if negative, take) ``amount`` after the fact"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the store"""
+
+
+def _plan(
+    balances: Dict[str, Tuple[float, float]],
+    withdrawals: Sequence[Withdrawal],
+    now: float,
+) -> Tuple[Dict[str, float], float]:
+    """Compute new balances and the wait they imply"""
+    updated: Dict[str, float] = {}
+    wait = 0.0
+    for key, limit, amount in withdrawals:
+        balance, last = balances.get(key, (limit, now))
+        balance = _refill(balance, last, limit, now) - amount
+        updated[key] = balance
+        if balance < 0:
+            wait = max(wait, -balance * 60.0 / limit)
+    return updated, wait
+
+
+class MemoryBucketStore(BucketStore):
+    """Buckets kept in this process"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Key -> (balance, time of last update)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def withdraw(
+        self, withdrawals: Sequence[Withdrawal], max_wait: float, now: float
+    ) -> float:
+        with self._lock:
+            balances, wait = _plan(self._buckets, withdrawals, now)
+            if wait <= max_wait:
+                for key, balance in balances.items():
+                    self._buckets[key] = (balance, now)
+        return wait
+
+    def deposit(self, key: str, limit: float, amount: float, now: float) -> None:
+        with self._lock:
+            balance, last = self._buckets.get(key, (limit, now))
+            balance = min(limit, _refill(balance, last, limit, now) + amount)
+            self._buckets[key] = (balance, now)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    balance REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class SQLiteBucketStore(BucketStore):
+    """Buckets shared by every process on a host that opens the same file
+
+    Each withdrawal runs in an immediate transaction, so processes see each
+    other's reservations and together stay within one budget.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """Open (and create if needed) the bucket database
+
+        Args:
+            path: Filesystem path of the SQLite database
+            timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def _load(self, keys: List[str]) -> Dict[str, Tuple[float, float]]:
+        placeholders = ",".join("?" * len(keys))
+        rows = self._conn.execute(
+            f"SELECT key, balance, updated_at FROM buckets WHERE key IN ({placeholders})",
+            keys,
+        ).fetchall()
+        return {key: (balance, updated) for key, balance, updated in rows}
+
+    def _save(self, balances: Dict[str, float], now: float) -> None:
+        self._conn.executemany(
+            "INSERT INTO buckets (key, balance, updated_at) VALUES (?, ?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET"
+            " balance = excluded.balance, updated_at = excluded.updated_at",
+            [(key, balance, now) for key, balance in balances.items()],
+        )
+
+    def withdraw(
+        self, withdrawals: Sequence[Withdrawal], max_wait: float, now: float
+    ) -> float:
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            current = self._load([key for key, _, _ in withdrawals])
+            balances, wait = _plan(current, withdrawals, now)
+            if wait <= max_wait:
+                self._save(balances, now)
+        return wait
+
+    def deposit(self, key: str, limit: float, amount: float, now: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            balance, last = self._load([key]).get(key, (limit, now))
+            balance = min(limit, _refill(balance, last, limit, now) + amount)
+            self._save({key: balance}, now)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class Reservation:
+    """Budget taken for one upstream request, settled once usage is known"""
+
+    __slots__ = ("wait", "tokens", "token_buckets")
+
+    def __init__(
+        self, wait: float, tokens: int, token_buckets: List[Tuple[str, float]]
+    ) -> None:
+        self.wait = wait
+        self.tokens = tokens
+        self.token_buckets = token_buckets
+
+
+class RateLimiter:
+    """Keeps upstream requests within per-endpoint and per-model RPM/TPM limits
+
+    Before a request is sent its tokens are estimated as the counted input
+    plus ``max_completion_tokens``, since upstreams typically charge the
+    completion budget up front. The estimate is withdrawn from the token
+    buckets together with one request, and the caller sleeps until the
+    buckets cover it. Once the response reports its real ``usage``, the
+    difference is deposited back.
+    """
+
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        counter: Optional[TokenCounter] = None,
+        store: Optional[BucketStore] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the limiter
+
+        Args:
+            config: Limits to enforce
+            counter: Estimates input tokens (length-based if None)
+            store: Bucket store (from ``config.store_path`` if None)
+            clock: Wall-clock time source shared with other processes
+        """
+        self.config = config
+        self.counter = counter or TokenCounter(ApproximateTokenizer())
+        if store is None:
+            store = (
+                SQLiteBucketStore(config.store_path)
+                if config.store_path
+                else MemoryBucketStore()
+            )
+        self.store = store
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.requests_total = 0
+        self.delayed_total = 0
+        self.rejected_total = 0
+        self.wait_seconds_total = 0.0
+        self.estimated_tokens_total = 0
+        self.used_tokens_total = 0
+
+    def estimate_tokens(self, request: Dict[str, Any]) -> int:
+        """Estimate the tokens a request will consume"""
+        return self.counter.estimate_total(request)
+
+    def _limits(
+        self, endpoint: str, model: str
+    ) -> Tuple[List[Tuple[str, float]], List[Tuple[str, float]]]:
+        """Get the (key, limit) request and token buckets that apply"""
+        config = self.config
+        request_buckets = []
+        token_buckets = []
+        if config.requests_per_minute:
+            request_buckets.append(
+                (f"endpoint:{endpoint}:requests", config.requests_per_minute)
+            )
+        if config.model_requests_per_minute:
+            request_buckets.append(
+                (f"model:{model}:requests", config.model_requests_per_minute)
+            )
+        if config.tokens_per_minute:
+            token_buckets.append(
+                (f"endpoint:{endpoint}:tokens", config.tokens_per_minute)
+            )
+        if config.model_tokens_per_minute:
+            token_buckets.append(
+                (f"model:{model}:tokens", config.model_tokens_per_minute)
+            )
+        return request_buckets, token_buckets
+
+    def reserve(self, endpoint: str, request: Dict[str, Any]) -> Reservation:
+        """Take budget for a request about to be sent to ``endpoint``
+
+        Returns:
+            Reservation whose ``wait`` the caller must sleep before sending
+
+        Raises:
+            RateLimitExceededError: If the wait would exceed ``max_wait``
+        """
+        request_buckets, token_buckets = self._limits(
+            endpoint, str(request.get("model", ""))
+        )
+        tokens = self.estimate_tokens(request) if token_buckets else 0
+        withdrawals = [(key, limit, 1.0) for key, limit in request_buckets]
+        withdrawals += [(key, limit, float(tokens)) for key, limit in token_buckets]
+        wait = self.store.withdraw(withdrawals, self.config.max_wait, self._clock())
+        with self._lock:
+            self.requests_total += 1
+            if wait > self.config.max_wait:
+                self.rejected_total += 1
+            else:
+                self.estimated_tokens_total += tokens
+                if wait > 0:
+                    self.delayed_total += 1
+                    self.wait_seconds_total += wait
+        if wait > self.config.max_wait:
+            raise RateLimitExceededError(
+                f"Local rate limit for {endpoint} would delay the request "
+                f"{wait:.1f}s (max_wait is {self.config.max_wait:.1f}s)",
+                wait,
+            )
+        return Reservation(wait, tokens, token_buckets)
+
+    def settle(self, reservation: Reservation, used_tokens: Optional[int]) -> None:
+        """Replace a reservation's token estimate with the tokens actually used
+
+        Args:
+            reservation: Reservation returned by ``reserve``
+            used_tokens: Total tokens reported by the upstream (0 for a failed
+                request). If None the estimate stands.
+        """
+        if used_tokens is None or not reservation.token_buckets:
+            return
+        difference = reservation.tokens - used_tokens
+        now = self._clock()
+        for key, limit in reservation.token_buckets:
+            self.store.deposit(key, limit, float(difference), now)
+        with self._lock:
+            self.used_tokens_total += used_tokens
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return delay, rejection and token estimate counters"""
+        with self._lock:
+            return {
+                "requests_total": self.requests_total,
+                "delayed_total": self.delayed_total,
+                "rejected_total": self.rejected_total,
+                "wait_seconds_total": self.wait_seconds_total,
+                "estimated_tokens_total": self.estimated_tokens_total,
+                "used_tokens_total": self.used_tokens_total,
+            }
@@ -0,0 +1,235 @@
+"""Retry policy for upstream requests"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar
+
+from ..errors import RETRYABLE_STATUS_CODES, UpstreamError, error_from_exception
+
+T = TypeVar("T")
+
+
+class RetryBudget:
+    """Caps retries at a fraction of first attempts, shared across callers
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    a sustained outage can add at most ``ratio`` extra load. A small reserve
+    that refills over time still lets an idle process retry occasional
+    failures.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_balance: float = 100.0,
+    ):
+        """Initialize the budget
+
+        Args:
+            ratio: Retries allowed per request, e.g. 0.1 for 10% extra load
+            min_retries_per_second: Reserve refill rate independent of traffic
+            max_balance: Most tokens that can be saved up
+        """
+        if ratio < 0 or min_retries_per_second < 0:
+            raise ValueError("Retry budget rates cannot be negative")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_balance = max_balance
+        self._lock = threading.Lock()
+        self._balance = max_balance
+        self._updated = time.monotonic()
+        self.requests_total = 0
+        self.retries_total = 0
+        self.retries_denied = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._balance = min(
+            self.max_balance, self._balance + elapsed * self.min_retries_per_second
+        )
+
+    def record_request(self) -> None:
+        """Deposit tokens for a first attempt"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.requests_total += 1
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """Withdraw one retry token
+
+        Returns:
+            True if the retry may proceed
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                self.retries_total += 1
+                return True
+            self.retries_denied += 1
+            return False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a consistent copy of the budget's counters"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "ratio": self.ratio,
+                "balance": self._balance,
+                "requests_total": self.requests_total,
+                "retries_total": self.retries_total,
+                "retries_denied": self.retries_denied,
+            }
+
+
+# Budget shared by every policy that does not bring its own, so all bridges
+# in the process together stay under the retry ratio
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+class RetryPolicy:
+    """Decides whether and when failed upstream requests are retried
+
+    Backoff uses decorrelated jitter (each delay is drawn between
+    ``base_delay`` and three times the previous delay, capped at
+    ``max_delay``) so synchronized clients spread out. A ``Retry-After`` from
+    the upstream is honored as a lower bound on the delay.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        retry_statuses: FrozenSet[int] = RETRYABLE_STATUS_CODES,
+        max_retry_after: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize the policy
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retries)
+            base_delay: Smallest backoff delay in seconds
+            max_delay: Largest backoff delay in seconds
+            retry_statuses: Upstream HTTP statuses that are retried
+            max_retry_after: Give up instead of waiting longer than this many
+                seconds when the upstream sends ``Retry-After``
+            budget: Retry budget to draw from (defaults to the process-wide one)
+            rng: Random source for jitter
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else DEFAULT_RETRY_BUDGET
+        self._random = rng or random.Random()
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Build a policy from ``OPENAI_MAX_RETRIES`` and related variables"""
+        values: Dict[str, Any] = {}
+        if os.getenv("OPENAI_MAX_RETRIES"):
+            values["max_retries"] = int(os.environ["OPENAI_MAX_RETRIES"])
+        if os.getenv("OPENAI_RETRY_BASE_DELAY"):
+            values["base_delay"] = float(os.environ["OPENAI_RETRY_BASE_DELAY"])
+        if os.getenv("OPENAI_RETRY_MAX_DELAY"):
+            values["max_delay"] = float(os.environ["OPENAI_RETRY_MAX_DELAY"])
+        return cls(**values)
+
+    def is_retryable(self, error: UpstreamError) -> bool:
+        """Whether the error's status (or lack of a connection) allows a retry"""
+        if error.status_code is None:
+            return error.retryable
+        return error.status_code in self.retry_statuses
+
+    def backoff(self, previous_delay: float) -> float:
+        """Draw the next decorrelated-jitter delay"""
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, self._random.uniform(self.base_delay, upper))
+
+    def next_delay(
+        self, error: UpstreamError, attempt: int, previous_delay: float
+    ) -> Optional[float]:
+        """Decide how long to wait before retrying
+
+        Args:
+            error: Error from the failed attempt
+            attempt: Number of attempts made so far
+            previous_delay: Delay used before the previous attempt
+
+        Returns:
+            Seconds to sleep, or None if the request must not be retried
+        """
+        if attempt > self.max_retries or not self.is_retryable(error):
+            return None
+        delay = self.backoff(previous_delay)
+        retry_after = error.retry_after
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            delay = max(delay, retry_after)
+        if not self.budget.try_acquire():
+            return None
+        return delay
+
+    def call(
+        self, func: Callable[[], T], sleep: Callable[[float], None] = time.sleep
+    ) -> T:
+        """Call ``func`` until it succeeds or the policy gives up
+
+        Raises:
+            UpstreamError: The last error when retries are exhausted
+        """
+        self.budget.record_request()
+        attempt = 0
+        delay = 0.0
+        while True:
+            attempt += 1
+            try:
+                return func()
+            except Exception as e:
+                error = error_from_exception(e)
+                next_delay = self.next_delay(error, attempt, delay)
+                if next_delay is None:
+                    if error is e:
+                        raise
+                    raise error from e
+            delay = next_delay
+            sleep(delay)
+
+    async def acall(
+        self,
+        func: Callable[[], Awaitable[T]],
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> T:
+        """Await ``func`` until it succeeds or the policy gives up
+
+        Raises:
+            UpstreamError: The last error when retries are exhausted
+        """
+        self.budget.record_request()
+        attempt = 0
+        delay = 0.0
+        while True:
+            attempt += 1
+            try:
+                return await func()
+            except Exception as e:
+                error = error_from_exception(e)
+                next_delay = self.next_delay(error, attempt, delay)
+                if next_delay is None:
+                    if error is e:
+                        raise
+                    raise error from e
+            delay = next_delay
+            await sleep(delay)
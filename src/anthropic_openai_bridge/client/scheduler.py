@@ -0,0 +1,457 @@
+"""Admission scheduling of upstream requests under a concurrency limit"""
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from ..tokens.counter import TokenCounter
+from ..tokens.tokenizers import ApproximateTokenizer
+from .hedging import LatencyTracker
+
+DEFAULT_REQUEST_CLASS = "interactive"
+
+_request_class: "contextvars.ContextVar[str]" = contextvars.ContextVar(
+    "bridge_request_class", default=DEFAULT_REQUEST_CLASS
+)
+_scheduling_tenant: "contextvars.ContextVar[Optional[str]]" = contextvars.ContextVar(
+    "bridge_scheduling_tenant", default=None
+)
+
+
+@contextlib.contextmanager
+def request_class(name: str) -> Iterator[None]:
+    """Schedule requests sent inside the block under the class ``name``
+
+    The class follows the current thread or asyncio task, so wrapping a
+    ``send_message`` call is enough, for example
+    ``with request_class("batch"): bridge.send_message(request)``. It also
+    follows requests that ``send_messages`` sends from its worker threads.
+    """
+    token = _request_class.set(name)
+    try:
+        yield
+    finally:
+        _request_class.reset(token)
+
+
+def current_request_class(request: Dict[str, Any]) -> str:
+    """Get the class set by the innermost ``request_class`` block"""
+    return _request_class.get()
+
+
+@contextlib.contextmanager
+def scheduling_tenant(name: Optional[str]) -> Iterator[None]:
+    """Schedule requests without a ``user`` inside the block as tenant ``name``
+
+    Unlike ``metadata.user_id``, the tenant is not part of the request, so it
+    is not sent upstream and does not split coalescing or response cache
+    keys. The HTTP server uses it for a hash of the caller's API key.
+    """
+    token = _scheduling_tenant.set(name)
+    try:
+        yield
+    finally:
+        _scheduling_tenant.reset(token)
+
+
+def request_tenant(request: Dict[str, Any]) -> str:
+    """Get the tenant of a converted request
+
+    The request's ``user`` field, which the request converter fills from
+    ``metadata.user_id``, takes precedence over the ``scheduling_tenant``
+    block the request was sent in.
+    """
+    return str(request.get("user") or _scheduling_tenant.get() or "default")
+
+
+class ScheduledRequest:
+    """One request waiting for, or holding, an upstream slot"""
+
+    __slots__ = (
+        "request_class",
+        "tenant",
+        "cost",
+        "rank",
+        "enqueued_at",
+        "granted",
+        "cancelled",
+        "wake",
+    )
+
+    def __init__(self, request_class: str, tenant: str, cost: int):
+        self.request_class = request_class
+        self.tenant = tenant
+        self.cost = cost
+        self.rank: Tuple[float, ...] = ()
+        self.enqueued_at = 0.0
+        self.granted = False
+        self.cancelled = False
+        self.wake: Optional[Callable[[], None]] = None
+
+
+class SchedulingPolicy:
+    """Orders queued requests; lower ranks are admitted first
+
+    ``rank`` and ``dispatched`` are called under the scheduler's lock, so
+    policies may keep state without locking. Equal ranks are admitted in
+    arrival order.
+    """
+
+    name = "fifo"
+    # Whether ranks need ``ScheduledRequest.cost``, which costs a token count
+    uses_cost = False
+
+    def rank(self, job: ScheduledRequest) -> Tuple[float, ...]:
+        """Rank a request as it is queued"""
+        return ()
+
+    def dispatched(self, job: ScheduledRequest) -> None:
+        """Note that a request was admitted"""
+
+
+class FifoPolicy(SchedulingPolicy):
+    """Admits requests in arrival order"""
+
+
+class PriorityPolicy(SchedulingPolicy):
+    """Strict priority between request classes, FIFO within a class
+
+    A lower class only runs when no higher class is waiting, so a flood of
+    batch traffic cannot delay interactive requests beyond the slots it
+    already holds. Unknown classes rank below all listed ones.
+    """
+
+    name = "priority"
+
+    def __init__(self, classes: Sequence[str] = (DEFAULT_REQUEST_CLASS, "batch")):
+        """Initialize the policy
+
+        Args:
+            classes: Request classes from highest to lowest priority
+        """
+        self.classes = list(classes)
+        self._order = {name: i for i, name in enumerate(self.classes)}
+
+    def rank(self, job: ScheduledRequest) -> Tuple[float, ...]:
+        return (self._order.get(job.request_class, len(self.classes)),)
+
+
+class ShortestJobFirstPolicy(SchedulingPolicy):
+    """Admits the request with the fewest estimated tokens first
+
+    Cost is the counted input plus ``max_completion_tokens``. This minimizes
+    mean wait, but a large request can wait as long as smaller ones keep
+    arriving.
+    """
+
+    name = "shortest_job_first"
+    uses_cost = True
+
+    def rank(self, job: ScheduledRequest) -> Tuple[float, ...]:
+        return (job.cost,)
+
+
+class FairSharePolicy(SchedulingPolicy):
+    """Weighted fair queuing of estimated tokens between tenants
+
+    Each request gets a virtual finish time: its tenant's previous finish
+    time (or the current virtual time, if later) plus its cost divided by
+    the tenant's weight. Requests are admitted by finish time, so every
+    backlogged tenant receives tokens in proportion to its weight however
+    many requests the others queue.
+    """
+
+    name = "fair_share"
+    uses_cost = True
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        default_weight: float = 1.0,
+    ):
+        """Initialize the policy
+
+        Args:
+            weights: Tenant to share weight
+            default_weight: Weight of tenants not in ``weights``
+        """
+        if default_weight <= 0 or any(w <= 0 for w in (weights or {}).values()):
+            raise ValueError("Tenant weights must be positive")
+        self.weights = dict(weights or {})
+        self.default_weight = default_weight
+        self.virtual_time = 0.0
+        self._finish: Dict[str, float] = {}
+
+    def rank(self, job: ScheduledRequest) -> Tuple[float, ...]:
+        weight = self.weights.get(job.tenant, self.default_weight)
+        start = max(self.virtual_time, self._finish.get(job.tenant, 0.0))
+        finish = start + max(job.cost, 1) / weight
+        self._finish[job.tenant] = finish
+        return (finish, start)
+
+    def dispatched(self, job: ScheduledRequest) -> None:
+        self.virtual_time = max(self.virtual_time, job.rank[1])
+        if len(self._finish) > 4096:
+            # Tenants whose finish time has passed have no backlog to remember
+            self._finish = {
+                tenant: finish
+                for tenant, finish in self._finish.items()
+                if finish > self.virtual_time
+            }
+
+
+SCHEDULING_POLICIES: Dict[str, Type[SchedulingPolicy]] = {
+    "fifo": FifoPolicy,
+    "priority": PriorityPolicy,
+    "fair_share": FairSharePolicy,
+    "shortest_job_first": ShortestJobFirstPolicy,
+}
+
+
+def create_scheduling_policy(name: str) -> SchedulingPolicy:
+    """Create a scheduling policy with default settings by name
+
+    Args:
+        name: One of ``SCHEDULING_POLICIES``
+
+    Raises:
+        ValueError: If the policy is unknown
+    """
+    try:
+        policy_class = SCHEDULING_POLICIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown scheduling policy {name!r}; "
+            f"expected one of {sorted(SCHEDULING_POLICIES)}"
+        ) from None
+    return policy_class()
+
+
+class _ClassStats:
+    __slots__ = ("admitted_total", "queued", "wait_seconds_total", "wait_seconds_max")
+
+    def __init__(self) -> None:
+        self.admitted_total = 0
+        self.queued = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+
+class RequestScheduler:
+    """Limits concurrent upstream requests and picks who goes next
+
+    Requests beyond ``max_concurrency`` queue and are admitted by
+    ``policy`` as slots free up. A request holds its slot for all its retry
+    attempts, or until its stream ends. Sync callers block their thread and
+    async callers await, so one scheduler can serve both.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        policy: Optional[SchedulingPolicy] = None,
+        classify: Callable[[Dict[str, Any]], str] = current_request_class,
+        tenant: Callable[[Dict[str, Any]], str] = request_tenant,
+        counter: Optional[TokenCounter] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the scheduler
+
+        Args:
+            max_concurrency: Upstream requests admitted at once
+            policy: Queue order (FIFO if None)
+            classify: Gets a request's class, for priority and wait metrics
+            tenant: Gets a request's tenant, for fair share
+            counter: Estimates request cost in tokens (length-based if None)
+            clock: Monotonic time source for wait times
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.policy = policy or FifoPolicy()
+        self.classify = classify
+        self.tenant = tenant
+        self.counter = counter
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[Tuple[float, ...], int, ScheduledRequest]] = []
+        self._sequence = itertools.count()
+        self.in_flight = 0
+        self._stats: Dict[str, _ClassStats] = {}
+        self.waits = LatencyTracker()
+
+    @classmethod
+    def from_env(cls) -> Optional["RequestScheduler"]:
+        """Build a scheduler from ``OPENAI_SCHEDULER_*`` environment variables
+
+        Returns:
+            Scheduler if ``OPENAI_SCHEDULER_POLICY`` or
+            ``OPENAI_SCHEDULER_MAX_CONCURRENCY`` is set, otherwise None
+        """
+        policy = os.getenv("OPENAI_SCHEDULER_POLICY")
+        max_concurrency = os.getenv("OPENAI_SCHEDULER_MAX_CONCURRENCY")
+        if not policy and not max_concurrency:
+            return None
+        values: Dict[str, Any] = {}
+        if policy:
+            values["policy"] = create_scheduling_policy(policy)
+        if max_concurrency:
+            values["max_concurrency"] = int(max_concurrency)
+        return cls(**values)
+
+    def _new_job(self, request: Dict[str, Any]) -> ScheduledRequest:
+        cost = 0
+        if self.policy.uses_cost:
+            if self.counter is None:
+                self.counter = TokenCounter(ApproximateTokenizer())
+            cost = self.counter.estimate_total(request)
+        return ScheduledRequest(self.classify(request), self.tenant(request), cost)
+
+    def _stats_for(self, name: str) -> _ClassStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _ClassStats()
+        return stats
+
+    def _enqueue(self, job: ScheduledRequest) -> None:
+        """Queue a request and admit whoever is next (call under the lock)"""
+        job.enqueued_at = self._clock()
+        job.rank = self.policy.rank(job)
+        heapq.heappush(self._queue, (job.rank, next(self._sequence), job))
+        self._stats_for(job.request_class).queued += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit queued requests while slots are free (call under the lock)"""
+        while self._queue and self.in_flight < self.max_concurrency:
+            job = heapq.heappop(self._queue)[2]
+            if job.cancelled:
+                continue
+            job.granted = True
+            self.in_flight += 1
+            self.policy.dispatched(job)
+            wait = self._clock() - job.enqueued_at
+            stats = self._stats_for(job.request_class)
+            stats.queued -= 1
+            stats.admitted_total += 1
+            stats.wait_seconds_total += wait
+            stats.wait_seconds_max = max(stats.wait_seconds_max, wait)
+            self.waits.record(job.request_class, wait)
+            if job.wake is not None:
+                job.wake()
+
+    def acquire(self, request: Dict[str, Any]) -> ScheduledRequest:
+        """Block until the request is admitted
+
+        Returns:
+            Admission to pass to ``release`` once the upstream call is done
+        """
+        job = self._new_job(request)
+        admitted = threading.Event()
+        job.wake = admitted.set
+        with self._lock:
+            self._enqueue(job)
+        admitted.wait()
+        return job
+
+    async def aacquire(self, request: Dict[str, Any]) -> ScheduledRequest:
+        """Wait without blocking the event loop until the request is admitted
+
+        Returns:
+            Admission to pass to ``release`` once the upstream call is done
+        """
+        job = self._new_job(request)
+        loop = asyncio.get_running_loop()
+        admitted: "asyncio.Future[None]" = loop.create_future()
+
+        def resolve() -> None:
+            if not admitted.done():
+                admitted.set_result(None)
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(resolve)
+
+        job.wake = wake
+        with self._lock:
+            self._enqueue(job)
+        try:
+            await admitted
+        except asyncio.CancelledError:
+            with self._lock:
+                if not job.granted:
+                    job.cancelled = True
+                    self._stats_for(job.request_class).queued -= 1
+            if job.granted:
+                self.release(job)
+            raise
+        return job
+
+    def release(self, job: ScheduledRequest) -> None:
+        """Free an admitted request's slot for the next queued request"""
+        with self._lock:
+            self.in_flight -= 1
+            self._dispatch()
+
+    @contextlib.contextmanager
+    def slot(self, request: Dict[str, Any]) -> Iterator[ScheduledRequest]:
+        """Hold an upstream slot for the duration of the block"""
+        job = self.acquire(request)
+        try:
+            yield job
+        finally:
+            self.release(job)
+
+    @contextlib.asynccontextmanager
+    async def aslot(self, request: Dict[str, Any]) -> AsyncIterator[ScheduledRequest]:
+        """Hold an upstream slot for the duration of the async block"""
+        job = await self.aacquire(request)
+        try:
+            yield job
+        finally:
+            self.release(job)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return slot usage and per-class queue wait times"""
+        with self._lock:
+            classes = {
+                name: {
+                    "admitted_total": stats.admitted_total,
+                    "queued": stats.queued,
+                    "wait_seconds_total": stats.wait_seconds_total,
+                    "wait_seconds_max": stats.wait_seconds_max,
+                    "wait_seconds_avg": (
+                        stats.wait_seconds_total / stats.admitted_total
+                        if stats.admitted_total
+                        else 0.0
+                    ),
+                }
+                for name, stats in self._stats.items()
+            }
+            snapshot = {
+                "policy": self.policy.name,
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "queued": sum(stats["queued"] for stats in classes.values()),
+                "classes": classes,
+            }
+        for name, stats in classes.items():
+            stats["wait_seconds_p50"] = self.waits.percentile(name, 0.5) or 0.0
+            stats["wait_seconds_p95"] = self.waits.percentile(name, 0.95) or 0.0
+        return snapshot
@@ -0,0 +1,86 @@
+"""Per-endpoint circuit breaker settings"""
+
+import os
+from typing import Any, Dict, Optional
+
+# Environment variables read by CircuitBreakerConfig.from_env
+_ENV_VARS = {
+    "failure_rate_threshold": "OPENAI_BREAKER_FAILURE_RATE",
+    "slow_call_seconds": "OPENAI_BREAKER_SLOW_CALL_SECONDS",
+    "slow_call_rate_threshold": "OPENAI_BREAKER_SLOW_CALL_RATE",
+    "window_seconds": "OPENAI_BREAKER_WINDOW_SECONDS",
+    "minimum_calls": "OPENAI_BREAKER_MINIMUM_CALLS",
+    "open_seconds": "OPENAI_BREAKER_OPEN_SECONDS",
+    "half_open_probes": "OPENAI_BREAKER_HALF_OPEN_PROBES",
+}
+
+
+class CircuitBreakerConfig:
+    """When an endpoint's circuit opens and how it is probed for recovery"""
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.8,
+        window_seconds: float = 30.0,
+        minimum_calls: int = 10,
+        open_seconds: float = 15.0,
+        half_open_probes: int = 2,
+    ):
+        """Initialize breaker settings
+
+        Args:
+            failure_rate_threshold: Fraction of failed calls in the window that
+                opens the circuit
+            slow_call_seconds: Calls slower than this count as slow (None
+                disables latency-based tripping)
+            slow_call_rate_threshold: Fraction of slow calls in the window that
+                opens the circuit
+            window_seconds: Length of the rolling window of recorded calls
+            minimum_calls: Calls required in the window before it can trip
+            open_seconds: Time an open circuit rejects calls before probing
+            half_open_probes: Concurrent probe calls allowed while half-open;
+                this many must succeed to close the circuit again
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        if not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError("slow_call_rate_threshold must be in (0, 1]")
+        if minimum_calls < 1 or half_open_probes < 1:
+            raise ValueError("minimum_calls and half_open_probes must be at least 1")
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_seconds = window_seconds
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+
+    @classmethod
+    def from_env(cls) -> Optional["CircuitBreakerConfig"]:
+        """Build settings from ``OPENAI_BREAKER_*`` environment variables
+
+        Returns:
+            Settings if any breaker variable is set, otherwise None
+        """
+        values: Dict[str, Any] = {}
+        for field, env_var in _ENV_VARS.items():
+            raw = os.getenv(env_var)
+            if raw is None or raw == "":
+                continue
+            if field in ("minimum_calls", "half_open_probes"):
+                values[field] = int(raw)
+            else:
+                values[field] = float(raw)
+        return cls(**values) if values else None
+
+    def __repr__(self) -> str:
+        return (
+            f"CircuitBreakerConfig(failure_rate_threshold="
+            f"{self.failure_rate_threshold}, slow_call_seconds="
+            f"{self.slow_call_seconds}, slow_call_rate_threshold="
+            f"{self.slow_call_rate_threshold}, window_seconds={self.window_seconds}, "
+            f"minimum_calls={self.minimum_calls}, open_seconds={self.open_seconds}, "
+            f"half_open_probes={self.half_open_probes})"
+        )
@@ -1,7 +1,13 @@
 import os
-from typing import Any, Optional
+from typing import Any, List, Optional
 
-from dotenv import load_dotenv
+from ..client.hedging import HedgingPolicy
+from ..client.retry import RetryPolicy
+from ..client.scheduler import RequestScheduler
+from .breaker_config import CircuitBreakerConfig
+from .endpoint_config import EndpointConfig
+from .pool_config import ConnectionPoolConfig
+from .rate_limit_config import RateLimitConfig
 
 
 class ConfigManager:
@@ -13,6 +19,15 @@ class ConfigManager:
         openai_api_key: Optional[str] = None,
         openai_base_url: Optional[str] = None,
         httpx_client: Optional[Any] = None,
+        connection_pool: Optional[ConnectionPoolConfig] = None,
+        openai_endpoints: Optional[List[EndpointConfig]] = None,
+        load_balancing: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        rate_limit: Optional[RateLimitConfig] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        raw_responses: Optional[bool] = None,
     ):
         """Initialize configuration manager
 
@@ -21,17 +36,57 @@ class ConfigManager:
             openai_api_key: Custom OpenAI API key (overrides environment variable)
             openai_base_url: Custom OpenAI base URL (overrides environment variable)
             httpx_client: Custom httpx client for OpenAI requests
+            connection_pool: Upstream connection pool settings (overrides
+                ``OPENAI_*`` pool environment variables). Ignored when a custom
+                httpx client is provided.
+            openai_endpoints: Upstream endpoints to balance requests across
+                (overrides ``OPENAI_ENDPOINTS`` and the single base URL)
+            load_balancing: Balancing strategy, ``least_outstanding``,
+                ``power_of_two`` or ``prefix_affinity`` (overrides
+                ``OPENAI_LOAD_BALANCING``)
+            retry_policy: Retry policy for upstream requests (overrides
+                ``OPENAI_MAX_RETRIES`` and related environment variables)
+            circuit_breaker: Per-endpoint circuit breaker settings (overrides
+                ``OPENAI_BREAKER_*`` environment variables)
+            hedging: Hedged request policy for non-streaming calls (overrides
+                ``OPENAI_HEDGE_*`` environment variables)
+            rate_limit: Client-side RPM/TPM limits (overrides
+                ``OPENAI_RATE_LIMIT_*`` environment variables)
+            scheduler: Concurrency limit and queue policy for upstream
+                requests (overrides ``OPENAI_SCHEDULER_*`` environment variables)
+            raw_responses: Decode upstream response bodies straight to dicts
+                instead of SDK models (overrides ``OPENAI_RAW_RESPONSES``)
         """
-        # Load environment variables first
-        if env_file:
-            load_dotenv(env_file)
-        else:
-            load_dotenv()
+        # The .env file is loaded when a setting is first read from the
+        # environment, so constructing a ConfigManager stays cheap
+        self._env_file = env_file
+        self._env_loaded = False
 
         # Store custom parameters (these override environment variables)
         self._custom_openai_api_key = openai_api_key
         self._custom_openai_base_url = openai_base_url
         self._httpx_client = httpx_client
+        self._connection_pool = connection_pool
+        self._openai_endpoints = openai_endpoints
+        self._load_balancing = load_balancing
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._hedging = hedging
+        self._rate_limit = rate_limit
+        self._scheduler = scheduler
+        self._raw_responses = raw_responses
+
+    def _load_env(self) -> None:
+        """Load the .env file into the environment once, on first use"""
+        if self._env_loaded:
+            return
+        from dotenv import load_dotenv
+
+        if self._env_file:
+            load_dotenv(self._env_file)
+        else:
+            load_dotenv()
+        self._env_loaded = True
 
     @property
     def openai_api_key(self) -> str:
@@ -39,6 +94,7 @@ class ConfigManager:
         if self._custom_openai_api_key:
             return self._custom_openai_api_key
 
+        self._load_env()
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError(
@@ -51,6 +107,7 @@ class ConfigManager:
         """Get OpenAI base URL from custom parameter or environment"""
         if self._custom_openai_base_url:
             return self._custom_openai_base_url
+        self._load_env()
         return os.getenv("OPENAI_BASE_URL")
 
     @property
@@ -58,9 +115,123 @@ class ConfigManager:
         """Get custom httpx client if provided"""
         return self._httpx_client
 
+    @property
+    def connection_pool(self) -> Optional[ConnectionPoolConfig]:
+        """Get upstream connection pool settings from custom parameter or environment"""
+        if self._connection_pool is not None:
+            return self._connection_pool
+        self._load_env()
+        return ConnectionPoolConfig.from_env()
+
+    @property
+    def openai_endpoints(self) -> List[EndpointConfig]:
+        """Get upstream endpoints from custom parameter or environment
+
+        Falls back to a single endpoint at ``openai_base_url``. Endpoints
+        without their own API key use ``openai_api_key``.
+        """
+        if self._openai_endpoints:
+            return list(self._openai_endpoints)
+        self._load_env()
+        endpoints = EndpointConfig.list_from_env()
+        if endpoints:
+            return endpoints
+        return [EndpointConfig(base_url=self.openai_base_url)]
+
+    @property
+    def load_balancing(self) -> str:
+        """Get the load balancing strategy from custom parameter or environment"""
+        if self._load_balancing:
+            return self._load_balancing
+        self._load_env()
+        return os.getenv("OPENAI_LOAD_BALANCING", "least_outstanding")
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Get the upstream retry policy from custom parameter or environment"""
+        if self._retry_policy is not None:
+            return self._retry_policy
+        self._load_env()
+        return RetryPolicy.from_env()
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreakerConfig]:
+        """Get circuit breaker settings from custom parameter or environment
+
+        Returns:
+            Settings, or None when circuit breaking is disabled
+        """
+        if self._circuit_breaker is not None:
+            return self._circuit_breaker
+        self._load_env()
+        return CircuitBreakerConfig.from_env()
+
+    @property
+    def hedging(self) -> Optional[HedgingPolicy]:
+        """Get the hedged request policy from custom parameter or environment
+
+        Returns:
+            Policy, or None when hedging is disabled
+        """
+        if self._hedging is not None:
+            return self._hedging
+        self._load_env()
+        return HedgingPolicy.from_env()
+
+    @property
+    def rate_limit(self) -> Optional[RateLimitConfig]:
+        """Get client-side rate limits from custom parameter or environment
+
+        Returns:
+            Limits, or None when rate limiting is disabled
+        """
+        if self._rate_limit is not None:
+            return self._rate_limit
+        self._load_env()
+        return RateLimitConfig.from_env()
+
+    @property
+    def scheduler(self) -> Optional[RequestScheduler]:
+        """Get the upstream request scheduler from custom parameter or environment
+
+        Returns:
+            Scheduler, or None when requests are sent as soon as they arrive
+        """
+        if self._scheduler is not None:
+            return self._scheduler
+        self._load_env()
+        return RequestScheduler.from_env()
+
+    @property
+    def raw_responses(self) -> bool:
+        """Get whether non-streaming responses skip the SDK's response models"""
+        if self._raw_responses is not None:
+            return self._raw_responses
+        self._load_env()
+        return os.getenv("OPENAI_RAW_RESPONSES", "").lower() in ("1", "true", "yes")
+
+    @property
+    def batch_store_path(self) -> str:
+        """Get the SQLite path used to persist message batches"""
+        self._load_env()
+        return os.getenv("BRIDGE_BATCH_STORE_PATH", "anthropic_bridge_batches.db")
+
+    @property
+    def batch_concurrency(self) -> int:
+        """Get the number of batch items processed in parallel"""
+        self._load_env()
+        return int(os.getenv("BRIDGE_BATCH_CONCURRENCY", "4"))
+
+    @property
+    def tokenizer_path(self) -> Optional[str]:
+        """Get the local vocabulary file used to count tokens, if any"""
+        self._load_env()
+        return os.getenv("BRIDGE_TOKENIZER_PATH") or None
+
     @property
     def anthropic_api_key(self) -> str:
         """Get Anthropic API key from environment (for reference/testing)"""
+        self._load_env()
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable is required")
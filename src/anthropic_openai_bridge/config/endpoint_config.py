@@ -0,0 +1,60 @@
+"""Upstream OpenAI-compatible endpoint settings"""
+
+import os
+from typing import List, Optional
+
+
+class EndpointConfig:
+    """One OpenAI-compatible upstream that requests can be routed to"""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        weight: float = 1.0,
+        name: Optional[str] = None,
+    ):
+        """Initialize endpoint settings
+
+        Args:
+            base_url: Endpoint base URL (None uses the OpenAI SDK default)
+            api_key: API key for this endpoint. If None, the bridge-wide
+                OpenAI API key is used.
+            weight: Relative capacity; an endpoint with weight 2 is given
+                twice the outstanding requests of one with weight 1
+            name: Label used in stats. Defaults to the base URL.
+        """
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self.base_url = base_url
+        self.api_key = api_key
+        self.weight = float(weight)
+        self.name = name or base_url or "default"
+
+    @classmethod
+    def parse(cls, spec: str) -> "EndpointConfig":
+        """Parse a ``url[|weight[|api_key]]`` endpoint specification"""
+        parts = [part.strip() for part in spec.split("|")]
+        if not parts[0]:
+            raise ValueError(f"Endpoint specification has no URL: {spec!r}")
+        weight = float(parts[1]) if len(parts) > 1 and parts[1] else 1.0
+        api_key = parts[2] if len(parts) > 2 and parts[2] else None
+        return cls(base_url=parts[0], api_key=api_key, weight=weight)
+
+    @classmethod
+    def list_from_env(cls) -> Optional[List["EndpointConfig"]]:
+        """Build endpoints from the comma-separated ``OPENAI_ENDPOINTS`` variable
+
+        Returns:
+            Endpoints if the variable is set, otherwise None
+        """
+        raw = os.getenv("OPENAI_ENDPOINTS")
+        if not raw:
+            return None
+        return [cls.parse(spec) for spec in raw.split(",") if spec.strip()]
+
+    def __repr__(self) -> str:
+        return (
+            f"EndpointConfig(name={self.name!r}, base_url={self.base_url!r}, "
+            f"weight={self.weight})"
+        )
@@ -0,0 +1,108 @@
+"""Upstream HTTP connection pool settings"""
+
+import os
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from ..httpx_compat import httpx
+
+# Environment variables read by ConnectionPoolConfig.from_env
+_ENV_VARS = {
+    "max_connections": "OPENAI_MAX_CONNECTIONS",
+    "max_keepalive_connections": "OPENAI_MAX_KEEPALIVE_CONNECTIONS",
+    "keepalive_expiry": "OPENAI_KEEPALIVE_EXPIRY",
+    "http2": "OPENAI_HTTP2",
+    "connect_timeout": "OPENAI_CONNECT_TIMEOUT",
+    "pool_timeout": "OPENAI_POOL_TIMEOUT",
+    "read_timeout": "OPENAI_READ_TIMEOUT",
+}
+
+
+class ConnectionPoolConfig:
+    """Connection pool limits and timeouts for the upstream httpx client"""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        connect_timeout: float = 5.0,
+        pool_timeout: Optional[float] = 10.0,
+        read_timeout: float = 600.0,
+    ):
+        """Initialize pool settings
+
+        Args:
+            max_connections: Maximum concurrent connections per client
+            max_keepalive_connections: Idle connections kept open for reuse.
+                Defaults to max_connections so a busy pool never re-handshakes.
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Multiplex requests over HTTP/2 (requires ``httpx[http2]``)
+            connect_timeout: Seconds allowed to establish a connection
+            pool_timeout: Seconds to wait for a free connection (None waits forever)
+            read_timeout: Seconds allowed between response bytes
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        if max_keepalive_connections is None:
+            max_keepalive_connections = max_connections
+        if max_keepalive_connections > max_connections:
+            raise ValueError("max_keepalive_connections cannot exceed max_connections")
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.connect_timeout = connect_timeout
+        self.pool_timeout = pool_timeout
+        self.read_timeout = read_timeout
+
+    @classmethod
+    def from_env(cls) -> Optional["ConnectionPoolConfig"]:
+        """Build settings from ``OPENAI_*`` environment variables
+
+        Returns:
+            Settings if any pool variable is set, otherwise None
+        """
+        values: Dict[str, Any] = {}
+        for field, env_var in _ENV_VARS.items():
+            raw = os.getenv(env_var)
+            if raw is None or raw == "":
+                continue
+            if field == "http2":
+                values[field] = raw.strip().lower() in ("1", "true", "yes", "on")
+            elif field in ("max_connections", "max_keepalive_connections"):
+                values[field] = int(raw)
+            else:
+                values[field] = float(raw)
+        return cls(**values) if values else None
+
+    def httpx_limits(self) -> "httpx.Limits":
+        """Build the ``httpx.Limits`` for these settings"""
+        from ..httpx_compat import httpx
+
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def httpx_timeout(self) -> "httpx.Timeout":
+        """Build the ``httpx.Timeout`` for these settings"""
+        from ..httpx_compat import httpx
+
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.read_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ConnectionPoolConfig(max_connections={self.max_connections}, "
+            f"max_keepalive_connections={self.max_keepalive_connections}, "
+            f"keepalive_expiry={self.keepalive_expiry}, http2={self.http2}, "
+            f"connect_timeout={self.connect_timeout}, "
+            f"pool_timeout={self.pool_timeout}, read_timeout={self.read_timeout})"
+        )
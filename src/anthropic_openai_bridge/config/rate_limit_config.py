@@ -0,0 +1,85 @@
+"""Client-side request and token rate limit settings"""
+
+import os
+from typing import Any, Dict, Optional
+
+# Environment variables read by RateLimitConfig.from_env
+_ENV_VARS = {
+    "requests_per_minute": "OPENAI_RATE_LIMIT_RPM",
+    "tokens_per_minute": "OPENAI_RATE_LIMIT_TPM",
+    "model_requests_per_minute": "OPENAI_MODEL_RATE_LIMIT_RPM",
+    "model_tokens_per_minute": "OPENAI_MODEL_RATE_LIMIT_TPM",
+    "max_wait": "OPENAI_RATE_LIMIT_MAX_WAIT",
+    "store_path": "OPENAI_RATE_LIMIT_STORE_PATH",
+}
+
+
+class RateLimitConfig:
+    """Request and token budgets enforced before calling the upstream
+
+    Endpoint limits apply to each endpoint separately; model limits apply to
+    each model across all endpoints. Unset limits are not enforced.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        model_requests_per_minute: Optional[float] = None,
+        model_tokens_per_minute: Optional[float] = None,
+        max_wait: float = 60.0,
+        store_path: Optional[str] = None,
+    ):
+        """Initialize rate limit settings
+
+        Args:
+            requests_per_minute: Requests allowed per endpoint per minute
+            tokens_per_minute: Tokens allowed per endpoint per minute
+            model_requests_per_minute: Requests allowed per model per minute
+            model_tokens_per_minute: Tokens allowed per model per minute
+            max_wait: Longest a request is delayed before it fails with a 429
+            store_path: SQLite file holding the buckets so every process on
+                the host shares one budget (in memory if None)
+        """
+        limits = (
+            requests_per_minute,
+            tokens_per_minute,
+            model_requests_per_minute,
+            model_tokens_per_minute,
+        )
+        if any(limit is not None and limit <= 0 for limit in limits):
+            raise ValueError("Rate limits must be positive")
+        if max_wait < 0:
+            raise ValueError("max_wait cannot be negative")
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.model_requests_per_minute = model_requests_per_minute
+        self.model_tokens_per_minute = model_tokens_per_minute
+        self.max_wait = max_wait
+        self.store_path = store_path
+
+    @classmethod
+    def from_env(cls) -> Optional["RateLimitConfig"]:
+        """Build settings from ``OPENAI_RATE_LIMIT_*`` environment variables
+
+        Returns:
+            Settings if any limit is set, otherwise None
+        """
+        values: Dict[str, Any] = {}
+        for field, env_var in _ENV_VARS.items():
+            raw = os.getenv(env_var)
+            if raw is None or raw == "":
+                continue
+            values[field] = raw if field == "store_path" else float(raw)
+        if not set(values) - {"max_wait", "store_path"}:
+            return None
+        return cls(**values)
+
+    def __repr__(self) -> str:
+        return (
+            f"RateLimitConfig(requests_per_minute={self.requests_per_minute}, "
+            f"tokens_per_minute={self.tokens_per_minute}, "
+            f"model_requests_per_minute={self.model_requests_per_minute}, "
+            f"model_tokens_per_minute={self.model_tokens_per_minute}, "
+            f"max_wait={self.max_wait}, store_path={self.store_path!r})"
+        )
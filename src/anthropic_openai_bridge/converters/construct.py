@@ -0,0 +1,74 @@
+"""Validated or trusted construction of Anthropic response models"""
+
+import copy
+import functools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+if TYPE_CHECKING:
+    import pydantic
+
+ModelT = TypeVar("ModelT", bound="pydantic.BaseModel")
+
+# Per model class: (field name, factory) for fields needing a fresh default
+_FieldPlan = List[Tuple[str, Callable[[], Any]]]
+_plans: Dict[type, _FieldPlan] = {}
+# Defaults of these types can be shared between instances
+_IMMUTABLE = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+
+def _field_plan(model_class: type) -> _FieldPlan:
+    """Get the fields whose default must be created per instance"""
+    if model_class in _plans:
+        return _plans[model_class]
+    plan: _FieldPlan = []
+    fields = getattr(model_class, "model_fields", None) or {}
+    for name, info in fields.items():
+        if info.is_required():
+            continue
+        factory = info.default_factory
+        if factory is None and not isinstance(info.default, _IMMUTABLE):
+            # Copy mutable defaults per instance, as pydantic does
+            factory = functools.partial(copy.deepcopy, info.default)
+        if factory is not None:
+            plan.append((name, factory))
+    _plans[model_class] = plan
+    return plan
+
+
+def build_model(model_class: Type[ModelT], trusted: bool, **fields: Any) -> ModelT:
+    """Create a response model, optionally skipping pydantic validation
+
+    Trusted construction goes through pydantic's ``model_construct``, which
+    sets the given fields and defaults for the rest without checking types.
+    It is only equivalent to validation when the fields already have the
+    declared types, which holds for values the converters build from a
+    well-formed upstream response. The SDK overrides ``model_construct`` to
+    convert every value by its annotated type, which is slower than
+    validating, so pydantic's implementation is called directly.
+
+    Args:
+        model_class: Model to create
+        trusted: Skip validation
+        **fields: Field values
+    """
+    if not trusted:
+        return model_class(**fields)
+    import pydantic
+
+    values = dict(fields)
+    for name, factory in _field_plan(model_class):
+        if name not in values:
+            values[name] = factory()
+    model_construct = vars(pydantic.BaseModel)["model_construct"].__func__
+    return cast(ModelT, model_construct(model_class, _fields_set=set(fields), **values))
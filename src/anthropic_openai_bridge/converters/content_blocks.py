@@ -0,0 +1,165 @@
+"""Single-pass conversion of Anthropic content blocks to OpenAI message parts"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from .tool_converter import ToolConverter
+
+
+class ConvertedContent:
+    """OpenAI pieces produced from one Anthropic message's content blocks
+
+    ``parts`` are the message's own content parts in block order,
+    ``tool_calls`` come from ``tool_use`` blocks and ``tool_messages`` are
+    the separate ``tool`` role messages produced by ``tool_result`` blocks.
+    """
+
+    __slots__ = ("parts", "tool_calls", "tool_messages")
+
+    def __init__(self) -> None:
+        self.parts: List[Dict[str, Any]] = []
+        self.tool_calls: List[Dict[str, Any]] = []
+        self.tool_messages: List[Dict[str, Any]] = []
+
+    def message_content(self) -> Optional[Any]:
+        """Get the content of the converted message
+
+        Returns:
+            The text of a single text part, the ordered list of parts
+            otherwise, or None if there are no parts
+        """
+        if not self.parts:
+            return None
+        if len(self.parts) == 1 and self.parts[0]["type"] == "text":
+            return self.parts[0]["text"]
+        return self.parts
+
+
+BlockHandler = Callable[[Dict[str, Any], ConvertedContent, ToolConverter], None]
+
+
+def _data_url(source: Dict[str, Any]) -> str:
+    # The base64 payload is passed through as-is, never decoded
+    return f"data:{source['media_type']};base64,{source['data']}"
+
+
+def _unsupported_source(block: Dict[str, Any]) -> ValueError:
+    source_type = block["source"].get("type")
+    return ValueError(
+        f"{block['type']} blocks with a {source_type!r} source are not supported"
+    )
+
+
+def convert_text_block(
+    block: Dict[str, Any], content: ConvertedContent, tools: ToolConverter
+) -> None:
+    """Convert a text block to a text part, dropping blank text"""
+    if block["text"].strip():
+        content.parts.append({"type": "text", "text": block["text"]})
+
+
+def convert_image_block(
+    block: Dict[str, Any], content: ConvertedContent, tools: ToolConverter
+) -> None:
+    """Convert a base64 or URL image block to an ``image_url`` part
+
+    Raises:
+        ValueError: For other image sources, such as uploaded file IDs
+    """
+    source = block["source"]
+    if source["type"] == "base64":
+        url = _data_url(source)
+    elif source["type"] == "url":
+        url = source["url"]
+    else:
+        raise _unsupported_source(block)
+    content.parts.append({"type": "image_url", "image_url": {"url": url}})
+
+
+def convert_document_block(
+    block: Dict[str, Any], content: ConvertedContent, tools: ToolConverter
+) -> None:
+    """Convert a document block to a file part or text parts
+
+    Base64 documents (PDFs) become ``file`` parts, plain text documents and
+    documents given as content blocks become text parts.
+
+    Raises:
+        ValueError: For URL and uploaded file sources, which chat
+            completions cannot fetch
+    """
+    source = block["source"]
+    if source["type"] == "base64":
+        content.parts.append(
+            {
+                "type": "file",
+                "file": {
+                    "filename": block.get("title") or "document.pdf",
+                    "file_data": _data_url(source),
+                },
+            }
+        )
+    elif source["type"] == "text":
+        convert_text_block({"text": source["data"]}, content, tools)
+    elif source["type"] == "content" and isinstance(source["content"], str):
+        convert_text_block({"text": source["content"]}, content, tools)
+    elif source["type"] == "content":
+        for inner in source["content"]:
+            handler = BLOCK_HANDLERS.get(inner.get("type", ""))
+            if handler is not None:
+                handler(inner, content, tools)
+    else:
+        raise _unsupported_source(block)
+
+
+def convert_tool_use_block(
+    block: Dict[str, Any], content: ConvertedContent, tools: ToolConverter
+) -> None:
+    """Convert a tool use block to an OpenAI tool call"""
+    content.tool_calls.append(
+        {
+            "id": tools._convert_tool_use_id_to_call_id(block["id"]),
+            "type": "function",
+            "function": {
+                "name": block["name"],
+                "arguments": json.dumps(block["input"]),
+            },
+        }
+    )
+
+
+def convert_tool_result_block(
+    block: Dict[str, Any], content: ConvertedContent, tools: ToolConverter
+) -> None:
+    """Convert a tool result block to an OpenAI tool message"""
+    content.tool_messages.append(tools.convert_anthropic_tool_result_to_openai(block))
+
+
+# Handlers by Anthropic block type. Blocks of other types (such as thinking
+# blocks) are skipped; add entries here to convert more block types.
+BLOCK_HANDLERS: Dict[str, BlockHandler] = {
+    "text": convert_text_block,
+    "image": convert_image_block,
+    "document": convert_document_block,
+    "tool_use": convert_tool_use_block,
+    "tool_result": convert_tool_result_block,
+}
+
+
+def convert_blocks(blocks: List[Any], tools: ToolConverter) -> ConvertedContent:
+    """Convert a message's content blocks in one pass, keeping their order
+
+    Args:
+        blocks: Anthropic content blocks
+        tools: Converter used for tool call IDs
+
+    Raises:
+        ValueError: If a block cannot be represented in an OpenAI request
+    """
+    content = ConvertedContent()
+    for block in blocks:
+        if isinstance(block, dict):
+            handler = BLOCK_HANDLERS.get(block.get("type", ""))
+            if handler is not None:
+                handler(block, content, tools)
+    return content
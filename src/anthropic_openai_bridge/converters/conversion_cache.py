@@ -0,0 +1,136 @@
+"""Reuse of converted messages across the turns of a conversation"""
+
+import collections
+import contextlib
+import contextvars
+import threading
+from typing import Any, Dict, Iterator, List, OrderedDict, Tuple
+
+# Anthropic messages of a converted history and the OpenAI messages they
+# converted to
+_Entry = Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+
+_bypassed: "contextvars.ContextVar[bool]" = contextvars.ContextVar(
+    "bridge_conversion_cache_bypassed", default=False
+)
+
+
+@contextlib.contextmanager
+def without_conversion_cache() -> Iterator[None]:
+    """Convert requests sent inside the block without the conversion cache
+
+    For callers whose requests never share message dicts with earlier ones,
+    such as requests decoded from JSON, which could only fill the cache.
+    """
+    token = _bypassed.set(True)
+    try:
+        yield
+    finally:
+        _bypassed.reset(token)
+
+
+def conversion_cache_bypassed() -> bool:
+    """Whether the current code runs inside a ``without_conversion_cache`` block"""
+    return _bypassed.get()
+
+
+class ConversionCache:
+    """Bounded LRU of converted conversation histories
+
+    Agent loops resend the whole history every turn and only append to it.
+    The cache remembers each conversation's last converted history, keyed by
+    the identity of its first message, so a new turn reuses the converted
+    prefix and only converts the messages appended since. The prefix is
+    checked with a list comparison, which compares the message dicts by
+    identity first and by value otherwise, so it costs far less than
+    converting and a history that was edited or branched is converted in
+    full again.
+
+    Cached histories hold on to their messages. A message edited in place
+    after it was sent still compares equal to itself, so messages must not
+    be modified once sent.
+    """
+
+    def __init__(self, max_messages: int = 10000):
+        """Initialize the cache
+
+        Args:
+            max_messages: Most messages held across all cached histories
+                before the least recently used histories are dropped
+        """
+        if max_messages <= 0:
+            raise ValueError("max_messages must be positive")
+        self.max_messages = max_messages
+        self._lock = threading.Lock()
+        # id of first message -> history, least recently used first
+        self._entries: OrderedDict[int, _Entry] = collections.OrderedDict()
+        self._messages = 0
+        self.hits = 0
+        self.misses = 0
+        self.reused_messages = 0
+        self.evictions = 0
+
+    def get(self, messages: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+        """Find the longest converted prefix of a history
+
+        Args:
+            messages: Anthropic messages of the request
+
+        Returns:
+            Number of leading messages already converted, and the OpenAI
+            messages they converted to
+        """
+        if not messages:
+            return 0, []
+        with self._lock:
+            entry = self._entries.get(id(messages[0]))
+            if entry is not None:
+                history, converted = entry
+                if len(history) <= len(messages) and (
+                    messages[: len(history)] == history
+                ):
+                    self._entries.move_to_end(id(messages[0]))
+                    self.hits += 1
+                    self.reused_messages += len(history)
+                    return len(history), converted
+            self.misses += 1
+            return 0, []
+
+    def set(
+        self, messages: List[Dict[str, Any]], converted: List[Dict[str, Any]]
+    ) -> None:
+        """Remember the OpenAI messages a history converted to"""
+        if not messages or len(messages) > self.max_messages:
+            return
+        key = id(messages[0])
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._messages -= len(previous[0])
+            self._entries[key] = (list(messages), converted)
+            self._messages += len(messages)
+            while self._messages > self.max_messages:
+                _, (history, _) = self._entries.popitem(last=False)
+                self._messages -= len(history)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._messages = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return hit, miss and eviction counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "conversations": len(self._entries),
+                "messages": self._messages,
+                "max_messages": self.max_messages,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "reused_messages": self.reused_messages,
+                "evictions": self.evictions,
+            }
@@ -1,14 +1,28 @@
-import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
+from .content_blocks import convert_blocks
+from .conversion_cache import ConversionCache, conversion_cache_bypassed
+from .tool_cache import ToolDefinitionCache
 from .tool_converter import ToolConverter
 
 
 class RequestConverter:
     """Converts Anthropic Messages API requests to OpenAI ChatCompletions API requests"""
 
-    def __init__(self) -> None:
-        self.tool_converter = ToolConverter()
+    def __init__(
+        self,
+        conversion_cache: Optional[ConversionCache] = None,
+        tool_cache: Optional[ToolDefinitionCache] = None,
+    ) -> None:
+        """Initialize the converter
+
+        Args:
+            conversion_cache: Cache of converted messages, so messages resent
+                on later turns of a conversation are not converted again
+            tool_cache: Cache of converted and encoded tool definitions
+        """
+        self.tool_converter = ToolConverter(tool_cache=tool_cache)
+        self.conversion_cache = conversion_cache
 
     def convert(self, anthropic_request: Dict[str, Any]) -> Dict[str, Any]:
         """Convert an Anthropic request to OpenAI format"""
@@ -26,6 +40,11 @@ class RequestConverter:
         if "temperature" in anthropic_request:
             openai_request["temperature"] = anthropic_request["temperature"]
 
+        # Identify the end user, which also keys per-tenant scheduling
+        user_id = (anthropic_request.get("metadata") or {}).get("user_id")
+        if user_id:
+            openai_request["user"] = user_id
+
         # Handle tool definitions
         if "tools" in anthropic_request:
             openai_request["tools"] = (
@@ -59,8 +78,15 @@ class RequestConverter:
         if "system" in anthropic_request:
             messages.append({"role": "system", "content": anthropic_request["system"]})
 
-        # Process each message
-        for message in anthropic_request.get("messages", []):
+        # Process each message, reusing the converted history of earlier turns
+        anthropic_messages = anthropic_request.get("messages", [])
+        cache = None if conversion_cache_bypassed() else self.conversion_cache
+        start = 0
+        if cache is not None:
+            start, converted_history = cache.get(anthropic_messages)
+            messages.extend(converted_history)
+
+        for message in anthropic_messages[start:]:
             if message["role"] in ["user", "assistant"]:
                 converted_message = self._convert_message_content(message)
                 if converted_message:
@@ -69,6 +95,11 @@ class RequestConverter:
                     else:
                         messages.append(converted_message)
 
+        if cache is not None and len(anthropic_messages) > start:
+            # Everything after the system message is this history's conversion
+            first = 1 if "system" in anthropic_request else 0
+            cache.set(anthropic_messages, messages[first:])
+
         return messages
 
     def _convert_message_content(
@@ -82,91 +113,33 @@ class RequestConverter:
         if isinstance(content, str):
             return {"role": role, "content": content}
 
-        # Handle content blocks (list)
-        if isinstance(content, list):
-            # Check if this contains tool results (user messages)
-            tool_result_blocks = [
-                block
-                for block in content
-                if isinstance(block, dict) and block.get("type") == "tool_result"
-            ]
-
-            if tool_result_blocks:
-                # Convert tool result blocks to OpenAI tool messages
-                tool_messages = (
-                    self.tool_converter.convert_anthropic_tool_results_to_openai(
-                        content
-                    )
-                )
+        if not isinstance(content, list):
+            return None
 
-                # Handle any text content alongside tool results
-                text_blocks = [
-                    block
-                    for block in content
-                    if isinstance(block, dict) and block.get("type") == "text"
-                ]
-                regular_messages = []
-
-                if text_blocks:
-                    text_content = " ".join(block["text"] for block in text_blocks)
-                    if text_content.strip():
-                        regular_messages.append({"role": role, "content": text_content})
-
-                # Return both regular messages and tool messages
-                return regular_messages + tool_messages
-
-            # Check if this contains tool use blocks (assistant messages)
-            tool_use_blocks = [
-                block
-                for block in content
-                if isinstance(block, dict) and block.get("type") == "tool_use"
+        converted = convert_blocks(content, self.tool_converter)
+        if role == "assistant":
+            # Chat completions only accept text parts in assistant messages
+            converted.parts = [
+                part for part in converted.parts if part["type"] == "text"
             ]
-
-            if tool_use_blocks:
-                # Handle assistant messages with tool calls
-                message_dict = {"role": role}
-
-                # Get text content
-                text_blocks = [
-                    block
-                    for block in content
-                    if isinstance(block, dict) and block.get("type") == "text"
-                ]
-                if text_blocks:
-                    text_content = " ".join(block["text"] for block in text_blocks)
-                    message_dict["content"] = (
-                        text_content if text_content.strip() else None
-                    )
-                else:
-                    message_dict["content"] = None
-
-                # Convert tool use blocks to OpenAI tool calls
-                tool_calls = []
-                for block in tool_use_blocks:
-                    tool_call = {
-                        "id": self.tool_converter._convert_tool_use_id_to_call_id(
-                            block["id"]
-                        ),
-                        "type": "function",
-                        "function": {
-                            "name": block["name"],
-                            "arguments": json.dumps(block["input"]),
-                        },
-                    }
-                    tool_calls.append(tool_call)
-
-                message_dict["tool_calls"] = tool_calls
-                return message_dict  # type: ignore
-            else:
-                # Handle other content blocks (like text blocks only)
-                text_blocks = [
-                    block
-                    for block in content
-                    if isinstance(block, dict) and block.get("type") == "text"
-                ]
-                if text_blocks:
-                    text_content = " ".join(block["text"] for block in text_blocks)
-                    if text_content.strip():
-                        return {"role": role, "content": text_content}
-
+        message_content = converted.message_content()
+
+        # Tool results (user messages) become tool messages, preceded by a
+        # message holding any other content
+        if converted.tool_messages:
+            regular_messages = []
+            if message_content is not None:
+                regular_messages.append({"role": role, "content": message_content})
+            return regular_messages + converted.tool_messages
+
+        # Tool use blocks (assistant messages) become tool calls
+        if converted.tool_calls:
+            return {
+                "role": role,
+                "content": message_content,
+                "tool_calls": converted.tool_calls,
+            }
+
+        if message_content is not None:
+            return {"role": role, "content": message_content}
         return None
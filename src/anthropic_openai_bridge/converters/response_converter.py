@@ -3,14 +3,25 @@ from typing import Any, Dict, List, cast
 
 import anthropic.types
 
+from ..errors import error_from_dict
+from .construct import build_model
 from .tool_converter import ToolConverter
 
 
 class ResponseConverter:
     """Converts OpenAI ChatCompletions API responses to Anthropic Messages API responses"""
 
-    def __init__(self) -> None:
-        self.tool_converter = ToolConverter()
+    def __init__(self, trusted: bool = False) -> None:
+        """Initialize the converter
+
+        Args:
+            trusted: Build the Message and its blocks with ``model_construct``
+                instead of validating them. Saves CPU for high request rates;
+                the result matches the validated one for well-formed
+                upstream responses.
+        """
+        self.trusted = trusted
+        self.tool_converter = ToolConverter(trusted)
 
     STOP_REASON_MAPPING = {
         "stop": "end_turn",
@@ -25,8 +36,7 @@ class ResponseConverter:
 
         # Handle error responses
         if "error" in openai_response:
-            error_msg = openai_response["error"].get("message", "Unknown error")
-            raise Exception(f"OpenAI API Error: {error_msg}")
+            raise error_from_dict(openai_response["error"])
 
         choice = openai_response["choices"][0]
         message = choice["message"]
@@ -34,12 +44,16 @@ class ResponseConverter:
         # Build content blocks
         content = self._build_content_blocks(message)
 
-        usage = anthropic.types.Usage(
+        usage = build_model(
+            anthropic.types.Usage,
+            self.trusted,
             input_tokens=openai_response.get("usage", {}).get("prompt_tokens", 0),
             output_tokens=openai_response.get("usage", {}).get("completion_tokens", 0),
         )
 
-        anthropic_response = anthropic.types.Message(
+        anthropic_response = build_model(
+            anthropic.types.Message,
+            self.trusted,
             id=f"msg_{uuid.uuid4().hex[:8].upper()}",
             type="message",
             role="assistant",
@@ -64,7 +78,12 @@ class ResponseConverter:
         # Add text content if present
         if message.get("content"):
             content.append(
-                anthropic.types.TextBlock(type="text", text=message["content"])
+                build_model(
+                    anthropic.types.TextBlock,
+                    self.trusted,
+                    type="text",
+                    text=message["content"],
+                )
             )
 
         # Add tool use blocks if present
@@ -78,7 +97,11 @@ class ResponseConverter:
 
         # If no content was created, add a default empty text block
         if not content:
-            content.append(anthropic.types.TextBlock(type="text", text=""))
+            content.append(
+                build_model(
+                    anthropic.types.TextBlock, self.trusted, type="text", text=""
+                )
+            )
 
         return content
 
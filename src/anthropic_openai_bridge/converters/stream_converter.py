@@ -0,0 +1,309 @@
+"""Incremental conversion of OpenAI chat completion chunks to Anthropic stream events"""
+
+import json
+import uuid
+from typing import Any, Dict, List, Optional, cast
+
+import anthropic.types
+
+from ..errors import error_from_dict
+from .response_converter import ResponseConverter
+from .tool_converter import ToolConverter
+
+
+class _BlockState:
+    """Accumulated state of one Anthropic content block while streaming"""
+
+    __slots__ = ("type", "parts", "tool_id", "tool_name")
+
+    def __init__(
+        self,
+        block_type: str,
+        tool_id: Optional[str] = None,
+        tool_name: Optional[str] = None,
+    ) -> None:
+        self.type = block_type
+        # Fragments are joined once at the end so accumulation stays linear
+        self.parts: List[str] = []
+        self.tool_id = tool_id
+        self.tool_name = tool_name
+
+
+def _is_complete_json(text: str) -> bool:
+    try:
+        json.loads(text)
+    except ValueError:
+        return False
+    return True
+
+
+class StreamConverter:
+    """Converts OpenAI ChatCompletion chunks into Anthropic Messages stream events
+
+    One converter instance handles exactly one streamed response. Feed every
+    chunk dictionary to ``convert_chunk`` and call ``finish`` once the upstream
+    stream is exhausted; both return the Anthropic events to emit. The complete
+    ``anthropic.types.Message`` is available from ``get_final_message``.
+    """
+
+    def __init__(self, model: Optional[str] = None) -> None:
+        self.tool_converter = ToolConverter()
+        self.message_id = f"msg_{uuid.uuid4().hex[:8].upper()}"
+        self.model = model or "unknown"
+        self.started = False
+        self.finished = False
+        self.finish_reason: Optional[str] = None
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self._blocks: List[_BlockState] = []
+        self._open_block: Optional[int] = None
+        # OpenAI tool call index -> Anthropic content block index
+        self._tool_blocks: Dict[int, int] = {}
+        # Tool calls whose arguments are still arriving, by OpenAI index
+        self._pending_tools: Dict[int, _BlockState] = {}
+
+    def convert_chunk(
+        self, chunk: Dict[str, Any]
+    ) -> List[anthropic.types.RawMessageStreamEvent]:
+        """Convert a single OpenAI chunk into zero or more Anthropic events"""
+        if "error" in chunk:
+            raise error_from_dict(chunk["error"])
+
+        events: List[anthropic.types.RawMessageStreamEvent] = []
+
+        if chunk.get("model"):
+            self.model = chunk["model"]
+        if not self.started:
+            events.append(self._message_start_event())
+
+        usage = chunk.get("usage")
+        if usage:
+            self.input_tokens = usage.get("prompt_tokens", 0) or 0
+            self.output_tokens = usage.get("completion_tokens", 0) or 0
+
+        for choice in chunk.get("choices") or []:
+            if choice.get("index", 0) != 0:
+                continue
+            delta = choice.get("delta") or {}
+
+            if delta.get("content"):
+                events.extend(self._text_delta_events(delta["content"]))
+
+            for tool_call in delta.get("tool_calls") or []:
+                events.extend(self._tool_call_delta_events(tool_call))
+
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+                events.extend(self._flush_tool_calls())
+
+        return events
+
+    def finish(self) -> List[anthropic.types.RawMessageStreamEvent]:
+        """Emit the closing events once the upstream stream is exhausted"""
+        if self.finished:
+            return []
+
+        events: List[anthropic.types.RawMessageStreamEvent] = []
+        if not self.started:
+            events.append(self._message_start_event())
+        events.extend(self._flush_tool_calls())
+
+        # Anthropic streams always carry at least one content block
+        if not self._blocks:
+            events.extend(self._start_block(_BlockState("text")))
+        events.extend(self._close_open_block())
+
+        events.append(
+            anthropic.types.RawMessageDeltaEvent(
+                type="message_delta",
+                delta={
+                    "stop_reason": self._stop_reason(),
+                    "stop_sequence": None,
+                },  # type: ignore[arg-type]
+                usage=anthropic.types.MessageDeltaUsage(
+                    input_tokens=self.input_tokens,
+                    output_tokens=self.output_tokens,
+                ),
+            )
+        )
+        events.append(anthropic.types.RawMessageStopEvent(type="message_stop"))
+        self.finished = True
+        return events
+
+    def get_final_message(self) -> anthropic.types.Message:
+        """Build the accumulated Anthropic message from everything seen so far"""
+        content: List[anthropic.types.ContentBlock] = []
+        for block in self._blocks + list(self._pending_tools.values()):
+            if block.type == "text":
+                content.append(
+                    anthropic.types.TextBlock(type="text", text="".join(block.parts))
+                )
+            else:
+                try:
+                    arguments = json.loads("".join(block.parts) or "{}")
+                except json.JSONDecodeError:
+                    arguments = {}
+                content.append(
+                    anthropic.types.ToolUseBlock(
+                        type="tool_use",
+                        id=cast(str, block.tool_id),
+                        name=cast(str, block.tool_name),
+                        input=arguments,
+                    )
+                )
+
+        if not content:
+            content.append(anthropic.types.TextBlock(type="text", text=""))
+
+        return anthropic.types.Message(
+            id=self.message_id,
+            type="message",
+            role="assistant",
+            content=content,
+            model=self.model,
+            stop_reason=cast(anthropic.types.StopReason, self._stop_reason()),
+            stop_sequence=None,
+            usage=anthropic.types.Usage(
+                input_tokens=self.input_tokens, output_tokens=self.output_tokens
+            ),
+        )
+
+    def _message_start_event(self) -> anthropic.types.RawMessageStartEvent:
+        self.started = True
+        return anthropic.types.RawMessageStartEvent(
+            type="message_start",
+            message=anthropic.types.Message(
+                id=self.message_id,
+                type="message",
+                role="assistant",
+                content=[],
+                model=self.model,
+                stop_reason=None,
+                stop_sequence=None,
+                usage=anthropic.types.Usage(input_tokens=0, output_tokens=0),
+            ),
+        )
+
+    def _text_delta_events(
+        self, text: str
+    ) -> List[anthropic.types.RawMessageStreamEvent]:
+        events: List[anthropic.types.RawMessageStreamEvent] = []
+        if self._open_block is None or self._blocks[self._open_block].type != "text":
+            events.extend(self._close_open_block())
+            events.extend(self._start_block(_BlockState("text")))
+
+        index = cast(int, self._open_block)
+        self._blocks[index].parts.append(text)
+        events.append(
+            anthropic.types.RawContentBlockDeltaEvent(
+                type="content_block_delta",
+                index=index,
+                delta=anthropic.types.TextDelta(type="text_delta", text=text),
+            )
+        )
+        return events
+
+    def _tool_call_delta_events(
+        self, tool_call: Dict[str, Any]
+    ) -> List[anthropic.types.RawMessageStreamEvent]:
+        events: List[anthropic.types.RawMessageStreamEvent] = []
+        call_index = tool_call.get("index", 0)
+        function = tool_call.get("function") or {}
+
+        if call_index in self._tool_blocks:
+            # The call was already emitted with arguments that parsed as
+            # complete JSON, so a later fragment cannot belong to it
+            return events
+
+        block = self._pending_tools.get(call_index)
+        if block is None:
+            # A new call usually means the previous ones are complete
+            events.extend(self._flush_tool_calls(complete_only=True))
+            call_id = tool_call.get("id") or self.tool_converter.generate_tool_call_id()
+            block = _BlockState(
+                "tool_use",
+                tool_id=self.tool_converter._convert_tool_call_id(call_id),
+                tool_name=function.get("name") or "",
+            )
+            self._pending_tools[call_index] = block
+
+        if function.get("name") and not block.tool_name:
+            block.tool_name = function["name"]
+        if function.get("arguments"):
+            block.parts.append(function["arguments"])
+        return events
+
+    def _flush_tool_calls(
+        self, complete_only: bool = False
+    ) -> List[anthropic.types.RawMessageStreamEvent]:
+        """Emit buffered tool calls as start, delta and stop events
+
+        OpenAI may interleave the argument fragments of parallel tool calls,
+        while an Anthropic tool block cannot receive deltas once it stopped.
+        Each call is therefore buffered and emitted in one piece, either once
+        its arguments form complete JSON and another call starts or when the
+        choice finishes.
+        """
+        events: List[anthropic.types.RawMessageStreamEvent] = []
+        for call_index, block in list(self._pending_tools.items()):
+            arguments = "".join(block.parts)
+            if complete_only and not _is_complete_json(arguments):
+                continue
+            del self._pending_tools[call_index]
+            block.parts = [arguments] if arguments else []
+
+            events.extend(self._close_open_block())
+            events.extend(self._start_block(block))
+            self._tool_blocks[call_index] = cast(int, self._open_block)
+            if arguments:
+                events.append(
+                    anthropic.types.RawContentBlockDeltaEvent(
+                        type="content_block_delta",
+                        index=cast(int, self._open_block),
+                        delta=anthropic.types.InputJSONDelta(
+                            type="input_json_delta", partial_json=arguments
+                        ),
+                    )
+                )
+            events.extend(self._close_open_block())
+        return events
+
+    def _start_block(
+        self, block: _BlockState
+    ) -> List[anthropic.types.RawMessageStreamEvent]:
+        self._blocks.append(block)
+        self._open_block = len(self._blocks) - 1
+
+        content_block: anthropic.types.ContentBlock
+        if block.type == "text":
+            content_block = anthropic.types.TextBlock(type="text", text="")
+        else:
+            content_block = anthropic.types.ToolUseBlock(
+                type="tool_use",
+                id=cast(str, block.tool_id),
+                name=cast(str, block.tool_name),
+                input={},
+            )
+        return [
+            anthropic.types.RawContentBlockStartEvent(
+                type="content_block_start",
+                index=self._open_block,
+                content_block=content_block,  # type: ignore[arg-type]
+            )
+        ]
+
+    def _close_open_block(self) -> List[anthropic.types.RawMessageStreamEvent]:
+        if self._open_block is None:
+            return []
+        index = self._open_block
+        self._open_block = None
+        return [
+            anthropic.types.RawContentBlockStopEvent(
+                type="content_block_stop", index=index
+            )
+        ]
+
+    def _stop_reason(self) -> str:
+        return ResponseConverter.STOP_REASON_MAPPING.get(
+            self.finish_reason or "stop", "end_turn"
+        )
@@ -0,0 +1,120 @@
+"""Reuse of converted and encoded tool definitions across requests"""
+
+import collections
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, OrderedDict, Tuple
+
+from ..json_codec import EncodedList, dumps
+
+# Tool list, a copy of its items when it was fingerprinted, and the fingerprint
+_Seen = Tuple[List[Dict[str, Any]], List[Dict[str, Any]], str]
+
+
+class ToolDefinitionCache:
+    """Bounded LRU of converted tool lists, keyed by a fingerprint of the tools
+
+    Agents send the same tool definitions with every request. The cache
+    converts each distinct tool set once and keeps the OpenAI tool list with
+    its JSON encoding, which the client splices into the request body instead
+    of serializing the schemas again. The fingerprint is a digest of the
+    encoded Anthropic tools. A tool list sent again as the same object with
+    the same items skips even that. Those items are compared by identity
+    first, so a tool dict edited in place still matches its old fingerprint:
+    tool lists and their dicts must not be modified once sent.
+
+    Returned lists are shared between requests and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, max_seen: int = 256):
+        """Initialize the cache
+
+        Args:
+            max_bytes: Largest total size of the encoded tool lists kept
+            max_seen: Most tool list objects whose fingerprint is remembered
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.max_seen = max_seen
+        self._lock = threading.Lock()
+        # Fingerprint -> converted tools, least recently used first
+        self._entries: OrderedDict[str, EncodedList] = collections.OrderedDict()
+        # id of a tool list -> fingerprint, for lists sent again as-is
+        self._seen: OrderedDict[int, _Seen] = collections.OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def fingerprint(self, tools: List[Dict[str, Any]]) -> str:
+        """Get the digest identifying a list of Anthropic tool definitions"""
+        with self._lock:
+            seen = self._seen.get(id(tools))
+            # List comparison checks each item by identity before value
+            if seen is not None and seen[0] is tools and seen[1] == tools:
+                self._seen.move_to_end(id(tools))
+                return seen[2]
+        digest = hashlib.sha256(dumps(tools)).hexdigest()
+        with self._lock:
+            self._seen[id(tools)] = (tools, list(tools), digest)
+            while len(self._seen) > self.max_seen:
+                self._seen.popitem(last=False)
+        return digest
+
+    def get_or_convert(
+        self,
+        tools: List[Dict[str, Any]],
+        convert: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+    ) -> EncodedList:
+        """Get the converted tool list, converting and encoding it on a miss
+
+        Args:
+            tools: Anthropic tool definitions
+            convert: Converts the definitions to OpenAI tools
+
+        Returns:
+            OpenAI tools carrying their encoded JSON
+        """
+        key = self.fingerprint(tools)
+        with self._lock:
+            converted = self._entries.get(key)
+            if converted is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return converted
+            self.misses += 1
+
+        converted = EncodedList(convert(tools))
+        size = len(converted.encoded)
+        with self._lock:
+            if key in self._entries or size > self.max_bytes:
+                return converted
+            self._entries[key] = converted
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.encoded)
+                self.evictions += 1
+        return converted
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._seen.clear()
+            self._bytes = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return hit, miss and eviction counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
@@ -1,17 +1,46 @@
 import json
 import uuid
-from typing import Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-import anthropic.types
+from .construct import build_model
+from .tool_cache import ToolDefinitionCache
+
+if TYPE_CHECKING:
+    import anthropic.types
 
 
 class ToolConverter:
     """Converts between Anthropic and OpenAI tool/function calling formats"""
 
+    def __init__(
+        self, trusted: bool = False, tool_cache: Optional[ToolDefinitionCache] = None
+    ) -> None:
+        """Initialize the converter
+
+        Args:
+            trusted: Build tool use blocks without pydantic validation
+            tool_cache: Cache of converted and encoded tool definitions
+        """
+        self.trusted = trusted
+        self.tool_cache = tool_cache
+
     def convert_anthropic_tools_to_openai(
         self, anthropic_tools: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Convert Anthropic tool definitions to OpenAI function definitions"""
+        """Convert Anthropic tool definitions to OpenAI function definitions
+
+        With a tool cache, the result is a shared ``EncodedList`` carrying its
+        JSON encoding.
+        """
+        if self.tool_cache is not None:
+            return self.tool_cache.get_or_convert(
+                anthropic_tools, self._convert_anthropic_tools
+            )
+        return self._convert_anthropic_tools(anthropic_tools)
+
+    def _convert_anthropic_tools(
+        self, anthropic_tools: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         openai_tools = []
 
         for tool in anthropic_tools:
@@ -29,8 +58,11 @@ class ToolConverter:
 
     def convert_openai_tool_calls_to_anthropic(
         self, openai_tool_calls: List[Dict[str, Any]]
-    ) -> List[anthropic.types.ToolUseBlock]:
+    ) -> List["anthropic.types.ToolUseBlock"]:
         """Convert OpenAI function calls to Anthropic tool use blocks"""
+        # Imported here so converting requests does not load the Anthropic SDK
+        import anthropic.types
+
         tool_use_blocks = []
 
         for tool_call in openai_tool_calls:
@@ -47,7 +79,9 @@ class ToolConverter:
                 # Convert OpenAI call ID to Anthropic format
                 anthropic_id = self._convert_tool_call_id(tool_call["id"])
 
-                tool_use_block = anthropic.types.ToolUseBlock(
+                tool_use_block = build_model(
+                    anthropic.types.ToolUseBlock,
+                    self.trusted,
                     type="tool_use",
                     id=anthropic_id,
                     name=function["name"],
@@ -61,21 +95,24 @@ class ToolConverter:
         self, anthropic_content: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Convert Anthropic tool_result content blocks to OpenAI tool role messages"""
-        tool_messages = []
-
-        for content_block in anthropic_content:
-            if content_block.get("type") == "tool_result":
-                tool_message = {
-                    "role": "tool",
-                    "tool_call_id": self._convert_tool_use_id_to_call_id(
-                        content_block["tool_use_id"]
-                    ),
-                    "name": content_block.get("name", "unknown"),
-                    "content": content_block["content"],
-                }
-                tool_messages.append(tool_message)
-
-        return tool_messages
+        return [
+            self.convert_anthropic_tool_result_to_openai(content_block)
+            for content_block in anthropic_content
+            if content_block.get("type") == "tool_result"
+        ]
+
+    def convert_anthropic_tool_result_to_openai(
+        self, tool_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Convert one Anthropic tool_result content block to an OpenAI tool message"""
+        return {
+            "role": "tool",
+            "tool_call_id": self._convert_tool_use_id_to_call_id(
+                tool_result["tool_use_id"]
+            ),
+            "name": tool_result.get("name", "unknown"),
+            "content": tool_result["content"],
+        }
 
     def convert_tool_choice_to_openai(
         self, anthropic_tool_choice: Union[str, Dict[str, Any]]
@@ -0,0 +1,276 @@
+"""Typed errors raised for failed upstream requests"""
+
+import email.utils
+import math
+import time
+from typing import Any, Dict, Optional, Type
+
+# Upstream statuses that are safe and useful to retry
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+class BridgeError(Exception):
+    """Base class for errors raised by the bridge"""
+
+
+class UpstreamError(BridgeError):
+    """A request to an OpenAI-compatible upstream failed
+
+    Keeps the HTTP status and response headers so callers can tell a rate
+    limit from a bad request and honor ``Retry-After``.
+    """
+
+    error_type = "api_error"
+    # Status reported to our own clients when the upstream sent none
+    default_status = 500
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        code: Any = "unknown",
+    ):
+        """Initialize the error
+
+        Args:
+            message: Error message
+            status_code: HTTP status returned by the upstream, if any
+            headers: Lower-cased upstream response headers
+            code: Upstream error code
+        """
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.code = code
+
+    @property
+    def retryable(self) -> bool:
+        """Whether repeating the request may succeed"""
+        return self.status_code in RETRYABLE_STATUS_CODES
+
+    @property
+    def endpoint_fault(self) -> bool:
+        """Whether the failure reflects on the endpoint rather than the request"""
+        return (
+            self.status_code is None
+            or self.status_code >= 500
+            or self.status_code in (408, 429)
+        )
+
+    @property
+    def http_status(self) -> int:
+        """Status to report for this error when serving HTTP"""
+        return self.status_code or self.default_status
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Seconds the upstream asked us to wait, from ``Retry-After`` headers"""
+        return parse_retry_after(self.headers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the ``{"error": ...}`` dictionary returned by client wrappers"""
+        return {
+            "error": {
+                "message": self.message,
+                "type": self.error_type,
+                "code": self.code,
+                "status_code": self.status_code,
+                "headers": self.headers,
+            }
+        }
+
+
+class APIConnectionError(UpstreamError):
+    """The upstream could not be reached or the connection dropped"""
+
+    default_status = 502
+
+    @property
+    def retryable(self) -> bool:
+        return True
+
+
+class APITimeoutError(APIConnectionError):
+    """The upstream did not respond in time"""
+
+    error_type = "timeout_error"
+    default_status = 504
+
+
+class CircuitOpenError(UpstreamError):
+    """Every endpoint's circuit breaker is open, so the call failed fast"""
+
+    error_type = "overloaded_error"
+    default_status = 503
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        """Initialize the error
+
+        Args:
+            message: Error message
+            retry_after: Seconds until the first circuit admits probe requests
+        """
+        super().__init__(
+            message,
+            headers={"retry-after": str(max(1, math.ceil(retry_after)))},
+            code="circuit_open",
+        )
+
+    @property
+    def endpoint_fault(self) -> bool:
+        return False
+
+
+class BadRequestError(UpstreamError):
+    error_type = "invalid_request_error"
+
+
+class AuthenticationError(UpstreamError):
+    error_type = "authentication_error"
+
+
+class PermissionDeniedError(UpstreamError):
+    error_type = "permission_error"
+
+
+class NotFoundError(UpstreamError):
+    error_type = "not_found_error"
+
+
+class RequestTooLargeError(UpstreamError):
+    error_type = "request_too_large"
+
+
+class RateLimitError(UpstreamError):
+    error_type = "rate_limit_error"
+
+
+class RateLimitExceededError(RateLimitError):
+    """The local rate limiter would have delayed the request for too long"""
+
+    default_status = 429
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        """Initialize the error
+
+        Args:
+            message: Error message
+            retry_after: Seconds until the request would fit in the limits
+        """
+        super().__init__(
+            message,
+            headers={"retry-after": str(max(1, math.ceil(retry_after)))},
+            code="rate_limited",
+        )
+
+    @property
+    def endpoint_fault(self) -> bool:
+        return False
+
+
+class InternalServerError(UpstreamError):
+    error_type = "api_error"
+
+
+class OverloadedError(InternalServerError):
+    error_type = "overloaded_error"
+
+
+_STATUS_ERRORS: Dict[int, Type[UpstreamError]] = {
+    400: BadRequestError,
+    401: AuthenticationError,
+    403: PermissionDeniedError,
+    404: NotFoundError,
+    413: RequestTooLargeError,
+    422: BadRequestError,
+    429: RateLimitError,
+    503: OverloadedError,
+    529: OverloadedError,
+}
+
+_TYPE_ERRORS: Dict[str, Type[UpstreamError]] = {
+    "timeout_error": APITimeoutError,
+}
+
+
+def error_class_for_status(status_code: Optional[int]) -> Type[UpstreamError]:
+    """Get the error class for an upstream HTTP status"""
+    if status_code is None:
+        return UpstreamError
+    if status_code in _STATUS_ERRORS:
+        return _STATUS_ERRORS[status_code]
+    if status_code >= 500:
+        return InternalServerError
+    if status_code >= 400:
+        return BadRequestError
+    return UpstreamError
+
+
+def parse_retry_after(headers: Dict[str, str]) -> Optional[float]:
+    """Parse ``retry-after-ms`` or ``retry-after`` (seconds or HTTP date)
+
+    Returns:
+        Non-negative delay in seconds, or None if no usable header is present
+    """
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - time.time())
+
+
+def error_from_exception(error: Exception) -> UpstreamError:
+    """Convert an exception raised by the OpenAI SDK to a typed upstream error"""
+    if isinstance(error, UpstreamError):
+        return error
+    import openai
+
+    message = str(error)
+    code = getattr(error, "code", None) or "unknown"
+    if isinstance(error, openai.APITimeoutError):
+        return APITimeoutError(message, code=code)
+    if isinstance(error, openai.APIConnectionError):
+        return APIConnectionError(message, code=code)
+    if isinstance(error, openai.APIStatusError):
+        headers = {key.lower(): value for key, value in error.response.headers.items()}
+        error_class = error_class_for_status(error.status_code)
+        return error_class(message, error.status_code, headers, code)
+    return UpstreamError(message, code=getattr(error, "code", "unknown"))
+
+
+def error_from_dict(error: Dict[str, Any]) -> UpstreamError:
+    """Rebuild the typed error described by a wrapper's ``{"error": ...}`` payload
+
+    The message is prefixed with ``OpenAI API Error:`` as raised by the
+    converters.
+    """
+    message = f"OpenAI API Error: {error.get('message', 'Unknown error')}"
+    if error.get("code") == "circuit_open":
+        retry_after = parse_retry_after(error.get("headers") or {})
+        return CircuitOpenError(message, retry_after or 0.0)
+    status_code = error.get("status_code")
+    error_class = _TYPE_ERRORS.get(error.get("type", "")) or error_class_for_status(
+        status_code
+    )
+    return error_class(
+        message,
+        status_code=status_code,
+        headers=error.get("headers"),
+        code=error.get("code", "unknown"),
+    )
@@ -0,0 +1,14 @@
+"""The httpx package the installed OpenAI and Anthropic SDKs are built on
+
+Current SDK releases use httpx 2, published as ``httpx2``, while older ones
+use ``httpx``. The bridge builds its transports and clients with whichever
+is installed, preferring httpx 2, so it needs neither package itself.
+"""
+
+try:
+    import httpx2 as httpx
+except ImportError:  # pragma: no cover - exercised with httpx-based SDKs
+    import httpx  # type: ignore[no-redef]
+
+# Name of the package in use, for diagnostics
+BACKEND = httpx.__name__
@@ -0,0 +1,59 @@
+"""JSON decoding and encoding, using orjson when it is installed"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+# Name of the library in use, for benchmarks and diagnostics
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document from bytes or text"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(value)  # type: ignore[no-any-return]
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class EncodedList(list):  # type: ignore[type-arg]
+    """List that carries its own encoded JSON
+
+    ``dumps_request`` splices ``encoded`` into the body instead of encoding
+    the items again. The list must not be modified after it is created.
+    """
+
+    def __init__(self, items: List[Any], encoded: Optional[bytes] = None) -> None:
+        super().__init__(items)
+        self.encoded = dumps(items) if encoded is None else encoded
+
+
+def dumps_request(request: Dict[str, Any]) -> bytes:
+    """Encode a request body, splicing in pre-encoded ``EncodedList`` values"""
+    plain: Dict[str, Any] = {}
+    encoded: List[Tuple[str, bytes]] = []
+    for key, value in request.items():
+        if isinstance(value, EncodedList):
+            encoded.append((key, value.encoded))
+        else:
+            plain[key] = value
+    if not encoded:
+        return dumps(request)
+    # Reopen the encoded object and append the pre-encoded members
+    parts = [dumps(plain)[:-1]]
+    separator = b"," if plain else b""
+    for key, value in encoded:
+        parts += [separator, dumps(key), b":", value]
+        separator = b","
+    parts.append(b"}")
+    return b"".join(parts)
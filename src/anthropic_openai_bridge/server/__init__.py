@@ -0,0 +1 @@
+"""Anthropic-compatible HTTP proxy server"""
@@ -0,0 +1,110 @@
+"""ASGI application exposing the bridge as an Anthropic-compatible API"""
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    MutableMapping,
+    Optional,
+)
+
+from ..bridge import AsyncAnthropicOpenAIBridge
+from .handlers import AsyncRequestHandler, HandlerResponse
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class BridgeASGIApp:
+    """ASGI app serving ``POST /v1/messages`` (including SSE streaming)
+
+    One AsyncAnthropicOpenAIBridge, and therefore one upstream connection
+    pool, is shared by every request the app serves. Point the stock Anthropic
+    SDK at the server with ``anthropic.Anthropic(base_url=...)``.
+    """
+
+    def __init__(self, bridge: Optional[AsyncAnthropicOpenAIBridge] = None):
+        """Initialize the app
+
+        Args:
+            bridge: AsyncAnthropicOpenAIBridge to serve. If None, one is created
+                from the default configuration.
+        """
+        self.bridge = bridge or AsyncAnthropicOpenAIBridge()
+        self.handler = AsyncRequestHandler(self.bridge)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.bridge.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        body = await _read_body(receive)
+        headers: Dict[str, str] = {
+            key.decode("latin-1").lower(): value.decode("latin-1")
+            for key, value in scope.get("headers", [])
+        }
+        response = await self.handler.handle(
+            scope["method"], scope["path"], body, headers
+        )
+        await _send_response(response, send)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def _send_response(response: HandlerResponse, send: Send) -> None:
+    headers = list(response.headers)
+    if isinstance(response.body, bytes):
+        headers.append((b"content-length", str(len(response.body)).encode()))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": response.body})
+        return
+
+    # The async handler only produces async streamed bodies
+    if not isinstance(response.body, AsyncIterator):
+        raise TypeError(
+            f"Streamed response body must be an async iterator, got "
+            f"{type(response.body).__name__}"
+        )
+    await send(
+        {"type": "http.response.start", "status": response.status, "headers": headers}
+    )
+    async for chunk in response.body:
+        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def create_app(bridge: Optional[AsyncAnthropicOpenAIBridge] = None) -> BridgeASGIApp:
+    """Create the ASGI app, optionally around an existing async bridge"""
+    return BridgeASGIApp(bridge)
@@ -0,0 +1,308 @@
+"""Transport-independent handling of Anthropic API HTTP requests"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+import anthropic.types
+
+from ..client.scheduler import scheduling_tenant
+from ..converters.conversion_cache import without_conversion_cache
+from ..errors import UpstreamError
+
+JSON_HEADERS = [(b"content-type", b"application/json")]
+SSE_HEADERS = [
+    (b"content-type", b"text/event-stream"),
+    (b"cache-control", b"no-cache"),
+]
+
+
+class HandlerResponse:
+    """Status, headers and body produced for one HTTP request
+
+    ``body`` is either complete bytes or an iterator of byte chunks for
+    streamed (SSE) responses, async for AsyncRequestHandler and sync for
+    RequestHandler.
+    """
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(
+        self,
+        status: int,
+        headers: List[Tuple[bytes, bytes]],
+        body: Union[bytes, AsyncIterator[bytes], Iterator[bytes]],
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def streaming(self) -> bool:
+        """Whether the body is produced incrementally"""
+        return not isinstance(self.body, bytes)
+
+
+def error_body(error_type: str, message: str) -> Dict[str, Any]:
+    """Build an Anthropic-format error payload"""
+    return {"type": "error", "error": {"type": error_type, "message": message}}
+
+
+def error_response(
+    status: int,
+    error_type: str,
+    message: str,
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+) -> HandlerResponse:
+    """Build an Anthropic-format JSON error response"""
+    return HandlerResponse(
+        status,
+        JSON_HEADERS + (headers or []),
+        json.dumps(error_body(error_type, message)).encode(),
+    )
+
+
+def exception_response(error: Exception) -> HandlerResponse:
+    """Map an exception raised while serving a request to an error response"""
+    if isinstance(error, UpstreamError):
+        # Pass the upstream status through so clients back off on 429/529
+        headers = [
+            (name.encode("latin-1"), error.headers[name].encode("latin-1"))
+            for name in ("retry-after", "retry-after-ms")
+            if name in error.headers
+        ]
+        return error_response(error.http_status, error.error_type, str(error), headers)
+    if isinstance(error, (KeyError, TypeError, ValueError)):
+        return error_response(400, "invalid_request_error", str(error))
+    return error_response(500, "api_error", str(error))
+
+
+def encode_sse_event(event_type: str, data: str) -> bytes:
+    """Encode one server-sent event"""
+    return f"event: {event_type}\ndata: {data}\n\n".encode()
+
+
+def encode_stream_event(event: anthropic.types.RawMessageStreamEvent) -> bytes:
+    """Encode an Anthropic stream event as a server-sent event"""
+    return encode_sse_event(event.type, event.model_dump_json())
+
+
+def parse_json_body(body: bytes) -> Dict[str, Any]:
+    """Decode a JSON object request body
+
+    Raises:
+        ValueError: If the body is not a JSON object
+    """
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise ValueError(f"Request body is not valid JSON: {e}") from e
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object")
+    return payload
+
+
+def api_key_tenant(headers: Dict[str, str]) -> Optional[str]:
+    """Identify the caller by a hash of its ``x-api-key`` or bearer token
+
+    Returns:
+        Tenant ID, or None if the request carries no API key
+    """
+    key = headers.get("x-api-key")
+    authorization = headers.get("authorization", "")
+    if not key and authorization.lower().startswith("bearer "):
+        key = authorization[7:].strip()
+    if not key:
+        return None
+    return "key-" + hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+@contextlib.contextmanager
+def _serving(tenant: Optional[str]) -> Iterator[None]:
+    """Context for bridge calls made on behalf of an HTTP request"""
+    # Requests decoded from JSON never share message dicts with earlier
+    # ones, so the conversion cache could only fill up
+    with scheduling_tenant(tenant), without_conversion_cache():
+        yield
+
+
+def stream_error_event(error: Exception) -> bytes:
+    """Encode an error raised mid-stream as an SSE error event
+
+    Headers are already sent by then, so the error cannot change the status.
+    Errors raised while the upstream stream opens are reported before that,
+    with their own status.
+    """
+    error_type = getattr(error, "error_type", "api_error")
+    return encode_sse_event("error", json.dumps(error_body(error_type, str(error))))
+
+
+class _BaseRequestHandler:
+    """Routing and request preparation shared by the sync and async handlers"""
+
+    def __init__(self, bridge: Any):
+        """Initialize the handler
+
+        Args:
+            bridge: Bridge used for every request
+        """
+        self.bridge = bridge
+
+    def _route(self, method: str, path: str) -> Union[str, HandlerResponse]:
+        """Match a request to a route name, or to an error response"""
+        path = path.rstrip("/")
+        if path in ("/v1/messages", "/v1/messages/count_tokens"):
+            if method != "POST":
+                return error_response(405, "invalid_request_error", "Use POST")
+            return path
+        if path == "/health" and method == "GET":
+            return HandlerResponse(200, JSON_HEADERS, b'{"status":"ok"}')
+        return error_response(404, "not_found_error", f"No route for {path}")
+
+    def _handle_count_tokens(self, body: bytes) -> HandlerResponse:
+        try:
+            with without_conversion_cache():
+                result = self.bridge.count_tokens(parse_json_body(body))
+        except Exception as e:
+            return exception_response(e)
+        return HandlerResponse(200, JSON_HEADERS, result.model_dump_json().encode())
+
+
+class RequestHandler(_BaseRequestHandler):
+    """Serves Anthropic Messages API routes through a sync bridge
+
+    Routes are ``POST /v1/messages``, ``POST /v1/messages/count_tokens`` and
+    ``GET /health``.
+    """
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> HandlerResponse:
+        """Handle one HTTP request
+
+        Args:
+            method: HTTP method
+            path: Request path without query string
+            body: Complete request body
+            headers: Lower-cased request headers
+
+        Returns:
+            HandlerResponse to send back to the client
+        """
+        route = self._route(method, path)
+        if isinstance(route, HandlerResponse):
+            return route
+        if route == "/v1/messages":
+            return self._handle_messages(body, headers or {})
+        return self._handle_count_tokens(body)
+
+    def _handle_messages(self, body: bytes, headers: Dict[str, str]) -> HandlerResponse:
+        # Callers that do not name a user are scheduled per API key. The key
+        # stays out of the request, so it is not sent upstream
+        tenant = api_key_tenant(headers)
+        try:
+            payload = parse_json_body(body)
+            with _serving(tenant):
+                result = self.bridge.send_message(payload)
+        except Exception as e:
+            return exception_response(e)
+
+        if not payload.get("stream"):
+            return HandlerResponse(200, JSON_HEADERS, result.model_dump_json().encode())
+        # Open the upstream stream before committing to a 200, so errors such
+        # as a 429 keep their status and Retry-After
+        try:
+            with _serving(tenant):
+                first = next(iter(result), None)
+        except Exception as e:
+            result.close()
+            return exception_response(e)
+        return HandlerResponse(200, SSE_HEADERS, self._stream_events(result, first))
+
+    def _stream_events(self, stream: Any, first: Any) -> Iterator[bytes]:
+        try:
+            if first is not None:
+                yield encode_stream_event(first)
+            for event in stream:
+                yield encode_stream_event(event)
+        except Exception as e:
+            yield stream_error_event(e)
+        finally:
+            stream.close()
+
+
+class AsyncRequestHandler(_BaseRequestHandler):
+    """Serves Anthropic Messages API routes through an async bridge
+
+    Routes are ``POST /v1/messages``, ``POST /v1/messages/count_tokens`` and
+    ``GET /health``.
+    """
+
+    async def handle(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> HandlerResponse:
+        """Handle one HTTP request
+
+        Args:
+            method: HTTP method
+            path: Request path without query string
+            body: Complete request body
+            headers: Lower-cased request headers
+
+        Returns:
+            HandlerResponse to send back to the client
+        """
+        route = self._route(method, path)
+        if isinstance(route, HandlerResponse):
+            return route
+        if route == "/v1/messages":
+            return await self._handle_messages(body, headers or {})
+        # Tokenizing is CPU-bound, so it runs off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._handle_count_tokens, body)
+
+    async def _handle_messages(
+        self, body: bytes, headers: Dict[str, str]
+    ) -> HandlerResponse:
+        tenant = api_key_tenant(headers)
+        try:
+            payload = parse_json_body(body)
+            with _serving(tenant):
+                result = await self.bridge.send_message(payload)
+        except Exception as e:
+            return exception_response(e)
+
+        if not payload.get("stream"):
+            return HandlerResponse(200, JSON_HEADERS, result.model_dump_json().encode())
+        # Open the upstream stream before committing to a 200, so errors such
+        # as a 429 keep their status and Retry-After
+        try:
+            with _serving(tenant):
+                first = await result.__anext__()
+        except StopAsyncIteration:
+            first = None
+        except Exception as e:
+            await result.close()
+            return exception_response(e)
+        return HandlerResponse(200, SSE_HEADERS, self._stream_events(result, first))
+
+    async def _stream_events(self, stream: Any, first: Any) -> AsyncIterator[bytes]:
+        try:
+            if first is not None:
+                yield encode_stream_event(first)
+            async for event in stream:
+                yield encode_stream_event(event)
+        except Exception as e:
+            yield stream_error_event(e)
+        finally:
+            await stream.close()
@@ -0,0 +1,354 @@
+"""Minimal asyncio HTTP/1.1 server for running the ASGI app without extra deps"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from .app import Message, Scope
+
+_MAX_HEADER_LINES = 100
+_MAX_LINE_BYTES = 64 * 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    413: "Payload Too Large",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    529: "Overloaded",
+}
+
+
+class _BadRequest(Exception):
+    pass
+
+
+class _RequestTimeout(Exception):
+    pass
+
+
+class HTTPServer:
+    """Serves an ASGI app over HTTP/1.1 with keep-alive and chunked streaming
+
+    This is intentionally small: it implements exactly what the Anthropic SDK
+    needs (JSON request bodies, JSON and SSE responses, persistent
+    connections). Use a full ASGI server such as uvicorn for anything more.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_body_bytes: int = 64 * 1024 * 1024,
+        keep_alive_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+    ):
+        """Initialize the server
+
+        Args:
+            app: ASGI application
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            max_body_bytes: Largest accepted request body
+            keep_alive_timeout: Seconds an idle connection is kept open while
+                waiting for its next request
+            read_timeout: Seconds allowed for reading a request's headers and
+                body once it has started
+        """
+        self.app = app
+        self.host = host
+        self.port = port
+        self.max_body_bytes = max_body_bytes
+        self.keep_alive_timeout = keep_alive_timeout
+        self.read_timeout = read_timeout
+        self._server: Optional[asyncio.Server] = None
+        self._connections: Set["asyncio.Task[None]"] = set()
+        self._lifespan_queue: Optional["asyncio.Queue[Message]"] = None
+        self._lifespan_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def bound_port(self) -> int:
+        """Port the server is listening on"""
+        assert self._server is not None and self._server.sockets
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        """Run the ASGI lifespan startup and begin accepting connections"""
+        await self._run_lifespan("startup")
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=_MAX_LINE_BYTES
+        )
+
+    async def stop(self) -> None:
+        """Stop accepting connections, drop open ones and run lifespan shutdown"""
+        if self._server is not None:
+            self._server.close()
+            connections = list(self._connections)
+            for task in connections:
+                task.cancel()
+            await asyncio.gather(*connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        await self._run_lifespan("shutdown")
+
+    async def serve_forever(self) -> None:
+        """Start the server and serve until cancelled"""
+        await self.start()
+        try:
+            assert self._server is not None
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _run_lifespan(self, phase: str) -> None:
+        if self._lifespan_task is None:
+            if phase == "shutdown":
+                return
+            self._lifespan_queue = asyncio.Queue()
+            self._lifespan_task = asyncio.ensure_future(
+                self._lifespan_main(self._lifespan_queue)
+            )
+
+        assert self._lifespan_queue is not None
+        await self._lifespan_queue.put({"type": f"lifespan.{phase}"})
+        if phase == "shutdown":
+            await self._lifespan_task
+            self._lifespan_task = None
+
+    async def _lifespan_main(self, queue: "asyncio.Queue[Message]") -> None:
+        async def receive() -> Message:
+            return await queue.get()
+
+        async def send(message: Message) -> None:
+            pass
+
+        try:
+            await self.app(
+                {"type": "lifespan", "asgi": {"version": "3.0"}}, receive, send
+            )
+        except Exception:
+            # Apps without lifespan support may raise; the protocol allows it
+            pass
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except (_BadRequest, ValueError) as e:
+                    await _write_simple(writer, 400, str(e))
+                    break
+                except _RequestTimeout as e:
+                    await _write_simple(writer, 408, str(e))
+                    break
+                if request is None:
+                    break
+                scope, body = request
+                keep_alive = await self._dispatch(scope, body, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            if task is not None:
+                self._connections.discard(task)
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> Optional[Tuple[Scope, bytes]]:
+        try:
+            request_line = await asyncio.wait_for(
+                reader.readline(), self.keep_alive_timeout
+            )
+        except asyncio.TimeoutError:
+            # Idle connection, close it quietly
+            return None
+        if not request_line:
+            return None
+        try:
+            return await asyncio.wait_for(
+                self._read_head_and_body(request_line, reader), self.read_timeout
+            )
+        except asyncio.TimeoutError:
+            raise _RequestTimeout("Timed out reading the request")
+
+    async def _read_head_and_body(
+        self, request_line: bytes, reader: asyncio.StreamReader
+    ) -> Tuple[Scope, bytes]:
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            raise _BadRequest("Malformed request line")
+
+        headers: List[Tuple[bytes, bytes]] = []
+        for _ in range(_MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, sep, value = line.partition(b":")
+            if not sep:
+                raise _BadRequest("Malformed header line")
+            headers.append((name.strip().lower(), value.strip()))
+        else:
+            raise _BadRequest("Too many headers")
+
+        header_map: Dict[bytes, bytes] = dict(headers)
+        if header_map.get(b"transfer-encoding", b"").lower() == b"chunked":
+            body = await self._read_chunked(reader)
+        else:
+            length = int(header_map.get(b"content-length", b"0"))
+            if length > self.max_body_bytes:
+                raise _BadRequest("Request body too large")
+            body = await reader.readexactly(length) if length else b""
+
+        path, _, query = target.partition("?")
+        scope: Scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": version.split("/")[-1],
+            "method": method.upper(),
+            "scheme": "http",
+            "path": unquote(path),
+            "raw_path": path.encode("latin-1"),
+            "query_string": query.encode("latin-1"),
+            "root_path": "",
+            "headers": headers,
+            "server": (self.host, self.port),
+        }
+        return scope, body
+
+    async def _read_chunked(self, reader: asyncio.StreamReader) -> bytes:
+        chunks: List[bytes] = []
+        total = 0
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                # Skip trailers up to the terminating blank line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            total += size
+            if total > self.max_body_bytes:
+                raise _BadRequest("Request body too large")
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+
+    async def _dispatch(
+        self, scope: Scope, body: bytes, writer: asyncio.StreamWriter
+    ) -> bool:
+        request_headers: Dict[bytes, bytes] = dict(scope["headers"])
+        keep_alive = request_headers.get(b"connection", b"").lower() != b"close" and (
+            scope["http_version"] != "1.0"
+        )
+        disconnected = asyncio.Event()
+        body_sent = False
+        state: Dict[str, Any] = {"started": False, "chunked": False}
+
+        async def receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                state["headers"] = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                if not state["started"]:
+                    self._write_head(writer, state, more_body, keep_alive)
+                if state["chunked"]:
+                    if chunk:
+                        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    if not more_body:
+                        writer.write(b"0\r\n\r\n")
+                elif chunk:
+                    writer.write(chunk)
+                await writer.drain()
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception as e:
+            if state["started"]:
+                return False
+            await _write_simple(writer, 500, f"Internal server error: {e}")
+            return False
+        finally:
+            disconnected.set()
+        return keep_alive
+
+    def _write_head(
+        self,
+        writer: asyncio.StreamWriter,
+        state: Dict[str, Any],
+        more_body: bool,
+        keep_alive: bool,
+    ) -> None:
+        headers = state["headers"]
+        names = {name.lower() for name, _ in headers}
+        if b"content-length" not in names and more_body:
+            headers.append((b"transfer-encoding", b"chunked"))
+            state["chunked"] = True
+        headers.append((b"connection", b"keep-alive" if keep_alive else b"close"))
+
+        status = state["status"]
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}".encode()]
+        lines.extend(name + b": " + value for name, value in headers)
+        writer.write(b"\r\n".join(lines) + b"\r\n\r\n")
+        state["started"] = True
+
+
+async def _write_simple(writer: asyncio.StreamWriter, status: int, text: str) -> None:
+    body = text.encode()
+    writer.write(
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        f"content-type: text/plain\r\ncontent-length: {len(body)}\r\n"
+        "connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+
+
+def install_event_loop_policy() -> bool:
+    """Use uvloop for the event loop when it is installed
+
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def run(app: Any, host: str = "127.0.0.1", port: int = 8080) -> None:
+    """Serve an ASGI app until interrupted"""
+    install_event_loop_policy()
+
+    async def main() -> None:
+        await HTTPServer(app, host, port).serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
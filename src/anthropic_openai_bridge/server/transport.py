@@ -0,0 +1,140 @@
+"""httpx transports that serve the Anthropic API in-process through a bridge"""
+
+from typing import AsyncIterator, Dict, Iterator, Optional, Union
+
+from ..bridge import AnthropicOpenAIBridge, AsyncAnthropicOpenAIBridge
+from ..httpx_compat import httpx
+from .handlers import AsyncRequestHandler, HandlerResponse, RequestHandler
+
+
+class _IteratorStream(httpx.SyncByteStream):
+    """Response body read from a handler's chunk iterator"""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._chunks
+
+    def close(self) -> None:
+        # Closing the generator runs its cleanup, which releases the upstream
+        # stream when the client stops reading early
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+
+class _AsyncIteratorStream(httpx.AsyncByteStream):
+    """Response body read from a handler's async chunk iterator"""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._chunks:
+            yield chunk
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _request_headers(request: httpx.Request) -> Dict[str, str]:
+    return {key.lower(): value for key, value in request.headers.items()}
+
+
+def _build_response(
+    response: HandlerResponse,
+    request: httpx.Request,
+    stream: Union[httpx.SyncByteStream, httpx.AsyncByteStream, None] = None,
+) -> httpx.Response:
+    headers = [
+        (name.decode("latin-1"), value.decode("latin-1"))
+        for name, value in response.headers
+    ]
+    if stream is not None:
+        return httpx.Response(
+            response.status, headers=headers, stream=stream, request=request
+        )
+    assert isinstance(response.body, bytes)
+    return httpx.Response(
+        response.status, headers=headers, content=response.body, request=request
+    )
+
+
+class BridgeTransport(httpx.BaseTransport):
+    """httpx transport that answers Anthropic API requests with a sync bridge
+
+    Requests never leave the process: the stock Anthropic SDK's request is
+    routed to the bridge's converters and upstream client directly, and
+    streamed responses are read event by event as the upstream produces them.
+    The request host is ignored, so the SDK's default base URL works::
+
+        transport = BridgeTransport(AnthropicOpenAIBridge())
+        client = anthropic.Anthropic(
+            api_key="unused", http_client=httpx.Client(transport=transport)
+        )
+
+    Closing the httpx client closes the bridge and its upstream connections.
+    """
+
+    def __init__(self, bridge: Optional[AnthropicOpenAIBridge] = None):
+        """Initialize the transport
+
+        Args:
+            bridge: AnthropicOpenAIBridge to serve. If None, one is created
+                from the default configuration.
+        """
+        self.bridge = bridge or AnthropicOpenAIBridge()
+        self.handler = RequestHandler(self.bridge)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.handler.handle(
+            request.method, request.url.path, request.read(), _request_headers(request)
+        )
+        if isinstance(response.body, Iterator):
+            return _build_response(response, request, _IteratorStream(response.body))
+        return _build_response(response, request)
+
+    def close(self) -> None:
+        self.bridge.close()
+
+
+class AsyncBridgeTransport(httpx.AsyncBaseTransport):
+    """httpx transport that answers Anthropic API requests with an async bridge
+
+    The async counterpart of BridgeTransport, for ``anthropic.AsyncAnthropic``::
+
+        transport = AsyncBridgeTransport(AsyncAnthropicOpenAIBridge())
+        client = anthropic.AsyncAnthropic(
+            api_key="unused", http_client=httpx.AsyncClient(transport=transport)
+        )
+
+    Closing the httpx client closes the bridge and its upstream connections.
+    """
+
+    def __init__(self, bridge: Optional[AsyncAnthropicOpenAIBridge] = None):
+        """Initialize the transport
+
+        Args:
+            bridge: AsyncAnthropicOpenAIBridge to serve. If None, one is
+                created from the default configuration.
+        """
+        self.bridge = bridge or AsyncAnthropicOpenAIBridge()
+        self.handler = AsyncRequestHandler(self.bridge)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.handler.handle(
+            request.method,
+            request.url.path,
+            await request.aread(),
+            _request_headers(request),
+        )
+        if isinstance(response.body, AsyncIterator):
+            stream = _AsyncIteratorStream(response.body)
+            return _build_response(response, request, stream)
+        return _build_response(response, request)
+
+    async def aclose(self) -> None:
+        await self.bridge.close()
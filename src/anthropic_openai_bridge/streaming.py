@@ -0,0 +1,114 @@
+"""Anthropic-style message streams backed by OpenAI chunk iterators"""
+
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+import anthropic.types
+
+from .converters.stream_converter import StreamConverter
+
+
+class MessageStream:
+    """Iterable of Anthropic stream events translated from OpenAI chunks
+
+    Events are produced as upstream chunks arrive. ``get_final_message``
+    drains whatever has not been consumed yet and returns the accumulated
+    ``anthropic.types.Message``.
+    """
+
+    def __init__(
+        self, chunks: Iterator[Dict[str, Any]], model: Optional[str] = None
+    ) -> None:
+        """Initialize the stream
+
+        Args:
+            chunks: Iterator of OpenAI ChatCompletion chunk dictionaries
+            model: Requested model name, used until the upstream reports one
+        """
+        self._chunks = chunks
+        self.converter = StreamConverter(model=model)
+        self._events = self._iter_events()
+
+    def _iter_events(self) -> Iterator[anthropic.types.RawMessageStreamEvent]:
+        try:
+            for chunk in self._chunks:
+                yield from self.converter.convert_chunk(chunk)
+            yield from self.converter.finish()
+        finally:
+            self.close()
+
+    def __iter__(self) -> Iterator[anthropic.types.RawMessageStreamEvent]:
+        return self._events
+
+    def __next__(self) -> anthropic.types.RawMessageStreamEvent:
+        return next(self._events)
+
+    def get_final_message(self) -> anthropic.types.Message:
+        """Consume the rest of the stream and return the complete message"""
+        for _ in self._events:
+            pass
+        return self.converter.get_final_message()
+
+    def close(self) -> None:
+        """Release the upstream response"""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "MessageStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncMessageStream:
+    """Async iterable of Anthropic stream events translated from OpenAI chunks"""
+
+    def __init__(
+        self, chunks: AsyncIterator[Dict[str, Any]], model: Optional[str] = None
+    ) -> None:
+        """Initialize the stream
+
+        Args:
+            chunks: Async iterator of OpenAI ChatCompletion chunk dictionaries
+            model: Requested model name, used until the upstream reports one
+        """
+        self._chunks = chunks
+        self.converter = StreamConverter(model=model)
+        self._events = self._iter_events()
+
+    async def _iter_events(
+        self,
+    ) -> AsyncIterator[anthropic.types.RawMessageStreamEvent]:
+        try:
+            async for chunk in self._chunks:
+                for event in self.converter.convert_chunk(chunk):
+                    yield event
+            for event in self.converter.finish():
+                yield event
+        finally:
+            await self.close()
+
+    def __aiter__(self) -> AsyncIterator[anthropic.types.RawMessageStreamEvent]:
+        return self._events
+
+    async def __anext__(self) -> anthropic.types.RawMessageStreamEvent:
+        return await self._events.__anext__()
+
+    async def get_final_message(self) -> anthropic.types.Message:
+        """Consume the rest of the stream and return the complete message"""
+        async for _ in self._events:
+            pass
+        return self.converter.get_final_message()
+
+    async def close(self) -> None:
+        """Release the upstream response"""
+        aclose = getattr(self._chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def __aenter__(self) -> "AsyncMessageStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
@@ -0,0 +1 @@
+"""Offline token counting for converted requests"""
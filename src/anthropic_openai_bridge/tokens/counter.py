@@ -0,0 +1,119 @@
+"""Token counts for converted OpenAI requests with per-message memoization"""
+
+import collections
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, OrderedDict
+
+from ..json_codec import dumps
+from .tokenizers import Tokenizer
+
+# Chat formatting overhead in the style of OpenAI's chat templates: role and
+# delimiter tokens around every message, and the assistant reply primer
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_REPLY = 3
+
+
+def _text_parts(content: Any) -> List[str]:
+    """Collect the text of a message content string or list of parts"""
+    if content is None:
+        return []
+    if isinstance(content, str):
+        return [content]
+    texts = []
+    for part in content:
+        if isinstance(part, dict):
+            if isinstance(part.get("text"), str):
+                texts.append(part["text"])
+        elif isinstance(part, str):
+            texts.append(part)
+    return texts
+
+
+class TokenCounter:
+    """Counts the input tokens of converted OpenAI requests
+
+    Each message is counted once and its count memoized under a hash of its
+    content, so counting a conversation that grew by one turn only
+    tokenizes the new messages. The memo is a bounded LRU. Tokenizers that
+    are cheaper than hashing the message, such as the length estimate, are
+    not memoized.
+    """
+
+    def __init__(self, tokenizer: Tokenizer, cache_size: int = 4096):
+        """Initialize the counter
+
+        Args:
+            tokenizer: Tokenizer used for message text
+            cache_size: Message counts kept in the memo
+        """
+        self.tokenizer = tokenizer
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._counts: OrderedDict[bytes, int] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _memoized(self, value: Any, count: Callable[[Any], int]) -> int:
+        """Look up the count of a message or tool list, computing it on a miss"""
+        if not self.tokenizer.memoize:
+            return count(value)
+        key = hashlib.blake2b(dumps(value), digest_size=16).digest()
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None:
+                self._counts.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        tokens = count(value)
+        with self._lock:
+            self._counts[key] = tokens
+            if len(self._counts) > self.cache_size:
+                self._counts.popitem(last=False)
+        return tokens
+
+    def _count_message(self, message: Dict[str, Any]) -> int:
+        tokens = TOKENS_PER_MESSAGE + self.tokenizer.count(message.get("role", ""))
+        for text in _text_parts(message.get("content")):
+            tokens += self.tokenizer.count(text)
+        for tool_call in message.get("tool_calls") or []:
+            function = tool_call.get("function", {})
+            tokens += self.tokenizer.count(function.get("name", ""))
+            tokens += self.tokenizer.count(function.get("arguments", ""))
+        if message.get("name"):
+            tokens += self.tokenizer.count(message["name"])
+        return tokens
+
+    def _count_tools(self, tools: List[Dict[str, Any]]) -> int:
+        return self.tokenizer.count(json.dumps(tools, separators=(",", ":")))
+
+    def count_message(self, message: Dict[str, Any]) -> int:
+        """Get the tokens one OpenAI message adds to a prompt"""
+        return self._memoized(message, self._count_message)
+
+    def count_request(self, request: Dict[str, Any]) -> int:
+        """Get the input tokens of a converted OpenAI request"""
+        tokens = TOKENS_PER_REPLY
+        for message in request.get("messages", []):
+            tokens += self.count_message(message)
+        tools: Optional[List[Dict[str, Any]]] = request.get("tools")
+        if tools:
+            tokens += self._memoized(tools, self._count_tools)
+        return tokens
+
+    def estimate_total(self, request: Dict[str, Any]) -> int:
+        """Get the input tokens plus the request's completion token budget"""
+        max_tokens = request.get("max_completion_tokens") or request.get("max_tokens")
+        return self.count_request(request) + int(max_tokens or 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return memo hit and miss counters"""
+        with self._lock:
+            return {
+                "tokenizer": self.tokenizer.name,
+                "entries": len(self._counts),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
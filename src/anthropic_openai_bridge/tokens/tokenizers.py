@@ -0,0 +1,175 @@
+"""Tokenizers that run without network access"""
+
+import base64
+import math
+import re
+import threading
+from typing import Any, Dict, List, Optional, Pattern
+
+# GPT-2 style pre-tokenization using only the standard library ``re``:
+# contractions, letter runs, up to three digits, punctuation runs, whitespace
+DEFAULT_PATTERN = r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+"
+
+
+class Tokenizer:
+    """Counts the tokens in a piece of text"""
+
+    name = "tokenizer"
+    # Whether counts are worth memoizing, i.e. cost more than hashing the text
+    memoize = True
+
+    def count(self, text: str) -> int:
+        """Get the number of tokens ``text`` encodes to"""
+        raise NotImplementedError
+
+
+class ApproximateTokenizer(Tokenizer):
+    """Estimates tokens from text length when no vocabulary is available"""
+
+    name = "approximate"
+    memoize = False
+
+    def __init__(self, chars_per_token: float = 4.0):
+        """Initialize the tokenizer
+
+        Args:
+            chars_per_token: Average characters per token of the target model
+        """
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be positive")
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        return math.ceil(len(text) / self.chars_per_token)
+
+
+class BPETokenizer(Tokenizer):
+    """Byte-level BPE tokenizer driven by a table of merge ranks
+
+    The table maps each token's bytes to its rank, lowest merged first, in
+    the format of ``.tiktoken`` vocabulary files. Text is split into words by
+    ``pattern`` and each word is merged independently; merged words are
+    memoized because natural text repeats them heavily.
+    """
+
+    def __init__(
+        self,
+        ranks: Dict[bytes, int],
+        pattern: str = DEFAULT_PATTERN,
+        name: str = "bpe",
+        cache_size: int = 65536,
+    ):
+        """Initialize the tokenizer
+
+        Args:
+            ranks: Token bytes to merge rank (token ID)
+            pattern: Regular expression splitting text into words
+            name: Name reported with token counts
+            cache_size: Words whose encodings are memoized
+        """
+        self.ranks = ranks
+        self.name = name
+        self._pattern: Pattern[str] = re.compile(pattern)
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._cache: Dict[bytes, List[int]] = {}
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs: Any) -> "BPETokenizer":
+        """Load a ``.tiktoken`` file of ``<base64 token> <rank>`` lines
+
+        Args:
+            path: Filesystem path of the vocabulary
+            **kwargs: Passed to the constructor
+        """
+        ranks: Dict[bytes, int] = {}
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                token, rank = line.split()
+                ranks[base64.b64decode(token)] = int(rank)
+        kwargs.setdefault("name", path.rsplit("/", 1)[-1])
+        return cls(ranks, **kwargs)
+
+    def _merge(self, word: bytes) -> List[int]:
+        """Apply the lowest-ranked merges to one word until none apply"""
+        if word in self.ranks:
+            return [self.ranks[word]]
+        parts = [word[i : i + 1] for i in range(len(word))]
+        while len(parts) > 1:
+            best_rank: Optional[int] = None
+            best_index = 0
+            for i in range(len(parts) - 1):
+                rank = self.ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank = rank
+                    best_index = i
+            if best_rank is None:
+                break
+            parts[best_index : best_index + 2] = [
+                parts[best_index] + parts[best_index + 1]
+            ]
+        # Bytes missing from the vocabulary still count as one token each
+        return [self.ranks.get(part, -1) for part in parts]
+
+    def encode(self, text: str) -> List[int]:
+        """Encode text to token IDs (-1 for bytes outside the vocabulary)"""
+        tokens: List[int] = []
+        for match in self._pattern.finditer(text):
+            word = match.group().encode("utf-8")
+            with self._lock:
+                encoded = self._cache.get(word)
+            if encoded is None:
+                encoded = self._merge(word)
+                with self._lock:
+                    if len(self._cache) >= self._cache_size:
+                        self._cache.clear()
+                    self._cache[word] = encoded
+            tokens.extend(encoded)
+        return tokens
+
+    def count(self, text: str) -> int:
+        return len(self.encode(text))
+
+
+class HuggingFaceTokenizer(Tokenizer):
+    """Tokenizer loaded from a local ``tokenizer.json``
+
+    Requires the optional ``tokenizers`` package.
+    """
+
+    def __init__(self, path: str):
+        """Load the tokenizer
+
+        Args:
+            path: Filesystem path of a Hugging Face ``tokenizer.json``
+
+        Raises:
+            ImportError: If ``tokenizers`` is not installed
+        """
+        try:
+            import tokenizers  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError(
+                "Loading tokenizer.json files requires the 'tokenizers' package"
+            ) from e
+        self.name = path.rsplit("/", 1)[-1]
+        self._tokenizer = tokenizers.Tokenizer.from_file(path)
+
+    def count(self, text: str) -> int:
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+def load_tokenizer(path: Optional[str] = None) -> Tokenizer:
+    """Load a tokenizer from a local vocabulary file
+
+    Args:
+        path: A ``tokenizer.json`` (Hugging Face) or ``.tiktoken`` BPE ranks
+            file. If None, token counts are estimated from text length.
+    """
+    if not path:
+        return ApproximateTokenizer()
+    if path.endswith(".json"):
+        return HuggingFaceTokenizer(path)
+    return BPETokenizer.from_file(path)
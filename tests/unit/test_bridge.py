@@ -1,10 +1,40 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import anthropic.types
 import pytest
 
-from anthropic_openai_bridge.bridge import AnthropicOpenAIBridge
+from anthropic_openai_bridge.bridge import (
+    AnthropicOpenAIBridge,
+    AsyncAnthropicOpenAIBridge,
+)
 from anthropic_openai_bridge.config.config_manager import ConfigManager
+from anthropic_openai_bridge.config.endpoint_config import EndpointConfig
+from anthropic_openai_bridge.config.pool_config import ConnectionPoolConfig
+from anthropic_openai_bridge.streaming import AsyncMessageStream, MessageStream
+
+
+def _completion(openai_request):
+    return {
+        "id": "chatcmpl-1",
+        "model": openai_request["model"],
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": "hi"},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1},
+    }
+
+
+def _bulk_requests():
+    """Two requests for send_messages, the second asking to stream"""
+    requests = [
+        {"model": model, "max_tokens": 10, "messages": []} for model in ("a", "b")
+    ]
+    requests[1]["stream"] = True
+    return requests
 
 
 class TestAnthropicOpenAIBridge:
@@ -58,7 +88,18 @@ class TestAnthropicOpenAIBridge:
 
             # Verify ConfigManager was created with custom API key
             mock_config_class.assert_called_once_with(
-                openai_api_key="custom_key", openai_base_url=None, httpx_client=None
+                openai_api_key="custom_key",
+                openai_base_url=None,
+                httpx_client=None,
+                connection_pool=None,
+                openai_endpoints=None,
+                load_balancing=None,
+                retry_policy=None,
+                circuit_breaker=None,
+                hedging=None,
+                rate_limit=None,
+                scheduler=None,
+                raw_responses=None,
             )
             assert bridge.config == mock_config
 
@@ -86,6 +127,15 @@ class TestAnthropicOpenAIBridge:
                 openai_api_key=None,
                 openai_base_url="https://custom.endpoint.com",
                 httpx_client=None,
+                connection_pool=None,
+                openai_endpoints=None,
+                load_balancing=None,
+                retry_policy=None,
+                circuit_breaker=None,
+                hedging=None,
+                rate_limit=None,
+                scheduler=None,
+                raw_responses=None,
             )
             assert bridge.config == mock_config
 
@@ -113,6 +163,15 @@ class TestAnthropicOpenAIBridge:
                 openai_api_key=None,
                 openai_base_url=None,
                 httpx_client=mock_httpx_client,
+                connection_pool=None,
+                openai_endpoints=None,
+                load_balancing=None,
+                retry_policy=None,
+                circuit_breaker=None,
+                hedging=None,
+                rate_limit=None,
+                scheduler=None,
+                raw_responses=None,
             )
             assert bridge.config == mock_config
 
@@ -144,9 +203,81 @@ class TestAnthropicOpenAIBridge:
                 openai_api_key="custom_key",
                 openai_base_url="https://custom.endpoint.com",
                 httpx_client=mock_httpx_client,
+                connection_pool=None,
+                openai_endpoints=None,
+                load_balancing=None,
+                retry_policy=None,
+                circuit_breaker=None,
+                hedging=None,
+                rate_limit=None,
+                scheduler=None,
+                raw_responses=None,
             )
             assert bridge.config == mock_config
 
+    def test_init_with_connection_pool(self):
+        """Test connection pool settings are passed to the ConfigManager"""
+        pool = ConnectionPoolConfig(max_connections=8, http2=True)
+
+        with patch(
+            "anthropic_openai_bridge.bridge.ConfigManager"
+        ) as mock_config_class, patch(
+            "anthropic_openai_bridge.bridge.OpenAIClientWrapper"
+        ) as mock_client_class:
+            mock_client_class.return_value.pool_stats.return_value = {"in_flight": 0}
+
+            bridge = AnthropicOpenAIBridge(connection_pool=pool)
+
+            mock_config_class.assert_called_once_with(
+                openai_api_key=None,
+                openai_base_url=None,
+                httpx_client=None,
+                connection_pool=pool,
+                openai_endpoints=None,
+                load_balancing=None,
+                retry_policy=None,
+                circuit_breaker=None,
+                hedging=None,
+                rate_limit=None,
+                scheduler=None,
+                raw_responses=None,
+            )
+            assert bridge.pool_stats() == {"in_flight": 0}
+
+    def test_init_with_openai_endpoints(self):
+        """Test endpoints and balancing strategy are passed to the ConfigManager"""
+        endpoints = [
+            EndpointConfig("https://a.example/v1"),
+            EndpointConfig("https://b.example/v1", weight=2),
+        ]
+
+        with patch(
+            "anthropic_openai_bridge.bridge.ConfigManager"
+        ) as mock_config_class, patch(
+            "anthropic_openai_bridge.bridge.OpenAIClientWrapper"
+        ) as mock_client_class:
+            mock_client_class.return_value.endpoint_stats.return_value = []
+
+            bridge = AnthropicOpenAIBridge(
+                openai_endpoints=endpoints, load_balancing="power_of_two"
+            )
+
+            mock_config_class.assert_called_once_with(
+                openai_api_key=None,
+                openai_base_url=None,
+                httpx_client=None,
+                connection_pool=None,
+                openai_endpoints=endpoints,
+                load_balancing="power_of_two",
+                retry_policy=None,
+                circuit_breaker=None,
+                hedging=None,
+                rate_limit=None,
+                scheduler=None,
+                raw_responses=None,
+            )
+            assert bridge.endpoint_stats() == []
+
     def test_init_custom_params_with_existing_config_manager(self):
         """Test that custom parameters are ignored when config_manager is provided"""
         custom_config = Mock()
@@ -218,3 +349,189 @@ class TestAnthropicOpenAIBridge:
             # Verify result is an Anthropic Message object
             assert isinstance(result, anthropic.types.Message)
             assert result == anthropic_response
+
+    def test_send_message_stream(self):
+        """Test stream=True returns a MessageStream over the chunk iterator"""
+        with patch(
+            "anthropic_openai_bridge.bridge.OpenAIClientWrapper"
+        ) as mock_client_class:
+            mock_openai_client = mock_client_class.return_value
+            mock_openai_client.create_chat_completion_stream.return_value = iter(
+                [
+                    {
+                        "model": "test",
+                        "choices": [
+                            {
+                                "index": 0,
+                                "delta": {"content": "hi"},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                    }
+                ]
+            )
+
+            bridge = AnthropicOpenAIBridge(config_manager=Mock())
+            stream = bridge.send_message(
+                {"model": "test", "max_tokens": 10, "messages": []}, stream=True
+            )
+
+            mock_openai_client.create_chat_completion.assert_not_called()
+            assert isinstance(stream, MessageStream)
+            assert stream.get_final_message().content[0].text == "hi"
+
+    def test_send_messages_returns_per_item_results(self):
+        """Test send_messages returns complete messages, even for stream requests"""
+        with patch(
+            "anthropic_openai_bridge.bridge.OpenAIClientWrapper"
+        ) as mock_client_class:
+            mock_openai_client = mock_client_class.return_value
+            mock_openai_client.create_chat_completion.side_effect = _completion
+            bridge = AnthropicOpenAIBridge(config_manager=Mock())
+            requests = _bulk_requests()
+
+            results = list(bridge.send_messages(requests, max_concurrency=2))
+
+            mock_openai_client.create_chat_completion_stream.assert_not_called()
+            assert [result.message.model for result in results] == ["a", "b"]
+            assert all(
+                isinstance(result.message, anthropic.types.Message)
+                for result in results
+            )
+            assert "stream" in requests[1]
+
+    def test_batches_uses_configured_store(self, tmp_path):
+        """Test the batches API is built lazily from the configuration"""
+        config = Mock()
+        config.batch_store_path = str(tmp_path / "batches.db")
+        config.batch_concurrency = 2
+
+        with patch("anthropic_openai_bridge.bridge.OpenAIClientWrapper"):
+            bridge = AnthropicOpenAIBridge(config_manager=config)
+
+            batches = bridge.batches
+            try:
+                assert bridge.batches is batches
+                assert batches.store.path == config.batch_store_path
+                assert batches.workers.concurrency == 2
+            finally:
+                batches.close()
+
+
+class TestAsyncAnthropicOpenAIBridge:
+    def test_init_uses_async_client_wrapper(self):
+        """Test async bridge builds the async upstream client wrapper"""
+        custom_config = Mock()
+
+        with patch(
+            "anthropic_openai_bridge.bridge.AsyncOpenAIClientWrapper"
+        ) as mock_client_class, patch(
+            "anthropic_openai_bridge.bridge.OpenAIClientWrapper"
+        ) as mock_sync_client_class:
+
+            bridge = AsyncAnthropicOpenAIBridge(config_manager=custom_config)
+
+            mock_client_class.assert_called_once_with(custom_config)
+            mock_sync_client_class.assert_not_called()
+            assert bridge.openai_client == mock_client_class.return_value
+
+    @pytest.mark.asyncio
+    async def test_send_message_flow(self):
+        """Test the async send_message flow awaits the upstream call"""
+        with patch(
+            "anthropic_openai_bridge.bridge.AsyncOpenAIClientWrapper"
+        ) as mock_client_class, patch(
+            "anthropic_openai_bridge.bridge.RequestConverter"
+        ) as mock_req_converter_class, patch(
+            "anthropic_openai_bridge.bridge.ResponseConverter"
+        ) as mock_resp_converter_class:
+
+            mock_openai_client = Mock()
+            mock_openai_client.create_chat_completion = AsyncMock()
+            mock_client_class.return_value = mock_openai_client
+
+            anthropic_request = {"model": "test", "messages": []}
+            openai_request = {"model": "test", "messages": []}
+            openai_response = {"choices": [{"message": {"content": "response"}}]}
+            anthropic_response = Mock(spec=anthropic.types.Message)
+
+            mock_req_converter_class.return_value.convert.return_value = openai_request
+            mock_openai_client.create_chat_completion.return_value = openai_response
+            mock_resp_converter_class.return_value.convert.return_value = (
+                anthropic_response
+            )
+
+            bridge = AsyncAnthropicOpenAIBridge(config_manager=Mock())
+            result = await bridge.send_message(anthropic_request)
+
+            mock_openai_client.create_chat_completion.assert_awaited_once_with(
+                openai_request
+            )
+            mock_resp_converter_class.return_value.convert.assert_called_once_with(
+                openai_response
+            )
+            assert result == anthropic_response
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_client(self):
+        """Test leaving the async context closes the upstream client"""
+        with patch(
+            "anthropic_openai_bridge.bridge.AsyncOpenAIClientWrapper"
+        ) as mock_client_class:
+            mock_client_class.return_value.close = AsyncMock()
+
+            async with AsyncAnthropicOpenAIBridge(config_manager=Mock()):
+                pass
+
+            mock_client_class.return_value.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_send_message_stream_from_request_flag(self):
+        """Test "stream": True in the request returns an AsyncMessageStream"""
+
+        async def chunks():
+            yield {
+                "model": "test",
+                "choices": [
+                    {"index": 0, "delta": {"content": "hi"}, "finish_reason": "stop"}
+                ],
+            }
+
+        with patch(
+            "anthropic_openai_bridge.bridge.AsyncOpenAIClientWrapper"
+        ) as mock_client_class:
+            mock_client_class.return_value.create_chat_completion_stream = Mock(
+                return_value=chunks()
+            )
+
+            bridge = AsyncAnthropicOpenAIBridge(config_manager=Mock())
+            stream = await bridge.send_message(
+                {"model": "test", "messages": [], "stream": True}
+            )
+
+            assert isinstance(stream, AsyncMessageStream)
+            message = await stream.get_final_message()
+            assert message.content[0].text == "hi"
+
+    @pytest.mark.asyncio
+    async def test_send_messages_never_streams(self):
+        """Test async send_messages returns complete messages for stream requests"""
+        with patch(
+            "anthropic_openai_bridge.bridge.AsyncOpenAIClientWrapper"
+        ) as mock_client_class:
+            mock_openai_client = mock_client_class.return_value
+            mock_openai_client.create_chat_completion = AsyncMock(
+                side_effect=_completion
+            )
+
+            bridge = AsyncAnthropicOpenAIBridge(config_manager=Mock())
+            results = [
+                result async for result in bridge.send_messages(_bulk_requests())
+            ]
+
+            mock_openai_client.create_chat_completion_stream.assert_not_called()
+            assert [result.message.model for result in results] == ["a", "b"]
+            assert all(
+                isinstance(result.message, anthropic.types.Message)
+                for result in results
+            )
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from anthropic_openai_bridge.bulk import (
+    BulkResult,
+    aiter_bulk_results,
+    iter_bulk_results,
+)
+from anthropic_openai_bridge.client.scheduler import (
+    current_request_class,
+    request_class,
+)
+
+
+def _requests(count):
+    return [{"model": "test", "messages": [], "id": i} for i in range(count)]
+
+
+class TestIterBulkResults:
+    def test_ordered_results_follow_input_order(self):
+        """Test ordered mode yields results in input order despite timing"""
+
+        def send(request):
+            # Earlier requests finish last
+            time.sleep(0.01 * (5 - request["id"]))
+            return f"message-{request['id']}"
+
+        results = list(iter_bulk_results(send, _requests(5), max_concurrency=5))
+
+        assert [result.index for result in results] == [0, 1, 2, 3, 4]
+        assert [result.message for result in results] == [
+            f"message-{i}" for i in range(5)
+        ]
+        assert all(result.ok for result in results)
+
+    def test_unordered_yields_as_completed(self):
+        """Test unordered mode yields the fastest request first"""
+
+        def send(request):
+            time.sleep(0.05 if request["id"] == 0 else 0.0)
+            return request["id"]
+
+        results = list(
+            iter_bulk_results(send, _requests(3), max_concurrency=3, ordered=False)
+        )
+
+        assert results[-1].index == 0
+        assert sorted(result.index for result in results) == [0, 1, 2]
+
+    def test_failures_become_per_item_errors(self):
+        """Test a failing request does not abort the rest of the batch"""
+
+        def send(request):
+            if request["id"] == 1:
+                raise RuntimeError("upstream failed")
+            return request["id"]
+
+        results = list(iter_bulk_results(send, _requests(3), max_concurrency=2))
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, RuntimeError)
+        assert results[1].message is None
+        assert results[1].request == {"model": "test", "messages": [], "id": 1}
+
+    def test_workers_inherit_request_class(self):
+        """Test requests sent from worker threads keep the caller's class"""
+
+        def send(request):
+            return current_request_class(request)
+
+        with request_class("batch"):
+            results = list(iter_bulk_results(send, _requests(3), max_concurrency=2))
+
+        assert [result.message for result in results] == ["batch"] * 3
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency requests are in flight"""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def send(request):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.005)
+            with lock:
+                in_flight -= 1
+            return request["id"]
+
+        results = list(iter_bulk_results(send, iter(_requests(20)), max_concurrency=3))
+
+        assert len(results) == 20
+        assert peak <= 3
+
+    def test_invalid_concurrency(self):
+        """Test max_concurrency must be positive"""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            list(iter_bulk_results(Mock(), _requests(1), max_concurrency=0))
+
+
+class TestAsyncIterBulkResults:
+    @pytest.mark.asyncio
+    async def test_ordered_with_errors(self):
+        """Test async fan-out keeps order and captures per-item errors"""
+
+        async def send(request):
+            await asyncio.sleep(0.01 * (3 - request["id"]))
+            if request["id"] == 2:
+                raise ValueError("bad request")
+            return request["id"]
+
+        results = [
+            result
+            async for result in aiter_bulk_results(
+                send, _requests(4), max_concurrency=4
+            )
+        ]
+
+        assert [result.index for result in results] == [0, 1, 2, 3]
+        assert isinstance(results[2].error, ValueError)
+        assert isinstance(results[0], BulkResult)
+
+    @pytest.mark.asyncio
+    async def test_unordered(self):
+        """Test async unordered mode yields results as they complete"""
+
+        async def send(request):
+            await asyncio.sleep(0.05 if request["id"] == 0 else 0.0)
+            return request["id"]
+
+        results = [
+            result
+            async for result in aiter_bulk_results(
+                send, _requests(3), max_concurrency=3, ordered=False
+            )
+        ]
+
+        assert results[-1].index == 0
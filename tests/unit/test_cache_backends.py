@@ -0,0 +1,148 @@
+import os
+import threading
+
+import pytest
+
+from anthropic_openai_bridge.cache.backends import (
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from anthropic_openai_bridge.cache.response_cache import ResponseCache
+
+REQUEST = {"model": "m", "temperature": 0, "messages": [{"role": "user"}]}
+RESPONSE = {"id": "chatcmpl-1", "choices": [{"message": {"content": "ok " * 200}}]}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        store = MemoryCacheBackend(max_bytes=1000)
+    else:
+        store = SQLiteCacheBackend(str(tmp_path / "cache.db"), max_bytes=1000)
+    yield store
+    store.close()
+
+
+class TestCacheBackends:
+    def test_round_trip(self, backend):
+        assert backend.get("a", now=0) is None
+        assert backend.set("a", b"value", expires_at=None)
+        assert backend.get("a", now=0) == b"value"
+
+    def test_overwrite_replaces_value(self, backend):
+        backend.set("a", b"old", expires_at=None)
+        backend.set("a", b"new", expires_at=None)
+
+        assert backend.get("a", now=0) == b"new"
+        assert backend.snapshot()["entries"] == 1
+
+    def test_expiry(self, backend):
+        backend.set("a", b"value", expires_at=100.0)
+
+        assert backend.get("a", now=99.0) == b"value"
+        assert backend.get("a", now=100.0) is None
+        assert backend.snapshot()["expirations"] == 1
+        assert backend.snapshot()["entries"] == 0
+
+    def test_lru_eviction(self, backend):
+        """Test the least recently read entry is evicted first"""
+        # Random bytes do not compress, so two values fit in either backend
+        for key in "ab":
+            backend.set(key, os.urandom(400), expires_at=None)
+        backend.get("a", now=0)
+        backend.set("c", os.urandom(400), expires_at=None)
+
+        assert backend.get("b", now=0) is None
+        assert backend.get("a", now=0) is not None
+        assert backend.get("c", now=0) is not None
+        assert backend.snapshot()["evictions"] == 1
+        assert backend.snapshot()["bytes"] <= 1000
+
+    def test_clear(self, backend):
+        backend.set("a", b"value", expires_at=None)
+        backend.clear()
+
+        assert backend.get("a", now=0) is None
+        assert backend.snapshot()["bytes"] == 0
+
+
+class TestSQLiteCacheBackend:
+    def test_values_are_compressed(self, tmp_path):
+        """Test the size budget counts compressed bytes"""
+        backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+        value = b"repetitive " * 1000
+        backend.set("a", value, expires_at=None)
+
+        assert backend.snapshot()["bytes"] < len(value) / 10
+        assert backend.get("a", now=0) == value
+
+    def test_entries_survive_restart(self, tmp_path):
+        """Test a reopened database serves responses cached before a restart"""
+        path = str(tmp_path / "cache.db")
+        first = ResponseCache(backend=SQLiteCacheBackend(path), ttl=3600)
+        first.put(REQUEST, RESPONSE)
+        first.backend.close()
+
+        restarted = ResponseCache(backend=SQLiteCacheBackend(path), ttl=3600)
+
+        assert restarted.get(REQUEST) == RESPONSE
+        assert restarted.snapshot()["hits"] == 1
+
+    def test_processes_share_one_budget(self, tmp_path):
+        """Test separate connections see each other's entries and byte total"""
+        path = str(tmp_path / "cache.db")
+        worker_a = SQLiteCacheBackend(path, max_bytes=10_000)
+        worker_b = SQLiteCacheBackend(path, max_bytes=10_000)
+
+        worker_a.set("a", b"from a", expires_at=None)
+
+        assert worker_b.get("a", now=0) == b"from a"
+        assert worker_a.snapshot()["bytes"] == worker_b.snapshot()["bytes"]
+
+    def test_concurrent_writers(self, tmp_path):
+        """Test concurrent writers keep the byte total consistent"""
+        path = str(tmp_path / "cache.db")
+        backends = [SQLiteCacheBackend(path, max_bytes=5_000) for _ in range(4)]
+
+        def write(index):
+            for i in range(50):
+                value = f"{index}-{i}".encode() * 20
+                backends[index].set(f"{index}-{i}", value, expires_at=None)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = backends[0].snapshot()
+        stored = backends[0]._conn.execute("SELECT SUM(size) FROM entries").fetchone()
+        assert stats["bytes"] == stored[0]
+        assert stats["bytes"] <= 5_000
+
+    def test_purge_expired(self, tmp_path):
+        backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+        backend.set("old", b"x", expires_at=10.0)
+        backend.set("new", b"y", expires_at=1000.0)
+        backend.set("forever", b"z", expires_at=None)
+
+        assert backend.purge_expired(now=100.0) == 1
+        assert backend.snapshot()["entries"] == 2
+
+    def test_hits_do_not_write(self, tmp_path):
+        """Test hits are read-only until a write or a full batch records them"""
+        backend = SQLiteCacheBackend(str(tmp_path / "cache.db"), touch_batch=3)
+        backend.set("a", b"value", expires_at=None)
+
+        def accessed_at():
+            query = "SELECT accessed_at FROM entries WHERE key = 'a'"
+            return backend._conn.execute(query).fetchone()[0]
+
+        before = accessed_at()
+        backend.get("a", now=0)
+        backend.get("a", now=0)
+        assert accessed_at() == before
+        assert not backend._conn.in_transaction
+
+        backend.get("a", now=0)
+        assert accessed_at() > before
@@ -0,0 +1,207 @@
+import random
+from unittest.mock import Mock, patch
+
+import httpx
+import openai
+import pytest
+
+from anthropic_openai_bridge.client.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+)
+from anthropic_openai_bridge.client.openai_client import OpenAIClientWrapper
+from anthropic_openai_bridge.client.retry import RetryBudget, RetryPolicy
+from anthropic_openai_bridge.config.breaker_config import CircuitBreakerConfig
+from anthropic_openai_bridge.config.config_manager import ConfigManager
+from anthropic_openai_bridge.config.endpoint_config import EndpointConfig
+from anthropic_openai_bridge.converters.response_converter import ResponseConverter
+from anthropic_openai_bridge.errors import CircuitOpenError, error_from_dict
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(clock, **kwargs):
+    kwargs.setdefault("minimum_calls", 4)
+    kwargs.setdefault("open_seconds", 10)
+    kwargs.setdefault("half_open_probes", 2)
+    return CircuitBreaker(CircuitBreakerConfig(**kwargs), clock=clock)
+
+
+def _server_error():
+    request = httpx.Request("POST", "https://api.example/v1/chat/completions")
+    response = httpx.Response(503, request=request)
+    return openai.InternalServerError("unavailable", response=response, body=None)
+
+
+class TestCircuitBreaker:
+    def test_opens_when_failure_rate_crosses_threshold(self):
+        """Test the circuit opens once enough calls fail"""
+        clock = FakeClock()
+        breaker = _breaker(clock)
+
+        for failed in (False, True, False):
+            breaker.record(failed)
+        assert breaker.state == CLOSED
+
+        breaker.record(True)
+
+        assert breaker.state == OPEN
+        assert not breaker.try_acquire()
+        assert breaker.snapshot()["last_transition"]["reason"] == (
+            "failure rate 2/4 in window"
+        )
+
+    def test_opens_on_slow_calls(self):
+        """Test latency alone can trip the circuit"""
+        breaker = _breaker(FakeClock(), slow_call_seconds=1.0)
+
+        for _ in range(4):
+            breaker.record(False, latency=2.5)
+
+        assert breaker.state == OPEN
+
+    def test_old_calls_leave_the_window(self):
+        """Test failures outside the rolling window are forgotten"""
+        clock = FakeClock()
+        breaker = _breaker(clock, window_seconds=5)
+        for _ in range(3):
+            breaker.record(True)
+
+        clock.now += 10
+        breaker.record(True)
+
+        assert breaker.state == CLOSED
+        assert breaker.snapshot()["window_calls"] == 1
+
+    def test_half_open_probes_close_the_circuit(self):
+        """Test limited probes are admitted and close the circuit on success"""
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.record(True)
+        assert breaker.retry_after() == 10
+
+        clock.now += 10
+        assert breaker.try_acquire()
+        assert breaker.state == HALF_OPEN
+        assert breaker.try_acquire()
+        assert not breaker.try_acquire()
+
+        breaker.record(False)
+        breaker.record(False)
+
+        assert breaker.state == CLOSED
+        assert breaker.snapshot()["rejected_total"] == 1
+
+    def test_failed_probe_reopens(self):
+        """Test a failing probe sends the circuit back to open"""
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.record(True)
+        clock.now += 10
+        assert breaker.try_acquire()
+
+        breaker.record(True)
+
+        assert breaker.state == OPEN
+        assert breaker.snapshot()["opened_total"] == 2
+
+    def test_invalid_settings(self):
+        """Test invalid thresholds are rejected"""
+        with pytest.raises(ValueError):
+            CircuitBreakerConfig(failure_rate_threshold=0)
+
+
+class TestCircuitBreakerRouting:
+    def _wrapper(self, clients):
+        config = ConfigManager(
+            openai_api_key="test_key",
+            openai_endpoints=[
+                EndpointConfig("https://a.example/v1"),
+                EndpointConfig("https://b.example/v1"),
+            ],
+            circuit_breaker=CircuitBreakerConfig(minimum_calls=2, open_seconds=60),
+            retry_policy=RetryPolicy(
+                max_retries=1,
+                base_delay=0,
+                max_delay=0,
+                budget=RetryBudget(),
+                rng=random.Random(0),
+            ),
+        )
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            mock_openai_class.side_effect = clients
+            return OpenAIClientWrapper(config)
+
+    def test_retry_fails_over_and_open_circuit_is_skipped(self):
+        """Test failures shift traffic to the healthy endpoint"""
+        broken, healthy = Mock(), Mock()
+        broken.chat.completions.create.side_effect = _server_error()
+        healthy.chat.completions.create.return_value.model_dump.return_value = {
+            "id": "ok"
+        }
+        wrapper = self._wrapper([broken, healthy])
+
+        # Ties are broken at random; 30 requests reach the broken endpoint twice
+        for _ in range(30):
+            assert wrapper.create_chat_completion({"model": "m"}) == {"id": "ok"}
+
+        stats = {s["name"]: s for s in wrapper.endpoint_stats()}
+        assert stats["https://a.example/v1"]["circuit"]["state"] == OPEN
+        assert stats["https://b.example/v1"]["circuit"]["state"] == CLOSED
+        # Once open, the broken endpoint stops receiving requests
+        assert broken.chat.completions.create.call_count == 2
+
+    def test_all_circuits_open_fails_fast(self):
+        """Test a CircuitOpenError is returned without calling the upstream"""
+        clients = [Mock(), Mock()]
+        for client in clients:
+            client.chat.completions.create.side_effect = _server_error()
+        wrapper = self._wrapper(clients)
+
+        for _ in range(2):
+            wrapper.create_chat_completion({"model": "m"})
+        calls = sum(c.chat.completions.create.call_count for c in clients)
+        result = wrapper.create_chat_completion({"model": "m"})
+
+        assert sum(c.chat.completions.create.call_count for c in clients) == calls
+        assert result["error"]["code"] == "circuit_open"
+        with pytest.raises(CircuitOpenError) as exc_info:
+            ResponseConverter().convert(result)
+        assert exc_info.value.http_status == 503
+        assert exc_info.value.retry_after == 60
+
+    def test_circuit_open_error_without_retry_after(self):
+        """Test a circuit-open error payload without headers still converts"""
+        error = error_from_dict({"message": "all open", "code": "circuit_open"})
+
+        assert isinstance(error, CircuitOpenError)
+        assert error.http_status == 503
+        assert error.headers["retry-after"] == "1"
+
+    def test_client_errors_do_not_trip_the_circuit(self):
+        """Test 400 responses do not count against the endpoint"""
+        request = httpx.Request("POST", "https://api.example")
+        bad_request = openai.BadRequestError(
+            "bad", response=httpx.Response(400, request=request), body=None
+        )
+        clients = [Mock(), Mock()]
+        for client in clients:
+            client.chat.completions.create.side_effect = bad_request
+        wrapper = self._wrapper(clients)
+
+        for _ in range(5):
+            wrapper.create_chat_completion({"model": "m"})
+
+        assert all(s["circuit"]["state"] == CLOSED for s in wrapper.endpoint_stats())
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from anthropic_openai_bridge.config.config_manager import ConfigManager
+from anthropic_openai_bridge.config.endpoint_config import EndpointConfig
 
 
 class TestConfigManager:
@@ -162,3 +163,53 @@ class TestConfigManager:
                 _ = config.openai_api_key
         finally:
             os.unlink(temp_env_file)
+
+    def test_openai_endpoints_default_to_base_url(self):
+        """Test a single endpoint is derived from the base URL"""
+        config = ConfigManager(openai_base_url="https://custom.endpoint.com")
+
+        endpoints = config.openai_endpoints
+
+        assert len(endpoints) == 1
+        assert endpoints[0].base_url == "https://custom.endpoint.com"
+        assert endpoints[0].api_key is None
+        assert config.load_balancing == "least_outstanding"
+
+    def test_openai_endpoints_from_env(self, monkeypatch):
+        """Test endpoints are parsed from OPENAI_ENDPOINTS"""
+        monkeypatch.setenv(
+            "OPENAI_ENDPOINTS", "https://a.example/v1|3|key_a, https://b.example/v1"
+        )
+        monkeypatch.setenv("OPENAI_LOAD_BALANCING", "power_of_two")
+
+        config = ConfigManager()
+        first, second = config.openai_endpoints
+
+        assert (first.base_url, first.weight, first.api_key) == (
+            "https://a.example/v1",
+            3.0,
+            "key_a",
+        )
+        assert (second.base_url, second.weight, second.api_key) == (
+            "https://b.example/v1",
+            1.0,
+            None,
+        )
+        assert config.load_balancing == "power_of_two"
+
+    def test_custom_openai_endpoints_parameter(self, monkeypatch):
+        """Test custom endpoints override the environment"""
+        monkeypatch.setenv("OPENAI_ENDPOINTS", "https://env.example/v1")
+        endpoints = [EndpointConfig("https://custom.example/v1", weight=2)]
+
+        config = ConfigManager(
+            openai_endpoints=endpoints, load_balancing="power_of_two"
+        )
+
+        assert config.openai_endpoints == endpoints
+        assert config.load_balancing == "power_of_two"
+
+    def test_endpoint_weight_must_be_positive(self):
+        """Test non-positive endpoint weights are rejected"""
+        with pytest.raises(ValueError, match="weight must be positive"):
+            EndpointConfig("https://a.example/v1", weight=0)
@@ -0,0 +1,221 @@
+import base64
+from unittest.mock import patch
+
+import pytest
+
+from anthropic_openai_bridge.converters.content_blocks import (
+    BLOCK_HANDLERS,
+    convert_blocks,
+)
+from anthropic_openai_bridge.converters.request_converter import RequestConverter
+from anthropic_openai_bridge.converters.tool_converter import ToolConverter
+
+PNG = base64.b64encode(b"\x89PNG\r\n\x1a\n" + bytes(64)).decode()
+
+
+def _image(data=PNG, media_type="image/png"):
+    return {
+        "type": "image",
+        "source": {"type": "base64", "media_type": media_type, "data": data},
+    }
+
+
+def _convert(role, content):
+    request = {
+        "model": "gpt-4o",
+        "max_tokens": 100,
+        "messages": [{"role": role, "content": content}],
+    }
+    return RequestConverter().convert(request)["messages"]
+
+
+class TestContentBlocks:
+    def test_text_and_images_keep_their_order(self):
+        messages = _convert(
+            "user",
+            [
+                {"type": "text", "text": "Compare"},
+                _image(),
+                {"type": "text", "text": "with"},
+                {
+                    "type": "image",
+                    "source": {"type": "url", "url": "https://example.com/b.jpg"},
+                },
+            ],
+        )
+
+        assert messages == [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "Compare"},
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": f"data:image/png;base64,{PNG}"},
+                    },
+                    {"type": "text", "text": "with"},
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": "https://example.com/b.jpg"},
+                    },
+                ],
+            }
+        ]
+
+    def test_image_only_message(self):
+        messages = _convert("user", [_image(media_type="image/webp")])
+
+        url = messages[0]["content"][0]["image_url"]["url"]
+        assert url == f"data:image/webp;base64,{PNG}"
+
+    def test_large_image_payload_is_passed_through(self):
+        data = base64.b64encode(bytes(3 * 1024 * 1024)).decode()
+
+        with patch("base64.b64decode") as b64decode:
+            messages = _convert("user", [_image(data)])
+
+        b64decode.assert_not_called()
+        url = messages[0]["content"][0]["image_url"]["url"]
+        assert url.endswith(data)
+        assert len(url) == len("data:image/png;base64,") + len(data)
+
+    def test_pdf_document_becomes_file_part(self):
+        messages = _convert(
+            "user",
+            [
+                {
+                    "type": "document",
+                    "title": "report.pdf",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "application/pdf",
+                        "data": "JVBERi0x",
+                    },
+                },
+                {"type": "text", "text": "Summarize this"},
+            ],
+        )
+
+        assert messages[0]["content"] == [
+            {
+                "type": "file",
+                "file": {
+                    "filename": "report.pdf",
+                    "file_data": "data:application/pdf;base64,JVBERi0x",
+                },
+            },
+            {"type": "text", "text": "Summarize this"},
+        ]
+
+    def test_text_documents_become_text(self):
+        messages = _convert(
+            "user",
+            [
+                {
+                    "type": "document",
+                    "source": {
+                        "type": "text",
+                        "media_type": "text/plain",
+                        "data": "Plain notes",
+                    },
+                },
+                {
+                    "type": "document",
+                    "source": {
+                        "type": "content",
+                        "content": [{"type": "text", "text": "Chunk one"}],
+                    },
+                },
+            ],
+        )
+
+        assert messages[0]["content"] == [
+            {"type": "text", "text": "Plain notes"},
+            {"type": "text", "text": "Chunk one"},
+        ]
+
+    @pytest.mark.parametrize(
+        "block",
+        [
+            {"type": "image", "source": {"type": "file", "file_id": "file_1"}},
+            {
+                "type": "document",
+                "source": {"type": "url", "url": "https://example.com/a.pdf"},
+            },
+        ],
+    )
+    def test_unsupported_sources_are_rejected(self, block):
+        with pytest.raises(ValueError, match="not supported"):
+            _convert("user", [block])
+
+    def test_unknown_blocks_are_skipped(self):
+        messages = _convert(
+            "assistant",
+            [
+                {"type": "thinking", "thinking": "Hmm", "signature": "sig"},
+                {"type": "text", "text": "Answer"},
+            ],
+        )
+
+        assert messages == [{"role": "assistant", "content": "Answer"}]
+
+    def test_assistant_messages_keep_only_text(self):
+        """Test images in assistant turns, which OpenAI rejects, are dropped"""
+        messages = _convert(
+            "assistant",
+            [
+                {"type": "text", "text": "Here is the chart"},
+                _image(),
+                {"type": "tool_use", "id": "toolu_1", "name": "f", "input": {}},
+            ],
+        )
+
+        assert messages[0]["content"] == "Here is the chart"
+        assert len(messages[0]["tool_calls"]) == 1
+        assert _convert("assistant", [_image()]) == []
+
+    def test_tool_use_with_several_text_blocks(self):
+        messages = _convert(
+            "assistant",
+            [
+                {"type": "text", "text": "First"},
+                {"type": "tool_use", "id": "toolu_1", "name": "f", "input": {}},
+                {"type": "text", "text": "Second"},
+            ],
+        )
+
+        assert messages[0]["content"] == [
+            {"type": "text", "text": "First"},
+            {"type": "text", "text": "Second"},
+        ]
+        assert messages[0]["tool_calls"][0]["id"] == "call_1"
+
+    def test_blocks_are_visited_once(self):
+        blocks = [
+            {"type": "text", "text": "a"},
+            {"type": "tool_result", "tool_use_id": "toolu_1", "content": "ok"},
+            _image(),
+        ]
+        calls = []
+        handlers = {
+            block_type: (
+                lambda block, *args, h=handler: calls.append(block) or h(block, *args)
+            )
+            for block_type, handler in BLOCK_HANDLERS.items()
+        }
+
+        with patch.dict(BLOCK_HANDLERS, handlers):
+            converted = convert_blocks(blocks, ToolConverter())
+
+        assert calls == blocks
+        assert len(converted.parts) == 2
+        assert len(converted.tool_messages) == 1
+
+    def test_registering_a_block_type(self):
+        def convert_search_result(block, content, tools):
+            content.parts.append({"type": "text", "text": block["title"]})
+
+        with patch.dict(BLOCK_HANDLERS, {"search_result": convert_search_result}):
+            messages = _convert("user", [{"type": "search_result", "title": "Doc"}])
+
+        assert messages == [{"role": "user", "content": "Doc"}]
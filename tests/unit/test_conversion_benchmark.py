@@ -0,0 +1,51 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+CONVERTERS = ["request", "response", "tool_definitions", "tool_calls", "stream"]
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, "-m", "benchmarks.conversion", *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+class TestConversionBenchmark:
+    def test_runs_every_converter(self, tmp_path):
+        output = tmp_path / "results.json"
+
+        _run("--scenario", "tools", "--iterations", "2", "--json", str(output))
+
+        results = json.loads(output.read_text())["results"]
+        assert [result["converter"] for result in results] == CONVERTERS
+        for result in results:
+            assert result["scenario"] == "tools"
+            assert result["ops_per_sec"] > 0
+            assert result["p99_us"] >= result["p50_us"] > 0
+            assert result["peak_kib"] > 0
+
+    def test_custom_workload(self):
+        stdout = _run(
+            "--messages",
+            "12",
+            "--tools",
+            "3",
+            "--tool-call-density",
+            "1",
+            "--converter",
+            "request",
+            "--iterations",
+            "1",
+        )
+
+        rows = stdout.splitlines()[1:]
+        assert len(rows) == 1
+        assert rows[0].split()[:2] == ["custom", "request"]
@@ -0,0 +1,176 @@
+import copy
+import json
+from unittest.mock import patch
+
+import pytest
+
+from anthropic_openai_bridge.bridge import AnthropicOpenAIBridge
+from anthropic_openai_bridge.converters.conversion_cache import (
+    ConversionCache,
+    without_conversion_cache,
+)
+from anthropic_openai_bridge.converters.request_converter import RequestConverter
+from anthropic_openai_bridge.server.handlers import RequestHandler
+
+
+def _turn(index):
+    """One agent loop turn: a tool call and its result"""
+    tool_id = f"toolu_{index:04d}"
+    return [
+        {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": f"Step {index}"},
+                {
+                    "type": "tool_use",
+                    "id": tool_id,
+                    "name": "read_file",
+                    "input": {"path": f"/src/{index}.py"},
+                },
+            ],
+        },
+        {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": tool_id, "content": "ok"},
+            ],
+        },
+    ]
+
+
+def _request(messages):
+    return {
+        "model": "gpt-4o",
+        "max_tokens": 100,
+        "system": "You are an agent.",
+        "messages": messages,
+    }
+
+
+class TestConversionCache:
+    def test_matches_uncached_conversion(self):
+        converter = RequestConverter(conversion_cache=ConversionCache())
+        history = [{"role": "user", "content": "Fix the bug"}]
+        for index in range(5):
+            history += _turn(index)
+            request = _request(history)
+
+            assert converter.convert(request) == RequestConverter().convert(request)
+
+    def test_only_appended_messages_are_converted(self):
+        converter = RequestConverter(conversion_cache=ConversionCache())
+        history = [{"role": "user", "content": "Fix the bug"}]
+        converted = []
+        original = converter._convert_message_content
+
+        def record(message):
+            converted.append(message)
+            return original(message)
+
+        with patch.object(converter, "_convert_message_content", side_effect=record):
+            converter.convert(_request(list(history)))
+            for index in range(10):
+                history += _turn(index)
+                converted.clear()
+                # Each turn resends the history in a new list
+                converter.convert(_request(list(history)))
+
+                assert converted == history[-2:]
+
+        stats = converter.conversion_cache.snapshot()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 10
+        assert stats["reused_messages"] == sum(1 + 2 * index for index in range(10))
+
+    def test_new_first_message_starts_a_new_conversation(self):
+        """Test histories decoded from JSON each turn are converted in full"""
+        cache = ConversionCache()
+        converter = RequestConverter(conversion_cache=cache)
+        history = _turn(0)
+        converter.convert(_request(history))
+
+        copied = copy.deepcopy(history) + _turn(1)
+        result = converter.convert(_request(copied))
+
+        assert result == RequestConverter().convert(_request(copied))
+        assert cache.snapshot()["hits"] == 0
+        assert cache.snapshot()["conversations"] == 2
+
+    def test_edited_history_is_converted_again(self):
+        converter = RequestConverter(conversion_cache=ConversionCache())
+        history = _turn(0) + _turn(1)
+        converter.convert(_request(history))
+
+        # Retry from an earlier point with a different tool result
+        branched = history[:3] + [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": "toolu_0001",
+                        "content": "failed",
+                    }
+                ],
+            }
+        ]
+        result = converter.convert(_request(branched))
+
+        assert result == RequestConverter().convert(_request(branched))
+        assert converter.conversion_cache.snapshot()["hits"] == 0
+
+    def test_memory_is_bounded(self):
+        cache = ConversionCache(max_messages=10)
+        converter = RequestConverter(conversion_cache=cache)
+        conversations = [_turn(index) + _turn(index + 1) for index in range(4)]
+
+        for conversation in conversations:
+            converter.convert(_request(conversation))
+
+        stats = cache.snapshot()
+        assert stats["conversations"] == 2
+        assert stats["messages"] == 8
+        assert stats["evictions"] == 2
+        # The least recently used conversations were dropped
+        assert cache.get(conversations[-1])[0] == 4
+        assert cache.get(conversations[0])[0] == 0
+
+    def test_history_longer_than_the_cache_is_not_stored(self):
+        cache = ConversionCache(max_messages=3)
+        RequestConverter(conversion_cache=cache).convert(_request(_turn(0) + _turn(1)))
+
+        assert cache.snapshot()["messages"] == 0
+
+    def test_http_requests_bypass_the_cache(self):
+        """Test requests decoded from JSON are neither looked up nor stored"""
+        cache = ConversionCache()
+        with patch("anthropic_openai_bridge.bridge.OpenAIClientWrapper"):
+            bridge = AnthropicOpenAIBridge(
+                openai_api_key="test_key", conversion_cache=cache
+            )
+        body = json.dumps(_request(_turn(0))).encode()
+
+        response = RequestHandler(bridge).handle(
+            "POST", "/v1/messages/count_tokens", body
+        )
+        with without_conversion_cache():
+            RequestConverter(conversion_cache=cache).convert(_request(_turn(1)))
+
+        assert response.status == 200
+        stats = cache.snapshot()
+        assert stats["conversations"] == 0
+        assert stats["hits"] + stats["misses"] == 0
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            ConversionCache(max_messages=0)
+
+    def test_bridge_option(self):
+        with patch("anthropic_openai_bridge.bridge.OpenAIClientWrapper"):
+            plain = AnthropicOpenAIBridge(openai_api_key="test_key")
+            cached = AnthropicOpenAIBridge(
+                openai_api_key="test_key", conversion_cache=ConversionCache(100)
+            )
+
+        assert plain.conversion_cache_stats() is None
+        assert cached.conversion_cache_stats()["max_messages"] == 100
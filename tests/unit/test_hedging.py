@@ -0,0 +1,241 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from anthropic_openai_bridge.client.hedging import HedgingPolicy, LatencyTracker
+from anthropic_openai_bridge.client.openai_client import (
+    AsyncOpenAIClientWrapper,
+    OpenAIClientWrapper,
+)
+from anthropic_openai_bridge.config.config_manager import ConfigManager
+from anthropic_openai_bridge.config.endpoint_config import EndpointConfig
+from anthropic_openai_bridge.config.pool_config import ConnectionPoolConfig
+
+
+def _config(hedging, connection_pool=None):
+    return ConfigManager(
+        openai_api_key="test_key",
+        openai_endpoints=[
+            EndpointConfig("https://a.example/v1"),
+            EndpointConfig("https://b.example/v1"),
+        ],
+        hedging=hedging,
+        connection_pool=connection_pool,
+    )
+
+
+def _response(name):
+    response = Mock()
+    response.model_dump.return_value = {"id": name}
+    return response
+
+
+class TestHedgingPolicy:
+    def test_percentile(self):
+        """Test percentiles are taken over recent latencies per model"""
+        tracker = LatencyTracker(window=100)
+        for i in range(1, 101):
+            tracker.record("m", i / 100)
+
+        assert tracker.percentile("m", 0.95) == 0.95
+        assert tracker.percentile("other", 0.95) is None
+
+    def test_adaptive_delay_needs_samples(self):
+        """Test the p95 delay only applies once enough latencies are known"""
+        policy = HedgingPolicy(min_samples=5)
+        assert policy.hedge_delay("m") is None
+
+        for latency in (0.1, 0.2, 0.3, 0.4, 2.0):
+            policy.record("m", latency)
+
+        assert policy.hedge_delay("m") == 2.0
+
+    def test_fixed_delay_wins(self):
+        """Test a configured delay is used regardless of samples"""
+        assert HedgingPolicy(delay=0.25).hedge_delay("m") == 0.25
+
+    def test_hedge_rate_is_capped(self):
+        """Test hedges never exceed max_hedge_rate of requests"""
+        policy = HedgingPolicy(delay=0, max_hedge_rate=0.1)
+        fired = 0
+        for _ in range(100):
+            policy.hedge_delay("m")
+            fired += policy.try_fire()
+
+        assert fired == 10
+        assert policy.snapshot()["hedges_denied"] == 90
+
+
+class TestSyncHedging:
+    def test_slow_primary_is_hedged_to_other_endpoint(self):
+        """Test a duplicate goes to the other endpoint and the faster one wins"""
+        hedged = threading.Event()
+        slow, fast = Mock(), Mock()
+        callers = []
+
+        def slow_create(**kwargs):
+            callers.append(threading.current_thread())
+            # Answer only after the hedge has had time to finish
+            hedged.wait(5)
+            time.sleep(0.1)
+            return _response("slow")
+
+        def fast_create(**kwargs):
+            callers.append(threading.current_thread())
+            hedged.set()
+            return _response("fast")
+
+        slow.chat.completions.create.side_effect = slow_create
+        fast.chat.completions.create.side_effect = fast_create
+        policy = HedgingPolicy(delay=0.05, max_hedge_rate=1.0)
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            mock_openai_class.side_effect = [slow, fast]
+            wrapper = OpenAIClientWrapper(_config(policy))
+            # Make sure the primary lands on the slow endpoint
+            wrapper.endpoints[1].acquire()
+            try:
+                result = wrapper.create_chat_completion({"model": "m"})
+            finally:
+                wrapper.endpoints[1].release()
+                hedged.set()
+
+        assert result == {"id": "fast"}
+        # The primary runs on the calling thread, only the hedge uses the pool
+        assert callers[0] is threading.current_thread()
+        assert callers[1] is not threading.current_thread()
+        stats = wrapper.hedging_stats()
+        assert stats["hedges_fired"] == 1
+        assert stats["hedges_won"] == 1
+
+    def test_fast_primary_is_not_hedged(self):
+        """Test no duplicate is sent when the primary answers in time"""
+        clients = [Mock(), Mock()]
+        for client in clients:
+            client.chat.completions.create.return_value = _response("ok")
+        policy = HedgingPolicy(delay=5.0, max_hedge_rate=1.0)
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            mock_openai_class.side_effect = clients
+            wrapper = OpenAIClientWrapper(_config(policy))
+            result = wrapper.create_chat_completion({"model": "m"})
+
+        assert result == {"id": "ok"}
+        assert sum(c.chat.completions.create.call_count for c in clients) == 1
+        assert wrapper.hedging_stats()["hedges_fired"] == 0
+        assert policy.tracker.count("m") == 1
+
+    def test_hedge_pool_follows_connection_limit(self):
+        """Test the hedging pool is sized from the connection pool"""
+        policy = HedgingPolicy(delay=5.0, max_hedge_rate=1.0)
+
+        with patch("anthropic_openai_bridge.client.openai_client.openai.OpenAI"):
+            wrapper = OpenAIClientWrapper(
+                _config(policy, ConnectionPoolConfig(max_connections=8))
+            )
+
+        assert wrapper._get_hedge_executor()._max_workers == 8
+        wrapper.close()
+
+    def test_close_stops_hedging_threads(self):
+        """Test close shuts down the hedging pool and refuses further hedges"""
+        clients = [Mock(), Mock()]
+        for client in clients:
+            client.chat.completions.create.return_value = _response("ok")
+        policy = HedgingPolicy(delay=5.0, max_hedge_rate=1.0)
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            mock_openai_class.side_effect = clients
+            wrapper = OpenAIClientWrapper(_config(policy))
+            wrapper.create_chat_completion({"model": "m"})
+            executor = wrapper._hedge_executor
+            wrapper.close()
+            result = wrapper.create_chat_completion({"model": "m"})
+
+        assert executor is not None and executor._shutdown
+        assert "closed" in result["error"]["message"]
+        for client in clients:
+            client.close.assert_called_once()
+
+
+class TestAsyncHedging:
+    @pytest.mark.asyncio
+    async def test_loser_is_cancelled(self):
+        """Test the slow attempt is cancelled and its endpoint released"""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+        slow, fast = Mock(), Mock()
+
+        async def slow_create(**kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return _response("slow")
+
+        async def fast_create(**kwargs):
+            return _response("fast")
+
+        slow.chat.completions.create.side_effect = slow_create
+        fast.chat.completions.create.side_effect = fast_create
+        policy = HedgingPolicy(delay=0.01, max_hedge_rate=1.0)
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.AsyncOpenAI"
+        ) as mock_openai_class:
+            mock_openai_class.side_effect = [slow, fast]
+            wrapper = AsyncOpenAIClientWrapper(_config(policy))
+            wrapper.endpoints[1].acquire()
+            task = asyncio.ensure_future(wrapper.create_chat_completion({"model": "m"}))
+            await started.wait()
+            wrapper.endpoints[1].release()
+            result = await task
+
+        assert result == {"id": "fast"}
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert [s["in_flight"] for s in wrapper.endpoint_stats()] == [0, 0]
+        assert wrapper.hedging_stats()["hedges_won"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_cancels_primary(self):
+        """Test cancelling the caller during the hedge delay stops the primary"""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+        clients = [Mock(), Mock()]
+
+        async def slow_create(**kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        for client in clients:
+            client.chat.completions.create.side_effect = slow_create
+        policy = HedgingPolicy(delay=5.0, max_hedge_rate=1.0)
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.AsyncOpenAI"
+        ) as mock_openai_class:
+            mock_openai_class.side_effect = clients
+            wrapper = AsyncOpenAIClientWrapper(_config(policy))
+            task = asyncio.ensure_future(wrapper.create_chat_completion({"model": "m"}))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert wrapper.hedging_stats()["hedges_fired"] == 0
@@ -0,0 +1,89 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are slow to import and only needed once a request is sent
+HEAVY_MODULES = ("anthropic", "openai", "dotenv", "httpx")
+
+# Upper bound on a cold import of the package's lightweight modules. Generous
+# because CI machines vary; set BRIDGE_IMPORT_BUDGET_MS to tighten it locally.
+IMPORT_BUDGET_MS = float(os.getenv("BRIDGE_IMPORT_BUDGET_MS", "500"))
+
+
+def _fresh_import(statement):
+    """Run ``statement`` in a new interpreter, return loaded heavy modules and ms"""
+    script = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = (time.perf_counter() - started) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'heavy': heavy, 'ms': elapsed}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import anthropic_openai_bridge",
+            "from anthropic_openai_bridge.config.config_manager import ConfigManager",
+            "from anthropic_openai_bridge.converters.request_converter import "
+            "RequestConverter",
+            "import anthropic_openai_bridge.__main__",
+        ],
+    )
+    def test_import_does_not_load_sdks(self, statement):
+        result = _fresh_import(statement)
+
+        assert result["heavy"] == []
+        assert result["ms"] < IMPORT_BUDGET_MS
+
+    def test_config_and_request_conversion_do_not_load_sdks(self):
+        result = _fresh_import(
+            "from anthropic_openai_bridge.config.config_manager import ConfigManager\n"
+            "from anthropic_openai_bridge.converters.request_converter import "
+            "RequestConverter\n"
+            "ConfigManager(openai_api_key='key').openai_api_key\n"
+            "RequestConverter().convert({'model': 'claude', 'max_tokens': 10, "
+            "'messages': [{'role': 'user', 'content': 'hi'}], 'tools': [{'name': "
+            "'t', 'description': 'd', 'input_schema': {'type': 'object'}}]})"
+        )
+
+        assert result["heavy"] == []
+
+    def test_bridge_classes_load_on_first_access(self):
+        result = _fresh_import(
+            "import anthropic_openai_bridge\n"
+            "anthropic_openai_bridge.AnthropicOpenAIBridge"
+        )
+
+        assert "anthropic" in result["heavy"]
+        assert "openai" in result["heavy"]
+
+    def test_bridge_does_not_need_plain_httpx(self):
+        """Test the bridge works with only the SDKs' own httpx flavour"""
+        result = _fresh_import(
+            "sys.modules['httpx'] = None\n"
+            "from anthropic_openai_bridge import AnthropicOpenAIBridge\n"
+            "from anthropic_openai_bridge.config.pool_config import "
+            "ConnectionPoolConfig\n"
+            "AnthropicOpenAIBridge(openai_api_key='key', "
+            "connection_pool=ConnectionPoolConfig())"
+        )
+
+        # Importing httpx would have raised ImportError in the subprocess
+        assert "openai" in result["heavy"]
+
+    def test_unknown_attribute(self):
+        import anthropic_openai_bridge
+
+        with pytest.raises(AttributeError):
+            anthropic_openai_bridge.NotAThing
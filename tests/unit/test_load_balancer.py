@@ -0,0 +1,191 @@
+import random
+
+import pytest
+
+from anthropic_openai_bridge.client.endpoints import Endpoint
+from anthropic_openai_bridge.client.load_balancer import (
+    LeastOutstandingBalancer,
+    PowerOfTwoChoicesBalancer,
+    PrefixAffinityBalancer,
+    create_load_balancer,
+)
+from anthropic_openai_bridge.config.endpoint_config import EndpointConfig
+
+
+def make_endpoints(*weights):
+    return [
+        Endpoint(EndpointConfig(f"https://node{i}.example/v1", weight=w), client=None)
+        for i, w in enumerate(weights)
+    ]
+
+
+class TestLeastOutstandingBalancer:
+    def test_picks_endpoint_with_fewest_in_flight(self):
+        """Test the least loaded endpoint is chosen"""
+        endpoints = make_endpoints(1, 1, 1)
+        endpoints[0].acquire()
+        endpoints[2].acquire()
+
+        balancer = LeastOutstandingBalancer()
+
+        assert balancer.select(endpoints) is endpoints[1]
+
+    def test_weights_scale_capacity(self):
+        """Test a heavier endpoint absorbs proportionally more requests"""
+        endpoints = make_endpoints(1, 3)
+        balancer = LeastOutstandingBalancer(random.Random(0))
+
+        for _ in range(8):
+            balancer.select(endpoints).acquire()
+
+        assert [e.in_flight for e in endpoints] == [2, 6]
+
+    def test_ties_are_spread(self):
+        """Test idle endpoints share the load"""
+        endpoints = make_endpoints(1, 1)
+        balancer = LeastOutstandingBalancer(random.Random(0))
+
+        chosen = {balancer.select(endpoints).name for _ in range(50)}
+
+        assert len(chosen) == 2
+
+
+class TestPowerOfTwoChoicesBalancer:
+    def test_never_picks_the_busier_of_two(self):
+        """Test the less loaded of the two sampled endpoints wins"""
+        endpoints = make_endpoints(1, 1)
+        for _ in range(5):
+            endpoints[0].acquire()
+        balancer = PowerOfTwoChoicesBalancer(random.Random(1))
+
+        assert all(balancer.select(endpoints) is endpoints[1] for _ in range(20))
+
+    def test_balances_load(self):
+        """Test in-flight counts stay close across endpoints"""
+        endpoints = make_endpoints(1, 1, 1, 1)
+        balancer = PowerOfTwoChoicesBalancer(random.Random(2))
+
+        for _ in range(400):
+            balancer.select(endpoints).acquire()
+
+        counts = [e.in_flight for e in endpoints]
+        assert max(counts) - min(counts) <= 2
+
+    def test_single_endpoint(self):
+        """Test a lone endpoint is always selected"""
+        endpoints = make_endpoints(1)
+
+        assert PowerOfTwoChoicesBalancer().select(endpoints) is endpoints[0]
+
+
+def conversation(system, *turns):
+    messages = [{"role": "system", "content": system}]
+    for i, turn in enumerate(turns):
+        role = "user" if i % 2 == 0 else "assistant"
+        messages.append({"role": role, "content": turn})
+    return {"model": "m", "messages": messages}
+
+
+class TestPrefixAffinityBalancer:
+    def test_conversation_stays_on_one_endpoint(self):
+        """Test every turn of a conversation is routed to the same endpoint"""
+        endpoints = make_endpoints(1, 1, 1, 1)
+        balancer = PrefixAffinityBalancer()
+        turns = ["question", "answer", "follow-up", "answer", "more"]
+
+        chosen = {
+            balancer.select(endpoints, conversation("agent", *turns[:n])).name
+            for n in range(1, len(turns) + 1)
+        }
+
+        assert len(chosen) == 1
+
+    def test_conversations_spread_by_weight(self):
+        """Test distinct prefixes are spread roughly in proportion to weight"""
+        endpoints = make_endpoints(1, 3)
+        balancer = PrefixAffinityBalancer()
+
+        counts = {endpoint.name: 0 for endpoint in endpoints}
+        for i in range(2000):
+            counts[
+                balancer.select(endpoints, conversation(f"user {i}", "hi")).name
+            ] += 1
+
+        share = counts[endpoints[1].name] / 2000
+        assert 0.65 < share < 0.85
+
+    def test_spills_over_when_preferred_endpoint_is_full(self):
+        """Test bounded load sends requests past a saturated endpoint"""
+        endpoints = make_endpoints(1, 1, 1)
+        balancer = PrefixAffinityBalancer(load_factor=1.25)
+        request = conversation("hot", "hi")
+        preferred = balancer.select(endpoints, request)
+
+        for _ in range(4):
+            preferred.acquire()
+
+        spilled = balancer.select(endpoints, request)
+        assert spilled is not preferred
+        assert balancer.select(endpoints, request) is spilled
+
+    def test_losing_an_endpoint_only_moves_its_conversations(self):
+        """Test consistent hashing keeps other conversations in place"""
+        endpoints = make_endpoints(1, 1, 1, 1)
+        balancer = PrefixAffinityBalancer()
+        requests = [conversation(f"conversation {i}", "hi") for i in range(200)]
+        before = [balancer.select(endpoints, request) for request in requests]
+
+        remaining = endpoints[1:]
+        after = [balancer.select(remaining, request) for request in requests]
+
+        for old, new in zip(before, after):
+            if old is not endpoints[0]:
+                assert new is old
+
+    def test_placement_is_stable_across_instances(self):
+        """Test separate bridge processes agree on where a prefix goes"""
+        request = conversation("shared", "hi")
+        first = PrefixAffinityBalancer().select(make_endpoints(1, 1, 1), request)
+        second = PrefixAffinityBalancer().select(make_endpoints(1, 1, 1), request)
+
+        assert first.name == second.name
+
+    def test_without_request_falls_back_to_least_outstanding(self):
+        endpoints = make_endpoints(1, 1)
+        endpoints[0].acquire()
+
+        assert PrefixAffinityBalancer().select(endpoints) is endpoints[1]
+
+    def test_invalid_load_factor(self):
+        with pytest.raises(ValueError):
+            PrefixAffinityBalancer(load_factor=1.0)
+
+
+def test_create_load_balancer():
+    """Test strategies are created by name"""
+    assert isinstance(
+        create_load_balancer("least_outstanding"), LeastOutstandingBalancer
+    )
+    assert isinstance(create_load_balancer("power_of_two"), PowerOfTwoChoicesBalancer)
+    assert isinstance(create_load_balancer("prefix_affinity"), PrefixAffinityBalancer)
+    with pytest.raises(ValueError, match="Unknown load balancing strategy"):
+        create_load_balancer("round_robin")
+
+
+def test_endpoint_release_counts_errors():
+    """Test the endpoint tracks in-flight and error counts"""
+    endpoint = make_endpoints(2)[0]
+    endpoint.acquire()
+    endpoint.acquire()
+    endpoint.release()
+    endpoint.release(failed=True)
+
+    assert endpoint.snapshot() == {
+        "name": "https://node0.example/v1",
+        "base_url": "https://node0.example/v1",
+        "weight": 2.0,
+        "in_flight": 0,
+        "requests_total": 2,
+        "errors_total": 1,
+        "circuit": None,
+    }
@@ -0,0 +1,173 @@
+import json
+
+import anthropic.types
+import pytest
+
+from anthropic_openai_bridge.batches.job_store import (
+    PENDING,
+    PROCESSING,
+    SUCCEEDED,
+    BatchJobStore,
+)
+from anthropic_openai_bridge.batches.message_batches import MessageBatches
+
+
+def _message(text):
+    return anthropic.types.Message(
+        id="msg_12345678",
+        type="message",
+        role="assistant",
+        content=[anthropic.types.TextBlock(type="text", text=text)],
+        model="test",
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=anthropic.types.Usage(input_tokens=1, output_tokens=1),
+    )
+
+
+def _echo(request):
+    text = request["messages"][0]["content"]
+    if text == "fail":
+        raise Exception("OpenAI API Error: upstream failed")
+    return _message(text)
+
+
+def _batch_requests(*texts):
+    return [
+        {
+            "custom_id": f"req-{i}",
+            "params": {
+                "model": "test",
+                "max_tokens": 10,
+                "messages": [{"role": "user", "content": text}],
+            },
+        }
+        for i, text in enumerate(texts)
+    ]
+
+
+class TestBatchJobStore:
+    def test_claim_and_complete(self, tmp_path):
+        """Test items are claimed in order and the batch ends when all finish"""
+        store = BatchJobStore(str(tmp_path / "jobs.db"))
+        batch_id = store.create_batch(_batch_requests("a", "b"))
+
+        first = store.claim_next()
+        second = store.claim_next()
+        assert [first["custom_id"], second["custom_id"]] == ["req-0", "req-1"]
+        assert store.claim_next() is None
+
+        store.complete_item(batch_id, first["position"], SUCCEEDED, {"ok": 1})
+        assert store.get_batch(batch_id)["ended_at"] is None
+
+        store.complete_item(batch_id, second["position"], SUCCEEDED, {"ok": 2})
+        batch = store.get_batch(batch_id)
+        assert batch["ended_at"] is not None
+        assert batch["counts"] == {SUCCEEDED: 2}
+
+    def test_requeue_interrupted_items(self, tmp_path):
+        """Test items left processing by a dead process are resumed"""
+        path = str(tmp_path / "jobs.db")
+        store = BatchJobStore(path)
+        batch_id = store.create_batch(_batch_requests("a"))
+        store.claim_next()
+        store.close()
+
+        reopened = BatchJobStore(path)
+        assert reopened.get_batch(batch_id)["counts"] == {PROCESSING: 1}
+        assert reopened.requeue_interrupted() == 1
+        assert reopened.get_batch(batch_id)["counts"] == {PENDING: 1}
+
+    def test_outcome_after_close_is_dropped(self, tmp_path):
+        """Test a worker finishing after close leaves its item to be resumed"""
+        path = str(tmp_path / "jobs.db")
+        store = BatchJobStore(path)
+        batch_id = store.create_batch(_batch_requests("a"))
+        item = store.claim_next()
+        store.close()
+
+        store.complete_item(batch_id, item["position"], SUCCEEDED, {"ok": 1})
+        assert store.claim_next() is None
+
+        reopened = BatchJobStore(path)
+        assert reopened.get_batch(batch_id)["counts"] == {PROCESSING: 1}
+
+    def test_rejects_duplicate_custom_ids(self, tmp_path):
+        """Test custom_id values must be unique within a batch"""
+        store = BatchJobStore(str(tmp_path / "jobs.db"))
+        requests = _batch_requests("a", "b")
+        requests[1]["custom_id"] = "req-0"
+
+        with pytest.raises(ValueError, match="unique"):
+            store.create_batch(requests)
+
+
+class TestMessageBatches:
+    def test_create_process_and_results(self, tmp_path):
+        """Test a batch is drained and results come back per custom_id"""
+        batches = MessageBatches(_echo, str(tmp_path / "jobs.db"), concurrency=2)
+        try:
+            batch = batches.create(_batch_requests("hello", "fail", "world"))
+            assert batch.id.startswith("msgbatch_")
+            assert batch.request_counts.processing + batch.request_counts.succeeded
+
+            ended = batches.wait(batch.id, timeout=5, poll_interval=0.01)
+            assert ended.processing_status == "ended"
+            assert ended.request_counts.succeeded == 2
+            assert ended.request_counts.errored == 1
+
+            results = list(batches.results(batch.id))
+            assert [r.custom_id for r in results] == ["req-0", "req-1", "req-2"]
+            assert results[0].result.type == "succeeded"
+            assert results[0].result.message.content[0].text == "hello"
+            assert results[1].result.type == "errored"
+
+            lines = list(batches.results_jsonl(batch.id))
+            assert json.loads(lines[2])["result"]["message"]["content"][0]["text"] == (
+                "world"
+            )
+        finally:
+            batches.close()
+
+    def test_resume_after_restart(self, tmp_path):
+        """Test a new instance finishes work left behind by a previous one"""
+        path = str(tmp_path / "jobs.db")
+        store = BatchJobStore(path)
+        batch_id = store.create_batch(_batch_requests("a", "b"))
+        store.claim_next()  # simulate a worker that died mid-request
+        store.close()
+
+        batches = MessageBatches(_echo, path, concurrency=1)
+        try:
+            ended = batches.wait(batch_id, timeout=5, poll_interval=0.01)
+            assert ended.request_counts.succeeded == 2
+        finally:
+            batches.close()
+
+    def test_cancel_pending_items(self, tmp_path):
+        """Test canceling marks unstarted items canceled and ends the batch"""
+        batches = MessageBatches(
+            _echo, str(tmp_path / "jobs.db"), concurrency=1, autostart=False
+        )
+        try:
+            batch_id = batches.store.create_batch(_batch_requests("a", "b"))
+
+            canceled = batches.cancel(batch_id)
+
+            assert canceled.processing_status == "ended"
+            assert canceled.request_counts.canceled == 2
+            assert [r.result.type for r in batches.results(batch_id)] == [
+                "canceled",
+                "canceled",
+            ]
+        finally:
+            batches.close()
+
+    def test_retrieve_unknown_batch(self, tmp_path):
+        """Test retrieving an unknown batch raises KeyError"""
+        batches = MessageBatches(_echo, str(tmp_path / "jobs.db"), autostart=False)
+        try:
+            with pytest.raises(KeyError):
+                batches.retrieve("msgbatch_missing")
+        finally:
+            batches.close()
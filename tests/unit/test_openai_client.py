@@ -1,10 +1,17 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
 import httpx
 import pytest
 
-from anthropic_openai_bridge.client.openai_client import OpenAIClientWrapper
+from anthropic_openai_bridge import httpx_compat
+from anthropic_openai_bridge.client.openai_client import (
+    AsyncOpenAIClientWrapper,
+    OpenAIClientWrapper,
+)
+from anthropic_openai_bridge.client.retry import RetryPolicy
 from anthropic_openai_bridge.config.config_manager import ConfigManager
+from anthropic_openai_bridge.config.endpoint_config import EndpointConfig
+from anthropic_openai_bridge.config.pool_config import ConnectionPoolConfig
 
 
 class TestOpenAIClientWrapper:
@@ -18,7 +25,7 @@ class TestOpenAIClientWrapper:
             wrapper = OpenAIClientWrapper(config)
 
             # Verify OpenAI client was initialized with correct parameters
-            mock_openai_class.assert_called_once_with(api_key="test_key")
+            mock_openai_class.assert_called_once_with(api_key="test_key", max_retries=0)
             assert wrapper.config == config
 
     def test_init_with_custom_base_url(self):
@@ -34,7 +41,9 @@ class TestOpenAIClientWrapper:
 
             # Verify OpenAI client was initialized with base URL
             mock_openai_class.assert_called_once_with(
-                api_key="test_key", base_url="https://custom.endpoint.com"
+                api_key="test_key",
+                max_retries=0,
+                base_url="https://custom.endpoint.com",
             )
 
     def test_init_with_httpx_client(self):
@@ -51,7 +60,7 @@ class TestOpenAIClientWrapper:
 
             # Verify OpenAI client was initialized with httpx client
             mock_openai_class.assert_called_once_with(
-                api_key="test_key", http_client=custom_httpx_client
+                api_key="test_key", max_retries=0, http_client=custom_httpx_client
             )
 
     def test_init_with_all_custom_parameters(self):
@@ -71,10 +80,47 @@ class TestOpenAIClientWrapper:
             # Verify OpenAI client was initialized with all parameters
             mock_openai_class.assert_called_once_with(
                 api_key="test_key",
+                max_retries=0,
                 base_url="https://custom.endpoint.com",
                 http_client=custom_httpx_client,
             )
 
+    def test_init_with_connection_pool(self):
+        """Test pool settings build an instrumented httpx client"""
+        config = ConfigManager(
+            openai_api_key="test_key",
+            connection_pool=ConnectionPoolConfig(max_connections=16),
+        )
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            wrapper = OpenAIClientWrapper(config)
+
+            http_client = mock_openai_class.call_args.kwargs["http_client"]
+            assert isinstance(http_client, httpx_compat.httpx.Client)
+            assert wrapper.pool_stats()["max_connections"] == 16
+            assert wrapper.pool_stats()["in_flight"] == 0
+
+    def test_custom_httpx_client_takes_precedence_over_pool(self):
+        """Test a caller-built httpx client is used as-is"""
+        custom_httpx_client = httpx.Client()
+        config = ConfigManager(
+            openai_api_key="test_key",
+            httpx_client=custom_httpx_client,
+            connection_pool=ConnectionPoolConfig(),
+        )
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            wrapper = OpenAIClientWrapper(config)
+
+            assert (
+                mock_openai_class.call_args.kwargs["http_client"] is custom_httpx_client
+            )
+            assert wrapper.pool_stats() is None
+
     def test_create_chat_completion_success(self):
         """Test successful chat completion creation"""
         config = ConfigManager(openai_api_key="test_key")
@@ -164,3 +210,306 @@ class TestOpenAIClientWrapper:
             assert result["error"]["message"] == "Generic Error"
             assert result["error"]["type"] == "api_error"
             assert result["error"]["code"] == "unknown"
+
+    def test_create_chat_completion_stream(self):
+        """Test streaming requests usage and yields chunk dictionaries"""
+        config = ConfigManager(openai_api_key="test_key")
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            mock_client = Mock()
+            mock_openai_class.return_value = mock_client
+
+            chunk = Mock()
+            chunk.model_dump.return_value = {"choices": []}
+            mock_stream = MagicMock()
+            mock_stream.__iter__.return_value = iter([chunk, chunk])
+            mock_client.chat.completions.create.return_value = mock_stream
+
+            wrapper = OpenAIClientWrapper(config)
+            request = {"model": "gpt-3.5-turbo", "messages": []}
+
+            result = list(wrapper.create_chat_completion_stream(request))
+
+            mock_client.chat.completions.create.assert_called_once_with(
+                model="gpt-3.5-turbo",
+                messages=[],
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            assert result == [{"choices": []}, {"choices": []}]
+            mock_stream.close.assert_called_once()
+
+    def test_create_chat_completion_stream_error(self):
+        """Test streaming errors are yielded as an error dictionary"""
+        config = ConfigManager(openai_api_key="test_key")
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            mock_client = Mock()
+            mock_client.chat.completions.create.side_effect = Exception("API Error")
+            mock_openai_class.return_value = mock_client
+
+            wrapper = OpenAIClientWrapper(config)
+
+            result = list(wrapper.create_chat_completion_stream({"model": "m"}))
+
+            assert len(result) == 1
+            assert result[0]["error"]["message"] == "API Error"
+
+    def test_init_with_multiple_endpoints(self):
+        """Test one client is built per endpoint with its own key and URL"""
+        config = ConfigManager(
+            openai_api_key="test_key",
+            openai_endpoints=[
+                EndpointConfig("https://a.example/v1", api_key="key_a"),
+                EndpointConfig("https://b.example/v1", weight=2),
+            ],
+        )
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            wrapper = OpenAIClientWrapper(config)
+
+            assert mock_openai_class.call_args_list == [
+                call(api_key="key_a", max_retries=0, base_url="https://a.example/v1"),
+                call(
+                    api_key="test_key", max_retries=0, base_url="https://b.example/v1"
+                ),
+            ]
+            assert [stats["name"] for stats in wrapper.endpoint_stats()] == [
+                "https://a.example/v1",
+                "https://b.example/v1",
+            ]
+
+    def test_requests_are_balanced_across_endpoints(self):
+        """Test requests go to the least loaded endpoint and are counted"""
+        config = ConfigManager(
+            openai_api_key="test_key",
+            openai_endpoints=[
+                EndpointConfig("https://a.example/v1"),
+                EndpointConfig("https://b.example/v1"),
+            ],
+        )
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            clients = [Mock(), Mock()]
+            mock_openai_class.side_effect = clients
+            wrapper = OpenAIClientWrapper(config)
+
+            # Hold a request open on the first endpoint
+            wrapper.endpoints[0].acquire()
+            wrapper.create_chat_completion({"model": "m"})
+
+            clients[1].chat.completions.create.assert_called_once_with(model="m")
+            clients[0].chat.completions.create.assert_not_called()
+            stats = wrapper.endpoint_stats()
+            assert stats[0]["in_flight"] == 1
+            assert stats[1]["in_flight"] == 0
+            assert stats[1]["requests_total"] == 1
+
+    def test_prefix_affinity_routes_conversation_consistently(self):
+        """Test the wrapper passes the request to content-aware balancers"""
+        config = ConfigManager(
+            openai_api_key="test_key",
+            openai_endpoints=[
+                EndpointConfig("https://a.example/v1"),
+                EndpointConfig("https://b.example/v1"),
+                EndpointConfig("https://c.example/v1"),
+            ],
+            load_balancing="prefix_affinity",
+        )
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            mock_openai_class.side_effect = [Mock(), Mock(), Mock()]
+            wrapper = OpenAIClientWrapper(config)
+            messages = [{"role": "user", "content": "hi"}]
+            for turn in range(4):
+                messages = messages + [{"role": "user", "content": str(turn)}]
+                wrapper.create_chat_completion({"model": "m", "messages": messages})
+
+            totals = [stats["requests_total"] for stats in wrapper.endpoint_stats()]
+            assert sorted(totals) == [0, 0, 4]
+
+    def test_failed_request_releases_endpoint(self):
+        """Test errors are counted and release the in-flight slot"""
+        config = ConfigManager(openai_api_key="test_key")
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            mock_client = Mock()
+            mock_client.chat.completions.create.side_effect = Exception("API Error")
+            mock_openai_class.return_value = mock_client
+
+            wrapper = OpenAIClientWrapper(config)
+            wrapper.create_chat_completion({"model": "m"})
+            list(wrapper.create_chat_completion_stream({"model": "m"}))
+
+            stats = wrapper.endpoint_stats()[0]
+            assert stats["in_flight"] == 0
+            assert stats["requests_total"] == 2
+            assert stats["errors_total"] == 2
+
+
+class TestAsyncOpenAIClientWrapper:
+    def test_init_with_custom_base_url(self):
+        """Test AsyncOpenAI client initialization with custom base URL"""
+        config = ConfigManager(
+            openai_api_key="test_key", openai_base_url="https://custom.endpoint.com"
+        )
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.AsyncOpenAI"
+        ) as mock_openai_class:
+            wrapper = AsyncOpenAIClientWrapper(config)
+
+            mock_openai_class.assert_called_once_with(
+                api_key="test_key",
+                max_retries=0,
+                base_url="https://custom.endpoint.com",
+            )
+            assert wrapper.config == config
+
+    @pytest.mark.asyncio
+    async def test_create_chat_completion_success(self):
+        """Test successful async chat completion creation"""
+        config = ConfigManager(openai_api_key="test_key")
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.AsyncOpenAI"
+        ) as mock_openai_class:
+            mock_client = Mock()
+            mock_client.chat.completions.create = AsyncMock()
+            mock_openai_class.return_value = mock_client
+
+            mock_response = Mock()
+            mock_response.model_dump.return_value = {"id": "chatcmpl-123"}
+            mock_client.chat.completions.create.return_value = mock_response
+
+            wrapper = AsyncOpenAIClientWrapper(config)
+            request = {
+                "model": "gpt-3.5-turbo",
+                "messages": [{"role": "user", "content": "Hi"}],
+            }
+
+            result = await wrapper.create_chat_completion(request)
+
+            mock_client.chat.completions.create.assert_awaited_once_with(**request)
+            assert result == {"id": "chatcmpl-123"}
+
+    @pytest.mark.asyncio
+    async def test_create_chat_completion_error(self):
+        """Test async chat completion creation with error"""
+        config = ConfigManager(openai_api_key="test_key")
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.AsyncOpenAI"
+        ) as mock_openai_class:
+            mock_client = Mock()
+            error = Exception("API Error")
+            error.code = "invalid_request"
+            mock_client.chat.completions.create = AsyncMock(side_effect=error)
+            mock_openai_class.return_value = mock_client
+
+            wrapper = AsyncOpenAIClientWrapper(config)
+            result = await wrapper.create_chat_completion({"model": "gpt-3.5-turbo"})
+
+            assert result["error"]["message"] == "API Error"
+            assert result["error"]["type"] == "api_error"
+            assert result["error"]["code"] == "invalid_request"
+
+
+COMPLETION = {
+    "id": "chatcmpl-raw",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hi"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+}
+
+
+def _completion_handler(status=200, body=COMPLETION):
+    def handler(request):
+        assert request.url.path.endswith("/chat/completions")
+        return httpx.Response(status, json=body)
+
+    return handler
+
+
+class TestRawResponses:
+    def test_raw_response_matches_sdk_model_dump(self):
+        """Test the decoded body carries what the SDK model would dump"""
+        transport = httpx.MockTransport(_completion_handler())
+        request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hi"}]}
+
+        raw = OpenAIClientWrapper(
+            ConfigManager(
+                openai_api_key="test_key",
+                httpx_client=httpx.Client(transport=transport),
+                raw_responses=True,
+            )
+        ).create_chat_completion(request)
+        parsed = OpenAIClientWrapper(
+            ConfigManager(
+                openai_api_key="test_key",
+                httpx_client=httpx.Client(transport=transport),
+            )
+        ).create_chat_completion(request)
+
+        assert raw == COMPLETION
+        assert parsed["choices"][0]["message"]["content"] == "Hi"
+        assert parsed["usage"]["total_tokens"] == raw["usage"]["total_tokens"]
+
+    def test_raw_response_errors_are_typed(self):
+        transport = httpx.MockTransport(
+            _completion_handler(429, {"error": {"message": "slow down"}})
+        )
+        wrapper = OpenAIClientWrapper(
+            ConfigManager(
+                openai_api_key="test_key",
+                httpx_client=httpx.Client(transport=transport),
+                retry_policy=RetryPolicy(max_retries=0),
+                raw_responses=True,
+            )
+        )
+
+        result = wrapper.create_chat_completion({"model": "gpt-4o", "messages": []})
+
+        assert result["error"]["type"] == "rate_limit_error"
+        assert wrapper.endpoint_stats()[0]["errors_total"] == 1
+
+    def test_raw_responses_from_env(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_RAW_RESPONSES", "true")
+        assert ConfigManager(openai_api_key="test_key").raw_responses is True
+
+    @pytest.mark.asyncio
+    async def test_async_raw_response(self):
+        transport = httpx.MockTransport(_completion_handler())
+        wrapper = AsyncOpenAIClientWrapper(
+            ConfigManager(
+                openai_api_key="test_key",
+                httpx_client=httpx.AsyncClient(transport=transport),
+                raw_responses=True,
+            )
+        )
+
+        result = await wrapper.create_chat_completion(
+            {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hi"}]}
+        )
+
+        assert result == COMPLETION
@@ -0,0 +1,123 @@
+import pytest
+
+from anthropic_openai_bridge.client.pool_metrics import (
+    AsyncInstrumentedTransport,
+    InstrumentedTransport,
+)
+from anthropic_openai_bridge.config.pool_config import ConnectionPoolConfig
+from anthropic_openai_bridge.httpx_compat import httpx
+from anthropic_openai_bridge.server.app import create_app
+from anthropic_openai_bridge.server.http_server import HTTPServer
+
+
+class _HealthOnlyBridge:
+    async def close(self):
+        pass
+
+
+class TestConnectionPoolConfig:
+    def test_httpx_limits_and_timeout(self):
+        """Test settings translate into httpx limits and timeouts"""
+        config = ConnectionPoolConfig(
+            max_connections=50,
+            keepalive_expiry=60.0,
+            connect_timeout=2.0,
+            pool_timeout=1.0,
+        )
+
+        limits = config.httpx_limits()
+        timeout = config.httpx_timeout()
+
+        assert limits.max_connections == 50
+        assert limits.max_keepalive_connections == 50
+        assert limits.keepalive_expiry == 60.0
+        assert timeout.connect == 2.0
+        assert timeout.pool == 1.0
+
+    def test_keepalive_cannot_exceed_max(self):
+        """Test invalid keep-alive limits are rejected"""
+        with pytest.raises(ValueError, match="max_keepalive_connections"):
+            ConnectionPoolConfig(max_connections=4, max_keepalive_connections=5)
+
+    def test_from_env(self, monkeypatch):
+        """Test settings are read from OPENAI_* environment variables"""
+        monkeypatch.setenv("OPENAI_MAX_CONNECTIONS", "12")
+        monkeypatch.setenv("OPENAI_HTTP2", "true")
+        monkeypatch.setenv("OPENAI_POOL_TIMEOUT", "0.5")
+
+        config = ConnectionPoolConfig.from_env()
+
+        assert config.max_connections == 12
+        assert config.http2 is True
+        assert config.pool_timeout == 0.5
+
+    def test_from_env_unset(self, monkeypatch):
+        """Test no settings are produced without pool environment variables"""
+        for name in ("OPENAI_MAX_CONNECTIONS", "OPENAI_HTTP2", "OPENAI_POOL_TIMEOUT"):
+            monkeypatch.delenv(name, raising=False)
+
+        assert ConnectionPoolConfig.from_env() is None
+
+
+class TestInstrumentedTransport:
+    def test_in_flight_tracks_open_responses(self):
+        """Test a request counts as in flight until its response is closed"""
+
+        def handler(request):
+            return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+        transport = InstrumentedTransport(
+            ConnectionPoolConfig(max_connections=4),
+            transport=httpx.MockTransport(handler),
+        )
+
+        with httpx.Client(transport=transport) as client:
+            with client.stream("GET", "http://upstream/v1/models") as response:
+                assert response.status_code == 200
+                assert transport.metrics.in_flight == 1
+                assert transport.metrics.utilization == 0.25
+
+        stats = transport.metrics.snapshot()
+        assert stats["in_flight"] == 0
+        assert stats["peak_in_flight"] == 1
+        assert stats["requests_total"] == 1
+
+    def test_failed_request_is_not_left_in_flight(self):
+        """Test transport errors release the in-flight slot"""
+
+        def fail(request):
+            raise httpx.ConnectError("refused")
+
+        transport = InstrumentedTransport(
+            ConnectionPoolConfig(), transport=httpx.MockTransport(fail)
+        )
+
+        with httpx.Client(transport=transport) as client:
+            with pytest.raises(httpx.ConnectError):
+                client.get("http://upstream/")
+
+        assert transport.metrics.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_records_wait_and_connections_on_real_pool(self):
+        """Test pool wait and connection counters come from httpcore traces"""
+        server = HTTPServer(create_app(_HealthOnlyBridge()), port=0)
+        await server.start()
+        try:
+            transport = AsyncInstrumentedTransport(
+                ConnectionPoolConfig(max_connections=2)
+            )
+            async with httpx.AsyncClient(transport=transport) as client:
+                url = f"http://127.0.0.1:{server.bound_port}/health"
+                for _ in range(3):
+                    response = await client.get(url)
+                    assert response.status_code == 200
+
+            stats = transport.metrics.snapshot()
+            assert stats["requests_total"] == 3
+            # Keep-alive reuses the first connection
+            assert stats["connections_opened"] == 1
+            assert stats["wait_seconds_total"] >= 0.0
+            assert stats["in_flight"] == 0
+        finally:
+            await server.stop()
@@ -0,0 +1,220 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from anthropic_openai_bridge.client.openai_client import OpenAIClientWrapper
+from anthropic_openai_bridge.client.rate_limiter import (
+    MemoryBucketStore,
+    RateLimiter,
+    SQLiteBucketStore,
+)
+from anthropic_openai_bridge.config.config_manager import ConfigManager
+from anthropic_openai_bridge.config.rate_limit_config import RateLimitConfig
+from anthropic_openai_bridge.errors import RateLimitExceededError
+from anthropic_openai_bridge.tokens.counter import TokenCounter
+from anthropic_openai_bridge.tokens.tokenizers import Tokenizer
+
+
+class FixedTokenizer(Tokenizer):
+    """Counts nothing, so a request's estimate is its formatting overhead"""
+
+    def count(self, text):
+        return 0
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _request(model="gpt-4o", max_tokens=None):
+    request = {"model": model, "messages": [{"role": "user", "content": "hi"}]}
+    if max_tokens is not None:
+        request["max_completion_tokens"] = max_tokens
+    return request
+
+
+def _limiter(config, clock, store=None):
+    return RateLimiter(config, TokenCounter(FixedTokenizer()), store, clock)
+
+
+class TestRateLimitConfig:
+    def test_from_env_without_limits(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_RATE_LIMIT_MAX_WAIT", "5")
+        assert RateLimitConfig.from_env() is None
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_RATE_LIMIT_RPM", "60")
+        monkeypatch.setenv("OPENAI_RATE_LIMIT_STORE_PATH", "/tmp/buckets.db")
+
+        config = RateLimitConfig.from_env()
+
+        assert config.requests_per_minute == 60.0
+        assert config.tokens_per_minute is None
+        assert config.store_path == "/tmp/buckets.db"
+
+    def test_rejects_non_positive_limits(self):
+        with pytest.raises(ValueError):
+            RateLimitConfig(tokens_per_minute=0)
+
+
+class TestRateLimiter:
+    def test_requests_are_paced_once_the_bucket_is_empty(self):
+        """Test the bucket allows a burst of one minute's budget, then paces"""
+        clock = FakeClock()
+        limiter = _limiter(RateLimitConfig(requests_per_minute=2), clock)
+
+        assert limiter.reserve("primary", _request()).wait == 0
+        assert limiter.reserve("primary", _request()).wait == 0
+        assert limiter.reserve("primary", _request()).wait == pytest.approx(30.0)
+        assert limiter.reserve("primary", _request()).wait == pytest.approx(60.0)
+
+        clock.now += 60.0
+        assert limiter.reserve("primary", _request()).wait == pytest.approx(30.0)
+        assert limiter.snapshot()["delayed_total"] == 3
+
+    def test_wait_beyond_max_wait_is_rejected(self):
+        clock = FakeClock()
+        limiter = _limiter(RateLimitConfig(requests_per_minute=1, max_wait=10.0), clock)
+        limiter.reserve("primary", _request())
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            limiter.reserve("primary", _request())
+
+        assert exc_info.value.retry_after == pytest.approx(60.0)
+        assert exc_info.value.code == "rate_limited"
+        # A rejected request takes nothing from the bucket
+        clock.now += 60.0
+        assert limiter.reserve("primary", _request()).wait == 0
+        assert limiter.snapshot()["rejected_total"] == 1
+
+    def test_token_estimate_includes_completion_budget(self):
+        clock = FakeClock()
+        limiter = _limiter(RateLimitConfig(tokens_per_minute=1000), clock)
+
+        reservation = limiter.reserve("primary", _request(max_tokens=500))
+
+        # Formatting overhead only, since FixedTokenizer counts no text
+        assert reservation.tokens == 506
+        assert limiter.reserve("primary", _request(max_tokens=500)).wait > 0
+
+    def test_settle_refunds_unused_tokens(self):
+        """Test actual usage replaces the up-front estimate"""
+        clock = FakeClock()
+        limiter = _limiter(RateLimitConfig(tokens_per_minute=1000), clock)
+
+        reservation = limiter.reserve("primary", _request(max_tokens=894))
+        assert reservation.tokens == 900
+        limiter.settle(reservation, 100)
+
+        # 900 remain, enough for another identical request
+        assert limiter.reserve("primary", _request(max_tokens=894)).wait == 0
+        assert limiter.snapshot()["used_tokens_total"] == 100
+
+    def test_endpoint_limits_are_separate_and_model_limits_shared(self):
+        clock = FakeClock()
+        limiter = _limiter(
+            RateLimitConfig(requests_per_minute=1, model_requests_per_minute=2),
+            clock,
+        )
+
+        assert limiter.reserve("a", _request()).wait == 0
+        assert limiter.reserve("b", _request()).wait == 0
+        # Endpoint "a" is out of requests whichever model is asked for
+        assert limiter.reserve("a", _request(model="other")).wait == pytest.approx(60)
+        # A fresh endpoint is held back only by the model's shared budget
+        assert limiter.reserve("c", _request()).wait == pytest.approx(30.0)
+
+    def test_sqlite_store_is_shared_between_limiters(self, tmp_path):
+        """Test two processes opening the same file draw from one budget"""
+        path = str(tmp_path / "buckets.db")
+        clock = FakeClock()
+        config = RateLimitConfig(requests_per_minute=2)
+        first = _limiter(config, clock, SQLiteBucketStore(path))
+        second = _limiter(config, clock, SQLiteBucketStore(path))
+
+        assert first.reserve("primary", _request()).wait == 0
+        assert second.reserve("primary", _request()).wait == 0
+        assert first.reserve("primary", _request()).wait == pytest.approx(30.0)
+
+        first.store.close()
+        second.store.close()
+
+    def test_memory_store_is_default(self):
+        limiter = RateLimiter(RateLimitConfig(requests_per_minute=1))
+        assert isinstance(limiter.store, MemoryBucketStore)
+
+
+class TestClientRateLimiting:
+    def test_wrapper_waits_and_settles_usage(self):
+        config = ConfigManager(
+            openai_api_key="test_key",
+            rate_limit=RateLimitConfig(requests_per_minute=1, max_wait=120.0),
+        )
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            response = Mock()
+            response.usage.total_tokens = 12
+            mock_openai_class.return_value.chat.completions.create.return_value = (
+                response
+            )
+            wrapper = OpenAIClientWrapper(config)
+
+            with patch(
+                "anthropic_openai_bridge.client.openai_client.time.sleep"
+            ) as mock_sleep:
+                wrapper.create_chat_completion(_request())
+                wrapper.create_chat_completion(_request())
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(60.0, abs=1.0)
+        stats = wrapper.rate_limit_stats()
+        assert stats["requests_total"] == 2
+        assert stats["delayed_total"] == 1
+        assert wrapper.endpoint_stats()[0]["in_flight"] == 0
+
+    def test_wrapper_waits_before_taking_the_endpoint(self):
+        config = ConfigManager(
+            openai_api_key="test_key",
+            rate_limit=RateLimitConfig(requests_per_minute=1, max_wait=120.0),
+        )
+        with patch("anthropic_openai_bridge.client.openai_client.openai.OpenAI"):
+            wrapper = OpenAIClientWrapper(config)
+            in_flight_while_waiting = []
+
+            with patch(
+                "anthropic_openai_bridge.client.openai_client.time.sleep",
+                side_effect=lambda seconds: in_flight_while_waiting.append(
+                    wrapper.endpoint_stats()[0]["in_flight"]
+                ),
+            ):
+                wrapper.create_chat_completion(_request())
+                wrapper.create_chat_completion(_request())
+
+        assert in_flight_while_waiting == [0]
+        assert wrapper.endpoint_stats()[0]["requests_total"] == 2
+
+    def test_wrapper_rejects_and_releases_endpoint(self):
+        config = ConfigManager(
+            openai_api_key="test_key",
+            rate_limit=RateLimitConfig(requests_per_minute=1, max_wait=0.0),
+        )
+        with patch("anthropic_openai_bridge.client.openai_client.openai.OpenAI"):
+            wrapper = OpenAIClientWrapper(config)
+            wrapper.create_chat_completion(_request())
+
+            result = wrapper.create_chat_completion(_request())
+
+        assert result["error"]["code"] == "rate_limited"
+        assert wrapper.endpoint_stats()[0]["in_flight"] == 0
+        assert wrapper.rate_limit_stats()["rejected_total"] == 1
+
+    def test_disabled_by_default(self):
+        with patch("anthropic_openai_bridge.client.openai_client.openai.OpenAI"):
+            wrapper = OpenAIClientWrapper(ConfigManager(openai_api_key="test_key"))
+
+        assert wrapper.rate_limit_stats() is None
@@ -88,6 +88,19 @@ class TestRequestConverter:
 
         assert result["model"] == "gpt-4-turbo"
 
+    def test_convert_metadata_user_id(self, converter):
+        anthropic_request = {
+            "model": "gpt-4o",
+            "max_tokens": 1024,
+            "metadata": {"user_id": "user-42"},
+            "messages": [{"role": "user", "content": "test"}],
+        }
+
+        result = converter.convert(anthropic_request)
+
+        assert result["user"] == "user-42"
+        assert "metadata" not in result
+
     def test_convert_missing_model_parameter(self, converter):
         # Test that missing model parameter is handled gracefully
         anthropic_request = {
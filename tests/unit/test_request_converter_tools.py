@@ -221,4 +221,8 @@ class TestRequestConverterTools:
 
         assert len(result["messages"]) == 1
         assert result["messages"][0]["role"] == "user"
-        assert result["messages"][0]["content"] == "Hello World"
+        # Several text blocks stay separate, ordered parts
+        assert result["messages"][0]["content"] == [
+            {"type": "text", "text": "Hello"},
+            {"type": "text", "text": "World"},
+        ]
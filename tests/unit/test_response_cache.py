@@ -0,0 +1,165 @@
+from unittest.mock import patch
+
+import pytest
+
+from anthropic_openai_bridge.bridge import (
+    AnthropicOpenAIBridge,
+    AsyncAnthropicOpenAIBridge,
+)
+from anthropic_openai_bridge.cache.response_cache import ResponseCache
+
+OPENAI_RESPONSE = {
+    "id": "chatcmpl-1",
+    "model": "m",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "positive"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+}
+
+ANTHROPIC_REQUEST = {
+    "model": "m",
+    "max_tokens": 10,
+    "temperature": 0,
+    "messages": [{"role": "user", "content": "classify: great product"}],
+}
+
+
+def _request(text="hi", temperature=0):
+    return {
+        "model": "m",
+        "temperature": temperature,
+        "messages": [{"role": "user", "content": text}],
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache:
+    def test_hit_returns_independent_copy(self):
+        """Test a hit returns the stored response without sharing the object"""
+        cache = ResponseCache()
+        assert cache.get(_request()) is None
+        assert cache.put(_request(), OPENAI_RESPONSE)
+
+        first = cache.get(_request())
+        first["id"] = "mutated"
+
+        assert cache.get(_request()) == OPENAI_RESPONSE
+        stats = cache.snapshot()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+
+    def test_sampled_requests_are_not_cached(self):
+        """Test temperature > 0 requests bypass the cache by default"""
+        cache = ResponseCache()
+        assert not cache.put(_request(temperature=0.7), OPENAI_RESPONSE)
+        assert cache.get(_request(temperature=0.7)) is None
+        assert cache.snapshot()["misses"] == 0
+
+        permissive = ResponseCache(deterministic_only=False)
+        assert permissive.put(_request(temperature=0.7), OPENAI_RESPONSE)
+
+    def test_errors_are_not_cached(self):
+        """Test error dicts from the client are never stored"""
+        cache = ResponseCache()
+        assert not cache.put(_request(), {"error": {"message": "boom"}})
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_bytes(self):
+        """Test the least recently used entry is evicted to stay in budget"""
+        size = len(b'{"text":"' + b"x" * 100 + b'"}')
+        cache = ResponseCache(max_bytes=size * 2)
+        response = {"text": "x" * 100}
+        cache.put(_request("a"), response)
+        cache.put(_request("b"), response)
+        cache.get(_request("a"))
+        cache.put(_request("c"), response)
+
+        assert cache.get(_request("b")) is None
+        assert cache.get(_request("a")) == response
+        assert cache.get(_request("c")) == response
+        assert cache.snapshot()["evictions"] == 1
+        assert cache.snapshot()["bytes"] == size * 2
+
+    def test_oversized_response_is_skipped(self):
+        """Test a response larger than the whole budget is not stored"""
+        cache = ResponseCache(max_bytes=10)
+        assert not cache.put(_request(), OPENAI_RESPONSE)
+
+    def test_ttl_expiry(self):
+        """Test entries expire ttl seconds after being stored"""
+        clock = FakeClock()
+        cache = ResponseCache(ttl=60, clock=clock)
+        cache.put(_request(), OPENAI_RESPONSE)
+
+        clock.now = 59
+        assert cache.get(_request()) is not None
+        clock.now = 60
+        assert cache.get(_request()) is None
+        assert cache.snapshot()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_bytes=0)
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=0)
+
+
+class TestBridgeResponseCache:
+    def test_repeated_request_skips_upstream(self):
+        """Test an identical deterministic request is answered from the cache"""
+        with patch(
+            "anthropic_openai_bridge.bridge.OpenAIClientWrapper"
+        ) as mock_client_class:
+            mock_client = mock_client_class.return_value
+            mock_client.create_chat_completion.return_value = OPENAI_RESPONSE
+            bridge = AnthropicOpenAIBridge(
+                openai_api_key="test_key", response_cache=ResponseCache()
+            )
+
+            first = bridge.send_message(ANTHROPIC_REQUEST)
+            second = bridge.send_message(ANTHROPIC_REQUEST)
+
+        assert mock_client.create_chat_completion.call_count == 1
+        assert first.content == second.content
+        assert first is not second
+        assert bridge.response_cache_stats()["hits"] == 1
+
+    def test_disabled_by_default(self):
+        with patch("anthropic_openai_bridge.bridge.OpenAIClientWrapper"):
+            bridge = AnthropicOpenAIBridge(openai_api_key="test_key")
+
+        assert bridge.response_cache_stats() is None
+
+    @pytest.mark.asyncio
+    async def test_async_repeated_request_skips_upstream(self):
+        """Test the async bridge shares the same cache behavior"""
+        with patch(
+            "anthropic_openai_bridge.bridge.AsyncOpenAIClientWrapper"
+        ) as mock_client_class:
+            mock_client = mock_client_class.return_value
+
+            async def create(request):
+                return OPENAI_RESPONSE
+
+            mock_client.create_chat_completion.side_effect = create
+            bridge = AsyncAnthropicOpenAIBridge(
+                openai_api_key="test_key", response_cache=ResponseCache()
+            )
+
+            await bridge.send_message(ANTHROPIC_REQUEST)
+            result = await bridge.send_message(ANTHROPIC_REQUEST)
+
+        assert mock_client.create_chat_completion.call_count == 1
+        assert result.content[0].text == "positive"
@@ -0,0 +1,208 @@
+import random
+from unittest.mock import Mock, patch
+
+import httpx
+import openai
+import pytest
+
+from anthropic_openai_bridge.client.openai_client import OpenAIClientWrapper
+from anthropic_openai_bridge.client.retry import RetryBudget, RetryPolicy
+from anthropic_openai_bridge.config.config_manager import ConfigManager
+from anthropic_openai_bridge.converters.response_converter import ResponseConverter
+from anthropic_openai_bridge.errors import (
+    APITimeoutError,
+    BadRequestError,
+    OverloadedError,
+    RateLimitError,
+    UpstreamError,
+    error_from_exception,
+    parse_retry_after,
+)
+
+
+def _status_error(error_class, status, headers=None):
+    request = httpx.Request("POST", "https://api.example/v1/chat/completions")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return error_class("upstream failed", response=response, body=None)
+
+
+def _policy(**kwargs):
+    kwargs.setdefault("budget", RetryBudget())
+    kwargs.setdefault("rng", random.Random(0))
+    return RetryPolicy(**kwargs)
+
+
+class TestErrors:
+    def test_status_errors_keep_status_and_headers(self):
+        """Test SDK status errors become typed errors with headers"""
+        error = error_from_exception(
+            _status_error(openai.RateLimitError, 429, {"Retry-After": "2"})
+        )
+
+        assert isinstance(error, RateLimitError)
+        assert error.status_code == 429
+        assert error.retry_after == 2.0
+        assert error.to_dict()["error"]["type"] == "rate_limit_error"
+
+    def test_timeout_is_retryable_without_status(self):
+        """Test connection timeouts map to a retryable error"""
+        request = httpx.Request("POST", "https://api.example")
+        error = error_from_exception(openai.APITimeoutError(request=request))
+
+        assert isinstance(error, APITimeoutError)
+        assert error.retryable
+        assert error.http_status == 504
+
+    def test_parse_retry_after_variants(self):
+        """Test seconds, milliseconds and invalid Retry-After values"""
+        assert parse_retry_after({"retry-after-ms": "1500"}) == 1.5
+        assert parse_retry_after({"retry-after": "7"}) == 7.0
+        assert parse_retry_after({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+        assert parse_retry_after({"retry-after": "soon"}) is None
+        assert parse_retry_after({}) is None
+
+    def test_response_converter_raises_typed_error(self):
+        """Test error dictionaries are raised as their typed error"""
+        error = _status_error(openai.InternalServerError, 529)
+        payload = error_from_exception(error).to_dict()
+
+        with pytest.raises(OverloadedError) as exc_info:
+            ResponseConverter().convert(payload)
+
+        assert str(exc_info.value) == "OpenAI API Error: upstream failed"
+        assert exc_info.value.status_code == 529
+
+
+class TestRetryPolicy:
+    def test_retries_retryable_status_then_succeeds(self):
+        """Test a 503 is retried and the eventual result returned"""
+        func = Mock(
+            side_effect=[_status_error(openai.InternalServerError, 503), "done"]
+        )
+        sleeps = []
+
+        result = _policy().call(func, sleep=sleeps.append)
+
+        assert result == "done"
+        assert func.call_count == 2
+        assert len(sleeps) == 1
+
+    def test_does_not_retry_client_errors(self):
+        """Test a 400 is raised immediately as a typed error"""
+        func = Mock(side_effect=_status_error(openai.BadRequestError, 400))
+
+        with pytest.raises(BadRequestError):
+            _policy().call(func, sleep=Mock())
+
+        assert func.call_count == 1
+
+    def test_gives_up_after_max_retries(self):
+        """Test the last error is raised once retries are exhausted"""
+        func = Mock(side_effect=_status_error(openai.InternalServerError, 500))
+
+        with pytest.raises(UpstreamError):
+            _policy(max_retries=3).call(func, sleep=Mock())
+
+        assert func.call_count == 4
+
+    def test_retry_after_is_a_lower_bound(self):
+        """Test Retry-After delays the retry at least that long"""
+        func = Mock(
+            side_effect=[
+                _status_error(openai.RateLimitError, 429, {"retry-after": "5"}),
+                "done",
+            ]
+        )
+        sleeps = []
+
+        _policy(base_delay=0.1, max_delay=1.0).call(func, sleep=sleeps.append)
+
+        assert sleeps == [5.0]
+
+    def test_long_retry_after_is_not_waited_for(self):
+        """Test a Retry-After beyond max_retry_after fails fast"""
+        func = Mock(
+            side_effect=_status_error(
+                openai.RateLimitError, 429, {"retry-after": "120"}
+            )
+        )
+
+        with pytest.raises(RateLimitError):
+            _policy(max_retry_after=30).call(func, sleep=Mock())
+
+        assert func.call_count == 1
+
+    def test_decorrelated_jitter_stays_in_bounds(self):
+        """Test backoff delays grow but never leave [base_delay, max_delay]"""
+        policy = _policy(base_delay=0.5, max_delay=4.0)
+        delay = 0.0
+        for _ in range(50):
+            delay = policy.backoff(delay)
+            assert 0.5 <= delay <= 4.0
+
+    @pytest.mark.asyncio
+    async def test_acall_retries(self):
+        """Test the async variant retries and sleeps without blocking"""
+        attempts = []
+        sleeps = []
+
+        async def func():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise _status_error(openai.InternalServerError, 502)
+            return "done"
+
+        async def sleep(delay):
+            sleeps.append(delay)
+
+        assert await _policy().acall(func, sleep=sleep) == "done"
+        assert len(sleeps) == 2
+
+
+class TestRetryBudget:
+    def test_budget_limits_retry_ratio(self):
+        """Test retries are capped at the configured fraction of requests"""
+        budget = RetryBudget(ratio=0.1, min_retries_per_second=0, max_balance=1)
+        policy = _policy(budget=budget, max_retries=5)
+        func = Mock(side_effect=_status_error(openai.InternalServerError, 503))
+
+        for _ in range(100):
+            with pytest.raises(UpstreamError):
+                policy.call(func, sleep=Mock())
+
+        stats = budget.snapshot()
+        assert stats["requests_total"] == 100
+        # One token saved up front plus 0.1 per request
+        assert 9 <= stats["retries_total"] <= 11
+        assert func.call_count == 100 + stats["retries_total"]
+
+    def test_rejects_negative_rates(self):
+        """Test invalid budget settings are rejected"""
+        with pytest.raises(ValueError):
+            RetryBudget(ratio=-1)
+
+
+class TestClientRetries:
+    def test_wrapper_retries_and_reports_final_error(self):
+        """Test the client wrapper retries and keeps the status in the error dict"""
+        config = ConfigManager(
+            openai_api_key="test_key",
+            retry_policy=_policy(base_delay=0, max_delay=0),
+        )
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.OpenAI"
+        ) as mock_openai_class:
+            mock_client = Mock()
+            mock_client.chat.completions.create.side_effect = _status_error(
+                openai.RateLimitError, 429, {"retry-after": "0"}
+            )
+            mock_openai_class.return_value = mock_client
+
+            wrapper = OpenAIClientWrapper(config)
+            result = wrapper.create_chat_completion({"model": "m"})
+
+            assert mock_client.chat.completions.create.call_count == 3
+            assert result["error"]["status_code"] == 429
+            assert result["error"]["headers"] == {"retry-after": "0"}
+            assert wrapper.endpoint_stats()[0]["errors_total"] == 3
@@ -0,0 +1,199 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from anthropic_openai_bridge.client.openai_client import AsyncOpenAIClientWrapper
+from anthropic_openai_bridge.client.scheduler import (
+    FairSharePolicy,
+    PriorityPolicy,
+    RequestScheduler,
+    ShortestJobFirstPolicy,
+    create_scheduling_policy,
+    request_class,
+)
+from anthropic_openai_bridge.config.config_manager import ConfigManager
+
+
+def _request(user=None, max_tokens=100):
+    request = {
+        "model": "gpt-4o",
+        "max_completion_tokens": max_tokens,
+        "messages": [{"role": "user", "content": "hi"}],
+    }
+    if user is not None:
+        request["user"] = user
+    return request
+
+
+async def _admission_order(scheduler, queued):
+    """Occupy the only slot, queue ``(name, request, class)`` entries, free it"""
+    holder = await scheduler.aacquire(_request())
+    order = []
+
+    async def wait(name, request, cls):
+        with request_class(cls):
+            job = await scheduler.aacquire(request)
+        order.append(name)
+        scheduler.release(job)
+
+    tasks = [asyncio.create_task(wait(*entry)) for entry in queued]
+    await asyncio.sleep(0)
+    scheduler.release(holder)
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestPolicies:
+    @pytest.mark.asyncio
+    async def test_fifo_admits_in_arrival_order(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        queued = [(name, _request(), "interactive") for name in "abc"]
+
+        assert await _admission_order(scheduler, queued) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_priority_admits_interactive_before_batch(self):
+        """Test a batch backlog does not delay later interactive requests"""
+        scheduler = RequestScheduler(max_concurrency=1, policy=PriorityPolicy())
+        queued = [
+            ("batch-1", _request(), "batch"),
+            ("batch-2", _request(), "batch"),
+            ("user-1", _request(), "interactive"),
+            ("batch-3", _request(), "batch"),
+            ("user-2", _request(), "interactive"),
+        ]
+
+        order = await _admission_order(scheduler, queued)
+
+        assert order == ["user-1", "user-2", "batch-1", "batch-2", "batch-3"]
+
+    @pytest.mark.asyncio
+    async def test_shortest_job_first(self):
+        scheduler = RequestScheduler(max_concurrency=1, policy=ShortestJobFirstPolicy())
+        queued = [
+            ("large", _request(max_tokens=4000), "interactive"),
+            ("small", _request(max_tokens=10), "interactive"),
+            ("medium", _request(max_tokens=500), "interactive"),
+        ]
+
+        order = await _admission_order(scheduler, queued)
+
+        assert order == ["small", "medium", "large"]
+
+    @pytest.mark.asyncio
+    async def test_fair_share_interleaves_tenants_by_weight(self):
+        """Test a tenant's backlog does not push back another tenant"""
+        scheduler = RequestScheduler(
+            max_concurrency=1, policy=FairSharePolicy(weights={"bob": 2.0})
+        )
+        queued = [(f"alice-{i}", _request("alice"), "batch") for i in range(4)]
+        queued += [(f"bob-{i}", _request("bob"), "batch") for i in range(4)]
+
+        order = await _admission_order(scheduler, queued)
+
+        # Bob has twice Alice's weight, so he gets two turns per one of hers
+        assert order[:6] == ["bob-0", "alice-0", "bob-1", "bob-2", "alice-1", "bob-3"]
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError, match="fair_share"):
+            create_scheduling_policy("round_robin")
+
+
+class TestRequestScheduler:
+    def test_limits_concurrency_across_threads(self):
+        scheduler = RequestScheduler(max_concurrency=2)
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def work():
+            with scheduler.slot(_request()):
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                threading.Event().wait(0.01)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+        assert scheduler.snapshot()["in_flight"] == 0
+        assert scheduler.snapshot()["classes"]["interactive"]["admitted_total"] == 8
+
+    @pytest.mark.asyncio
+    async def test_wait_times_are_recorded_per_class(self):
+        now = [0.0]
+        scheduler = RequestScheduler(max_concurrency=1, clock=lambda: now[0])
+        holder = await scheduler.aacquire(_request())
+        with request_class("batch"):
+            waiter = asyncio.create_task(scheduler.aacquire(_request()))
+        await asyncio.sleep(0)
+        assert scheduler.snapshot()["classes"]["batch"]["queued"] == 1
+
+        now[0] = 2.5
+        scheduler.release(holder)
+        scheduler.release(await waiter)
+
+        stats = scheduler.snapshot()
+        assert stats["queued"] == 0
+        assert stats["classes"]["interactive"]["wait_seconds_max"] == 0.0
+        assert stats["classes"]["batch"]["wait_seconds_max"] == 2.5
+        assert stats["classes"]["batch"]["wait_seconds_p95"] == 2.5
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        holder = await scheduler.aacquire(_request())
+        cancelled = asyncio.create_task(scheduler.aacquire(_request()))
+        waiting = asyncio.create_task(scheduler.aacquire(_request()))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        scheduler.release(holder)
+        scheduler.release(await asyncio.wait_for(waiting, 1))
+
+        stats = scheduler.snapshot()
+        assert stats["in_flight"] == 0
+        assert stats["classes"]["interactive"]["admitted_total"] == 2
+
+    def test_from_env(self, monkeypatch):
+        assert RequestScheduler.from_env() is None
+
+        monkeypatch.setenv("OPENAI_SCHEDULER_POLICY", "priority")
+        monkeypatch.setenv("OPENAI_SCHEDULER_MAX_CONCURRENCY", "4")
+        scheduler = RequestScheduler.from_env()
+
+        assert scheduler.policy.name == "priority"
+        assert scheduler.max_concurrency == 4
+
+
+class TestClientScheduling:
+    @pytest.mark.asyncio
+    async def test_wrapper_requests_pass_through_the_scheduler(self):
+        scheduler = RequestScheduler(max_concurrency=1, policy=ShortestJobFirstPolicy())
+        config = ConfigManager(openai_api_key="test_key", scheduler=scheduler)
+        with patch(
+            "anthropic_openai_bridge.client.openai_client.openai.AsyncOpenAI"
+        ) as mock_openai_class:
+            create = mock_openai_class.return_value.chat.completions.create
+            create.side_effect = AsyncMock(side_effect=Exception("upstream down"))
+            wrapper = AsyncOpenAIClientWrapper(config)
+
+            result = await wrapper.create_chat_completion(_request())
+
+        assert "error" in result
+        stats = wrapper.scheduler_stats()
+        assert stats["policy"] == "shortest_job_first"
+        assert stats["in_flight"] == 0
+        assert stats["classes"]["interactive"]["admitted_total"] == 1
+        # The wrapper shares its token counter with cost-based policies
+        assert scheduler.counter is not None
@@ -0,0 +1,307 @@
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import anthropic.types
+import httpx
+import pytest
+
+from anthropic_openai_bridge.__main__ import _build_parser
+from anthropic_openai_bridge.client.scheduler import request_tenant
+from anthropic_openai_bridge.errors import RateLimitError
+from anthropic_openai_bridge.server.app import create_app
+from anthropic_openai_bridge.server.handlers import AsyncRequestHandler
+from anthropic_openai_bridge.server.http_server import HTTPServer
+from anthropic_openai_bridge.streaming import AsyncMessageStream
+
+
+def _message(text="Hello!"):
+    return anthropic.types.Message(
+        id="msg_12345678",
+        type="message",
+        role="assistant",
+        content=[anthropic.types.TextBlock(type="text", text=text)],
+        model="test",
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=anthropic.types.Usage(input_tokens=3, output_tokens=2),
+    )
+
+
+async def _chunks():
+    yield {
+        "model": "test",
+        "choices": [{"index": 0, "delta": {"content": "Hi"}, "finish_reason": None}],
+    }
+    yield {
+        "model": "test",
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+    }
+
+
+async def _limited_chunks():
+    # Client wrappers report a failure to open the stream as an error chunk
+    error = RateLimitError("slow down", 429, {"retry-after": "3"})
+    yield error.to_dict()
+
+
+def _mock_bridge():
+    bridge = Mock()
+    bridge.close = AsyncMock()
+
+    async def send_message(request):
+        if request.get("stream") and request["model"] == "limited":
+            return AsyncMessageStream(_limited_chunks(), model=request["model"])
+        if request.get("stream"):
+            return AsyncMessageStream(_chunks(), model=request["model"])
+        if request["model"] == "broken":
+            raise Exception("OpenAI API Error: upstream down")
+        if request["model"] == "limited":
+            raise RateLimitError(
+                "OpenAI API Error: slow down", 429, {"retry-after": "3"}
+            )
+        return _message()
+
+    bridge.send_message = AsyncMock(side_effect=send_message)
+    bridge.count_tokens = Mock(
+        return_value=anthropic.types.MessageTokensCount(input_tokens=12)
+    )
+    return bridge
+
+
+REQUEST = {
+    "model": "test",
+    "max_tokens": 10,
+    "messages": [{"role": "user", "content": "Hello"}],
+}
+
+
+class TestAsyncRequestHandler:
+    @pytest.mark.asyncio
+    async def test_messages_json_response(self):
+        """Test POST /v1/messages returns the message as JSON"""
+        handler = AsyncRequestHandler(_mock_bridge())
+
+        response = await handler.handle(
+            "POST", "/v1/messages", json.dumps(REQUEST).encode()
+        )
+
+        assert response.status == 200
+        assert json.loads(response.body)["content"][0]["text"] == "Hello!"
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_is_invalid_request(self):
+        """Test malformed bodies map to an Anthropic invalid_request_error"""
+        handler = AsyncRequestHandler(_mock_bridge())
+
+        response = await handler.handle("POST", "/v1/messages", b"{not json")
+
+        assert response.status == 400
+        assert json.loads(response.body)["error"]["type"] == "invalid_request_error"
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_is_api_error(self):
+        """Test upstream failures map to an Anthropic api_error"""
+        handler = AsyncRequestHandler(_mock_bridge())
+
+        response = await handler.handle(
+            "POST", "/v1/messages", json.dumps({**REQUEST, "model": "broken"}).encode()
+        )
+
+        assert response.status == 500
+        body = json.loads(response.body)
+        assert body["type"] == "error"
+        assert body["error"]["type"] == "api_error"
+
+    @pytest.mark.asyncio
+    async def test_upstream_status_is_passed_through(self):
+        """Test typed upstream errors keep their status and Retry-After"""
+        handler = AsyncRequestHandler(_mock_bridge())
+
+        response = await handler.handle(
+            "POST", "/v1/messages", json.dumps({**REQUEST, "model": "limited"}).encode()
+        )
+
+        assert response.status == 429
+        assert (b"retry-after", b"3") in response.headers
+        assert json.loads(response.body)["error"]["type"] == "rate_limit_error"
+
+    @pytest.mark.asyncio
+    async def test_stream_open_errors_keep_their_status(self):
+        """Test an upstream error before the first event is not sent as a 200"""
+        handler = AsyncRequestHandler(_mock_bridge())
+
+        response = await handler.handle(
+            "POST",
+            "/v1/messages",
+            json.dumps({**REQUEST, "model": "limited", "stream": True}).encode(),
+        )
+
+        assert response.status == 429
+        assert not response.streaming
+        assert (b"retry-after", b"3") in response.headers
+
+    @pytest.mark.asyncio
+    async def test_api_key_identifies_tenant(self):
+        """Test requests without a user ID are scheduled by a hashed API key"""
+        bridge = _mock_bridge()
+        send_message = bridge.send_message.side_effect
+        tenants = []
+
+        async def record_tenant(request):
+            user = (request.get("metadata") or {}).get("user_id")
+            tenants.append(request_tenant({"user": user}))
+            return await send_message(request)
+
+        bridge.send_message.side_effect = record_tenant
+        handler = AsyncRequestHandler(bridge)
+        body = json.dumps(REQUEST).encode()
+
+        await handler.handle("POST", "/v1/messages", body, {"x-api-key": "sk-a"})
+        await handler.handle(
+            "POST", "/v1/messages", body, {"authorization": "Bearer sk-a"}
+        )
+        await handler.handle(
+            "POST",
+            "/v1/messages",
+            json.dumps({**REQUEST, "metadata": {"user_id": "alice"}}).encode(),
+            {"x-api-key": "sk-a"},
+        )
+
+        assert tenants[0] == tenants[1]
+        assert tenants[0].startswith("key-") and "sk-a" not in tenants[0]
+        assert tenants[2] == "alice"
+        # The tenant never becomes part of the request sent upstream
+        assert bridge.send_message.call_args_list[0].args[0] == REQUEST
+
+    @pytest.mark.asyncio
+    async def test_count_tokens_route(self):
+        """Test POST /v1/messages/count_tokens is answered by the bridge"""
+        bridge = _mock_bridge()
+        handler = AsyncRequestHandler(bridge)
+
+        response = await handler.handle(
+            "POST", "/v1/messages/count_tokens", json.dumps(REQUEST).encode()
+        )
+
+        assert response.status == 200
+        assert json.loads(response.body) == {"input_tokens": 12}
+        bridge.count_tokens.assert_called_once_with(REQUEST)
+        bridge.send_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_count_tokens_runs_off_the_event_loop(self):
+        """Test tokenizing does not block the event loop thread"""
+        bridge = _mock_bridge()
+        threads = []
+
+        def count_tokens(request):
+            threads.append(threading.current_thread())
+            return anthropic.types.MessageTokensCount(input_tokens=12)
+
+        bridge.count_tokens = Mock(side_effect=count_tokens)
+        handler = AsyncRequestHandler(bridge)
+
+        await handler.handle(
+            "POST", "/v1/messages/count_tokens", json.dumps(REQUEST).encode()
+        )
+
+        assert threads and threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_unknown_route(self):
+        """Test unknown paths return not_found_error"""
+        handler = AsyncRequestHandler(_mock_bridge())
+
+        response = await handler.handle("GET", "/v1/models", b"")
+
+        assert response.status == 404
+
+
+class TestHTTPServer:
+    @pytest.mark.asyncio
+    async def test_serves_json_and_sse_over_http(self):
+        """Test the built-in server serves JSON and streamed responses"""
+        bridge = _mock_bridge()
+        server = HTTPServer(create_app(bridge), port=0)
+        await server.start()
+        try:
+            base_url = f"http://127.0.0.1:{server.bound_port}"
+            async with httpx.AsyncClient(base_url=base_url) as client:
+                response = await client.post("/v1/messages", json=REQUEST)
+                assert response.status_code == 200
+                assert response.json()["content"][0]["text"] == "Hello!"
+
+                # Second request reuses the keep-alive connection
+                response = await client.post(
+                    "/v1/messages", json={**REQUEST, "stream": True}
+                )
+                assert response.status_code == 200
+                assert response.headers["content-type"] == "text/event-stream"
+                event_types = [
+                    line.split(": ", 1)[1]
+                    for line in response.text.splitlines()
+                    if line.startswith("event: ")
+                ]
+                assert event_types[0] == "message_start"
+                assert event_types[-1] == "message_stop"
+                assert "content_block_delta" in event_types
+        finally:
+            await server.stop()
+
+        bridge.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_slow_and_idle_clients_are_disconnected(self):
+        """Test stalled request reads get a 408 and idle connections are closed"""
+        server = HTTPServer(
+            create_app(_mock_bridge()),
+            port=0,
+            keep_alive_timeout=0.05,
+            read_timeout=0.05,
+        )
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", server.bound_port
+            )
+            writer.write(b"POST /v1/messages HTTP/1.1\r\nhost: x\r\n")
+            response = await asyncio.wait_for(reader.read(), 2)
+            assert response.startswith(b"HTTP/1.1 408 ")
+            writer.close()
+
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", server.bound_port
+            )
+            assert await asyncio.wait_for(reader.read(), 2) == b""
+            writer.close()
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_closes_open_connections(self):
+        """Test stop cancels connection handlers instead of leaving them running"""
+        server = HTTPServer(create_app(_mock_bridge()), port=0, keep_alive_timeout=30)
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.bound_port)
+        try:
+            # Wait for the server to pick up the idle connection
+            while not server._connections:
+                await asyncio.sleep(0.01)
+            await asyncio.wait_for(server.stop(), 2)
+
+            assert not server._connections
+            assert await asyncio.wait_for(reader.read(), 2) == b""
+        finally:
+            writer.close()
+
+
+class TestCommandLine:
+    def test_serve_arguments(self):
+        """Test the serve subcommand parses host and port"""
+        args = _build_parser().parse_args(["serve", "--host", "0.0.0.0", "--port", "9"])
+
+        assert args.command == "serve"
+        assert args.host == "0.0.0.0"
+        assert args.port == 9
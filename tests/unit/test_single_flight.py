@@ -0,0 +1,197 @@
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from anthropic_openai_bridge.bridge import AnthropicOpenAIBridge
+from anthropic_openai_bridge.cache.keys import (
+    is_deterministic,
+    prefix_key,
+    request_key,
+)
+from anthropic_openai_bridge.cache.single_flight import AsyncSingleFlight, SingleFlight
+from anthropic_openai_bridge.json_codec import EncodedList, dumps
+
+REQUEST = {"model": "m", "temperature": 0, "messages": [{"role": "user"}]}
+
+
+class TestRequestKey:
+    def test_key_ignores_dict_order(self):
+        """Test equal requests built in different orders share a key"""
+        reordered = {"messages": [{"role": "user"}], "temperature": 0, "model": "m"}
+        assert request_key(REQUEST) == request_key(reordered)
+        assert request_key(REQUEST) != request_key({**REQUEST, "model": "other"})
+
+    def test_is_deterministic(self):
+        """Test only greedy single-choice requests are deterministic"""
+        assert is_deterministic(REQUEST)
+        assert not is_deterministic({**REQUEST, "temperature": 0.7})
+        assert not is_deterministic({"model": "m"})
+        assert not is_deterministic({**REQUEST, "n": 2})
+
+    def test_prefix_key_is_stable_across_turns(self):
+        """Test appending turns keeps the prefix key, a new system prompt does not"""
+        system = {"role": "system", "content": "You are terse."}
+        first = {"model": "m", "messages": [system, {"role": "user", "content": "a"}]}
+        later = {
+            "model": "m",
+            "messages": first["messages"]
+            + [{"role": "assistant", "content": "b"}, {"role": "user", "content": "c"}],
+        }
+        other = {
+            "model": "m",
+            "messages": [{"role": "system", "content": "Be verbose."}]
+            + first["messages"][1:],
+        }
+
+        assert prefix_key(first) == prefix_key(later)
+        assert prefix_key(first) != prefix_key(other)
+
+    def test_prefix_key_reuses_encoded_tools(self):
+        """Test a cached tool list is keyed by its stored encoding"""
+        tools = [{"type": "function", "function": {"name": "f"}}]
+        encoded = EncodedList(tools)
+
+        assert prefix_key({**REQUEST, "tools": encoded}) == prefix_key(
+            {**REQUEST, "tools": tools}
+        )
+        with patch(
+            "anthropic_openai_bridge.cache.keys.dumps", side_effect=dumps
+        ) as mock_dumps:
+            prefix_key({**REQUEST, "tools": encoded})
+        assert all(call.args[0] is not encoded for call in mock_dumps.call_args_list)
+
+
+class TestSingleFlight:
+    def _run_concurrently(self, flight, requests):
+        release = threading.Event()
+        calls = []
+
+        def upstream(request):
+            calls.append(request)
+            release.wait(5)
+            return {"id": len(calls)}
+
+        results = [None] * len(requests)
+
+        def worker(i):
+            results[i] = flight.do(requests[i], upstream)
+
+        threads = [
+            threading.Thread(target=worker, args=(i,)) for i in range(len(requests))
+        ]
+        for thread in threads:
+            thread.start()
+        # Let every caller reach the coalescer before the leader returns
+        while flight.snapshot()["coalesced_total"] + len(calls) < len(requests):
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        return calls, results
+
+    def test_identical_requests_share_one_call(self):
+        """Test concurrent identical requests make a single upstream call"""
+        flight = SingleFlight()
+        calls, results = self._run_concurrently(flight, [dict(REQUEST)] * 5)
+
+        assert len(calls) == 1
+        assert results == [{"id": 1}] * 5
+        assert flight.snapshot() == {
+            "leaders_total": 1,
+            "coalesced_total": 4,
+            "in_flight": 0,
+        }
+
+    def test_sampled_requests_are_not_coalesced(self):
+        """Test temperature > 0 requests each reach the upstream"""
+        flight = SingleFlight()
+        calls, _ = self._run_concurrently(flight, [{**REQUEST, "temperature": 1}] * 3)
+
+        assert len(calls) == 3
+        assert flight.snapshot()["leaders_total"] == 0
+
+    def test_error_is_shared_and_not_cached(self):
+        """Test waiters get the leader's error and later calls retry"""
+        flight = SingleFlight()
+        upstream = Mock(side_effect=[RuntimeError("boom"), {"id": 2}])
+
+        with pytest.raises(RuntimeError):
+            flight.do(REQUEST, upstream)
+
+        assert flight.do(REQUEST, upstream) == {"id": 2}
+        assert upstream.call_count == 2
+
+
+class TestAsyncSingleFlight:
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_call(self):
+        """Test concurrent identical coroutines await a single upstream call"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def upstream(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+            return {"id": "shared"}
+
+        results = await asyncio.gather(
+            *(flight.do(dict(REQUEST), upstream) for _ in range(4))
+        )
+
+        assert len(calls) == 1
+        assert results == [{"id": "shared"}] * 4
+        assert flight.snapshot()["coalesced_total"] == 3
+        assert flight.snapshot()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test the shared call survives the leader being cancelled"""
+        flight = AsyncSingleFlight()
+
+        async def upstream(request):
+            await asyncio.sleep(0.05)
+            return {"id": "shared"}
+
+        leader = asyncio.ensure_future(flight.do(REQUEST, upstream))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do(REQUEST, upstream))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == {"id": "shared"}
+
+
+class TestBridgeSingleFlight:
+    def test_disabled_by_default(self):
+        """Test the bridge does not coalesce unless asked to"""
+        with patch("anthropic_openai_bridge.bridge.OpenAIClientWrapper"):
+            bridge = AnthropicOpenAIBridge(openai_api_key="test_key")
+
+        assert bridge.single_flight is None
+        assert bridge.single_flight_stats() is None
+
+    def test_send_message_goes_through_single_flight(self):
+        """Test send_message passes the converted request to the coalescer"""
+        with patch(
+            "anthropic_openai_bridge.bridge.OpenAIClientWrapper"
+        ) as mock_client_class, patch(
+            "anthropic_openai_bridge.bridge.ResponseConverter"
+        ):
+            mock_client = mock_client_class.return_value
+            mock_client.create_chat_completion.return_value = {"id": "x"}
+            bridge = AnthropicOpenAIBridge(
+                openai_api_key="test_key", single_flight=True
+            )
+            bridge.send_message(
+                {
+                    "model": "m",
+                    "max_tokens": 10,
+                    "temperature": 0,
+                    "messages": [{"role": "user", "content": "hi"}],
+                }
+            )
+
+        assert mock_client.create_chat_completion.call_count == 1
+        assert bridge.single_flight_stats()["leaders_total"] == 1
@@ -0,0 +1,204 @@
+import json
+
+import anthropic.types
+import pytest
+
+from anthropic_openai_bridge.converters.stream_converter import StreamConverter
+from anthropic_openai_bridge.streaming import AsyncMessageStream, MessageStream
+
+
+def _chunk(delta=None, finish_reason=None, usage=None):
+    chunk = {
+        "id": "chatcmpl-123",
+        "object": "chat.completion.chunk",
+        "model": "test-model",
+        "choices": [],
+    }
+    if delta is not None or finish_reason is not None:
+        chunk["choices"] = [
+            {"index": 0, "delta": delta or {}, "finish_reason": finish_reason}
+        ]
+    if usage is not None:
+        chunk["usage"] = usage
+    return chunk
+
+
+TEXT_CHUNKS = [
+    _chunk({"role": "assistant", "content": ""}),
+    _chunk({"content": "Hello"}),
+    _chunk({"content": ", world"}),
+    _chunk(finish_reason="stop"),
+    _chunk(usage={"prompt_tokens": 12, "completion_tokens": 3}),
+]
+
+TOOL_CHUNKS = [
+    _chunk({"role": "assistant", "content": "Checking."}),
+    _chunk(
+        {
+            "tool_calls": [
+                {
+                    "index": 0,
+                    "id": "call_abc",
+                    "type": "function",
+                    "function": {"name": "get_weather", "arguments": ""},
+                }
+            ]
+        }
+    ),
+    _chunk({"tool_calls": [{"index": 0, "function": {"arguments": '{"loc'}}]}),
+    _chunk({"tool_calls": [{"index": 0, "function": {"arguments": 'ation": "SF"}'}}]}),
+    _chunk(finish_reason="tool_calls"),
+    _chunk(usage={"prompt_tokens": 20, "completion_tokens": 8}),
+]
+
+
+def _convert_all(chunks):
+    converter = StreamConverter()
+    events = []
+    for chunk in chunks:
+        events.extend(converter.convert_chunk(chunk))
+    events.extend(converter.finish())
+    return converter, events
+
+
+class TestStreamConverter:
+    def test_text_stream_event_sequence(self):
+        """Test a text stream produces the Anthropic event sequence"""
+        _, events = _convert_all(TEXT_CHUNKS)
+
+        assert [event.type for event in events] == [
+            "message_start",
+            "content_block_start",
+            "content_block_delta",
+            "content_block_delta",
+            "content_block_stop",
+            "message_delta",
+            "message_stop",
+        ]
+        assert events[0].message.model == "test-model"
+        assert events[2].delta.text == "Hello"
+        assert events[5].delta.stop_reason == "end_turn"
+        assert events[5].usage.output_tokens == 3
+
+    def test_text_stream_final_message(self):
+        """Test the accumulated message joins all text deltas"""
+        converter, events = _convert_all(TEXT_CHUNKS)
+
+        message = converter.get_final_message()
+
+        assert isinstance(message, anthropic.types.Message)
+        assert message.id == events[0].message.id
+        assert message.content[0].text == "Hello, world"
+        assert message.usage.input_tokens == 12
+        assert message.usage.output_tokens == 3
+
+    def test_tool_call_stream(self):
+        """Test tool call deltas become tool_use blocks with input_json deltas"""
+        converter, events = _convert_all(TOOL_CHUNKS)
+
+        starts = [e for e in events if e.type == "content_block_start"]
+        assert [s.content_block.type for s in starts] == ["text", "tool_use"]
+        assert starts[1].index == 1
+        assert starts[1].content_block.id == "toolu_abc"
+        assert starts[1].content_block.name == "get_weather"
+
+        json_deltas = [
+            e.delta.partial_json
+            for e in events
+            if e.type == "content_block_delta" and e.delta.type == "input_json_delta"
+        ]
+        assert "".join(json_deltas) == '{"location": "SF"}'
+
+        stops = [e.index for e in events if e.type == "content_block_stop"]
+        assert stops == [0, 1]
+
+        message = converter.get_final_message()
+        assert message.stop_reason == "tool_use"
+        assert message.content[1].input == {"location": "SF"}
+
+    def test_interleaved_tool_calls(self):
+        """Test interleaved argument fragments all reach the stream"""
+
+        def call(index, arguments, call_id=None):
+            tool_call = {"index": index, "function": {"arguments": arguments}}
+            if call_id:
+                tool_call.update(id=call_id, type="function")
+                tool_call["function"]["name"] = f"tool_{index}"
+            return _chunk({"tool_calls": [tool_call]})
+
+        converter, events = _convert_all(
+            [
+                call(0, '{"a": ', call_id="call_a"),
+                call(1, '{"b": ', call_id="call_b"),
+                call(0, "1}"),
+                call(1, "2}"),
+                _chunk(finish_reason="tool_calls"),
+            ]
+        )
+
+        stopped = set()
+        streamed = {}
+        for event in events:
+            if event.type == "content_block_stop":
+                stopped.add(event.index)
+            elif event.type == "content_block_delta":
+                assert event.index not in stopped
+                streamed[event.index] = (
+                    streamed.get(event.index, "") + event.delta.partial_json
+                )
+        assert [e.index for e in events if e.type == "content_block_stop"] == [0, 1]
+        inputs = [json.loads(streamed[index]) for index in sorted(streamed)]
+        assert inputs == [{"a": 1}, {"b": 2}]
+
+        message = converter.get_final_message()
+        assert [block.input for block in message.content] == inputs
+
+    def test_empty_stream_still_emits_content_block(self):
+        """Test a stream without content yields one empty text block"""
+        converter, events = _convert_all([_chunk(finish_reason="stop")])
+
+        assert [event.type for event in events] == [
+            "message_start",
+            "content_block_start",
+            "content_block_stop",
+            "message_delta",
+            "message_stop",
+        ]
+        assert converter.get_final_message().content[0].text == ""
+
+    def test_error_chunk_raises(self):
+        """Test an error chunk from the client wrapper raises"""
+        converter = StreamConverter()
+
+        with pytest.raises(Exception) as exc_info:
+            converter.convert_chunk({"error": {"message": "boom"}})
+
+        assert "OpenAI API Error: boom" in str(exc_info.value)
+
+
+class TestMessageStream:
+    def test_iterates_events_and_returns_final_message(self):
+        """Test the sync stream yields events and then the final message"""
+        stream = MessageStream(iter(TEXT_CHUNKS), model="requested-model")
+
+        first = next(iter(stream))
+        message = stream.get_final_message()
+
+        assert first.type == "message_start"
+        assert message.content[0].text == "Hello, world"
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self):
+        """Test the async stream yields the same events"""
+
+        async def chunks():
+            for chunk in TOOL_CHUNKS:
+                yield chunk
+
+        stream = AsyncMessageStream(chunks())
+        event_types = [event.type async for event in stream]
+        message = await stream.get_final_message()
+
+        assert event_types[0] == "message_start"
+        assert event_types[-1] == "message_stop"
+        assert message.content[1].name == "get_weather"
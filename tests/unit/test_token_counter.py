@@ -0,0 +1,172 @@
+import base64
+from unittest.mock import patch
+
+import anthropic.types
+import pytest
+
+from anthropic_openai_bridge.bridge import AnthropicOpenAIBridge
+from anthropic_openai_bridge.tokens.counter import (
+    TOKENS_PER_MESSAGE,
+    TOKENS_PER_REPLY,
+    TokenCounter,
+)
+from anthropic_openai_bridge.tokens.tokenizers import (
+    ApproximateTokenizer,
+    BPETokenizer,
+    Tokenizer,
+    load_tokenizer,
+)
+
+
+def _byte_ranks(*merges):
+    """Every single byte plus the given merged tokens, in rank order"""
+    ranks = {bytes([i]): i for i in range(256)}
+    for token in merges:
+        ranks[token] = len(ranks)
+    return ranks
+
+
+class WordTokenizer(Tokenizer):
+    """One token per whitespace-separated word, recording what it counted"""
+
+    name = "words"
+
+    def __init__(self):
+        self.seen = []
+
+    def count(self, text):
+        self.seen.append(text)
+        return len(text.split())
+
+
+class TestTokenizers:
+    def test_bpe_applies_merges_by_rank(self):
+        """Test the lowest-ranked merge is applied first"""
+        tokenizer = BPETokenizer(_byte_ranks(b"ab", b"bc", b"abc"))
+
+        # "ab" outranks "bc", and "ab"+"c" then merges into "abc"
+        assert tokenizer.encode("abc") == [258]
+        assert tokenizer.encode("abd") == [256, ord("d")]
+        assert tokenizer.count("abc abc") == 3  # "abc", " ", "abc"
+
+    def test_bpe_from_tiktoken_file(self, tmp_path):
+        """Test a .tiktoken vocabulary file is loaded"""
+        ranks = _byte_ranks(b"he", b"ll", b"hell", b"hello")
+        path = tmp_path / "tiny.tiktoken"
+        path.write_bytes(
+            b"".join(
+                base64.b64encode(token) + b" " + str(rank).encode() + b"\n"
+                for token, rank in ranks.items()
+            )
+        )
+
+        tokenizer = load_tokenizer(str(path))
+
+        assert isinstance(tokenizer, BPETokenizer)
+        assert tokenizer.name == "tiny.tiktoken"
+        assert tokenizer.encode("hello") == [ranks[b"hello"]]
+
+    def test_approximate_is_default(self):
+        tokenizer = load_tokenizer(None)
+
+        assert isinstance(tokenizer, ApproximateTokenizer)
+        assert tokenizer.count("x" * 10) == 3
+
+    def test_huggingface_requires_optional_package(self, tmp_path):
+        with patch.dict("sys.modules", {"tokenizers": None}):
+            with pytest.raises(ImportError, match="tokenizers"):
+                load_tokenizer(str(tmp_path / "tokenizer.json"))
+
+
+class TestTokenCounter:
+    def test_counts_messages_tools_and_overhead(self):
+        counter = TokenCounter(WordTokenizer())
+        request = {
+            "messages": [
+                {"role": "system", "content": "be brief"},
+                {"role": "user", "content": [{"type": "text", "text": "hi there"}]},
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {"function": {"name": "lookup", "arguments": '{"q": "x"}'}}
+                    ],
+                },
+            ],
+            "tools": [{"type": "function", "function": {"name": "lookup"}}],
+        }
+
+        # roles (1 each) + "be brief" (2) + "hi there" (2) + name (1) + args (2)
+        # + the tool list serialized without spaces (1)
+        expected = TOKENS_PER_REPLY + 3 * TOKENS_PER_MESSAGE + 3 + 2 + 2 + 1 + 2 + 1
+        assert counter.count_request(request) == expected
+
+    def test_growing_conversation_only_counts_new_messages(self):
+        """Test re-counting a conversation tokenizes only the appended turn"""
+        tokenizer = WordTokenizer()
+        counter = TokenCounter(tokenizer)
+        messages = [
+            {"role": "user", "content": "first question"},
+            {"role": "assistant", "content": "first answer"},
+        ]
+        counter.count_request({"messages": messages})
+
+        tokenizer.seen.clear()
+        messages.append({"role": "user", "content": "second question"})
+        counter.count_request({"messages": messages})
+
+        assert tokenizer.seen == ["user", "second question"]
+        assert counter.snapshot()["hits"] == 2
+
+    def test_memo_is_bounded(self):
+        counter = TokenCounter(WordTokenizer(), cache_size=2)
+        for i in range(5):
+            counter.count_message({"role": "user", "content": f"message {i}"})
+
+        assert counter.snapshot()["entries"] == 2
+
+    def test_approximate_counts_are_not_memoized(self):
+        """Test the length estimate is recomputed rather than hashed and stored"""
+        counter = TokenCounter(ApproximateTokenizer())
+        message = {"role": "user", "content": "x" * 40}
+
+        assert counter.count_message(message) == counter.count_message(message)
+        assert counter.snapshot()["entries"] == 0
+        assert counter.snapshot()["hits"] == 0
+
+
+class TestBridgeCountTokens:
+    def test_count_tokens_converts_and_counts_locally(self):
+        """Test count_tokens never calls the upstream"""
+        with patch(
+            "anthropic_openai_bridge.bridge.OpenAIClientWrapper"
+        ) as mock_client_class:
+            bridge = AnthropicOpenAIBridge(
+                openai_api_key="test_key", tokenizer=WordTokenizer()
+            )
+            result = bridge.count_tokens(
+                {
+                    "model": "m",
+                    "system": "be brief",
+                    "messages": [{"role": "user", "content": "hello world"}],
+                }
+            )
+
+        assert isinstance(result, anthropic.types.MessageTokensCount)
+        assert result.input_tokens == TOKENS_PER_REPLY + 2 * TOKENS_PER_MESSAGE + 6
+        mock_client_class.return_value.create_chat_completion.assert_not_called()
+
+    def test_tokenizer_is_loaded_from_config(self, tmp_path, monkeypatch):
+        path = tmp_path / "vocab.tiktoken"
+        path.write_bytes(
+            b"".join(
+                base64.b64encode(bytes([i])) + b" " + str(i).encode() + b"\n"
+                for i in range(256)
+            )
+        )
+        monkeypatch.setenv("BRIDGE_TOKENIZER_PATH", str(path))
+
+        with patch("anthropic_openai_bridge.bridge.OpenAIClientWrapper"):
+            bridge = AnthropicOpenAIBridge(openai_api_key="test_key")
+
+        assert bridge.token_counter.tokenizer.name == "vocab.tiktoken"
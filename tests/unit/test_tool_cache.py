@@ -0,0 +1,250 @@
+import copy
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from anthropic_openai_bridge.bridge import (
+    AnthropicOpenAIBridge,
+    AsyncAnthropicOpenAIBridge,
+)
+from anthropic_openai_bridge.converters.request_converter import RequestConverter
+from anthropic_openai_bridge.converters.tool_cache import ToolDefinitionCache
+from anthropic_openai_bridge.json_codec import EncodedList, dumps_request
+
+
+def _tools(count, prefix="tool"):
+    return [
+        {
+            "name": f"{prefix}_{index}",
+            "description": f"Tool number {index} ✓",
+            "input_schema": {
+                "type": "object",
+                "properties": {"query": {"type": "string"}},
+                "required": ["query"],
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def _request(tools, stream=False):
+    request = {
+        "model": "gpt-4o",
+        "max_tokens": 100,
+        "tools": tools,
+        "messages": [{"role": "user", "content": "Hi"}],
+    }
+    if stream:
+        request["stream"] = True
+    return request
+
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "message": {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "tool_0", "arguments": '{"query": "x"}'},
+                    }
+                ],
+            },
+            "finish_reason": "tool_calls",
+        }
+    ],
+    "usage": {"prompt_tokens": 9, "completion_tokens": 3, "total_tokens": 12},
+}
+
+CHUNK = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion.chunk",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [{"index": 0, "delta": {"content": "Hi"}, "finish_reason": "stop"}],
+}
+
+
+class Upstream:
+    """Fake OpenAI API recording the raw request bodies it receives"""
+
+    def __init__(self):
+        self.bodies = []
+
+    def __call__(self, request):
+        self.bodies.append(request.content)
+        if json.loads(request.content).get("stream"):
+            return httpx.Response(
+                200,
+                text=f"data: {json.dumps(CHUNK)}\n\ndata: [DONE]\n\n",
+                headers={"content-type": "text/event-stream"},
+            )
+        return httpx.Response(200, json=COMPLETION)
+
+
+class TestDumpsRequest:
+    def test_splices_encoded_values(self):
+        tools = [{"type": "function", "function": {"name": "é"}}]
+        request = {"model": "gpt-4o", "tools": EncodedList(tools), "n": 1}
+
+        body = dumps_request(request)
+
+        assert json.loads(body) == {"model": "gpt-4o", "tools": tools, "n": 1}
+
+    def test_only_encoded_values(self):
+        body = dumps_request({"tools": EncodedList([1, 2], encoded=b"[1,2]")})
+
+        assert body == b'{"tools":[1,2]}'
+
+    def test_encoded_list_behaves_as_list(self):
+        tools = EncodedList([{"a": 1}])
+
+        assert tools == [{"a": 1}]
+        assert json.dumps({"tools": tools}) == '{"tools": [{"a": 1}]}'
+
+
+class TestToolDefinitionCache:
+    def test_converts_each_tool_set_once(self):
+        cache = ToolDefinitionCache()
+        converter = RequestConverter(tool_cache=cache)
+        tools = _tools(3)
+
+        first = converter.convert(_request(tools))["tools"]
+        again = converter.convert(_request(tools))["tools"]
+        copied = converter.convert(_request(copy.deepcopy(tools)))["tools"]
+
+        assert first == RequestConverter().convert(_request(tools))["tools"]
+        assert isinstance(first, EncodedList)
+        assert json.loads(first.encoded) == first
+        assert again is first
+        assert copied is first
+        assert cache.snapshot()["hits"] == 2
+        assert cache.snapshot()["misses"] == 1
+
+    def test_changed_tool_list_is_converted_again(self):
+        converter = RequestConverter(tool_cache=ToolDefinitionCache())
+        tools = _tools(2)
+        converter.convert(_request(tools))
+
+        tools.append(_tools(1, prefix="extra")[0])
+        converted = converter.convert(_request(tools))["tools"]
+
+        assert [tool["function"]["name"] for tool in converted] == [
+            "tool_0",
+            "tool_1",
+            "extra_0",
+        ]
+
+    def test_memory_is_bounded(self):
+        converted = RequestConverter().convert(_request(_tools(4)))["tools"]
+        one_set = len(EncodedList(converted).encoded)
+        cache = ToolDefinitionCache(max_bytes=one_set * 2)
+        converter = RequestConverter(tool_cache=cache)
+
+        for prefix in "abc":
+            converter.convert(_request(_tools(4, prefix=prefix)))
+
+        stats = cache.snapshot()
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= cache.max_bytes
+        assert stats["evictions"] == 1
+
+    def test_tool_set_larger_than_the_cache_is_not_stored(self):
+        cache = ToolDefinitionCache(max_bytes=10)
+        converted = RequestConverter(tool_cache=cache).convert(_request(_tools(2)))
+
+        assert len(converted["tools"]) == 2
+        assert cache.snapshot()["entries"] == 0
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            ToolDefinitionCache(max_bytes=0)
+
+
+class TestPreEncodedRequests:
+    def _bridge(self, upstream):
+        return AnthropicOpenAIBridge(
+            openai_api_key="test_key",
+            httpx_client=httpx.Client(transport=httpx.MockTransport(upstream)),
+            tool_cache=ToolDefinitionCache(),
+        )
+
+    def test_body_contains_the_encoded_tools(self):
+        upstream = Upstream()
+        bridge = self._bridge(upstream)
+        tools = _tools(3)
+
+        message = bridge.send_message(_request(tools))
+        bridge.send_message(_request(tools))
+
+        assert message.content[0].name == "tool_0"
+        assert message.stop_reason == "tool_use"
+        encoded = bridge.request_converter.convert(_request(tools))["tools"].encoded
+        for body in upstream.bodies:
+            assert encoded in body
+            assert json.loads(body) == RequestConverter().convert(_request(tools))
+        assert bridge.tool_cache_stats()["hits"] == 2
+
+    def test_sdk_without_raw_bodies(self):
+        """Test SDKs that cannot post raw bytes are sent the request dict"""
+        upstream = Upstream()
+        bridge = self._bridge(upstream)
+        tools = _tools(2)
+
+        with patch(
+            "anthropic_openai_bridge.client.openai_client._POST_ACCEPTS_CONTENT",
+            False,
+        ):
+            message = bridge.send_message(_request(tools))
+
+        assert message.content[0].name == "tool_0"
+        expected = RequestConverter().convert(_request(tools))
+        assert json.loads(upstream.bodies[0])["tools"] == expected["tools"]
+
+    def test_streaming(self):
+        upstream = Upstream()
+        bridge = self._bridge(upstream)
+
+        with bridge.send_message(_request(_tools(2), stream=True)) as stream:
+            final = stream.get_final_message()
+
+        assert final.content[0].text == "Hi"
+        body = json.loads(upstream.bodies[0])
+        assert body["stream"] is True
+        assert body["stream_options"] == {"include_usage": True}
+        assert len(body["tools"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        upstream = Upstream()
+        bridge = AsyncAnthropicOpenAIBridge(
+            openai_api_key="test_key",
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(upstream)),
+            tool_cache=ToolDefinitionCache(),
+        )
+
+        message = await bridge.send_message(_request(_tools(2)))
+        async with await bridge.send_message(
+            _request(_tools(2), stream=True)
+        ) as stream:
+            final = await stream.get_final_message()
+
+        assert message.content[0].name == "tool_0"
+        assert final.content[0].text == "Hi"
+        assert len(upstream.bodies) == 2
+        await bridge.close()
+
+    def test_bridge_without_cache(self):
+        bridge = AnthropicOpenAIBridge(openai_api_key="test_key")
+
+        assert bridge.tool_cache_stats() is None
@@ -0,0 +1,197 @@
+import json
+
+import anthropic
+import httpx
+import pytest
+
+from anthropic_openai_bridge.bridge import (
+    AnthropicOpenAIBridge,
+    AsyncAnthropicOpenAIBridge,
+)
+from anthropic_openai_bridge.server.transport import (
+    AsyncBridgeTransport,
+    BridgeTransport,
+)
+
+# These tests drive Anthropic SDK releases built on httpx 2
+httpx2 = pytest.importorskip("httpx2")
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello there!"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 9, "completion_tokens": 3, "total_tokens": 12},
+}
+
+
+def _chunk(delta, finish_reason=None):
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+STREAM_BODY = (
+    "".join(
+        f"data: {json.dumps(chunk)}\n\n"
+        for chunk in [
+            _chunk({"role": "assistant", "content": "Hel"}),
+            _chunk({"content": "lo"}),
+            _chunk({}, "stop"),
+        ]
+    )
+    + "data: [DONE]\n\n"
+)
+
+
+class Upstream:
+    """Fake OpenAI API recording the chat completion requests it receives"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request):
+        payload = json.loads(request.content)
+        self.requests.append(payload)
+        if payload["model"] == "limited":
+            return httpx.Response(
+                429,
+                json={"error": {"message": "slow down", "type": "rate_limit"}},
+                headers={"retry-after": "0"},
+            )
+        if payload.get("stream"):
+            return httpx.Response(
+                200, text=STREAM_BODY, headers={"content-type": "text/event-stream"}
+            )
+        return httpx.Response(200, json=COMPLETION)
+
+
+REQUEST = {
+    "model": "gpt-4o",
+    "max_tokens": 100,
+    "messages": [{"role": "user", "content": "Hi"}],
+}
+
+
+@pytest.fixture
+def upstream():
+    return Upstream()
+
+
+@pytest.fixture
+def client(upstream):
+    bridge = AnthropicOpenAIBridge(
+        openai_api_key="test_key",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(upstream)),
+        retry_policy=None,
+    )
+    http_client = httpx2.Client(transport=BridgeTransport(bridge))
+    return anthropic.Anthropic(api_key="caller", http_client=http_client, max_retries=0)
+
+
+@pytest.fixture
+def async_client(upstream):
+    bridge = AsyncAnthropicOpenAIBridge(
+        openai_api_key="test_key",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(upstream)),
+    )
+    http_client = httpx2.AsyncClient(transport=AsyncBridgeTransport(bridge))
+    return anthropic.AsyncAnthropic(
+        api_key="caller", http_client=http_client, max_retries=0
+    )
+
+
+class TestBridgeTransport:
+    def test_messages_create(self, client, upstream):
+        message = client.messages.create(**REQUEST)
+
+        assert isinstance(message, anthropic.types.Message)
+        assert message.content[0].text == "Hello there!"
+        assert message.stop_reason == "end_turn"
+        assert message.usage.input_tokens == 9
+        assert upstream.requests[0]["messages"] == [{"role": "user", "content": "Hi"}]
+        # The caller's API key schedules the request but is not sent upstream
+        assert "user" not in upstream.requests[0]
+
+    def test_messages_stream(self, client):
+        with client.messages.stream(**REQUEST) as stream:
+            text = "".join(stream.text_stream)
+            final = stream.get_final_message()
+
+        assert text == "Hello"
+        assert final.content[0].text == "Hello"
+        assert final.stop_reason == "end_turn"
+
+    def test_create_with_stream_true(self, client):
+        events = list(client.messages.create(stream=True, **REQUEST))
+
+        assert events[0].type == "message_start"
+        assert events[-1].type == "message_stop"
+
+    def test_upstream_errors_become_sdk_errors(self, client):
+        with pytest.raises(anthropic.RateLimitError):
+            client.messages.create(**{**REQUEST, "model": "limited"})
+
+    def test_stream_open_errors_keep_their_status(self, client):
+        with pytest.raises(anthropic.RateLimitError) as exc_info:
+            client.messages.create(stream=True, **{**REQUEST, "model": "limited"})
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.response.headers["retry-after"] == "0"
+
+    def test_count_tokens(self, client, upstream):
+        result = client.messages.count_tokens(
+            model="gpt-4o", messages=REQUEST["messages"]
+        )
+
+        assert result.input_tokens > 0
+        assert upstream.requests == []
+
+    def test_unknown_route(self, client):
+        with pytest.raises(anthropic.NotFoundError):
+            client.models.list()
+
+
+class TestAsyncBridgeTransport:
+    @pytest.mark.asyncio
+    async def test_messages_create(self, async_client):
+        message = await async_client.messages.create(**REQUEST)
+
+        assert message.content[0].text == "Hello there!"
+
+    @pytest.mark.asyncio
+    async def test_messages_stream(self, async_client):
+        async with async_client.messages.stream(**REQUEST) as stream:
+            final = await stream.get_final_message()
+
+        assert final.content[0].text == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_stream_open_errors_keep_their_status(self, async_client):
+        with pytest.raises(anthropic.RateLimitError) as exc_info:
+            async with async_client.messages.stream(
+                **{**REQUEST, "model": "limited"}
+            ) as stream:
+                await stream.get_final_message()
+
+        assert exc_info.value.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_closing_the_client_closes_the_bridge(self, async_client):
+        transport = async_client._client._transport
+        bridge = transport.bridge
+
+        await async_client.close()
+
+        assert bridge.openai_client.client.is_closed()
@@ -0,0 +1,185 @@
+import json
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import anthropic.types
+import pydantic
+import pytest
+
+from anthropic_openai_bridge.bridge import AnthropicOpenAIBridge
+from anthropic_openai_bridge.converters.construct import build_model
+from anthropic_openai_bridge.converters.response_converter import ResponseConverter
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def _fixture_responses():
+    responses = []
+    for name in ("openai_samples.json", "tool_calling_openai_samples.json"):
+        with open(FIXTURES / name) as f:
+            samples = json.load(f)
+        responses += [
+            pytest.param(sample, id=key)
+            for key, sample in samples.items()
+            if "choices" in sample
+        ]
+    return responses
+
+
+def _response(message, finish_reason="stop", usage=None):
+    response = {
+        "id": "chatcmpl-1",
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+    }
+    if usage is not None:
+        response["usage"] = usage
+    return response
+
+
+def _tool_call(call_id, name, arguments):
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": arguments},
+    }
+
+
+EDGE_CASES = [
+    pytest.param(_response({"role": "assistant", "content": None}), id="no_content"),
+    pytest.param(
+        _response({"role": "assistant", "content": "cut"}, "length"), id="length"
+    ),
+    pytest.param(
+        _response(
+            {"role": "assistant", "content": "héllo ✓ 日本"},
+            usage={"prompt_tokens": 7, "completion_tokens": 3},
+        ),
+        id="unicode_with_usage",
+    ),
+    pytest.param(
+        _response(
+            {
+                "role": "assistant",
+                "content": "Checking both.",
+                "tool_calls": [
+                    _tool_call("call_a", "lookup", '{"q": "x", "n": [1, 2]}'),
+                    _tool_call("b", "noop", "{}"),
+                    _tool_call("call_c", "broken", "{not json"),
+                ],
+            },
+            "tool_calls",
+            usage={"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+        ),
+        id="text_and_tool_calls",
+    ),
+    pytest.param(
+        _response(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    _tool_call(
+                        "call_deep",
+                        "store",
+                        json.dumps({"nested": {"list": [{"a": None}, True, 1.5]}}),
+                    )
+                ],
+            },
+            "tool_calls",
+        ),
+        id="nested_arguments",
+    ),
+]
+
+
+def _convert_both(openai_response):
+    """Convert with and without validation, with the same message ID"""
+    fixed = uuid.UUID(int=0x1234)
+    with patch(
+        "anthropic_openai_bridge.converters.response_converter.uuid.uuid4",
+        return_value=fixed,
+    ):
+        validated = ResponseConverter().convert(openai_response)
+        trusted = ResponseConverter(trusted=True).convert(openai_response)
+    return validated, trusted
+
+
+class TestTrustedConstructionEquivalence:
+    @pytest.mark.parametrize("openai_response", _fixture_responses() + EDGE_CASES)
+    def test_trusted_message_equals_validated(self, openai_response):
+        validated, trusted = _convert_both(openai_response)
+
+        assert trusted == validated
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_dump_json() == validated.model_dump_json()
+        # Fields that were explicitly set decide what exclude_unset dumps
+        assert trusted.model_dump(exclude_unset=True) == validated.model_dump(
+            exclude_unset=True
+        )
+
+    @pytest.mark.parametrize("openai_response", _fixture_responses() + EDGE_CASES)
+    def test_trusted_blocks_have_validated_types(self, openai_response):
+        validated, trusted = _convert_both(openai_response)
+
+        assert type(trusted) is anthropic.types.Message
+        assert type(trusted.usage) is type(validated.usage)
+        assert [type(block) for block in trusted.content] == [
+            type(block) for block in validated.content
+        ]
+        for block, expected in zip(trusted.content, validated.content):
+            assert block.model_fields_set == expected.model_fields_set
+
+    def test_trusted_message_round_trips_through_validation(self):
+        """Test a trusted Message is a valid Message"""
+        _, trusted = _convert_both(EDGE_CASES[3].values[0])
+
+        revalidated = anthropic.types.Message.model_validate(trusted.model_dump())
+
+        assert revalidated == trusted
+
+    def test_errors_are_raised_in_trusted_mode(self):
+        with pytest.raises(Exception, match="bad key"):
+            ResponseConverter(trusted=True).convert(
+                {"error": {"message": "bad key", "type": "authentication_error"}}
+            )
+
+    def test_bridge_option(self):
+        with patch("anthropic_openai_bridge.bridge.OpenAIClientWrapper"):
+            bridge = AnthropicOpenAIBridge(
+                openai_api_key="test_key", trusted_responses=True
+            )
+
+        assert bridge.response_converter.trusted
+        assert bridge.response_converter.tool_converter.trusted
+
+
+class _Record(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="allow")
+
+    name: str
+    tags: List[str] = []
+    meta: Dict[str, Any] = pydantic.Field(default_factory=dict)
+    note: Optional[str] = None
+
+
+class TestBuildModel:
+    def test_matches_model_construct(self):
+        """Test trusted construction only marks the given fields as set"""
+        built = build_model(_Record, trusted=True, name="a", note="n", extra=1)
+
+        assert built == _Record.model_construct(name="a", note="n", extra=1)
+        assert built.model_fields_set == {"name", "note", "extra"}
+        assert built.model_extra == {"extra": 1}
+
+    def test_mutable_defaults_are_not_shared(self):
+        first = build_model(_Record, trusted=True, name="a")
+        second = build_model(_Record, trusted=True, name="b")
+
+        first.tags.append("x")
+        first.meta["k"] = 1
+
+        assert second.tags == [] and second.meta == {}
+        assert _Record.model_fields["tags"].default == []